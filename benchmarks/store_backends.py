@@ -0,0 +1,123 @@
+"""Write throughput, file size and reopen time of the two store backends.
+
+Backs the "Append-only journal store" CHANGELOG entry. Each backend gets the
+same ``n`` orders, each written as the router writes it (submitted, opened,
+filled: three order writes) plus its fill, so ``4 * n`` writes in all:
+
+- ``sqlite``: :class:`~trading_bot.storage.SqliteStore`, a commit per write;
+- ``sqlite write-behind``: the same, with ``write_behind=True``;
+- ``journal``: :class:`~trading_bot.storage.JournalStore`.
+
+The time of building the orders and fills themselves (measured against a store
+that drops every write) is taken out of the write rate. Reopening reads the
+restore set and every fill back, as a restart does.
+
+Usage::
+
+    python benchmarks/store_backends.py [-n 20000]
+
+Numbers depend on the disk; compare the rows with each other, not across
+machines.
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import tempfile
+import time
+from collections.abc import Callable
+from typing import Any
+
+from trading_bot.domain import (
+    Fill,
+    Instrument,
+    Order,
+    OrderSide,
+    OrderType,
+    Symbol,
+    money,
+)
+from trading_bot.storage import JournalStore, SqliteStore
+
+BTC = Instrument(Symbol("BTC", "USD"))
+
+
+class _Discard:
+    """A store that drops every write: the cost of the loop itself."""
+
+    def upsert_order(self, order: Order) -> None:
+        pass
+
+    def record_fill(self, fill: Fill) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+
+def _drive(store: Any, n: int) -> float:
+    """Seconds to write ``n`` orders' lifecycles and fills, flushed."""
+    start = time.perf_counter()
+    for i in range(n):
+        order = Order(
+            f"c{i}", BTC, OrderSide.BUY, money("0.5"), OrderType.LIMIT,
+            limit_price=money("30000.1"),
+        )
+        order.submit()
+        store.upsert_order(order)
+        order.open(f"V{i}")
+        store.upsert_order(order)
+        order.apply_fill(money("0.5"), money("30000.1"))
+        store.upsert_order(order)
+        store.record_fill(
+            Fill(
+                f"F{i}", f"c{i}", BTC, OrderSide.BUY, money("0.5"),
+                money("30000.1"), money("0.015"), 1_700_000_000_000 + i,
+            )
+        )
+    store.flush()
+    return time.perf_counter() - start
+
+
+def _size(path: pathlib.Path) -> int:
+    """Bytes on disk under ``path`` (a file, or a directory's files)."""
+    files = [path] if path.is_file() else [p for p in path.rglob("*") if p.is_file()]
+    return sum(p.stat().st_size for p in files)
+
+
+BACKENDS: dict[str, Callable[[pathlib.Path], SqliteStore | JournalStore]] = {
+    "sqlite": lambda tmp: SqliteStore(tmp / "history.db"),
+    "sqlite write-behind": lambda tmp: SqliteStore(
+        tmp / "history.db", write_behind=True
+    ),
+    "journal": lambda tmp: JournalStore(tmp / "journal"),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", type=int, default=20_000, help="orders per run")
+    args = parser.parse_args()
+    overhead = _drive(_Discard(), args.n)
+    for name, make in BACKENDS.items():
+        with tempfile.TemporaryDirectory() as tmp:
+            root = pathlib.Path(tmp)
+            store = make(root)
+            elapsed = _drive(store, args.n) - overhead
+            store.close()
+            size = sum(_size(path) for path in root.iterdir())
+            start = time.perf_counter()
+            with make(root) as again:
+                sum(1 for _ in again.orders_to_restore(window_ms=0))
+                sum(1 for _ in again.iter_fills())
+            reopen = time.perf_counter() - start
+        print(
+            f"{name:<20} {4 * args.n / elapsed:>10,.0f} writes/s"
+            f" {size / 2**20:>8.1f} MiB  reopen {reopen:6.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Single-row write throughput of :class:`~trading_bot.storage.SqliteStore`.
+
+Backs the "Persistent SQLite connections" CHANGELOG entry. Three runs record
+the same ``n`` fills into a fresh database:
+
+- ``per-call``: the old store, a new connection opened, committed and closed
+  for every write (the schema's ``synchronous=NORMAL`` is per connection, so
+  each write commits at the default ``FULL``);
+- ``persistent``: the current store, one writer connection for its lifetime;
+- ``batched``: the current store, every write inside one
+  ``store.transaction()``.
+
+Usage::
+
+    python benchmarks/store_writes.py [-n 5000]
+
+Numbers depend on the disk; compare the rows with each other, not across
+machines.
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sqlite3
+import tempfile
+import time
+from collections.abc import Callable
+
+from trading_bot.domain import Fill, Instrument, OrderSide, Symbol, money
+from trading_bot.storage import SqliteStore
+from trading_bot.storage.sqlite_store import _INSERT_FILL
+
+BTC = Instrument(Symbol("BTC", "USD"))
+
+
+def _fill(i: int) -> Fill:
+    return Fill(
+        f"F{i}", f"c{i}", BTC, OrderSide.BUY, money("0.1"), money("30000"),
+        money("0"), i,
+    )
+
+
+def _per_call(db: pathlib.Path, n: int) -> None:
+    SqliteStore(db).close()  # create the schema
+    for i in range(n):
+        fill = _fill(i)
+        conn = sqlite3.connect(str(db))
+        try:
+            conn.execute(
+                _INSERT_FILL,
+                (
+                    fill.fill_id, fill.client_order_id, "BTC/USD",
+                    fill.side.value, str(fill.qty), str(fill.price),
+                    str(fill.fee), fill.ts, None, None, None, None,
+                ),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+
+def _persistent(db: pathlib.Path, n: int) -> None:
+    with SqliteStore(db) as store:
+        for i in range(n):
+            store.record_fill(_fill(i))
+
+
+def _batched(db: pathlib.Path, n: int) -> None:
+    with SqliteStore(db) as store, store.transaction():
+        for i in range(n):
+            store.record_fill(_fill(i))
+
+
+RUNS: dict[str, Callable[[pathlib.Path, int], None]] = {
+    "per-call": _per_call,
+    "persistent": _persistent,
+    "batched": _batched,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", type=int, default=5000, help="fills per run")
+    args = parser.parse_args()
+    for name, run in RUNS.items():
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.perf_counter()
+            run(pathlib.Path(tmp) / "bench.db", args.n)
+            elapsed = time.perf_counter() - start
+        print(f"{name:<11} {args.n / elapsed:>10,.0f} writes/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,7 +17,9 @@ cross-cutting primitives:
   :class:`~trading_bot.application.events.FillEvent`,
   :class:`~trading_bot.application.events.LogEvent`): the pub/sub fan-out the
   router, the position tracker and a future UI consume. Events carry domain
-  objects, so money stays :class:`~decimal.Decimal` end to end.
+  objects, so money stays :class:`~decimal.Decimal` end to end. Log sampling,
+  rate limits and the pageable ring sink live in
+  :mod:`~trading_bot.application.log_events`.
 
 It then layers the engine's use-cases:
 
@@ -87,6 +89,20 @@ It then layers the engine's use-cases:
   opt-in/injectable (the process entrypoint calls
   :meth:`~trading_bot.application.orchestrator.Orchestrator.install_signal_handlers`;
   importing installs nothing). Replaces the legacy multiprocessing server.
+* bar_scheduler — the
+  :class:`~trading_bot.application.bar_scheduler.BarCloseScheduler`, the daemon's
+  data-driven clock: it steps each supervised unit on its own ``span``'s bar-close
+  boundaries (plus a settle delay), grouping units whose boundaries coincide into
+  one wake-up, and optionally steps everything at once when new data lands.
+* watchdog — the :class:`~trading_bot.application.watchdog.LoopWatchdog`: a
+  heartbeat samples event-loop lag into a histogram while a helper thread
+  snapshots the loop's stack during a stall, so each stall past the threshold is
+  reported (as a warning ``LogEvent``) with the code path that blocked trading.
+* journal — :func:`~trading_bot.application.journal.record_app` /
+  :func:`~trading_bot.application.journal.replay_app`, the record-and-replay
+  journal: a run's external inputs (bar reads as row deltas, venue HTTP
+  responses, WS frames, clock readings) go to a compact binary file that replays
+  through the same wiring at full speed, with no venue and no dccd store.
 * portfolio_runner — the
   :class:`~trading_bot.application.portfolio_runner.PortfolioRunner`, the
   **multi-asset** analogue of the ``StrategyRunner``: each (daily) rebalance tick
@@ -113,18 +129,26 @@ It then layers the engine's use-cases:
   returning a :class:`~trading_bot.application.run_app.RunReport` (per-strategy
   orders + final positions + aggregate PnL). The single seam the CLI's ``run``
   delegates to when handed a config — the whole declared (paper) system, up.
+* snapshot — the :class:`~trading_bot.application.snapshot.Snapshotter` saves
+  the engine's fill-derived state (positions, performance totals and equity,
+  the risk daily PnL) to the store with a fill watermark, and
+  :func:`~trading_bot.application.snapshot.restore_snapshot` restarts from it,
+  folding only the fills stored after it.
 """
 
 from __future__ import annotations
 
+from trading_bot.application.bar_scheduler import BarCloseScheduler
 from trading_bot.application.config import (
     AppConfig,
     BrokerConfig,
     DataSourceConfig,
+    EventsConfig,
     RiskConfig,
     SignalRefConfig,
     StorageConfig,
     StrategyConfig,
+    WatchdogConfig,
 )
 from trading_bot.application.data_feed import (
     BARS_SCHEMA,
@@ -140,7 +164,15 @@ from trading_bot.application.events import (
     LogEvent,
     OrderEvent,
 )
+from trading_bot.application.journal import (
+    JournalError,
+    JournalReader,
+    JournalWriter,
+    record_app,
+    replay_app,
+)
 from trading_bot.application.live_fills import FillSource, LiveFillStreamer
+from trading_bot.application.log_events import LogPolicy, LogRecord, LogRing
 from trading_bot.application.orchestrator import Orchestrator, RunnerGroupError
 from trading_bot.application.order_router import OrderRouter
 from trading_bot.application.performance_service import PerformanceService
@@ -161,14 +193,27 @@ from trading_bot.application.portfolio_runner import (
 )
 from trading_bot.application.position_tracker import PositionTracker
 from trading_bot.application.reconcile import ReconResult, reconcile
-from trading_bot.application.risk import RiskManager
+from trading_bot.application.risk import KillReport, RiskManager
 from trading_bot.application.run_app import (
     RunReport,
     StrategyReport,
     build_runners,
+    close_system,
     run_app,
+    run_system,
+)
+from trading_bot.application.service_factory import (
+    Engine,
+    build_engine,
+    restore_engine,
+    restore_orders,
+)
+from trading_bot.application.snapshot import (
+    EngineSnapshot,
+    Snapshotter,
+    load_snapshot,
+    restore_snapshot,
 )
-from trading_bot.application.service_factory import Engine, build_engine
 from trading_bot.application.strategy import (
     SignalFn,
     Strategy,
@@ -179,7 +224,9 @@ from trading_bot.application.strategy_runner import OrderFactory, StrategyRunner
 from trading_bot.application.supervisor import (
     StrategyStatus,
     StrategySupervisor,
+    UnitUsage,
 )
+from trading_bot.application.watchdog import LagHistogram, LoopWatchdog, StallReport
 
 __all__ = [
     # config
@@ -190,21 +237,28 @@ __all__ = [
     "StorageConfig",
     "StrategyConfig",
     "RiskConfig",
+    "WatchdogConfig",
+    "EventsConfig",
     # events
     "EventBus",
     "Event",
     "OrderEvent",
     "FillEvent",
     "LogEvent",
+    "LogPolicy",
+    "LogRecord",
+    "LogRing",
     # use-cases
     "OrderRouter",
     "PositionTracker",
     "PerformanceService",
     "RiskManager",
+    "KillReport",
     "LiveFillStreamer",
     "FillSource",
     "StrategySupervisor",
     "StrategyStatus",
+    "UnitUsage",
     "reconcile",
     "ReconResult",
     # data feed
@@ -238,12 +292,30 @@ __all__ = [
     # orchestration
     "Orchestrator",
     "RunnerGroupError",
+    "BarCloseScheduler",
+    "LoopWatchdog",
+    "LagHistogram",
+    "StallReport",
     # wiring
     "Engine",
     "build_engine",
+    "restore_engine",
+    "restore_orders",
+    "EngineSnapshot",
+    "Snapshotter",
+    "load_snapshot",
+    "restore_snapshot",
     # entrypoint
     "run_app",
+    "run_system",
+    "close_system",
     "build_runners",
     "RunReport",
     "StrategyReport",
+    # record / replay
+    "record_app",
+    "replay_app",
+    "JournalWriter",
+    "JournalReader",
+    "JournalError",
 ]
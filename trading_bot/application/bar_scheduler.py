@@ -0,0 +1,364 @@
+"""The :class:`BarCloseScheduler` — wake the daemon on bar closes, not on a timer.
+
+A fixed ``IntervalTrigger`` (or a cron line) ticks regardless of when bars
+actually close: tick too often and every step re-reads dccd for nothing (each
+step is idempotent over unchanged data, so it is pure waste); tick too rarely and
+the engine reacts late to a close. The data already says when something can
+change — a unit's bars close on its :class:`~trading_bot.application.config.
+DataSourceConfig` ``span`` boundaries — so this scheduler wakes **exactly then**.
+
+Bar-close boundaries (carried into the ADR)
+-------------------------------------------
+dccd stamps a bar at its **open** time, aligned to multiples of ``span`` since the
+epoch, and the live feed treats a bar as closed once ``now - bar.time ≥ span``
+(see :meth:`~trading_bot.application.data_feed.DccdFeed.live_windows`). The bar
+open at ``k * span`` therefore closes at ``(k + 1) * span``, and the next close
+after ``now`` is :func:`next_bar_close` — the next multiple of ``span`` strictly
+after it. The scheduler sleeps until that boundary **plus a settle delay**
+(``settle``, seconds): the collector needs a moment to write the just-closed bar,
+and stepping a hair too early would see the previous window and trade nothing
+until the next close.
+
+Grouping (carried into the ADR)
+-------------------------------
+Units sharing a ``span`` share a boundary, so they are grouped and stepped on
+**one** wake-up; units on different spans whose boundaries coincide (an hourly
+and a minutely unit at the top of the hour) are stepped on the same wake-up too.
+A unit that declares no data source (no ``span``) falls back to the scheduler's
+``default_span`` — the old fixed cadence, kept for exactly those units.
+
+Data-driven wake-ups (carried into the ADR)
+-------------------------------------------
+Two optional hooks step **every** unit immediately, without waiting for the next
+boundary: a push-style :meth:`BarCloseScheduler.notify` (for a store that can
+signal new data), and a pull-style ``data_version`` callable polled every
+``version_poll`` seconds on a worker thread (a directory walk never stalls the
+loop) — when its value changes, new data has landed.
+:func:`path_data_version` is the stock one: the newest modification time under a
+directory (e.g. :attr:`~trading_bot.application.config.StorageConfig.data_path`).
+Both are safe to fire spuriously — a step over unchanged data trades nothing.
+
+Failure policy
+--------------
+A unit whose step raises does **not** stop its group or the scheduler: the error
+is handed to ``on_error`` (if given) and the remaining units are stepped — the
+daemon's own tick already never lets one failure kill it.
+
+This module is part of the application layer: it sequences the
+:class:`~trading_bot.application.supervisor.StrategySupervisor`'s ``step``, owns
+no money logic, and performs no I/O of its own beyond the optional
+``data_version`` probe. The clock and sleep are injectable (``now_ns`` /
+``sleep``, the same seams as the live feed) so tests drive a fake clock.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import time
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from trading_bot.application.supervisor import StrategySupervisor
+
+__all__ = [
+    "BarCloseScheduler",
+    "next_bar_close",
+    "group_by_span",
+    "path_data_version",
+]
+
+_NS_PER_S = 1_000_000_000
+
+
+def next_bar_close(now_ns: int, span: int) -> int:
+    """The next bar-close boundary strictly after ``now_ns`` (ns, epoch-aligned).
+
+    Parameters
+    ----------
+    now_ns : int
+        The current time in nanoseconds UTC.
+    span : int
+        Bar width in **seconds** (must be ``> 0``).
+
+    Returns
+    -------
+    int
+        The smallest multiple of ``span`` (in ns) strictly greater than
+        ``now_ns``. Exactly on a boundary, the *next* one is returned — the
+        current one has just been handled.
+
+    Raises
+    ------
+    ValueError
+        If ``span`` is not positive.
+
+    """
+    if span <= 0:
+        raise ValueError(f"span must be positive seconds, got {span}")
+    span_ns = span * _NS_PER_S
+    return (now_ns // span_ns + 1) * span_ns
+
+
+def group_by_span(spans: Mapping[str, int]) -> dict[int, list[str]]:
+    """Group unit names by bar ``span``, preserving the mapping's order.
+
+    Parameters
+    ----------
+    spans : Mapping[str, int]
+        Unit name → bar span (seconds).
+
+    Returns
+    -------
+    dict of int to list of str
+        Span → the names on that span, in first-seen order.
+
+    """
+    groups: dict[int, list[str]] = {}
+    for name, span in spans.items():
+        groups.setdefault(span, []).append(name)
+    return groups
+
+
+def path_data_version(path: str | os.PathLike[str]) -> Callable[[], int]:
+    """A ``data_version`` probe: the newest ``st_mtime_ns`` under ``path``.
+
+    Walks ``path`` (a file or a directory tree, e.g. the dccd data directory) and
+    returns the largest modification time found, so the value changes whenever a
+    collector writes a file. A missing path reads as ``0``.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The file or directory to watch.
+
+    Returns
+    -------
+    Callable[[], int]
+        A zero-argument probe suitable for ``BarCloseScheduler(data_version=...)``.
+
+    """
+    root = os.fspath(path)
+
+    def _probe() -> int:
+        try:
+            newest = os.stat(root).st_mtime_ns
+        except OSError:
+            return 0
+        for dirpath, _dirnames, filenames in os.walk(root):
+            for filename in filenames:
+                with contextlib.suppress(OSError):
+                    newest = max(
+                        newest, os.stat(os.path.join(dirpath, filename)).st_mtime_ns
+                    )
+        return newest
+
+    return _probe
+
+
+async def _wall_sleep(seconds: float) -> None:
+    await asyncio.sleep(seconds)
+
+
+class BarCloseScheduler:
+    """Step supervisor units on their bar-close boundaries (plus a settle delay).
+
+    See the module docstring for the boundary rule, the span grouping and the
+    data-driven wake-ups.
+
+    Parameters
+    ----------
+    supervisor : StrategySupervisor
+        The units to step. Each unit's span comes from
+        :meth:`~trading_bot.application.supervisor.StrategySupervisor.span_of`.
+    default_span : int, optional
+        Span (seconds) for a unit that declares no data source. Defaults to
+        ``60``.
+    settle : float, optional
+        Seconds to wait past each boundary before stepping, so the collector has
+        written the just-closed bar. Defaults to ``2.0``. Must be ``>= 0``.
+    data_version : Callable[[], Hashable] or None, optional
+        Polled every ``version_poll`` seconds, on a worker thread; a changed
+        value steps every unit at once (see :func:`path_data_version`). ``None``
+        (default) disables it.
+    version_poll : float, optional
+        Poll period (seconds) of ``data_version``. Defaults to ``5.0``.
+    on_step : Callable[[list of str], None] or None, optional
+        Called after each wake-up with the names just stepped.
+    on_error : Callable[[str, Exception], None] or None, optional
+        Called with ``(name, exc)`` when a unit's step raises.
+    now_ns : Callable[[], int], optional
+        Current time in ns UTC. Defaults to :func:`time.time_ns`.
+    sleep : Callable[[float], Awaitable[None]], optional
+        Async sleep (seconds). Defaults to :func:`asyncio.sleep`.
+
+    Raises
+    ------
+    ValueError
+        If ``default_span`` is not positive, or ``settle`` / ``version_poll``
+        is negative / not positive.
+
+    """
+
+    def __init__(
+        self,
+        supervisor: StrategySupervisor,
+        *,
+        default_span: int = 60,
+        settle: float = 2.0,
+        data_version: Callable[[], Hashable] | None = None,
+        version_poll: float = 5.0,
+        on_step: Callable[[list[str]], None] | None = None,
+        on_error: Callable[[str, Exception], None] | None = None,
+        now_ns: Callable[[], int] = time.time_ns,
+        sleep: Callable[[float], Awaitable[None]] = _wall_sleep,
+    ) -> None:
+        if default_span <= 0:
+            raise ValueError(f"default_span must be positive, got {default_span}")
+        if settle < 0:
+            raise ValueError(f"settle must be non-negative, got {settle}")
+        if version_poll <= 0:
+            raise ValueError(f"version_poll must be positive, got {version_poll}")
+        self._supervisor = supervisor
+        self._default_span = default_span
+        self._settle_ns = int(settle * _NS_PER_S)
+        self._data_version = data_version
+        self._version_poll = version_poll
+        self._on_step = on_step
+        self._on_error = on_error
+        self._now_ns = now_ns
+        self._sleep = sleep
+        self._wake = asyncio.Event()
+
+    def groups(self) -> dict[int, list[str]]:
+        """The current span → unit-names grouping (unknown spans → ``default_span``)."""
+        spans = {
+            name: self._supervisor.span_of(name) or self._default_span
+            for name in self._supervisor.names()
+        }
+        return group_by_span(spans)
+
+    def next_wake_ns(self) -> tuple[int, list[str]]:
+        """The next wake-up time (ns, settle included) and the units due then.
+
+        Every group whose next boundary is the earliest is due, so coinciding
+        boundaries of different spans share one wake-up. Due units are listed in
+        the supervisor's registration order.
+        """
+        now = self._now_ns()
+        groups = self.groups()
+        boundaries = {
+            span: next_bar_close(now - self._settle_ns, span) for span in groups
+        }
+        if not boundaries:
+            return now + self._default_span * _NS_PER_S, []
+        earliest = min(boundaries.values())
+        due_names = {
+            name
+            for span, names in groups.items()
+            if boundaries[span] == earliest
+            for name in names
+        }
+        due = [name for name in self._supervisor.names() if name in due_names]
+        return earliest + self._settle_ns, due
+
+    def notify(self) -> None:
+        """Step every unit now — the push-style "new data landed" hook."""
+        self._wake.set()
+
+    async def step_units(self, names: list[str]) -> int:
+        """Step ``names`` once each (stopped units are no-ops); return how many ran.
+
+        A unit whose step raises is reported to ``on_error`` and skipped — the
+        rest of the group is still stepped.
+        """
+        stepped = 0
+        for name in names:
+            try:
+                await self._supervisor.step(name)
+            except Exception as exc:  # noqa: BLE001 - one unit never stops the group
+                if self._on_error is not None:
+                    self._on_error(name, exc)
+                continue
+            stepped += 1
+        if self._on_step is not None and names:
+            self._on_step(list(names))
+        return stepped
+
+    async def run(
+        self, stop_event: asyncio.Event, *, max_wakeups: int | None = None
+    ) -> int:
+        """Wake on each bar close (or on new data) and step the due units.
+
+        Parameters
+        ----------
+        stop_event : asyncio.Event
+            Stops the loop when set — checked between wake-ups, and also awaited
+            alongside the sleep so a stop never waits out a long (daily) span.
+        max_wakeups : int or None, optional
+            Return after this many wake-ups (bounds the loop for tests). ``None``
+            (default) runs until ``stop_event`` is set.
+
+        Returns
+        -------
+        int
+            The number of wake-ups performed.
+
+        """
+        wakeups = 0
+        watcher = (
+            asyncio.ensure_future(self._watch_version(stop_event))
+            if self._data_version is not None
+            else None
+        )
+        try:
+            while not stop_event.is_set():
+                if max_wakeups is not None and wakeups >= max_wakeups:
+                    break
+                wake_at, due = self.next_wake_ns()
+                delay = max(0.0, (wake_at - self._now_ns()) / _NS_PER_S)
+                notified = await self._wait(delay, stop_event)
+                if stop_event.is_set():
+                    break
+                if notified:
+                    # New data: everyone re-evaluates now, not only the due group.
+                    due = self._supervisor.names()
+                await self.step_units(due)
+                wakeups += 1
+        finally:
+            if watcher is not None:
+                watcher.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await watcher
+        return wakeups
+
+    async def _wait(self, delay: float, stop_event: asyncio.Event) -> bool:
+        """Sleep ``delay`` seconds unless stopped or notified; ``True`` if notified."""
+        sleeper = asyncio.ensure_future(self._sleep(delay))
+        stopper = asyncio.ensure_future(stop_event.wait())
+        woken = asyncio.ensure_future(self._wake.wait())
+        pending = {sleeper, stopper, woken}
+        try:
+            await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        notified = self._wake.is_set()
+        self._wake.clear()
+        return notified
+
+    async def _watch_version(self, stop_event: asyncio.Event) -> None:
+        """Poll ``data_version`` and :meth:`notify` whenever its value changes."""
+        probe = self._data_version
+        assert probe is not None
+        # On a worker thread: walking a data directory must not stall the loop.
+        last = await asyncio.to_thread(probe)
+        while not stop_event.is_set():
+            await self._sleep(self._version_poll)
+            current = await asyncio.to_thread(probe)
+            if current != last:
+                last = current
+                self.notify()
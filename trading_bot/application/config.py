@@ -57,6 +57,8 @@ __all__ = [
     "StrategyConfig",
     "PortfolioStrategyConfig",
     "RiskConfig",
+    "WatchdogConfig",
+    "EventsConfig",
     "AppConfig",
 ]
 
@@ -206,6 +208,11 @@ class StrategyConfig(BaseModel):
     lookback : int, optional
         Warmup: minimum number of bars before the signal is meaningful. Must be
         ``>= 0``. Default ``0`` (no warmup).
+    prefetch : int, optional
+        How many bar windows the runner may read ahead of the step in flight, so
+        feed reads overlap venue round-trips (see
+        :class:`~trading_bot.application.strategy_runner.StrategyRunner`). Must
+        be ``>= 0``. Default ``0`` (no read-ahead).
 
     """
 
@@ -215,6 +222,7 @@ class StrategyConfig(BaseModel):
     signal: SignalRefConfig | None = None
     reference_qty: Decimal | None = None
     lookback: int = 0
+    prefetch: int = 0
 
     @field_validator("name", "symbol")
     @classmethod
@@ -240,6 +248,14 @@ class StrategyConfig(BaseModel):
             raise ValueError(f"lookback must be non-negative, got {v}")
         return v
 
+    @field_validator("prefetch")
+    @classmethod
+    def _non_negative_prefetch(cls, v: int) -> int:
+        """Reject a negative ``prefetch`` depth."""
+        if v < 0:
+            raise ValueError(f"prefetch must be non-negative, got {v}")
+        return v
+
 
 class PortfolioStrategyConfig(BaseModel):
     """One **multi-asset** strategy the engine should drive — a universe + sizing.
@@ -305,6 +321,13 @@ class PortfolioStrategyConfig(BaseModel):
 
         Single-instrument strategies need no equivalent: they read under the exact
         ``symbol`` string the config gives, so there is nothing to re-render.
+    parallelism : int, optional
+        Most rebalance legs routed concurrently (see
+        :class:`~trading_bot.application.portfolio_runner.PortfolioRunner`).
+        Defaults to ``1`` (one leg after another). Must be at least ``1``.
+    leg_order : {"given", "sells_first"}, optional
+        Leg sequencing: ``"given"`` (default) routes in universe order;
+        ``"sells_first"`` settles every sell before any buy starts.
 
     """
 
@@ -316,6 +339,16 @@ class PortfolioStrategyConfig(BaseModel):
     gross_cap: Decimal | None = None
     venue: str = "binance"
     store_key_format: Literal["venue", "hyphen", "slash"] = "venue"
+    parallelism: int = 1
+    leg_order: Literal["given", "sells_first"] = "given"
+
+    @field_validator("parallelism")
+    @classmethod
+    def _positive_parallelism(cls, v: int) -> int:
+        """Reject a parallelism below one leg in flight."""
+        if v < 1:
+            raise ValueError(f"parallelism must be at least 1, got {v}")
+        return v
 
     @field_validator("name", "venue")
     @classmethod
@@ -378,23 +411,117 @@ class StorageConfig(BaseModel):
     """Where the engine persists state and finds market data on disk.
 
     Both paths are optional (``None`` = use the layer's default): ``db_path`` is
-    the append-only SQLite store of order/fill history + engine state (the
+    the append-only store of order/fill history + engine state (the
     reconciliation source), and ``data_path`` is the dccd data directory the
     bars feed reads from.
 
     Parameters
     ----------
     db_path : str or None, optional
-        Path to the engine's SQLite database. ``None`` (default) defers to the
-        storage layer's default location.
+        Path to the engine's SQLite database, or the journal store's directory.
+        ``None`` (default) defers to the storage layer's default location.
+    backend : {"sqlite", "journal"}, optional
+        The store behind ``db_path``: ``"sqlite"`` (default,
+        :class:`~trading_bot.storage.SqliteStore`) or ``"journal"``
+        (:class:`~trading_bot.storage.JournalStore`, a segmented append-only
+        log for high-rate order/fill streams; it batches its fsyncs itself, so
+        ``write_behind`` does not apply).
     data_path : str or None, optional
         Path to the dccd on-disk data directory. ``None`` (default) defers to
         dccd's own default.
+    order_retention : float or None, optional
+        Seconds a terminal order stays in the router's memory before it is
+        archived to the store (dedup then falls back to the store). Only
+        applies with a ``db_path``. ``None`` (default) keeps every order.
+    write_behind : bool, optional
+        Queue order/fill writes and commit them in batches from a writer thread
+        instead of once per event. Defaults to ``False``.
+    flush_rows : int, optional
+        Most rows per write-behind batch. Defaults to ``500``.
+    flush_interval : float, optional
+        Longest time (seconds) a queued write waits for its batch. Defaults to
+        ``0.02``.
+    snapshot_every : int or None, optional
+        Fills between engine snapshots (positions, performance totals, the
+        risk daily PnL) saved to the store; a restart then loads the latest
+        snapshot and folds only the fills after it. Only applies with a
+        ``db_path``. ``None`` (default) takes no snapshots.
+    read_workers : int, optional
+        Reader threads serving the store's reads for async code (the API, the
+        startup restore), so they never run on the event loop. Defaults to
+        ``2``.
+    archive_after_days : float or None, optional
+        Age in days past which terminal orders and fills move out of the
+        SQLite database into per-month archive databases beside it
+        (``<db_path stem>.archive/YYYY-MM.db``), so the hot file stays small.
+        Reads still span the archives. ``None`` (default) keeps everything in
+        one file. Ignored by the journal backend, which compacts itself.
+    archive_interval : float, optional
+        Seconds between archive passes (each followed by an incremental
+        vacuum). Defaults to ``3600``.
 
     """
 
     db_path: str | None = None
+    backend: Literal["sqlite", "journal"] = "sqlite"
     data_path: str | None = None
+    order_retention: float | None = None
+    write_behind: bool = False
+    flush_rows: int = 500
+    flush_interval: float = 0.02
+    snapshot_every: int | None = None
+    read_workers: int = 2
+    archive_after_days: float | None = None
+    archive_interval: float = 3600.0
+
+    @field_validator("order_retention")
+    @classmethod
+    def _retention_non_negative(cls, v: float | None) -> float | None:
+        if v is not None and v < 0:
+            raise ValueError(f"order_retention must be >= 0, got {v}")
+        return v
+
+    @field_validator("flush_rows")
+    @classmethod
+    def _flush_rows_positive(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError(f"flush_rows must be at least 1, got {v}")
+        return v
+
+    @field_validator("flush_interval")
+    @classmethod
+    def _flush_interval_non_negative(cls, v: float) -> float:
+        if v < 0:
+            raise ValueError(f"flush_interval must be >= 0, got {v}")
+        return v
+
+    @field_validator("snapshot_every")
+    @classmethod
+    def _snapshot_every_positive(cls, v: int | None) -> int | None:
+        if v is not None and v < 1:
+            raise ValueError(f"snapshot_every must be at least 1, got {v}")
+        return v
+
+    @field_validator("archive_after_days")
+    @classmethod
+    def _archive_after_non_negative(cls, v: float | None) -> float | None:
+        if v is not None and v < 0:
+            raise ValueError(f"archive_after_days must be >= 0, got {v}")
+        return v
+
+    @field_validator("archive_interval")
+    @classmethod
+    def _archive_interval_positive(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError(f"archive_interval must be positive, got {v}")
+        return v
+
+    @field_validator("read_workers")
+    @classmethod
+    def _read_workers_positive(cls, v: int) -> int:
+        if v < 1:
+            raise ValueError(f"read_workers must be at least 1, got {v}")
+        return v
 
 
 class RiskConfig(BaseModel):
@@ -412,14 +539,28 @@ class RiskConfig(BaseModel):
         Largest size (base units) a single order may request.
     max_daily_loss : Decimal, optional
         Loss (quote units) at which trading halts for the day.
+    max_gross_notional : Decimal, optional
+        Largest gross book notional (quote units): the sum over instruments of
+        ``abs(net position) * price`` once the orders land.
+    max_net_notional : Decimal, optional
+        Largest absolute net book notional (quote units): ``abs`` of the sum
+        over instruments of ``net position * price`` once the orders land.
 
     """
 
     max_position: Decimal | None = None
     max_order: Decimal | None = None
     max_daily_loss: Decimal | None = None
-
-    @field_validator("max_position", "max_order", "max_daily_loss")
+    max_gross_notional: Decimal | None = None
+    max_net_notional: Decimal | None = None
+
+    @field_validator(
+        "max_position",
+        "max_order",
+        "max_daily_loss",
+        "max_gross_notional",
+        "max_net_notional",
+    )
     @classmethod
     def _non_negative(cls, v: Decimal | None) -> Decimal | None:
         """Reject a negative risk limit (``None`` and ``0`` are allowed)."""
@@ -428,6 +569,117 @@ class RiskConfig(BaseModel):
         return v
 
 
+class WatchdogConfig(BaseModel):
+    """The event-loop stall watchdog (off by default).
+
+    When ``enabled``, a run is watched by a
+    :class:`~trading_bot.application.watchdog.LoopWatchdog`: event-loop lag is
+    sampled every ``interval`` seconds into a histogram, and a stall of at least
+    ``threshold`` seconds is reported as a warning ``LogEvent`` carrying the stack
+    that blocked the loop.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        Whether to watch the loop. Defaults to ``False``.
+    interval : float, optional
+        Heartbeat / sampling period in seconds. Defaults to ``0.1``.
+    threshold : float, optional
+        Lag in seconds reported as a stall. Defaults to ``0.5``.
+
+    """
+
+    enabled: bool = False
+    interval: float = 0.1
+    threshold: float = 0.5
+
+    @field_validator("interval", "threshold")
+    @classmethod
+    def _positive_seconds(cls, v: float) -> float:
+        """Reject a non-positive period / threshold."""
+        if v <= 0:
+            raise ValueError(f"watchdog interval/threshold must be positive, got {v}")
+        return v
+
+
+class EventsConfig(BaseModel):
+    """How the engine bus delivers events to its subscribers.
+
+    Parameters
+    ----------
+    dispatch : {"sync", "async"}, optional
+        ``"sync"`` (default) runs every handler inside ``emit``; ``"async"``
+        gives each subscriber its own buffer and worker task, taking the store's
+        SQLite writes off the order path (see
+        :mod:`trading_bot.application.events`).
+    queue_size : int, optional
+        Async mode: events a non-critical subscriber may buffer before new ones
+        are dropped (the store and trackers are never dropped from). Defaults
+        to ``1024``.
+    socket_path : str or None, optional
+        Also publish every event on this Unix domain socket for out-of-process
+        observers (:mod:`trading_bot.interfaces.stream`), while ``trading-bot
+        run`` executes. ``None`` (default) publishes nothing.
+    log_sample : dict of str to float, optional
+        Fraction of ``info``/``debug`` log events kept per category
+        (``"strategy"``, ``"portfolio"``, ... or ``"*"``). Empty by default.
+    log_rate : dict of str to float, optional
+        Sustained ``info``/``debug`` log events per second allowed per
+        category. Empty (unlimited) by default.
+    log_buffer : int, optional
+        Log events the in-memory ring keeps for the dashboard's ``/api/logs``.
+        Defaults to ``0``: no ring, so nothing subscribes to log events and
+        :meth:`~trading_bot.application.events.EventBus.log` stays free. Set it
+        (e.g. ``1000``) to page recent logs on the dashboard.
+
+    """
+
+    dispatch: Literal["sync", "async"] = "sync"
+    queue_size: int = 1024
+    socket_path: str | None = None
+    log_sample: dict[str, float] = Field(default_factory=dict)
+    log_rate: dict[str, float] = Field(default_factory=dict)
+    log_buffer: int = 0
+
+    @field_validator("queue_size")
+    @classmethod
+    def _positive_size(cls, v: int) -> int:
+        """Reject a queue bound below one."""
+        if v < 1:
+            raise ValueError(f"events queue_size must be at least 1, got {v}")
+        return v
+
+    @field_validator("log_sample")
+    @classmethod
+    def _fractions(cls, v: dict[str, float]) -> dict[str, float]:
+        """Reject a sample fraction outside ``[0, 1]``."""
+        for category, fraction in v.items():
+            if not 0.0 <= fraction <= 1.0:
+                raise ValueError(
+                    f"log_sample[{category!r}] must be within [0, 1], got {fraction}"
+                )
+        return v
+
+    @field_validator("log_rate")
+    @classmethod
+    def _rates(cls, v: dict[str, float]) -> dict[str, float]:
+        """Reject a negative per-category rate."""
+        for category, per_second in v.items():
+            if per_second < 0:
+                raise ValueError(
+                    f"log_rate[{category!r}] must be non-negative, got {per_second}"
+                )
+        return v
+
+    @field_validator("log_buffer")
+    @classmethod
+    def _non_negative_buffer(cls, v: int) -> int:
+        """Reject a negative ring size."""
+        if v < 0:
+            raise ValueError(f"events log_buffer must be >= 0, got {v}")
+        return v
+
+
 class AppConfig(BaseModel):
     """Top-level engine configuration — brokers, strategies and risk.
 
@@ -474,6 +726,10 @@ class AppConfig(BaseModel):
     storage : StorageConfig, optional
         Where state is persisted (SQLite) and where the bars feed reads data
         from (dccd dir). Defaults to all-unset (each layer's own default).
+    watchdog : WatchdogConfig, optional
+        The event-loop stall watchdog. Defaults to disabled.
+    events : EventsConfig, optional
+        The engine bus dispatch mode. Defaults to synchronous.
 
     Examples
     --------
@@ -498,6 +754,8 @@ class AppConfig(BaseModel):
     portfolios: list[PortfolioStrategyConfig] = Field(default_factory=list)
     risk: RiskConfig = Field(default_factory=RiskConfig)
     storage: StorageConfig = Field(default_factory=StorageConfig)
+    watchdog: WatchdogConfig = Field(default_factory=WatchdogConfig)
+    events: EventsConfig = Field(default_factory=EventsConfig)
 
     @field_validator("starting_capital")
     @classmethod
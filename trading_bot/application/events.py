@@ -17,7 +17,8 @@ Design choices (carried into the ADR):
     :class:`~trading_bot.domain.order.Order` aggregate);
   - :class:`FillEvent` — a venue-confirmed execution landed (carries the
     immutable :class:`~trading_bot.domain.fill.Fill`, the PnL source of truth);
-  - :class:`LogEvent` — a human-readable line (level + message).
+  - :class:`LogEvent` — a log line: a template plus its fields, a level and a
+    category, rendered lazily (see :mod:`trading_bot.application.log_events`).
 
   All money stays :class:`~decimal.Decimal`, because the events carry the domain
   objects themselves — there is no float round-trip.
@@ -31,19 +32,71 @@ Design choices (carried into the ADR):
   swallowed (one bad subscriber must not break the others). Queue puts are
   non-blocking (:meth:`asyncio.Queue.put_nowait`); a full queue drops the event
   (a slow consumer must not stall the producer) — see :meth:`EventBus.emit`.
+
+* **Logs are free when nobody listens.** Producers log through
+  :meth:`EventBus.log`, which returns before building anything when no
+  handler or queue takes :class:`LogEvent`, and applies the bus's
+  :class:`~trading_bot.application.log_events.LogPolicy` (per-category
+  sampling / rate limits) otherwise.
+
+* **Type-routed subscriptions.** :meth:`EventBus.subscribe` takes the event
+  ``types`` a handler cares about; :meth:`EventBus.emit` looks the handlers up
+  by ``type(event)`` in a per-type route table (rebuilt lazily after a
+  (un)subscribe), so a fill-only consumer is never even called for an
+  :class:`OrderEvent` or :class:`LogEvent`.
+
+Async dispatch (carried into the ADR)
+-------------------------------------
+By default (``dispatch="sync"``) every handler runs inside :meth:`EventBus.emit`,
+on the producer's call stack — so a handler that does I/O (the SQLite store
+commits per event) sits on the hot path between the venue acknowledging an
+order and :meth:`~trading_bot.application.order_router.OrderRouter.submit`
+returning. With ``dispatch="async"`` each subscriber instead owns a FIFO buffer
+and a worker task: ``emit`` only appends to the buffers and returns, and the
+worker calls the handler on a later loop iteration.
+
+* **Per-subscriber ordering.** One buffer and at most one worker per
+  subscriber: a handler sees events in emit order, one at a time. There is no
+  ordering *across* buffered subscribers — the store may lag the SSE hub or
+  vice versa.
+* **Bounded, except for critical consumers.** A buffer holds ``maxsize``
+  events; past that a non-critical subscriber's new events are dropped (and
+  counted). A ``critical=True`` subscriber — the store — is never dropped
+  from: its buffer grows past the bound (logged once per overflow) because
+  losing a fill would corrupt positions and history.
+* **Risk inputs stay synchronous.** An ``inline=True`` subscriber is called
+  inside ``emit`` even in async mode. The position tracker and the performance
+  service (whose realised PnL is the risk gate's daily loss) subscribe inline,
+  so the next order's pre-trade check never reads a position or a loss that
+  trails a fill already emitted.
+* **Observable.** :meth:`EventBus.snapshot` reports every subscriber's current
+  depth, high-water mark and drop count (served on ``/api/health``).
+* **Drained, not abandoned.** Workers are started on demand from the running
+  loop and exit when their buffer empties; :meth:`EventBus.drain` waits for
+  every buffer to empty — including those of subscribers removed with events
+  still buffered — and is awaited before a run reports. Emitting with no
+  running loop delivers inline, so the mode is safe from synchronous code.
+
+The trade-off is read-your-writes: in async mode a buffered consumer's view (the
+store's rows) trails ``emit`` by its queue depth, so a caller needing the
+settled state awaits :meth:`EventBus.drain` first.
 """
 
 from __future__ import annotations
 
 import asyncio
+import collections
 import logging
-from collections.abc import Callable
-from dataclasses import dataclass
-from typing import Any
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
 
 from trading_bot.domain.fill import Fill
 from trading_bot.domain.order import Order
 
+if TYPE_CHECKING:
+    from trading_bot.application.log_events import LogPolicy
+
 __all__ = [
     "Event",
     "OrderEvent",
@@ -85,22 +138,70 @@ class FillEvent:
     fill: Fill
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, init=False)
 class LogEvent:
-    """A human-readable log line emitted by a use-case.
+    """A log line emitted by a use-case — structured, formatted lazily.
+
+    Producers pass a :meth:`str.format` template plus its ``fields`` rather than
+    a pre-built string; :attr:`message` renders it on first read (and caches
+    it), so an event nobody reads is never formatted. Without ``fields`` the
+    message is used verbatim (braces and all).
 
     Parameters
     ----------
     message : str
-        The log message.
+        The log message, or a :meth:`str.format` template when ``fields`` is
+        given. Stored as :attr:`template`.
     level : str, optional
         Severity, lower-case (``"info"`` by default, e.g. ``"warning"``,
         ``"error"``).
+    category : str, optional
+        The producer's category (``"strategy"``, ``"portfolio"``, ``"risk"``,
+        ...), the key for sampling and rate limits. Defaults to ``"general"``.
+    fields : Mapping or None, optional
+        The template's values. Kept as objects (a ``Decimal`` stays exact) for
+        structured consumers.
+
+    Examples
+    --------
+    >>> event = LogEvent("{name} bought {qty}", fields={"name": "ma", "qty": 2})
+    >>> event.message
+    'ma bought 2'
 
     """
 
-    message: str
-    level: str = "info"
+    template: str
+    level: str
+    category: str
+    fields: Mapping[str, Any] | None = field(hash=False)
+    _text: str | None = field(compare=False, repr=False, hash=False)
+
+    def __init__(
+        self,
+        message: str,
+        level: str = "info",
+        *,
+        category: str = "general",
+        fields: Mapping[str, Any] | None = None,
+    ) -> None:
+        object.__setattr__(self, "template", message)
+        object.__setattr__(self, "level", level)
+        object.__setattr__(self, "category", category)
+        object.__setattr__(self, "fields", fields or None)
+        object.__setattr__(self, "_text", None if fields else message)
+
+    @property
+    def message(self) -> str:
+        """The rendered text (formatted on first access, then cached)."""
+        text = self._text
+        if text is None:
+            fields = self.fields or {}
+            try:
+                text = self.template.format_map(fields)
+            except (KeyError, IndexError, ValueError):
+                text = f"{self.template} {dict(fields)!r}"
+            object.__setattr__(self, "_text", text)
+        return text
 
 
 #: The union of every event the bus carries.
@@ -110,14 +211,77 @@ Event = OrderEvent | FillEvent | LogEvent
 Handler = Callable[[Event], Any]
 
 
+#: How :meth:`EventBus.emit` delivers to subscribed handlers.
+Dispatch = Literal["sync", "async"]
+
+
+class _Subscription:
+    """One subscribed handler: its event-type filter and its async buffer."""
+
+    __slots__ = (
+        "handler",
+        "types",
+        "critical",
+        "inline",
+        "name",
+        "pending",
+        "task",
+        "high_water",
+        "dropped",
+        "overflowing",
+    )
+
+    def __init__(
+        self,
+        handler: Handler,
+        types: tuple[type, ...] | None,
+        critical: bool,
+        inline: bool,
+        name: str,
+    ) -> None:
+        self.handler = handler
+        self.types = types
+        self.critical = critical
+        self.inline = inline
+        self.name = name
+        # Async mode only: events awaiting the worker, head = being handled.
+        self.pending: collections.deque[Event] = collections.deque()
+        self.task: asyncio.Task[None] | None = None
+        self.high_water = 0
+        self.dropped = 0
+        self.overflowing = False
+
+    def wants(self, event_type: type) -> bool:
+        return self.types is None or issubclass(event_type, self.types)
+
+
 class EventBus:
     """Pub/sub bus fanning engine events to handlers and async queues.
 
     Use-cases :meth:`emit` :class:`OrderEvent` / :class:`FillEvent` /
-    :class:`LogEvent`. Consumers either register a synchronous :meth:`subscribe`
-    handler or, for async consumption, :meth:`add_queue` to get their own
-    :class:`asyncio.Queue` to drain. Every registered handler and queue receives
-    every event.
+    :class:`LogEvent`. Consumers either register a :meth:`subscribe` handler
+    (optionally filtered by event type) or, for async consumption,
+    :meth:`add_queue` to get their own :class:`asyncio.Queue` to drain. Every
+    registered queue, and every handler whose ``types`` match, receives every
+    event. See the module docstring for the sync/async dispatch modes.
+
+    Parameters
+    ----------
+    dispatch : {"sync", "async"}, optional
+        ``"sync"`` (default) calls handlers inside :meth:`emit`; ``"async"``
+        hands each subscriber's events to its own worker task.
+    maxsize : int, optional
+        Async mode: events a non-critical subscriber may have buffered before
+        new ones are dropped. Defaults to ``1024``. Must be at least ``1``.
+    log_policy : LogPolicy or None, optional
+        Per-category sampling / rate limits applied by :meth:`log`
+        (:class:`~trading_bot.application.log_events.LogPolicy`). ``None``
+        (default) lets every log through.
+
+    Raises
+    ------
+    ValueError
+        If ``dispatch`` is unknown or ``maxsize < 1``.
 
     Examples
     --------
@@ -130,40 +294,249 @@ class EventBus:
 
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        dispatch: Dispatch = "sync",
+        maxsize: int = 1024,
+        log_policy: LogPolicy | None = None,
+    ) -> None:
         """Start with no handlers and no queues."""
-        self._handlers: list[Handler] = []
+        if dispatch not in ("sync", "async"):
+            raise ValueError(f"dispatch must be 'sync' or 'async', got {dispatch!r}")
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self._async = dispatch == "async"
+        self._maxsize = maxsize
+        self.log_policy = log_policy
+        self._subscriptions: list[_Subscription] = []
+        # Async mode: unsubscribed subscriptions whose buffers still hold
+        # events — their workers keep delivering, and :meth:`drain` waits.
+        self._retired: list[_Subscription] = []
+        # ``type(event)`` → the subscriptions that want it, in subscribe order.
+        # Filled on first emit of each type; cleared on every (un)subscribe.
+        self._routes: dict[type, tuple[_Subscription, ...]] = {}
         # A *set* of queues so several async consumers (e.g. the position
         # tracker, a live UI) each receive every event; a single shared queue
         # would let one consumer steal events from the others.
         self._queues: set[asyncio.Queue[Event]] = set()
 
-    def subscribe(self, handler: Handler) -> None:
-        """Register a handler called synchronously for every emitted event."""
-        self._handlers.append(handler)
+    @property
+    def dispatch(self) -> Dispatch:
+        """The dispatch mode, ``"sync"`` or ``"async"``."""
+        return "async" if self._async else "sync"
+
+    def subscribe(
+        self,
+        handler: Handler,
+        *,
+        types: Iterable[type] | None = None,
+        critical: bool = False,
+        inline: bool = False,
+        name: str | None = None,
+    ) -> None:
+        """Register ``handler`` for every emitted event of the given ``types``.
+
+        Parameters
+        ----------
+        handler : Handler
+            Called with each matching event — inside :meth:`emit` in sync mode,
+            from the subscriber's worker task in async mode.
+        types : iterable of type or None, optional
+            The event classes to deliver (subclasses match). ``None`` (default)
+            delivers every event.
+        critical : bool, optional
+            Async mode: never drop an event for this subscriber, even past
+            ``maxsize``. Defaults to ``False``. Ignored in sync mode.
+        inline : bool, optional
+            Call the handler inside :meth:`emit` even in async mode, for state
+            the next pre-trade check reads. Defaults to ``False``.
+        name : str or None, optional
+            The label :meth:`snapshot` reports. Defaults to the handler's
+            qualified name.
+
+        """
+        label = name or getattr(handler, "__qualname__", None) or repr(handler)
+        self._subscriptions.append(
+            _Subscription(
+                handler,
+                None if types is None else tuple(types),
+                critical,
+                inline,
+                label,
+            )
+        )
+        self._routes.clear()
 
     def unsubscribe(self, handler: Handler) -> None:
-        """Remove a previously registered handler (no-op if not registered)."""
-        self._handlers = [h for h in self._handlers if h != handler]
+        """Remove a previously registered handler (no-op if not registered).
+
+        In async mode events already buffered for it are still delivered, and
+        :meth:`drain` waits for them.
+        """
+        kept: list[_Subscription] = []
+        for sub in self._subscriptions:
+            if sub.handler != handler:
+                kept.append(sub)
+            elif sub.pending:
+                self._retired.append(sub)
+        self._subscriptions = kept
+        self._routes.clear()
+
+    def wants(self, event_type: type) -> bool:
+        """Whether an event of ``event_type`` would reach any handler or queue.
+
+        The producer-side guard that makes unconsumed events (chiefly logs)
+        free: skip building the event when this is ``False``.
+        """
+        return bool(self._queues) or bool(self._route(event_type))
+
+    def log(
+        self,
+        template: str,
+        /,
+        *,
+        level: str = "info",
+        category: str = "general",
+        **fields: Any,
+    ) -> None:
+        """Emit a structured :class:`LogEvent` — if anyone listens and policy allows.
+
+        The producers' entry point for logs. Costs one route lookup when no
+        handler or queue takes :class:`LogEvent`; otherwise the
+        :attr:`log_policy` may sample or rate-limit it by ``category`` (warnings
+        and errors always pass). The template is only formatted when a consumer
+        reads :attr:`LogEvent.message`.
+
+        Parameters
+        ----------
+        template : str
+            A :meth:`str.format` template over ``fields`` (verbatim without).
+        level : str, optional
+            Severity. Defaults to ``"info"``.
+        category : str, optional
+            The sampling / rate-limit key. Defaults to ``"general"``.
+        **fields
+            The template's values.
+
+        """
+        if not self.wants(LogEvent):
+            return
+        policy = self.log_policy
+        if policy is not None and not policy.allow(category, level):
+            return
+        self.emit(LogEvent(template, level, category=category, fields=fields))
+
+    def _route(self, event_type: type) -> tuple[_Subscription, ...]:
+        """The subscriptions that want ``event_type`` (cached per type)."""
+        route = self._routes.get(event_type)
+        if route is None:
+            route = tuple(s for s in self._subscriptions if s.wants(event_type))
+            self._routes[event_type] = route
+        return route
 
     def emit(self, event: Event) -> None:
-        """Publish *event* to every handler and every registered queue.
+        """Publish *event* to every matching handler and every registered queue.
 
         Never blocks and never propagates: a handler that raises is logged and
         skipped (one bad subscriber must not break the rest), and a put onto a
-        full queue is dropped (a slow consumer must not stall the producer).
+        full queue is dropped (a slow consumer must not stall the producer). In
+        async mode the handlers are only scheduled — see :meth:`drain`.
         """
-        for handler in self._handlers:
-            try:
-                handler(event)
-            except Exception:
-                logger.exception("EventBus handler error")
+        route = self._route(type(event))
+        if self._async:
+            for sub in route:
+                if sub.inline:
+                    _deliver(sub, event)
+                else:
+                    self._enqueue(sub, event)
+        else:
+            for sub in route:
+                _deliver(sub, event)
         for queue in self._queues:
             try:
                 queue.put_nowait(event)
             except asyncio.QueueFull:
                 logger.warning("EventBus queue full; dropping event %r", event)
 
+    async def drain(self) -> None:
+        """Wait until every subscriber has handled every event emitted so far.
+
+        A no-op in sync mode (handlers already ran inside :meth:`emit`).
+        """
+        while True:
+            self._retired = [s for s in self._retired if s.pending]
+            busy = [s for s in (*self._subscriptions, *self._retired) if s.pending]
+            if not busy:
+                return
+            for sub in busy:
+                self._start(sub)
+            await asyncio.gather(*(s.task for s in busy if s.task is not None))
+
+    def snapshot(self) -> dict[str, object]:
+        """Dispatch mode plus per-subscriber and per-queue depth — a metrics view.
+
+        Each subscriber reports ``name``, ``types`` (class names, ``None`` for
+        all), ``critical``, ``inline``, the current ``depth``, the ``high_water`` depth and
+        the number of events ``dropped``. Depths are always ``0`` in sync mode.
+        """
+        return {
+            "dispatch": self.dispatch,
+            "maxsize": self._maxsize,
+            "subscribers": [
+                {
+                    "name": s.name,
+                    "types": None
+                    if s.types is None
+                    else [t.__name__ for t in s.types],
+                    "critical": s.critical,
+                    "inline": s.inline,
+                    "depth": len(s.pending),
+                    "high_water": s.high_water,
+                    "dropped": s.dropped,
+                }
+                for s in self._subscriptions
+            ],
+            "queues": [queue.qsize() for queue in self._queues],
+        }
+
+    def _enqueue(self, sub: _Subscription, event: Event) -> None:
+        """Async mode: buffer ``event`` for ``sub`` and make sure its worker runs."""
+        depth = len(sub.pending)
+        if depth >= self._maxsize:
+            if not sub.critical:
+                sub.dropped += 1
+                logger.warning(
+                    "EventBus subscriber %s full; dropping event %r", sub.name, event
+                )
+                return
+            if not sub.overflowing:
+                sub.overflowing = True
+                logger.warning(
+                    "EventBus critical subscriber %s is %d events behind; buffering",
+                    sub.name,
+                    depth,
+                )
+        elif sub.overflowing:
+            sub.overflowing = False
+        sub.pending.append(event)
+        sub.high_water = max(sub.high_water, depth + 1)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop to schedule a worker on: deliver inline, in order.
+            while sub.pending:
+                _deliver(sub, sub.pending.popleft())
+            return
+        self._start(sub)
+
+    @staticmethod
+    def _start(sub: _Subscription) -> None:
+        """Start ``sub``'s worker on the running loop unless it is already live."""
+        loop = asyncio.get_running_loop()
+        if sub.task is None or sub.task.done() or sub.task.get_loop() is not loop:
+            sub.task = loop.create_task(_work(sub), name=f"event-bus:{sub.name}")
+
     def add_queue(self, maxsize: int = 1000) -> asyncio.Queue[Event]:
         """Register and return a fresh queue that receives every event.
 
@@ -187,3 +560,24 @@ class EventBus:
     def remove_queue(self, queue: asyncio.Queue[Event]) -> None:
         """Unregister a queue (no-op if it was not registered)."""
         self._queues.discard(queue)
+
+
+def _deliver(sub: _Subscription, event: Event) -> None:
+    """Call ``sub``'s handler with ``event``, logging (not raising) a failure."""
+    try:
+        sub.handler(event)
+    except Exception:
+        logger.exception("EventBus handler error in %s", sub.name)
+
+
+async def _work(sub: _Subscription) -> None:
+    """An async-mode worker: handle ``sub``'s buffer in order until it is empty.
+
+    The head stays in the buffer while its handler runs, so the reported depth
+    counts it. Yields to the loop between events so a deep backlog does not
+    starve the producer.
+    """
+    while sub.pending:
+        _deliver(sub, sub.pending[0])
+        sub.pending.popleft()
+        await asyncio.sleep(0)
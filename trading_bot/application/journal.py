@@ -0,0 +1,745 @@
+"""Record-and-replay **journal** of a run's external inputs.
+
+A recording run writes every input the engine did not compute itself to a
+compact binary journal — the bar windows dccd returned, the venue's HTTP
+responses, the WebSocket frames and the clock readings. A replay run feeds that
+journal back through the **same** :func:`~trading_bot.application.run_app.
+prepare_system` wiring, with no venue, no dccd store and no real waits, so a
+production incident reproduces bit-for-bit and an engine change can be
+benchmarked against real traffic.
+
+Seams, not mocks (carried into the ADR)
+---------------------------------------
+Nothing here patches the engine. Every input already crosses an injectable seam,
+and the journal supplies a recording or a replaying implementation of each:
+
+=====================  ===========================  ==========================
+seam                   recording                    replay
+=====================  ===========================  ==========================
+``dccd_client``        :class:`RecordingDccdClient`  :class:`ReplayDccdClient`
+broker ``http``        :class:`RecordingHTTPClient`  :class:`ReplayHTTPClient`
+WS ``connect``         :func:`recording_connect`     :func:`replay_connect`
+``PaperBroker`` clock  :class:`RecordingClock`       :class:`VirtualClock`
+=====================  ===========================  ==========================
+
+:func:`record_app` / :func:`replay_app` wire the first, second and fourth through
+:func:`~trading_bot.application.run_app.run_app` (the WS connector is exposed for
+the private-stream adapters, which take ``connect`` directly).
+
+Format (carried into the ADR)
+-----------------------------
+The file starts with :data:`MAGIC`, then a flat sequence of records, each a
+5-byte header — kind (``u8``) and payload length (big-endian ``u32``) — and the
+payload. Kinds are independent streams: replay consumes each kind in its own
+recorded order, so interleaving across kinds (e.g. a clock reading vs. a bar read)
+need not repeat exactly.
+
+* **bars** — a JSON call header (the ``read`` arguments plus ``base``, the number
+  of rows reused from the previous read of the same dataset) followed by the
+  *new* rows only, as Arrow IPC. A live poll that surfaces one new bar therefore
+  records one row, not the whole growing window.
+* **clock** — one big-endian ``i64``.
+* **http** — JSON: the request's method and URL and either its parsed JSON
+  result or the exception it raised. ``HTTPError`` and
+  ``AmbiguousRequestError`` keep their fields (so the ambiguity semantics
+  replay faithfully); any other transport failure keeps its class and message
+  and is raised again as that class.
+* **ws** — a ``u8`` tag (connect / text / bytes) and the frame.
+
+Divergence
+----------
+Replay is strict where it matters: a bar read or an HTTP call that does not match
+the next recorded one raises :class:`JournalError` — the engine under test
+asked for something the recording never saw, which is exactly what a regression
+run must surface. The clock is lenient: once its readings run out it keeps
+advancing one millisecond per call, so an engine that reads the clock a little
+more often still replays. Recording does not change the clock either: unless
+given another source, :class:`RecordingClock` reads the same deterministic
+clock the paper broker uses by default, so a recorded run equals an unrecorded
+one.
+
+This module is part of the application layer. Its only I/O is the journal file
+(and, while recording, whatever the wrapped seams do).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import importlib
+import io
+import json
+import os
+import struct
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+import polars as pl
+
+from trading_bot.brokers.paper import deterministic_clock
+from trading_bot.domain.errors import TradingBotError
+from trading_bot.transport.http import (
+    AmbiguousRequestError,
+    AsyncHTTPClient,
+    HTTPError,
+)
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from trading_bot.application.config import AppConfig
+    from trading_bot.application.data_provider import DccdClient
+    from trading_bot.application.run_app import RunReport
+
+__all__ = [
+    "MAGIC",
+    "JournalError",
+    "JournalWriter",
+    "JournalReader",
+    "RecordingDccdClient",
+    "ReplayDccdClient",
+    "RecordingClock",
+    "VirtualClock",
+    "RecordingHTTPClient",
+    "ReplayHTTPClient",
+    "recording_connect",
+    "replay_connect",
+    "record_app",
+    "replay_app",
+]
+
+#: The journal file signature (format version 1).
+MAGIC = b"TBJ\x01"
+
+_HEADER = struct.Struct(">BI")
+_I64 = struct.Struct(">q")
+_U32 = struct.Struct(">I")
+
+_KIND_BARS = 1
+_KIND_CLOCK = 2
+_KIND_HTTP = 3
+_KIND_WS = 4
+
+_WS_CONNECT = 0
+_WS_TEXT = 1
+_WS_BYTES = 2
+
+
+class JournalError(TradingBotError):
+    """A journal is malformed, exhausted, or diverges from the replayed run.
+
+    Raised on a bad signature or a truncated record, and during replay when the
+    engine asks for a bar read or HTTP call the recording does not have next.
+    """
+
+
+# --- file I/O --------------------------------------------------------------- #
+
+
+class JournalWriter:
+    """Append framed records to a journal file (created/truncated on open).
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The journal file to write.
+
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self._fh = open(path, "wb")  # noqa: SIM115 - closed by close()/__exit__
+        self._fh.write(MAGIC)
+        self._records = 0
+
+    @property
+    def records(self) -> int:
+        """Number of records written so far."""
+        return self._records
+
+    def write(self, kind: int, payload: bytes) -> None:
+        """Append one ``kind`` record carrying ``payload``."""
+        self._fh.write(_HEADER.pack(kind, len(payload)))
+        self._fh.write(payload)
+        self._records += 1
+
+    def record_clock(self, value: int) -> None:
+        """Append a clock reading."""
+        self.write(_KIND_CLOCK, _I64.pack(value))
+
+    def record_bars(self, call: Mapping[str, Any], base: int, rows: pl.DataFrame) -> None:
+        """Append a bar read: its call header, reused-row count and new rows."""
+        head = json.dumps({**call, "base": base}, sort_keys=True).encode()
+        buf = io.BytesIO()
+        rows.write_ipc(buf)
+        self.write(_KIND_BARS, _U32.pack(len(head)) + head + buf.getvalue())
+
+    def record_http(self, entry: Mapping[str, Any]) -> None:
+        """Append an HTTP exchange (request identity + result or error)."""
+        self.write(_KIND_HTTP, json.dumps(entry).encode())
+
+    def record_ws(self, tag: int, frame: str | bytes = b"") -> None:
+        """Append a WebSocket connect marker or inbound frame."""
+        data = frame.encode() if isinstance(frame, str) else frame
+        self.write(_KIND_WS, bytes([tag]) + data)
+
+    def flush(self) -> None:
+        """Flush buffered records to the OS."""
+        self._fh.flush()
+
+    def close(self) -> None:
+        """Flush and close the file. Idempotent."""
+        if not self._fh.closed:
+            self._fh.close()
+
+    def __enter__(self) -> JournalWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class JournalReader:
+    """Load a journal and hand out its records one kind-stream at a time.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The journal file to read (loaded whole on construction).
+
+    Raises
+    ------
+    JournalError
+        If the signature is wrong or a record is truncated.
+
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        with open(path, "rb") as fh:
+            data = fh.read()
+        if not data.startswith(MAGIC):
+            raise JournalError(f"{os.fspath(path)!r} is not a trading_bot journal")
+        self._streams: dict[int, deque[bytes]] = {}
+        offset = len(MAGIC)
+        while offset < len(data):
+            if offset + _HEADER.size > len(data):
+                raise JournalError(f"truncated record header at byte {offset}")
+            kind, length = _HEADER.unpack_from(data, offset)
+            offset += _HEADER.size
+            if offset + length > len(data):
+                raise JournalError(f"truncated record payload at byte {offset}")
+            self._streams.setdefault(kind, deque()).append(data[offset : offset + length])
+            offset += length
+
+    def remaining(self, kind: int) -> int:
+        """Records of ``kind`` not yet consumed."""
+        return len(self._streams.get(kind, ()))
+
+    def next(self, kind: int) -> bytes | None:
+        """Pop the next ``kind`` record's payload, or ``None`` if exhausted."""
+        stream = self._streams.get(kind)
+        return stream.popleft() if stream else None
+
+    def next_clock(self) -> int | None:
+        """The next clock reading, or ``None`` if exhausted."""
+        payload = self.next(_KIND_CLOCK)
+        return None if payload is None else int(_I64.unpack(payload)[0])
+
+    def next_bars(self) -> tuple[dict[str, Any], pl.DataFrame]:
+        """The next bar read's call header (with ``base``) and its new rows."""
+        payload = self.next(_KIND_BARS)
+        if payload is None:
+            raise JournalError("journal exhausted: no more recorded bar reads")
+        (head_len,) = _U32.unpack_from(payload)
+        head = json.loads(payload[_U32.size : _U32.size + head_len])
+        rows = pl.read_ipc(io.BytesIO(payload[_U32.size + head_len :]))
+        return head, rows
+
+    def next_http(self) -> dict[str, Any]:
+        """The next recorded HTTP exchange."""
+        payload = self.next(_KIND_HTTP)
+        if payload is None:
+            raise JournalError("journal exhausted: no more recorded HTTP responses")
+        entry: dict[str, Any] = json.loads(payload)
+        return entry
+
+    def next_ws(self) -> tuple[int, bytes] | None:
+        """The next WS ``(tag, data)`` record, or ``None`` if exhausted."""
+        payload = self.next(_KIND_WS)
+        return None if payload is None else (payload[0], payload[1:])
+
+    def peek_ws_tag(self) -> int | None:
+        """The tag of the next WS record without consuming it."""
+        stream = self._streams.get(_KIND_WS)
+        return stream[0][0] if stream else None
+
+
+# --- bars (dccd client) ----------------------------------------------------- #
+
+
+def _bars_call(
+    exchange: str,
+    symbol: str,
+    data_type: str,
+    span: int | None,
+    start_ns: int | None,
+    end_ns: int | None,
+) -> dict[str, Any]:
+    return {
+        "exchange": exchange,
+        "symbol": symbol,
+        "data_type": data_type,
+        "span": span,
+        "start_ns": start_ns,
+        "end_ns": end_ns,
+    }
+
+
+def _dataset_key(call: Mapping[str, Any]) -> tuple[Any, ...]:
+    """The dataset a read targets — the delta base is per dataset, not per bound."""
+    return (call["exchange"], call["symbol"], call["data_type"], call["span"])
+
+
+class RecordingDccdClient:
+    """A dccd client wrapper that journals every ``read`` as a row delta.
+
+    Each read is forwarded to ``inner``; when the result extends the previous
+    read of the same dataset (the common case — a live poll appends closed bars),
+    only the appended rows are written, otherwise the whole frame is.
+    ``backfill`` is forwarded and not journalled (it produces no engine input).
+
+    Parameters
+    ----------
+    inner : DccdClient
+        The real (or fake) client to read through.
+    journal : JournalWriter
+        Where reads are recorded.
+
+    """
+
+    def __init__(self, inner: DccdClient, journal: JournalWriter) -> None:
+        self._inner = inner
+        self._journal = journal
+        self._last: dict[tuple[Any, ...], pl.DataFrame] = {}
+
+    def read(
+        self,
+        exchange: str,
+        symbol: str,
+        data_type: str = "ohlc",
+        span: int | None = None,
+        start_ns: int | None = None,
+        end_ns: int | None = None,
+    ) -> pl.DataFrame:
+        """Read through ``inner`` and journal the delta against the last read."""
+        frame = self._inner.read(exchange, symbol, data_type, span, start_ns, end_ns)
+        call = _bars_call(exchange, symbol, data_type, span, start_ns, end_ns)
+        key = _dataset_key(call)
+        prev = self._last.get(key)
+        base = 0
+        if (
+            prev is not None
+            and prev.height <= frame.height
+            and prev.schema == frame.schema
+            and frame.head(prev.height).equals(prev)
+        ):
+            base = prev.height
+        self._journal.record_bars(call, base, frame.slice(base))
+        self._last[key] = frame
+        return frame
+
+    def backfill(self, *args: Any, **kwargs: Any) -> Any:
+        """Forward to ``inner`` (collection is not an engine input)."""
+        return self._inner.backfill(*args, **kwargs)
+
+
+class ReplayDccdClient:
+    """A dccd client that serves the bar reads a journal recorded, in order.
+
+    Parameters
+    ----------
+    journal : JournalReader
+        The recording to replay.
+
+    Raises
+    ------
+    JournalError
+        From :meth:`read` when the call differs from the next recorded read, or
+        the recording has no more reads.
+
+    """
+
+    def __init__(self, journal: JournalReader) -> None:
+        self._journal = journal
+        self._last: dict[tuple[Any, ...], pl.DataFrame] = {}
+
+    def read(
+        self,
+        exchange: str,
+        symbol: str,
+        data_type: str = "ohlc",
+        span: int | None = None,
+        start_ns: int | None = None,
+        end_ns: int | None = None,
+    ) -> pl.DataFrame:
+        """Rebuild and return the next recorded frame (checking the call matches)."""
+        call = _bars_call(exchange, symbol, data_type, span, start_ns, end_ns)
+        head, rows = self._journal.next_bars()
+        base = head.pop("base")
+        if head != call:
+            raise JournalError(
+                f"replay diverged: engine read {call!r}, journal recorded {head!r}"
+            )
+        key = _dataset_key(call)
+        frame = rows
+        if base:
+            prev = self._last[key]
+            frame = pl.concat([prev.head(base), rows]) if rows.height else prev.head(base)
+        self._last[key] = frame
+        return frame
+
+    def backfill(self, *args: Any, **kwargs: Any) -> None:
+        """No-op: a replay never collects."""
+        return None
+
+
+# --- clock ------------------------------------------------------------------ #
+
+
+class RecordingClock:
+    """A clock callable that journals every reading it returns.
+
+    Parameters
+    ----------
+    journal : JournalWriter
+        Where readings are recorded.
+    source : Callable[[], int] or None, optional
+        The clock being recorded, in milliseconds. ``None`` (default) records
+        the :class:`~trading_bot.brokers.paper.PaperBroker`'s own deterministic
+        clock, so recording does not change the run.
+
+    """
+
+    def __init__(
+        self, journal: JournalWriter, source: Callable[[], int] | None = None
+    ) -> None:
+        self._journal = journal
+        self._source = deterministic_clock() if source is None else source
+
+    def __call__(self) -> int:
+        value = self._source()
+        self._journal.record_clock(value)
+        return value
+
+
+class VirtualClock:
+    """A clock callable that replays recorded readings, then keeps ticking.
+
+    Returns each recorded reading in order; once they run out it advances one
+    unit per call from the last one, so a replay never stalls on the clock.
+
+    Parameters
+    ----------
+    journal : JournalReader
+        The recording to replay.
+
+    """
+
+    def __init__(self, journal: JournalReader) -> None:
+        self._journal = journal
+        self._last = 0
+
+    def __call__(self) -> int:
+        value = self._journal.next_clock()
+        self._last = value if value is not None else self._last + 1
+        return self._last
+
+
+# --- HTTP ------------------------------------------------------------------- #
+
+
+def _error_entry(exc: Exception) -> dict[str, Any]:
+    if isinstance(exc, AmbiguousRequestError):
+        return {"type": "AmbiguousRequestError", "url": exc.url, "reason": exc.reason}
+    if isinstance(exc, HTTPError):
+        return {"type": "HTTPError", "status": exc.status, "url": exc.url, "body": exc.body}
+    cls = type(exc)
+    return {"type": cls.__qualname__, "module": cls.__module__, "message": str(exc)}
+
+
+def _raise_entry(error: Mapping[str, Any]) -> None:
+    if error["type"] == "AmbiguousRequestError":
+        raise AmbiguousRequestError(error["url"], error["reason"])
+    if error["type"] == "HTTPError":
+        raise HTTPError(error["status"], error["url"], error["body"])
+    # Any other transport failure: raise the recorded class again if it can be
+    # rebuilt from its message, so the engine takes the same error path.
+    cls: Any = None
+    with contextlib.suppress(ImportError, AttributeError):
+        cls = importlib.import_module(error.get("module", "builtins"))
+        for name in error["type"].split("."):
+            cls = getattr(cls, name)
+    exc: Any = None
+    if isinstance(cls, type) and issubclass(cls, Exception):
+        with contextlib.suppress(Exception):
+            exc = cls(error["message"])
+    if exc is None:
+        raise JournalError(
+            f"recorded transport failure: {error['type']}: {error['message']}"
+        )
+    raise exc
+
+
+class RecordingHTTPClient(AsyncHTTPClient):
+    """An :class:`~trading_bot.transport.http.AsyncHTTPClient` that journals responses.
+
+    Behaves exactly like the client it extends (retries, limiter, ambiguity) and
+    records each request's final outcome — the parsed JSON result, or whatever
+    exception it raised (a cancellation is not an outcome). Request bodies are not
+    recorded (they carry signatures and nonces); method and URL identify the call.
+
+    Parameters
+    ----------
+    journal : JournalWriter
+        Where exchanges are recorded.
+    **kwargs
+        Forwarded to :class:`~trading_bot.transport.http.AsyncHTTPClient`.
+
+    """
+
+    def __init__(self, journal: JournalWriter, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._journal = journal
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> Any:
+        entry: dict[str, Any] = {"method": method, "url": url}
+        try:
+            result = await super()._request(method, url, **kwargs)
+        except Exception as exc:  # noqa: BLE001 - recorded, then re-raised
+            entry["error"] = _error_entry(exc)
+            self._journal.record_http(entry)
+            raise
+        entry["result"] = result
+        self._journal.record_http(entry)
+        return result
+
+
+class ReplayHTTPClient(AsyncHTTPClient):
+    """An :class:`~trading_bot.transport.http.AsyncHTTPClient` that replays a journal.
+
+    Opens no connection and waits on no limiter: each request returns (or
+    raises) the next recorded outcome, after checking its method and URL match.
+
+    Parameters
+    ----------
+    journal : JournalReader
+        The recording to replay.
+
+    Raises
+    ------
+    JournalError
+        From a request that differs from the next recorded one, or when the
+        recording has no more responses.
+
+    """
+
+    def __init__(self, journal: JournalReader) -> None:
+        super().__init__()
+        self._journal = journal
+
+    async def __aenter__(self) -> ReplayHTTPClient:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> Any:
+        entry = self._journal.next_http()
+        if (entry["method"], entry["url"]) != (method, url):
+            raise JournalError(
+                f"replay diverged: engine sent {method} {url}, journal recorded "
+                f"{entry['method']} {entry['url']}"
+            )
+        if "error" in entry:
+            _raise_entry(entry["error"])
+        return entry["result"]
+
+
+# --- WebSocket -------------------------------------------------------------- #
+
+
+class _RecordingConnection:
+    def __init__(self, ws: Any, journal: JournalWriter) -> None:
+        self._ws = ws
+        self._journal = journal
+
+    async def send(self, message: Any) -> None:
+        await self._ws.send(message)
+
+    async def __aiter__(self) -> AsyncIterator[str | bytes]:
+        async for raw in self._ws:
+            tag = _WS_TEXT if isinstance(raw, str) else _WS_BYTES
+            self._journal.record_ws(tag, raw)
+            yield raw
+
+
+def recording_connect(
+    journal: JournalWriter, connect: Callable[[str], Any] | None = None
+) -> Callable[[str], Any]:
+    """Wrap a ``websockets.connect``-style connector so inbound frames are journalled.
+
+    Each (re)connect writes a marker, so a replay reproduces the reconnect
+    boundaries (and the ``on_connect`` resubscription / reconcile they trigger).
+
+    Parameters
+    ----------
+    journal : JournalWriter
+        Where frames are recorded.
+    connect : Callable[[str], Any] or None, optional
+        The connector to wrap. ``None`` uses the real ``websockets`` one.
+
+    """
+    if connect is None:
+        from trading_bot.transport.ws import _default_connect
+
+        connect = _default_connect
+    inner = connect
+
+    @asynccontextmanager
+    async def _connect(url: str) -> AsyncIterator[_RecordingConnection]:
+        async with inner(url) as ws:
+            journal.record_ws(_WS_CONNECT, url)
+            yield _RecordingConnection(ws, journal)
+
+    return _connect
+
+
+class _ReplayConnection:
+    def __init__(self, journal: JournalReader) -> None:
+        self._journal = journal
+
+    async def send(self, message: Any) -> None:
+        return None
+
+    async def __aiter__(self) -> AsyncIterator[str | bytes]:
+        while self._journal.peek_ws_tag() not in (None, _WS_CONNECT):
+            record = self._journal.next_ws()
+            assert record is not None
+            tag, data = record
+            yield data.decode() if tag == _WS_TEXT else data
+            await asyncio.sleep(0)
+
+
+def replay_connect(journal: JournalReader) -> Callable[[str], Any]:
+    """A connector that replays the journal's WS sessions, one per connect.
+
+    Each connect consumes one recorded connect marker and yields that session's
+    frames; the session ends where the recording reconnected. Once the recording
+    is exhausted, connecting raises :class:`JournalError` (the stream's consumer
+    should stop it then).
+    """
+
+    @asynccontextmanager
+    async def _connect(url: str) -> AsyncIterator[_ReplayConnection]:
+        record = journal.next_ws()
+        if record is None:
+            raise JournalError("journal exhausted: no more recorded WS sessions")
+        if record[0] != _WS_CONNECT:
+            raise JournalError("malformed WS stream: frame outside a session")
+        yield _ReplayConnection(journal)
+
+    return _connect
+
+
+# --- whole-run helpers ------------------------------------------------------ #
+
+
+async def record_app(
+    config: AppConfig,
+    path: str | os.PathLike[str],
+    *,
+    dccd_client: DccdClient | None = None,
+    max_steps: int | None = None,
+    reconcile_on_start: bool = True,
+    http_factory: Callable[[JournalWriter], AsyncHTTPClient] | None = None,
+) -> RunReport:
+    """Run ``config`` through :func:`~trading_bot.application.run_app.run_app`, journalling.
+
+    Bars, clock readings and (for a venue broker) HTTP responses are written to
+    ``path``. ``dccd_client`` is required unless a real dccd is installed (the
+    recorder wraps whatever client the run would have used).
+
+    Parameters
+    ----------
+    config : AppConfig
+        The system to run.
+    path : str or os.PathLike
+        The journal file to write.
+    dccd_client : DccdClient or None, optional
+        The client to read bars through. ``None`` builds the real dccd client.
+    max_steps, reconcile_on_start
+        As for :func:`~trading_bot.application.run_app.run_app`.
+    http_factory : Callable[[JournalWriter], AsyncHTTPClient] or None, optional
+        Builds the venue broker's recording HTTP client. ``None`` uses a
+        :class:`RecordingHTTPClient` with default settings.
+
+    Returns
+    -------
+    RunReport
+        The recorded run's report.
+
+    """
+    from trading_bot.application.run_app import run_app
+
+    if dccd_client is None:
+        from trading_bot.application.data_provider import _make_client
+
+        dccd_client = _make_client(config.storage.data_path)
+    with JournalWriter(path) as journal:
+        http = (
+            http_factory(journal)
+            if http_factory is not None
+            else RecordingHTTPClient(journal)
+        )
+        return await run_app(
+            config,
+            dccd_client=RecordingDccdClient(dccd_client, journal),
+            max_steps=max_steps,
+            reconcile_on_start=reconcile_on_start,
+            http=http,
+            clock=RecordingClock(journal),
+        )
+
+
+async def replay_app(
+    config: AppConfig,
+    path: str | os.PathLike[str],
+    *,
+    max_steps: int | None = None,
+    reconcile_on_start: bool = True,
+) -> RunReport:
+    """Replay a :func:`record_app` journal through the same ``run_app`` wiring.
+
+    No venue, no dccd store, no waits: bars, HTTP responses and clock readings all
+    come from ``path``. Pass the ``config`` (and ``max_steps`` /
+    ``reconcile_on_start``) the recording ran with; a changed engine that asks for
+    different inputs raises :class:`JournalError`.
+    """
+    from trading_bot.application.run_app import run_app
+
+    journal = JournalReader(path)
+    return await run_app(
+        config,
+        dccd_client=ReplayDccdClient(journal),
+        max_steps=max_steps,
+        reconcile_on_start=reconcile_on_start,
+        http=ReplayHTTPClient(journal),
+        clock=VirtualClock(journal),
+    )
+
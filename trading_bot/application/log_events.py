@@ -0,0 +1,246 @@
+"""Structured log events — sampling, rate limits and an in-memory ring sink.
+
+The runners log one :class:`~trading_bot.application.events.LogEvent` per step
+and per rebalance leg; a 200-leg rebalance used to build 200 f-strings and fan
+them out whether or not anybody was listening. Logging now goes through
+:meth:`EventBus.log <trading_bot.application.events.EventBus.log>`, and this
+module holds the two pieces around it.
+
+Cost model (carried into the ADR)
+---------------------------------
+* **Nobody listening → one dict lookup.** ``EventBus.log`` first asks the bus
+  whether any handler or queue takes ``LogEvent``; if not, it returns before a
+  single object is built.
+* **Listening → no string formatting on the hot path.** The event carries the
+  template and its field objects; the text is rendered on the first read of
+  :attr:`~trading_bot.application.events.LogEvent.message`, by the consumer.
+* **Chatty categories are thinned at the source.** A :class:`LogPolicy` samples
+  (keeps a fraction) and rate-limits (token bucket, events per second) each
+  category before the event is built. Only ``debug`` / ``info`` are subject to
+  it: a warning or an error is never sampled away.
+
+The dashboard reads logs from a :class:`LogRing`: a bounded in-memory sink that
+keeps the last ``capacity`` events under increasing sequence numbers and serves
+them newest-first, one page at a time (``/api/logs``).
+"""
+
+from __future__ import annotations
+
+import collections
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from trading_bot.application.events import LogEvent
+
+if TYPE_CHECKING:
+    from trading_bot.application.events import Event, EventBus
+
+__all__ = ["LogPolicy", "LogRecord", "LogRing"]
+
+#: Levels a :class:`LogPolicy` may drop; anything else always passes.
+_THROTTLED_LEVELS = frozenset({"debug", "info"})
+
+
+class LogPolicy:
+    """Per-category sampling and rate limits for ``debug`` / ``info`` logs.
+
+    A category absent from both maps falls back to its ``"*"`` entry, if any,
+    and is otherwise unlimited.
+
+    Parameters
+    ----------
+    sample : Mapping[str, float] or None, optional
+        Fraction of each category's events to keep, in ``[0, 1]``. Sampling is
+        deterministic (an accumulator, not a random draw): ``0.25`` keeps
+        exactly every fourth event.
+    rate : Mapping[str, float] or None, optional
+        Sustained events per second each category may emit (a token bucket,
+        starting full).
+    burst : float or None, optional
+        Bucket size. Defaults to ``max(1, rate)`` — one second's worth.
+    clock : Callable[[], float], optional
+        Monotonic seconds. Defaults to :func:`time.monotonic`.
+
+    Raises
+    ------
+    ValueError
+        If a sample fraction is outside ``[0, 1]`` or a rate is negative.
+
+    Examples
+    --------
+    >>> policy = LogPolicy(sample={"portfolio": 0.5})
+    >>> [policy.allow("portfolio", "info") for _ in range(4)]
+    [False, True, False, True]
+    >>> policy.allow("portfolio", "warning")
+    True
+
+    """
+
+    def __init__(
+        self,
+        *,
+        sample: Mapping[str, float] | None = None,
+        rate: Mapping[str, float] | None = None,
+        burst: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        for category, fraction in (sample or {}).items():
+            if not 0.0 <= fraction <= 1.0:
+                raise ValueError(
+                    f"sample for {category!r} must be within [0, 1], got {fraction}"
+                )
+        for category, per_second in (rate or {}).items():
+            if per_second < 0:
+                raise ValueError(
+                    f"rate for {category!r} must be non-negative, got {per_second}"
+                )
+        self._sample = dict(sample or {})
+        self._rate = dict(rate or {})
+        self._burst = burst
+        self._clock = clock
+        self._carry: dict[str, float] = {}
+        # category → (tokens, last refill time)
+        self._buckets: dict[str, tuple[float, float]] = {}
+        #: Events dropped so far, per category.
+        self.suppressed: collections.Counter[str] = collections.Counter()
+
+    def allow(self, category: str, level: str) -> bool:
+        """Whether to emit one ``level`` event of ``category`` (and count it)."""
+        if level not in _THROTTLED_LEVELS:
+            return True
+        if self._sampled_out(category) or self._rate_limited(category):
+            self.suppressed[category] += 1
+            return False
+        return True
+
+    def _sampled_out(self, category: str) -> bool:
+        fraction = self._sample.get(category, self._sample.get("*"))
+        if fraction is None or fraction >= 1.0:
+            return False
+        carry = self._carry.get(category, 0.0) + fraction
+        if carry >= 1.0:
+            self._carry[category] = carry - 1.0
+            return False
+        self._carry[category] = carry
+        return True
+
+    def _rate_limited(self, category: str) -> bool:
+        per_second = self._rate.get(category, self._rate.get("*"))
+        if per_second is None:
+            return False
+        size = self._burst if self._burst is not None else max(1.0, per_second)
+        now = self._clock()
+        tokens, last = self._buckets.get(category, (size, now))
+        tokens = min(size, tokens + (now - last) * per_second)
+        if tokens < 1.0:
+            self._buckets[category] = (tokens, now)
+            return True
+        self._buckets[category] = (tokens - 1.0, now)
+        return False
+
+
+@dataclass(frozen=True, slots=True)
+class LogRecord:
+    """One log line as the ring serves it.
+
+    Parameters
+    ----------
+    seq : int
+        The ring's sequence number (increasing; the paging cursor).
+    ts_ns : int
+        Wall-clock time (ns UTC) the ring received it.
+    level : str
+        Severity.
+    category : str
+        The producer's category.
+    message : str
+        The rendered text.
+
+    """
+
+    seq: int
+    ts_ns: int
+    level: str
+    category: str
+    message: str
+
+
+class LogRing:
+    """A bounded, pageable in-memory sink for the bus's log events.
+
+    Subscribes to :class:`~trading_bot.application.events.LogEvent` only and
+    keeps the last ``capacity`` of them. Events are stored unrendered; a page
+    renders just the lines it returns.
+
+    Parameters
+    ----------
+    event_bus : EventBus
+        The bus to subscribe to.
+    capacity : int, optional
+        Events kept. Defaults to ``1000``. Must be at least ``1``.
+
+    Raises
+    ------
+    ValueError
+        If ``capacity < 1``.
+
+    """
+
+    def __init__(self, event_bus: EventBus, *, capacity: int = 1000) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        self._ring: collections.deque[tuple[int, int, LogEvent]] = collections.deque(
+            maxlen=capacity
+        )
+        self._seq = 0
+        event_bus.subscribe(self._on_event, types=(LogEvent,), name="LogRing")
+
+    def __len__(self) -> int:
+        return len(self._ring)
+
+    @property
+    def head(self) -> int:
+        """The newest sequence number (``0`` before any log)."""
+        return self._seq
+
+    def _on_event(self, event: Event) -> None:
+        self._seq += 1
+        self._ring.append((self._seq, time.time_ns(), event))  # type: ignore[arg-type]
+
+    def page(
+        self,
+        *,
+        before: int | None = None,
+        limit: int = 100,
+        level: str | None = None,
+        category: str | None = None,
+    ) -> list[LogRecord]:
+        """The newest ``limit`` records older than ``before``, newest first.
+
+        Parameters
+        ----------
+        before : int or None, optional
+            Only records with ``seq < before`` (the previous page's last
+            ``seq``). ``None`` (default) starts at the newest.
+        limit : int, optional
+            Page size. Defaults to ``100``.
+        level, category : str or None, optional
+            Only records with this level / category.
+
+        """
+        out: list[LogRecord] = []
+        for seq, ts_ns, event in reversed(self._ring):
+            if len(out) >= limit:
+                break
+            if before is not None and seq >= before:
+                continue
+            if level is not None and event.level != level:
+                continue
+            if category is not None and event.category != category:
+                continue
+            out.append(
+                LogRecord(seq, ts_ns, event.level, event.category, event.message)
+            )
+        return out
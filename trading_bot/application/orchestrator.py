@@ -78,7 +78,7 @@ import asyncio
 import signal
 from typing import TYPE_CHECKING
 
-from trading_bot.application.events import EventBus, LogEvent
+from trading_bot.application.events import EventBus
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -306,4 +306,4 @@ class Orchestrator:
     def _emit(self, message: str, *, level: str = "info") -> None:
         """Emit a :class:`LogEvent` on the bus if one was provided."""
         if self._bus is not None:
-            self._bus.emit(LogEvent(message=message, level=level))
+            self._bus.log(message, level=level, category="orchestrator")
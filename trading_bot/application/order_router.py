@@ -9,7 +9,8 @@ It does three things and no more:
   broker order, never a duplicate venue order;
 * **drives the order's state machine** from the broker's response
   (``NEW -> SUBMITTED -> OPEN``, or ``-> REJECTED`` on a broker/order failure);
-* **cancels** a tracked order on the venue and transitions it.
+* **cancels** a tracked order on the venue and transitions it, or **amends**
+  (reprices/resizes) it in place where the venue supports that.
 
 It speaks **domain types only** and never touches money as ``float`` (orders and
 events carry :class:`~decimal.Decimal` throughout). Every broker operation is
@@ -43,9 +44,78 @@ is removed once settled. Because asyncio is single-threaded and the
 install-or-find check runs synchronously (no ``await`` between the lookup and the
 install), exactly one coroutine ever reaches the broker per id.
 
+Batched submission (carried into the ADR)
+-----------------------------------------
+:meth:`OrderRouter.submit_many` submits a batch of legs (a portfolio rebalance)
+**concurrently**, at most ``parallelism`` in flight. Each leg goes through
+:meth:`OrderRouter.submit` unchanged, so per-id idempotency, the in-flight guard
+and the risk gate hold leg by leg; a leg that raises is captured in its result
+slot instead of aborting the batch. The venue's own pacing stays where it is — in
+the broker's HTTP client's rate limiter (and Kraken's call counter) — so the
+parallelism bounds how many legs *wait* on it, never how fast the venue is hit.
+The :data:`SubmitOrdering` policy decides the sequencing: ``"given"`` starts legs
+in input order, ``"sells_first"`` settles every sell before the first buy starts
+(freeing the quote balance the buys spend).
+
+With a risk manager, the whole batch first goes through
+:meth:`~trading_bot.application.risk.RiskManager.check_batch` in that same
+sequence. That is the book-level gate: gross and net notional over the book the
+legs produce together. A leg it refuses is never submitted and gets its breach
+as its result. Each remaining leg is still checked again by :meth:`submit`
+against the book at its own submit time.
+
+Native batches (carried into the ADR)
+-------------------------------------
+When the broker declares :attr:`~trading_bot.brokers.base.Capability.BATCH_ORDERS`
+(a :class:`~trading_bot.brokers.base.BatchBroker`), :meth:`OrderRouter.submit_many`
+groups each phase's legs by instrument and sends every group of two or more in
+one :meth:`~trading_bot.brokers.base.BatchBroker.place_orders` call (one
+parallelism slot per batch). The per-leg guarantees are kept: dedup and the
+in-flight guard are applied per ``client_order_id`` before the batch is built,
+the risk gate checks every leg before the venue is touched, and each leg's
+result is driven onto its own :class:`Order` — opened with its venue id,
+``REJECTED`` for its venue error, or left untracked with the
+:class:`~trading_bot.transport.http.AmbiguousRequestError` of an ambiguous batch,
+exactly as a single :meth:`submit` would. :meth:`OrderRouter.cancel_many` does
+the same for cancels under ``BATCH_CANCEL`` (the kill-switch's path), falling back
+to one cancel per order when the batch fails so each failure is attributed.
+
+Amend (carried into the ADR)
+----------------------------
+Repricing a resting order by cancel + submit costs two round-trips, leaves a gap
+with nothing on the book, and needs a new ``client_order_id``.
+:meth:`OrderRouter.amend` does it in one call on a broker that declares
+:attr:`~trading_bot.brokers.base.Capability.AMEND`. The broker amends in place
+(Kraken ``AmendOrder``, paper) or cancel-replaces (Binance). The order keeps its
+``client_order_id``, status and fills either way. Only its price, quantity and
+possibly its venue id change, through :meth:`~trading_bot.domain.order.Order.
+amend`. The change is validated on a copy of the order and risk-checked as the
+amended order *before* the venue is asked. The tracked order is only changed
+once the venue confirms. A failed or ambiguous amend leaves it as it was, and
+reconcile repairs any drift. One amend per order may be in flight at a time.
+
+Bounded history and indexes (carried into the ADR)
+--------------------------------------------------
+The dedup map would otherwise hold every order for the life of the process. Two
+secondary indexes sit beside it: the **live** index (non-terminal orders, keyed
+by instrument) behind :meth:`OrderRouter.open_orders` — what reconcile and the
+kill-switch walk, in O(live) rather than O(history) — and the **terminal** queue
+(terminal orders, oldest first, stamped when the router first saw them
+terminal). Orders can turn terminal outside the router (a fill applied by the
+tracker), so the live index is re-checked lazily whenever it is read.
+
+With an ``archive`` store and a ``retention`` window, terminal orders older than
+the window are written to the store and dropped from memory
+(:meth:`OrderRouter.archive_terminal`, also run every half window from
+:meth:`OrderRouter.submit`). Dedup still holds for archived ids: a submit that
+misses the in-memory map checks the store by primary key before touching the
+broker, and returns the archived order on a hit. Neither the archiving nor the
+lookup waits for a write-behind commit: the store answers a point lookup of a
+row still on its queue from the queue.
+
 Fill ingestion — the boundary (carried into the ADR)
 ----------------------------------------------------
-The router owns **submit and cancel only**. Fill ingestion does **not** live
+The router owns **submit, amend and cancel only**. Fill ingestion does **not** live
 here: applying a :class:`~trading_bot.domain.fill.Fill` to an order, recomputing
 the average price and folding it into a position is the job of the
 ``PositionTracker`` (leaf 04), which subscribes to the broker's fill stream and
@@ -58,8 +128,10 @@ an order was submitted. The router therefore exposes no ``ingest_fill`` method.
 from __future__ import annotations
 
 import asyncio
+import copy
 import logging
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Literal
 
 from trading_bot.application.events import EventBus, OrderEvent
 from trading_bot.brokers.base import Broker, Capability, require
@@ -67,19 +139,30 @@ from trading_bot.domain.errors import (
     BrokerError,
     MissingOrder,
     OrderError,
+    ReplaceFailed,
     RiskLimitBreached,
 )
-from trading_bot.domain.order import Order, OrderStatus
+from trading_bot.domain.order import Order, OrderSide, OrderStatus
+from trading_bot.transport.http import AmbiguousRequestError
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable, Mapping, Sequence
 
     from trading_bot.application.risk import RiskManager
+    from trading_bot.brokers.base import AmendBroker, BatchBroker
+    from trading_bot.domain.instrument import Instrument, Symbol
+    from trading_bot.domain.money import Money
+    from trading_bot.storage.journal_store import JournalStore
+    from trading_bot.storage.sqlite_store import SqliteStore
 
-__all__ = ["OrderRouter"]
+__all__ = ["OrderRouter", "SubmitOrdering"]
 
 logger = logging.getLogger(__name__)
 
+#: How :meth:`OrderRouter.submit_many` sequences a batch: ``"given"`` starts legs
+#: in input order; ``"sells_first"`` completes every sell before any buy starts.
+SubmitOrdering = Literal["given", "sells_first"]
+
 
 def _consume_exception(future: "asyncio.Future[Order]") -> None:
     """Mark a done future's exception retrieved (silences asyncio's GC warning).
@@ -93,6 +176,15 @@ def _consume_exception(future: "asyncio.Future[Order]") -> None:
         future.exception()
 
 
+def _settled(results: list[Order | Exception | None]) -> list[Order | Exception]:
+    """Narrow a batch's result slots once every one has been written."""
+    settled: list[Order | Exception] = []
+    for result in results:
+        assert result is not None, "every leg's slot is written before returning"
+        settled.append(result)
+    return settled
+
+
 class OrderRouter:
     """Idempotent order submission + lifecycle driving over a :class:`Broker`.
 
@@ -120,11 +212,23 @@ class OrderRouter:
         half-tracked submission — so the idempotency map stays a record of
         *accepted* submissions only, and a later retry is free to re-attempt).
         ``None`` (the default) runs the router with no risk gate.
+    archive : SqliteStore or JournalStore, optional
+        Where terminal orders are archived once ``retention`` has passed, and
+        the fallback dedup lookup for an id missing from memory. ``None``
+        (default) keeps every order in memory.
+    retention : float, optional
+        Seconds a terminal order stays in memory before it is archived.
+        Requires ``archive``. ``None`` (default) never archives.
+    clock : Callable[[], float], optional
+        Monotonic seconds stamping terminal orders. Defaults to
+        :func:`time.monotonic`.
 
     Raises
     ------
     NoCapability
         If ``broker`` does not declare both ``PLACE_ORDER`` and ``CANCEL``.
+    ValueError
+        If ``retention`` is negative or given without an ``archive``.
 
     """
 
@@ -134,7 +238,14 @@ class OrderRouter:
         event_bus: EventBus,
         *,
         risk_manager: RiskManager | None = None,
+        archive: SqliteStore | JournalStore | None = None,
+        retention: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
+        if retention is not None and (archive is None or retention < 0):
+            raise ValueError(
+                f"retention needs an archive and must be >= 0, got {retention}"
+            )
         # Gate up front: a broker that cannot place *and* cancel is not a valid
         # write-path target, so fail at construction rather than at first call.
         require(broker, Capability.PLACE_ORDER)
@@ -146,6 +257,19 @@ class OrderRouter:
         self._orders: dict[str, Order] = {}
         # Per-id in-flight submissions, the concurrency guard (see module doc).
         self._inflight: dict[str, asyncio.Future[Order]] = {}
+        # Ids with an amend awaiting the venue (one amend per order at a time).
+        self._amending: set[str] = set()
+        # Secondary indexes over ``_orders`` (see the module docstring): the
+        # live orders per instrument, and terminal ids -> when first seen
+        # terminal, oldest first (insertion order of a monotonic clock).
+        self._live: dict[Symbol, dict[str, Order]] = {}
+        self._terminal: dict[str, float] = {}
+        self._archive = archive
+        self._retention = retention
+        self._clock = clock
+        self._next_sweep = 0.0
+        #: How many terminal orders have been archived out of memory so far.
+        self.archived = 0
 
     async def submit(self, order: Order) -> Order:
         """Submit ``order`` to the broker idempotently and drive its lifecycle.
@@ -189,11 +313,12 @@ class OrderRouter:
 
         """
         cid = order.client_order_id
+        self._maybe_archive()
 
         # Already tracked (succeeded earlier, or rejected earlier): return the
         # tracked order, never re-call the broker. This is the steady-state
-        # idempotency check for a *sequential* retry.
-        existing = self._orders.get(cid)
+        # idempotency check for a *sequential* retry. Falls back to the archive.
+        existing = self._lookup(cid)
         if existing is not None:
             return existing
 
@@ -231,6 +356,194 @@ class OrderRouter:
             # waiters); drop it so the dedup map is the single source of truth.
             self._inflight.pop(cid, None)
 
+    async def submit_many(
+        self,
+        orders: Iterable[Order],
+        *,
+        parallelism: int = 8,
+        ordering: SubmitOrdering = "given",
+    ) -> list[Order | Exception]:
+        """Submit a batch of orders concurrently; capture each leg's outcome.
+
+        Every leg goes through :meth:`submit` (idempotent on its
+        ``client_order_id``, risk-gated), with at most ``parallelism`` legs in
+        flight. A leg refused by the risk gate or failed by the broker is
+        captured in its result slot — the remaining legs still run. On a broker
+        declaring ``BATCH_ORDERS`` the same-instrument legs of each phase go out
+        as native batches. See the module docstring's batched-submission and
+        native-batch sections.
+
+        Parameters
+        ----------
+        orders : Iterable[Order]
+            The legs, in their given order.
+        parallelism : int, optional
+            Most legs in flight at once. Defaults to ``8``; ``1`` submits
+            sequentially.
+        ordering : SubmitOrdering, optional
+            ``"given"`` (default) starts legs in input order; ``"sells_first"``
+            finishes every ``SELL`` leg before the first ``BUY`` starts.
+
+        Returns
+        -------
+        list of Order or Exception
+            One slot per input order, **in input order**: the tracked order, or
+            the exception that leg raised — a
+            :class:`~trading_bot.domain.errors.RiskLimitBreached` /
+            :class:`~trading_bot.domain.errors.BrokerError` /
+            :class:`~trading_bot.domain.errors.OrderError` /
+            :class:`~trading_bot.transport.http.AmbiguousRequestError`, or any
+            unexpected error, which fails only its own leg (or its native batch).
+            An ambiguous leg is left untracked: reconcile before retrying.
+
+        Raises
+        ------
+        ValueError
+            If ``parallelism`` is less than ``1``.
+
+        """
+        if parallelism < 1:
+            raise ValueError(f"parallelism must be at least 1, got {parallelism}")
+        legs = list(orders)
+        results: list[Order | Exception | None] = [None] * len(legs)
+        gate = asyncio.Semaphore(parallelism)
+        self._maybe_archive()
+
+        async def _leg(i: int) -> None:
+            async with gate:
+                results[i] = await self.submit(legs[i])
+
+        async def _batch(indices: list[int]) -> None:
+            async with gate:
+                outcomes = await self._submit_batch([legs[i] for i in indices])
+            for i, outcome in zip(indices, outcomes, strict=True):
+                results[i] = outcome
+
+        if ordering == "sells_first":
+            phases = [
+                [i for i, leg in enumerate(legs) if leg.side is OrderSide.SELL],
+                [i for i, leg in enumerate(legs) if leg.side is not OrderSide.SELL],
+            ]
+        else:
+            phases = [list(range(len(legs)))]
+        refused = await self._gate_batch(legs, phases)
+        for i, breach in refused.items():
+            results[i] = breach
+        phases = [[i for i in phase if i not in refused] for phase in phases]
+        batching = Capability.BATCH_ORDERS in self._broker.capabilities()
+        for phase in phases:
+            groups: dict[object, list[int]] = {}
+            for i in phase:
+                key = legs[i].instrument.symbol if batching else i
+                groups.setdefault(key, []).append(i)
+            outcomes = await asyncio.gather(
+                *(
+                    _batch(group) if len(group) > 1 else _leg(group[0])
+                    for group in groups.values()
+                ),
+                return_exceptions=True,
+            )
+            # A group that raised fails its own legs only: the error lands in
+            # each of its still-empty slots, and the other groups keep theirs.
+            for group, outcome in zip(groups.values(), outcomes, strict=True):
+                if not isinstance(outcome, BaseException):
+                    continue
+                if not isinstance(outcome, Exception):
+                    raise outcome
+                for i in group:
+                    if results[i] is None:
+                        results[i] = outcome
+        return _settled(results)
+
+    async def _submit_batch(self, orders: Sequence[Order]) -> list[Order | Exception]:
+        """Submit same-instrument ``orders`` through one native broker batch.
+
+        The per-leg steps of :meth:`submit` / :meth:`_do_submit`, split around a
+        single :meth:`~trading_bot.brokers.base.BatchBroker.place_orders` call:
+        dedup and in-flight lookup, then the risk gate, per leg; then the batch;
+        then each leg's outcome driven onto its own order. Returns one slot per
+        order, as :meth:`submit_many` does.
+        """
+        loop = asyncio.get_running_loop()
+        results: list[Order | Exception | None] = [None] * len(orders)
+        waiting: dict[int, asyncio.Future[Order]] = {}
+        owned: dict[int, asyncio.Future[Order]] = {}
+        for k, order in enumerate(orders):
+            cid = order.client_order_id
+            existing = self._lookup(cid)
+            if existing is not None:
+                results[k] = existing
+            elif cid in self._inflight:
+                waiting[k] = self._inflight[cid]
+            else:
+                future: asyncio.Future[Order] = loop.create_future()
+                future.add_done_callback(_consume_exception)
+                self._inflight[cid] = owned[k] = future
+
+        def _settle(k: int, outcome: Order | Exception) -> None:
+            results[k] = outcome
+            future = owned[k]
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+        try:
+            accepted: list[int] = []
+            for k in owned:
+                try:
+                    await self._check_risk(orders[k])
+                except RiskLimitBreached as breach:
+                    _settle(k, breach)
+                else:
+                    accepted.append(k)
+            if accepted:
+                broker: BatchBroker = self._broker  # type: ignore[assignment]
+                try:
+                    placed = await broker.place_orders([orders[k] for k in accepted])
+                except BrokerError as exc:
+                    placed = [exc] * len(accepted)
+                for k, outcome in zip(accepted, placed, strict=True):
+                    _settle(k, self._open_placed(orders[k], outcome))
+        except BaseException as exc:
+            for future in owned.values():
+                if not future.done():
+                    future.set_exception(exc)
+            raise
+        finally:
+            for k, future in owned.items():
+                if self._inflight.get(orders[k].client_order_id) is future:
+                    del self._inflight[orders[k].client_order_id]
+
+        for k, inflight in waiting.items():
+            try:
+                results[k] = await inflight
+            except Exception as exc:  # noqa: BLE001 - the leg's outcome, per slot
+                results[k] = exc
+        return _settled(results)
+
+    def _open_placed(self, order: Order, outcome: str | Exception) -> Order | Exception:
+        """Drive one batch leg from its broker outcome, as :meth:`_do_submit` would.
+
+        A venue id opens and tracks the order; a venue or state-machine error
+        rejects and tracks it; an ambiguous outcome leaves it ``NEW`` and
+        untracked (reconcile first). Returns the order, or the leg's exception.
+        """
+        if isinstance(outcome, AmbiguousRequestError):
+            return outcome
+        if isinstance(outcome, str):
+            try:
+                order.submit()
+                order.open(outcome)
+            except OrderError as exc:
+                self._reject(order, str(exc))
+                return exc
+            self._track(order)
+            self._bus.emit(OrderEvent(order))
+            return order
+        self._reject(order, str(outcome))
+        return outcome
+
     async def _do_submit(self, order: Order) -> Order:
         """Drive one fresh submission ``NEW -> SUBMITTED -> OPEN`` (or reject).
 
@@ -256,25 +569,7 @@ class OrderRouter:
         .kill` (cancel every resting order + trip the switch) and *then* re-raises
         — the whole book halts for the day, not just this order.
         """
-        if self._risk is not None:
-            # Pre-trade gate: raises RiskLimitBreached before the broker is ever
-            # touched. Left to propagate untracked (see the docstring). A
-            # ``max_daily_loss`` breach is special: that limit is the day's *halt*
-            # threshold, not a one-order cap, so reaching it must stop trading for
-            # the day — the router escalates to the kill-switch (cancel resting
-            # orders + trip) before re-raising. Other breaches propagate unchanged.
-            try:
-                self._risk.check(order)
-            except RiskLimitBreached as breach:
-                if breach.limit == "max_daily_loss" and not self._risk.tripped:
-                    await self._risk.kill(
-                        router=self,
-                        reason=(
-                            f"max_daily_loss breached: daily loss {breach.value} "
-                            f">= {breach.threshold} — halting for the day"
-                        ),
-                    )
-                raise
+        await self._check_risk(order)
         try:
             venue_id = await self._broker.place_order(order)
             order.submit()
@@ -285,10 +580,85 @@ class OrderRouter:
             self._reject(order, str(exc))
             raise
         # Track the (now live or terminal-by-fill) order so the dedup map owns it.
-        self._orders[order.client_order_id] = order
+        self._track(order)
         self._bus.emit(OrderEvent(order))
         return order
 
+    def record_marks(self, marks: Mapping[Instrument, Money]) -> None:
+        """Feed the latest mark prices to the risk gate (no-op without one).
+
+        The runners call this each step with the bar closes, so the notional
+        limits can value a MARKET order (see
+        :meth:`~trading_bot.application.risk.RiskManager.record_marks`).
+        """
+        if self._risk is not None:
+            self._risk.record_marks(marks)
+
+    async def _check_risk(self, order: Order) -> None:
+        """Run the pre-trade gate on ``order``; escalate a daily-loss breach.
+
+        Raises :class:`~trading_bot.domain.errors.RiskLimitBreached` before the
+        broker is ever touched (see :meth:`_do_submit`). No-op without a
+        ``risk_manager``.
+        """
+        if self._risk is None:
+            return
+        # Pre-trade gate: raises RiskLimitBreached before the broker is ever
+        # touched. Left to propagate untracked (see the docstring). A
+        # ``max_daily_loss`` breach is special: that limit is the day's *halt*
+        # threshold, not a one-order cap, so reaching it must stop trading for
+        # the day — the router escalates to the kill-switch (cancel resting
+        # orders + trip) before re-raising. Other breaches propagate unchanged.
+        try:
+            self._risk.check(order)
+        except RiskLimitBreached as breach:
+            await self._escalate(breach)
+            raise
+
+    async def _escalate(self, breach: RiskLimitBreached) -> None:
+        """Kill (cancel resting orders + trip) on a ``max_daily_loss`` breach."""
+        if self._risk is None or self._risk.tripped:
+            return
+        if breach.limit == "max_daily_loss":
+            await self._risk.kill(
+                router=self,
+                reason=(
+                    f"max_daily_loss breached: daily loss {breach.value} "
+                    f">= {breach.threshold} — halting for the day"
+                ),
+            )
+
+    async def _gate_batch(
+        self, legs: list[Order], phases: list[list[int]]
+    ) -> dict[int, RiskLimitBreached]:
+        """Run the book-level risk gate over a batch's fresh legs, in phase order.
+
+        Legs already tracked or in flight are skipped (they are deduped, not
+        placed again), as is a repeated id after its first leg. Returns the
+        refused legs' breaches by index. A ``max_daily_loss`` breach escalates
+        once, as in :meth:`_check_risk`.
+        """
+        if self._risk is None:
+            return {}
+        fresh: list[int] = []
+        seen: set[str] = set()
+        for i in (i for phase in phases for i in phase):
+            cid = legs[i].client_order_id
+            if cid in seen or cid in self._inflight or self._lookup(cid) is not None:
+                continue
+            seen.add(cid)
+            fresh.append(i)
+        verdicts = self._risk.check_batch([legs[i] for i in fresh])
+        refused = {
+            i: breach
+            for i, breach in zip(fresh, verdicts, strict=True)
+            if breach is not None
+        }
+        daily = [b for b in refused.values() if b.limit == "max_daily_loss"]
+        if daily:
+            await self._escalate(daily[0])
+        return refused
+
     def _reject(self, order: Order, reason: str) -> None:
         """Drive ``order`` to ``REJECTED``, track the attempt, and emit an event.
 
@@ -313,7 +683,7 @@ class OrderRouter:
                 order.client_order_id,
                 order.status.value,
             )
-        self._orders[order.client_order_id] = order
+        self._track(order)
         self._bus.emit(OrderEvent(order))
 
     async def cancel(self, order_or_id: Order | str) -> Order:
@@ -349,6 +719,181 @@ class OrderRouter:
         # The broker only cancels its own venue record (it never touches our
         # Order); the router drives the local CANCELLED transition.
         order.cancel()
+        self._reindex(order)
+        self._bus.emit(OrderEvent(order))
+        return order
+
+    async def cancel_many(
+        self, orders_or_ids: Iterable[Order | str], *, parallelism: int = 8
+    ) -> list[Order | Exception]:
+        """Cancel several tracked orders; capture each one's outcome.
+
+        On a broker declaring ``BATCH_CANCEL`` the venue ids go out in one
+        :meth:`~trading_bot.brokers.base.BatchBroker.cancel_orders` call and
+        every order is driven to ``CANCELLED`` once it succeeds. If the batch
+        fails, or the broker has no batch cancel, each order is cancelled through
+        :meth:`cancel` — concurrently, at most ``parallelism`` at once (the
+        broker's rate limiter still paces the requests) — so every failure lands
+        in that order's own slot.
+
+        Parameters
+        ----------
+        orders_or_ids : Iterable[Order or str]
+            Tracked orders, or their ``client_order_id``\\ s.
+        parallelism : int, optional
+            Most single cancels in flight at once. Defaults to ``8``.
+
+        Returns
+        -------
+        list of Order or Exception
+            One slot per input, in input order: the cancelled order, or the
+            :class:`~trading_bot.domain.errors.MissingOrder` /
+            :class:`~trading_bot.domain.errors.BrokerError` (or other error) its
+            cancel raised.
+
+        Raises
+        ------
+        ValueError
+            If ``parallelism`` is less than ``1``.
+
+        """
+        if parallelism < 1:
+            raise ValueError(f"parallelism must be at least 1, got {parallelism}")
+        targets = list(orders_or_ids)
+        if len(targets) > 1 and Capability.BATCH_CANCEL in self._broker.capabilities():
+            cancelled = await self._cancel_batch(targets)
+            if cancelled is not None:
+                return cancelled
+        gate = asyncio.Semaphore(parallelism)
+
+        async def _one(target: Order | str) -> Order | Exception:
+            async with gate:
+                try:
+                    return await self.cancel(target)
+                except Exception as exc:
+                    return exc
+
+        return list(await asyncio.gather(*(_one(target) for target in targets)))
+
+    async def _cancel_batch(
+        self, targets: list[Order | str]
+    ) -> list[Order | Exception] | None:
+        """One native batch cancel for :meth:`cancel_many`; ``None`` to fall back.
+
+        Falls back (returns ``None``, nothing transitioned) when a target is not
+        tracked or not live on the venue, or when the batch call fails — the
+        one-by-one path then attributes each failure to its own order.
+        """
+        try:
+            resolved = [self._resolve(target) for target in targets]
+        except MissingOrder:
+            return None
+        venue_ids = [order.venue_order_id for order in resolved]
+        if None in venue_ids:
+            return None
+        broker: BatchBroker = self._broker  # type: ignore[assignment]
+        try:
+            await broker.cancel_orders([vid for vid in venue_ids if vid is not None])
+        except Exception:
+            logger.warning(
+                "batch cancel of %d orders failed; cancelling one by one",
+                len(resolved),
+                exc_info=True,
+            )
+            return None
+        results: list[Order | Exception] = []
+        for order in resolved:
+            try:
+                order.cancel()
+            except OrderError as exc:
+                results.append(exc)
+                continue
+            self._reindex(order)
+            self._bus.emit(OrderEvent(order))
+            results.append(order)
+        return results
+
+    async def amend(
+        self,
+        order_or_id: Order | str,
+        *,
+        qty: Money | None = None,
+        limit_price: Money | None = None,
+    ) -> Order:
+        """Reprice and/or resize a tracked live order in one venue call.
+
+        The amendment is validated on a copy of the order and risk-checked as
+        the amended order. It is then sent through :meth:`~trading_bot.brokers.
+        base.AmendBroker.amend_order`. Once the venue confirms, the tracked
+        order is updated with :meth:`~trading_bot.domain.order.Order.amend`
+        (taking the new venue id of a cancel-replace) and an
+        :class:`~trading_bot.application.events.OrderEvent` is emitted. The
+        ``client_order_id`` and status never change.
+
+        Parameters
+        ----------
+        order_or_id : Order or str
+            A tracked :class:`Order` or its ``client_order_id``.
+        qty : Decimal, optional
+            The new *total* quantity, fills included.
+        limit_price : Decimal, optional
+            The new limit price.
+
+        Returns
+        -------
+        Order
+            The amended tracked order.
+
+        Raises
+        ------
+        NoCapability
+            If the broker does not declare ``AMEND``.
+        MissingOrder
+            If no order is tracked under that id.
+        OrderError
+            If the amendment is invalid for the order (see
+            :meth:`~trading_bot.domain.order.Order.amend`), including an order
+            that is not live, or if another amend of it is in flight.
+        RiskLimitBreached
+            If the risk gate refuses the amended order. The venue is not asked.
+        ReplaceFailed
+            If a cancel-replace cancelled the order but placed no replacement.
+            The tracked order is driven to ``CANCELLED`` (with its
+            :class:`~trading_bot.application.events.OrderEvent`) first.
+        BrokerError or AmbiguousRequestError
+            If the venue refuses the amend, or its outcome is unknown. The
+            tracked order is left unchanged.
+
+        """
+        require(self._broker, Capability.AMEND)
+        order = self._resolve(order_or_id)
+        cid = order.client_order_id
+        if cid in self._amending:
+            raise OrderError(cid, "an amend of this order is already in flight")
+        # Validate on a copy: the tracked order only changes once the venue
+        # has confirmed, so a refusal anywhere below leaves it untouched.
+        proposed = copy.copy(order)
+        proposed.amend(qty=qty, limit_price=limit_price)
+        self._amending.add(cid)
+        try:
+            await self._check_risk(proposed)
+            broker: AmendBroker = self._broker  # type: ignore[assignment]
+            venue_id = await broker.amend_order(
+                order, qty=qty, limit_price=limit_price
+            )
+        except ReplaceFailed:
+            # The venue cancelled the original: track that before surfacing it.
+            order.cancel()
+            self._reindex(order)
+            self._bus.emit(OrderEvent(order))
+            raise
+        finally:
+            self._amending.discard(cid)
+        order.amend(
+            qty=qty,
+            limit_price=limit_price,
+            venue_order_id=venue_id if venue_id != order.venue_order_id else None,
+        )
         self._bus.emit(OrderEvent(order))
         return order
 
@@ -363,19 +908,138 @@ class OrderRouter:
     def get(self, client_order_id: str) -> Order | None:
         """Return the tracked order for ``client_order_id``, or ``None``.
 
-        A read-only view of the dedup map, for callers (tests, a UI) that need to
-        inspect what the router has tracked without driving a transition.
+        A read-only view of the in-memory dedup map, for callers (tests, a UI)
+        that need to inspect what the router has tracked without driving a
+        transition. An archived order is no longer here; it lives in the archive.
         """
         return self._orders.get(client_order_id)
 
+    @property
+    def tracked_count(self) -> int:
+        """How many orders the in-memory dedup map holds (live and terminal)."""
+        return len(self._orders)
+
+    def open_orders(self, instrument: Instrument | None = None) -> list[Order]:
+        """Return the tracked non-terminal orders, optionally for one instrument.
+
+        Served from the live index — O(live orders), not O(history). Entries
+        that turned terminal since the last read (e.g. filled) move to the
+        terminal queue first.
+
+        Parameters
+        ----------
+        instrument : Instrument, optional
+            Only orders on this instrument's symbol. ``None`` (default) returns
+            every live order.
+
+        Returns
+        -------
+        list of Order
+            The live tracked orders (shared objects, not copies).
+
+        """
+        self._refresh()
+        if instrument is not None:
+            return list(self._live.get(instrument.symbol, {}).values())
+        return [order for bucket in self._live.values() for order in bucket.values()]
+
+    def archive_terminal(self) -> int:
+        """Archive terminal orders older than ``retention`` out of memory.
+
+        Each one is written to the archive store (its final state) and dropped
+        from the dedup map and the indexes; a later submit of its id still
+        dedups through the store. A no-op without ``retention``.
+
+        Returns
+        -------
+        int
+            How many orders were archived by this call.
+
+        """
+        if self._retention is None or self._archive is None:
+            return 0
+        now = self._clock()
+        self._refresh(now)
+        cutoff = now - self._retention
+        expired: list[str] = []
+        for cid, seen in self._terminal.items():
+            if seen > cutoff:
+                break  # the queue is oldest-first: the rest are younger
+            expired.append(cid)
+        if not expired:
+            return 0
+        # Dedup for these ids now rests on the store. Its point lookup sees a
+        # write-behind row before the commit, so nothing waits for one here.
+        for cid in expired:
+            order = self._orders.get(cid)
+            if order is not None:
+                self._archive.upsert_order(order)
+        archived = 0
+        for cid in expired:
+            del self._terminal[cid]
+            if self._orders.pop(cid, None) is not None:
+                archived += 1
+        self.archived += archived
+        return archived
+
+    def _maybe_archive(self) -> None:
+        """Run :meth:`archive_terminal` at most once every half retention window."""
+        if self._retention is None:
+            return
+        now = self._clock()
+        if now >= self._next_sweep:
+            self.archive_terminal()
+            self._next_sweep = now + self._retention / 2
+
+    def _lookup(self, client_order_id: str) -> Order | None:
+        """The tracked order for an id, falling back to the archive on a miss."""
+        order = self._orders.get(client_order_id)
+        if order is None and self._archive is not None:
+            order = self._archive.get_order(client_order_id)
+        return order
+
+    def _track(self, order: Order) -> None:
+        """Record ``order`` in the dedup map and the matching index."""
+        self._orders[order.client_order_id] = order
+        if order.is_terminal:
+            self._terminal.setdefault(order.client_order_id, self._clock())
+        else:
+            bucket = self._live.setdefault(order.instrument.symbol, {})
+            bucket[order.client_order_id] = order
+
+    def _reindex(self, order: Order, now: float | None = None) -> None:
+        """Move a terminal ``order`` from the live index to the terminal queue."""
+        if not order.is_terminal:
+            return
+        bucket = self._live.get(order.instrument.symbol)
+        if bucket is not None:
+            bucket.pop(order.client_order_id, None)
+            if not bucket:
+                del self._live[order.instrument.symbol]
+        self._terminal.setdefault(
+            order.client_order_id, self._clock() if now is None else now
+        )
+
+    def _refresh(self, now: float | None = None) -> None:
+        """Re-check the live index for orders that turned terminal elsewhere."""
+        stale = [
+            order
+            for bucket in self._live.values()
+            for order in bucket.values()
+            if order.is_terminal
+        ]
+        if stale:
+            now = self._clock() if now is None else now
+            for order in stale:
+                self._reindex(order, now)
+
     def tracked_orders(self) -> dict[str, Order]:
         """Return a snapshot of every tracked order, keyed by client-order-id.
 
-        A read-only copy of the dedup map (the mapping is fresh; the
-        :class:`Order` values are shared). For callers — notably
-        :func:`~trading_bot.application.reconcile.reconcile` — that need to
-        diff the router's view against the venue's truth without driving a
-        transition.
+        A read-only copy of the in-memory dedup map (the mapping is fresh; the
+        :class:`Order` values are shared), for callers (the API, a UI) that need
+        the whole tracked view. Callers that only want live orders — reconcile,
+        the kill-switch — use the cheaper :meth:`open_orders`.
         """
         return dict(self._orders)
 
@@ -414,7 +1078,7 @@ class OrderRouter:
         existing = self._orders.get(order.client_order_id)
         if existing is not None:
             return existing
-        self._orders[order.client_order_id] = order
+        self._track(order)
         self._bus.emit(OrderEvent(order))
         return order
 
@@ -426,7 +1090,15 @@ class OrderRouter:
         reconcile has driven it terminal. Returns the removed order, or ``None``
         if the id was not tracked (a no-op, so a second reconcile is clean).
         """
-        return self._orders.pop(client_order_id, None)
+        order = self._orders.pop(client_order_id, None)
+        self._terminal.pop(client_order_id, None)
+        if order is not None:
+            bucket = self._live.get(order.instrument.symbol)
+            if bucket is not None:
+                bucket.pop(client_order_id, None)
+                if not bucket:
+                    del self._live[order.instrument.symbol]
+        return order
 
     def restore(self, orders: Iterable[Order]) -> int:
         """Seed the dedup map from persisted orders after a restart — **no events**.
@@ -462,6 +1134,6 @@ class OrderRouter:
         restored = 0
         for order in orders:
             if order.client_order_id not in self._orders:
-                self._orders[order.client_order_id] = order
+                self._track(order)
                 restored += 1
         return restored
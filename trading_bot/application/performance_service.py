@@ -68,6 +68,10 @@ equity curve); only the KPI series crosses to ``float`` at the
 :func:`trading_bot.domain.performance.equity_array` boundary, exactly as the
 domain layer already does.
 
+A long stored history need not go through :meth:`PerformanceService.apply` one
+fill at a time: :meth:`PerformanceService.from_frame` folds a columnar fill
+history (a Parquet export read with polars) in one pass, with the same result.
+
 The module is part of the application layer: it imports the pure domain and the
 event bus, holds money as :class:`~decimal.Decimal` end to end, and is
 deterministic in fill order.
@@ -75,10 +79,15 @@ deterministic in fill order.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from decimal import Decimal
+
+import polars as pl
+
 from trading_bot.application.events import Event, EventBus, FillEvent
 from trading_bot.domain import performance as perf
 from trading_bot.domain.fill import Fill
-from trading_bot.domain.instrument import Instrument
+from trading_bot.domain.instrument import Instrument, Symbol
 from trading_bot.domain.money import Money, money
 from trading_bot.domain.position import Position
 
@@ -153,14 +162,124 @@ class PerformanceService:
         self._seen_fill_ids: set[str] = set()
         self._bus = event_bus
         if event_bus is not None:
-            event_bus.subscribe(self._on_event)
+            event_bus.subscribe(
+                self._on_event,
+                types=(FillEvent,),
+                critical=True,
+                inline=True,
+                name="PerformanceService",
+            )
+
+    @classmethod
+    def from_frame(
+        cls, frame: pl.DataFrame, *, v0: Money = _ZERO
+    ) -> PerformanceService:
+        """Build the service from a fill history held as columns.
+
+        The bulk counterpart of calling :meth:`apply` once per fill, for a long
+        history read from a columnar export
+        (:func:`~trading_bot.storage.columnar.scan_fills`): no
+        :class:`~trading_bot.domain.fill.Fill` is built per row, and the fold
+        runs through :func:`trading_bot.domain.performance.fold_fill_columns`.
+        The result equals applying the same fills one by one, and further
+        :meth:`apply` calls continue from it.
+
+        Parameters
+        ----------
+        frame : polars.DataFrame
+            Columns ``fill_id``, ``instrument`` (``BASE/QUOTE``), ``side``
+            (``"buy"`` / ``"sell"``), ``qty``, ``price`` and ``fee`` (decimal or
+            string), one row per fill, **in execution order**. A ``fill_id``
+            seen earlier in the frame is skipped, as :meth:`apply` would.
+        v0 : Money, optional
+            Initial account capital. Defaults to ``money("0")``.
+
+        Returns
+        -------
+        PerformanceService
+            A bus-less service holding the folded history.
+
+        """
+        frame = frame.unique("fill_id", keep="first", maintain_order=True)
+        # Decimal(38, 18) columns come back padded to 18 places; trim them to
+        # the canonical form the store and the live fills use. Only zeros after
+        # the point go: "100" and "0" keep theirs.
+        columns = frame.select(
+            pl.col("instrument"),
+            *(
+                pl.col(name)
+                .cast(pl.String)
+                .str.replace(r"(\.\d*[1-9])0+$", "${1}")
+                .str.replace(r"\.0+$", "")
+                if frame.schema[name] != pl.String
+                else pl.col(name)
+                for name in ("qty", "price", "fee")
+            ),
+            pl.col("side") == "buy",
+        )
+        symbols = {
+            text: Instrument(Symbol(*text.split("/", 1)))
+            for text in columns["instrument"].unique().to_list()
+        }
+        instruments = [symbols[text] for text in columns["instrument"].to_list()]
+        signed = [
+            Decimal(qty) if buy else -Decimal(qty)
+            for qty, buy in zip(
+                columns["qty"].to_list(), columns["side"].to_list(), strict=True
+            )
+        ]
+        prices = [Decimal(price) for price in columns["price"].to_list()]
+        fees = [Decimal(fee) for fee in columns["fee"].to_list()]
+        path, positions = perf.fold_fill_columns(instruments, signed, prices, fees)
+
+        service = cls(v0=v0)
+        service._positions = positions
+        service._equity = [v0 + step for step in path]
+        service._realised_pnl = path[-1] if path else _ZERO
+        service._fees_paid = sum(fees, _ZERO)
+        service._seen_fill_ids = set(frame["fill_id"].to_list())
+        return service
+
+    def restore(
+        self,
+        positions: Iterable[Position],
+        *,
+        realised_pnl: Money,
+        fees_paid: Money,
+        equity: Iterable[Money],
+        seen_fill_ids: Iterable[str] = (),
+    ) -> None:
+        """Replace the service's state with saved totals — no refold.
+
+        The restart path (:func:`~trading_bot.application.snapshot.
+        restore_snapshot`); later :meth:`apply` calls continue from the saved
+        running totals and equity curve.
+
+        Parameters
+        ----------
+        positions : Iterable[Position]
+            One position per instrument.
+        realised_pnl, fees_paid : Money
+            The aggregate running totals.
+        equity : Iterable[Money]
+            The equity curve so far, one point per fill (``v0`` included).
+        seen_fill_ids : Iterable[str], optional
+            Fill ids to treat as already folded. Defaults to none.
+
+        """
+        self._positions = {position.instrument: position for position in positions}
+        self._realised_pnl = realised_pnl
+        self._fees_paid = fees_paid
+        self._equity = list(equity)
+        self._seen_fill_ids = set(seen_fill_ids)
 
     def _on_event(self, event: Event) -> None:
         """Bus handler: apply the fill of a :class:`FillEvent`, ignore the rest.
 
-        Subscribed to the :class:`~trading_bot.application.events.EventBus`, which
-        fans out every event type; the service only cares about
-        :class:`~trading_bot.application.events.FillEvent`.
+        Subscribed to the :class:`~trading_bot.application.events.EventBus` for
+        :class:`~trading_bot.application.events.FillEvent` only, as a critical
+        subscriber (an async bus never drops a fill for the service). The
+        ``isinstance`` guard keeps the handler safe to call directly.
         """
         if isinstance(event, FillEvent):
             self.apply(event.fill)
@@ -257,6 +376,15 @@ class PerformanceService:
         """
         return self._positions.get(instrument)
 
+    def all_positions(self) -> dict[Instrument, Position]:
+        """Return every instrument's running position (a fresh mapping)."""
+        return dict(self._positions)
+
+    @property
+    def v0(self) -> Money:
+        """The initial account capital anchoring the equity curve."""
+        return self._v0
+
     def equity_curve(self) -> tuple[Money, ...]:
         """The account-value path: ``v0`` + cumulative realised PnL per fill.
 
@@ -273,6 +401,13 @@ class PerformanceService:
         """
         return tuple(self._equity)
 
+    def equity_since(self, start: int) -> tuple[Money, ...]:
+        """The equity points from index ``start`` on (see :meth:`equity_curve`).
+
+        Copies only those points, for a caller that already holds the rest.
+        """
+        return tuple(self._equity[start:])
+
     # --- KPI ratios — delegate to domain.performance (fynance-backed) -------- #
 
     def sharpe(self, *, rf: float = 0.0, period: int = 252, log: bool = False) -> float:
@@ -68,6 +68,19 @@ submissions — the halt is total, by the gate, without the runner needing to kn
 about it. (A caller that wants strict all-or-nothing can inspect
 :attr:`RebalanceResult.failures` and act.)
 
+Concurrent legs (carried into the ADR)
+--------------------------------------
+Every leg's delta is computed first (against the tracker as it stands at the
+start of the tick), then the legs route together through
+:meth:`~trading_bot.application.order_router.OrderRouter.submit_many` with the
+runner's ``parallelism`` — a wide rebalance then costs about one venue
+round-trip per ``parallelism`` legs instead of one per leg, so prices drift less
+while the book moves. Per-leg idempotency, the risk gate and the failure capture
+are the router's per-leg :meth:`submit`, unchanged; the results (and the
+per-leg ``LogEvent``\\ s) are reported in universe order. ``leg_order=
+"sells_first"`` completes the sells before any buy starts, so the buys can
+spend the quote the sells freed.
+
 Cooperative stop & cadence (carried into the ADR)
 -------------------------------------------------
 :meth:`run` mirrors :class:`StrategyRunner.run`: it iterates the feed, checks an
@@ -90,7 +103,7 @@ from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from trading_bot.application.events import EventBus, LogEvent
+from trading_bot.application.events import EventBus
 from trading_bot.application.portfolio import weights_to_signals
 from trading_bot.domain.errors import BrokerError, RiskLimitBreached
 from trading_bot.domain.instrument import Instrument, Symbol
@@ -101,7 +114,7 @@ from trading_bot.domain.position import Position
 if TYPE_CHECKING:
     import polars as pl
 
-    from trading_bot.application.order_router import OrderRouter
+    from trading_bot.application.order_router import OrderRouter, SubmitOrdering
     from trading_bot.application.portfolio import PortfolioStrategy
     from trading_bot.application.position_tracker import PositionTracker
 
@@ -225,6 +238,19 @@ class PortfolioRunner:
         self-contained). Whatever it returns, the runner overrides the
         ``client_order_id`` with its deterministic, symbol-namespaced per-step id
         (so idempotency is the runner's, not the factory's, concern).
+    parallelism : int, optional
+        Most legs in flight at once, through
+        :meth:`~trading_bot.application.order_router.OrderRouter.submit_many`.
+        Defaults to ``1`` (legs route one after another, in universe order); a
+        larger value overlaps the venue round-trips of a wide rebalance.
+    leg_order : SubmitOrdering, optional
+        ``"given"`` (default) starts legs in universe order; ``"sells_first"``
+        settles every sell before the first buy, freeing quote balance.
+
+    Raises
+    ------
+    ValueError
+        If ``parallelism`` is less than ``1``.
 
     Examples
     --------
@@ -243,7 +269,11 @@ class PortfolioRunner:
         *,
         event_bus: EventBus | None = None,
         order_factory: PortfolioOrderFactory | None = None,
+        parallelism: int = 1,
+        leg_order: SubmitOrdering = "given",
     ) -> None:
+        if parallelism < 1:
+            raise ValueError(f"parallelism must be at least 1, got {parallelism}")
         self._strategy = strategy
         self._feed = feed
         self._router = router
@@ -259,6 +289,9 @@ class PortfolioRunner:
         # same ids (deterministic re-run), while a single runner re-driven via
         # repeated ``run`` calls keeps advancing.
         self._step_index = 0
+        self._window_bytes = 0
+        self._parallelism = parallelism
+        self._leg_order: SubmitOrdering = leg_order
 
     @property
     def strategy(self) -> PortfolioStrategy:
@@ -270,6 +303,11 @@ class PortfolioRunner:
         """The next rebalance index (== number of ticks processed so far)."""
         return self._step_index
 
+    @property
+    def window_bytes(self) -> int:
+        """Estimated size (bytes) of the last cross-section rebalanced over."""
+        return self._window_bytes
+
     async def run(
         self,
         max_steps: int | None = None,
@@ -360,6 +398,9 @@ class PortfolioRunner:
         # its slot — keeping ``f"{name}-{symbol}-{step}"`` aligned 1:1 with the
         # tick sequence (re-run determinism does not depend on the outcome).
         self._step_index += 1
+        self._window_bytes = sum(
+            int(frame.estimated_size()) for frame in frames.values()
+        )
 
         asof = self._asof_ms(frames)
         prices = self._latest_closes(frames)
@@ -380,10 +421,17 @@ class PortfolioRunner:
             asof_ms=asof,
         )
         signal_by_symbol = {sig.instrument.symbol: sig for sig in signals}
+        self._router.record_marks(
+            {
+                sig.instrument: prices[sig.instrument.symbol]
+                for sig in signals
+                if sig.instrument.symbol in prices
+            }
+        )
 
-        submitted = 0
-        failures: list[RebalanceFailure] = []
-        # Route in universe order for a deterministic per-tick leg sequence.
+        # Build the legs in universe order for a deterministic per-tick sequence
+        # (every delta is read before any leg routes).
+        legs: list[tuple[Symbol, Money, Order]] = []
         for symbol in self._strategy.universe:
             signal = signal_by_symbol[symbol]
             instrument = signal.instrument
@@ -394,38 +442,53 @@ class PortfolioRunner:
                 # Already on target (incl. a flat target against a flat position):
                 # no leg.
                 continue
-
             order = self._build_order(symbol, instrument, delta, prices[symbol], step)
-            try:
-                routed = await self._router.submit(order)
-            except (RiskLimitBreached, BrokerError) as exc:
+            legs.append((symbol, delta, order))
+
+        outcomes = await self._router.submit_many(
+            [order for _, _, order in legs],
+            parallelism=self._parallelism,
+            ordering=self._leg_order,
+        )
+
+        submitted = 0
+        failures: list[RebalanceFailure] = []
+        for (symbol, delta, _order), routed in zip(legs, outcomes, strict=True):
+            if isinstance(routed, Exception) and not isinstance(
+                routed, (RiskLimitBreached, BrokerError)
+            ):
+                raise routed  # an order state-machine fault is a bug, not a leg failure
+            if isinstance(routed, (RiskLimitBreached, BrokerError)):
                 # Per-leg failure: record it and continue the other legs (the
                 # rebalance is not all-or-nothing — see the module docstring).
+                exc = routed
                 failures.append(RebalanceFailure(symbol=symbol, error=exc))
                 if self._bus is not None:
-                    self._bus.emit(
-                        LogEvent(
-                            message=(
-                                f"{self._strategy.name} step {step}: leg "
-                                f"{symbol} FAILED "
-                                f"({type(exc).__name__}: {exc})"
-                            ),
-                            level="warning",
-                        )
+                    self._bus.log(
+                        "{name} step {step}: leg {symbol} FAILED ({error}: {exc})",
+                        level="warning",
+                        category="portfolio",
+                        name=self._strategy.name,
+                        step=step,
+                        symbol=symbol,
+                        error=type(exc).__name__,
+                        exc=exc,
                     )
                 continue
 
             submitted += 1
             if self._bus is not None:
-                self._bus.emit(
-                    LogEvent(
-                        message=(
-                            f"{self._strategy.name} step {step}: "
-                            f"{routed.side.value} {routed.qty} "
-                            f"{routed.instrument} "
-                            f"(delta={delta}, cid={routed.client_order_id})"
-                        )
-                    )
+                self._bus.log(
+                    "{name} step {step}: {side} {qty} {instrument} "
+                    "(delta={delta}, cid={cid})",
+                    category="portfolio",
+                    name=self._strategy.name,
+                    step=step,
+                    side=routed.side.value,
+                    qty=routed.qty,
+                    instrument=routed.instrument,
+                    delta=delta,
+                    cid=routed.client_order_id,
                 )
 
         return RebalanceResult(submitted=submitted, failures=failures)
@@ -99,14 +99,21 @@ class PositionTracker:
         self._seen_fill_ids: set[str] = set()
         self._bus = event_bus
         if event_bus is not None:
-            event_bus.subscribe(self._on_event)
+            event_bus.subscribe(
+                self._on_event,
+                types=(FillEvent,),
+                critical=True,
+                inline=True,
+                name="PositionTracker",
+            )
 
     def _on_event(self, event: Event) -> None:
         """Bus handler: apply the fill of a :class:`FillEvent`, ignore the rest.
 
-        Subscribed to the :class:`~trading_bot.application.events.EventBus`, which
-        fans out every event type; the tracker only cares about
-        :class:`~trading_bot.application.events.FillEvent`.
+        Subscribed to the :class:`~trading_bot.application.events.EventBus` for
+        :class:`~trading_bot.application.events.FillEvent` only, as a critical
+        subscriber (an async bus never drops a fill for the tracker). The
+        ``isinstance`` guard keeps the handler safe to call directly.
         """
         if isinstance(event, FillEvent):
             self.apply(event.fill)
@@ -179,6 +186,31 @@ class PositionTracker:
         for fill in fills:
             self.apply(fill)
 
+    def restore(
+        self, positions: Iterable[Position], seen_fill_ids: Iterable[str] = ()
+    ) -> None:
+        """Replace the tracked state with saved ``positions`` — no refold.
+
+        The restart path (:func:`~trading_bot.application.snapshot.
+        restore_snapshot`): a snapshot's positions are loaded as they were, and
+        later fills continue from them through :meth:`apply`.
+
+        Parameters
+        ----------
+        positions : Iterable[Position]
+            One position per instrument.
+        seen_fill_ids : Iterable[str], optional
+            Fill ids to treat as already folded (so a re-delivery of a fill the
+            positions already include is ignored). Defaults to none.
+
+        """
+        self._positions = {position.instrument: position for position in positions}
+        self._seen_fill_ids = set(seen_fill_ids)
+
+    def has_seen(self, fill_id: str) -> bool:
+        """Whether a fill with ``fill_id`` has already been folded."""
+        return fill_id in self._seen_fill_ids
+
     def position(self, instrument: Instrument) -> Position | None:
         """Return the live net :class:`Position` for ``instrument``, or ``None``.
 
@@ -58,6 +58,45 @@ are the PnL source of truth, so the post-reconcile positions are **exactly**
 than diffing) makes the pass trivially correct and avoids ever double-counting a
 fill the tracker had already applied.
 
+**Positions from a restored snapshot — apply the window.** A fill window that
+starts at ``since_ms`` cannot rebuild a position, so with ``since_ms`` the
+tracker is *not* reset: the window's fills the tracker has not seen are applied
+on top of its positions (restored by
+:func:`~trading_bot.application.snapshot.restore_snapshot`) and, with a bus,
+published as :class:`~trading_bot.application.events.FillEvent`\\ s so the
+performance service and the store take them in as if they had streamed in.
+
+**Incremental passes — a persisted watermark.** Given the engine's store,
+each pass ends by saving a watermark to its ``state`` table
+(:data:`RECONCILE_KEY`). The watermark holds the latest venue fill ``ts`` with
+the ids of the fills at that ``ts``, the venue balances read by the pass, and
+the tracker's net quantity per instrument. The next pass (a reconnect, or a
+restart) asks the venue only for fills from that ``ts`` on. Before applying
+them it checks that nothing else moved:
+
+* the venue's balances must equal the saved ones plus the settlement of those
+  fills (a buy adds ``qty`` of the base asset and takes ``qty * price`` of the
+  quote asset; a sell the reverse), less their fees. A fill does not say which
+  asset its fee was charged in (Binance takes it from the base asset, the
+  quote asset or BNB), so no balance may exceed its settlement and the
+  shortfalls across all assets must add up to the fees. Each fill may round a
+  balance once, so a gap of one unit in the balance's last reported place per
+  fill is allowed;
+* the tracker's net quantities must equal the saved ones plus the fills of the
+  window it has already folded (streamed in since the last pass).
+
+If both hold, the fills the tracker has not seen are applied as deltas, as
+with ``since_ms``. If either fails — a deposit, a fill the window missed, a
+tracker that did not come from the saved state — the pass falls back to a full
+rebuild from the venue's default fill window. A reconnect therefore costs one
+small fill request instead of refolding the venue's fill history. The
+:class:`~trading_bot.application.performance_service.PerformanceService` is
+never reset: its equity curve spans more history than any venue fill window.
+It takes each fill of the pass it has not seen. On a rebuild with a store, that
+is only the fills from the latest stored ``ts`` on: it has folded every stored
+fill, but after a snapshot restore it marks only the last ``ts``'s as seen. A
+malformed watermark counts as none, so the pass runs as without one.
+
 **Idempotency.** With no venue change between two runs, the second
 :func:`reconcile` is a no-op: every venue-open order is already tracked (ingested
 in the first pass), there are no new orphans, and the rebuild folds the same
@@ -70,16 +109,34 @@ objects, so there is no float round-trip.
 
 from __future__ import annotations
 
+import json
+from collections.abc import Iterable
 from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING
 
-from trading_bot.application.events import EventBus, LogEvent
+from trading_bot.application.events import EventBus, FillEvent
 from trading_bot.application.order_router import OrderRouter
 from trading_bot.application.position_tracker import PositionTracker
 from trading_bot.brokers.base import Broker
 from trading_bot.domain.errors import OrderError
-from trading_bot.domain.order import Order, OrderStatus
+from trading_bot.domain.fill import Fill
+from trading_bot.domain.money import Money, money
+from trading_bot.domain.order import Order, OrderSide, OrderStatus
+
+if TYPE_CHECKING:
+    from trading_bot.application.performance_service import PerformanceService
+    from trading_bot.storage.async_store import AsyncStore
+
+__all__ = ["RECONCILE_KEY", "ReconResult", "reconcile"]
+
+#: The ``state`` key of the reconcile watermark.
+RECONCILE_KEY = "reconcile.watermark"
+
+#: Watermark format version. A watermark of another version is ignored.
+_VERSION = 1
 
-__all__ = ["ReconResult", "reconcile"]
+_ZERO: Money = money("0")
 
 
 @dataclass(frozen=True, slots=True)
@@ -103,9 +160,14 @@ class ReconResult:
         — closed (``CANCELLED``) and evicted from the map per the orphan policy.
     fills_applied : int
         Broker-confirmed fills folded into the rebuilt
-        :class:`~trading_bot.application.position_tracker.PositionTracker`.
+        :class:`~trading_bot.application.position_tracker.PositionTracker`
+        (with ``since_ms``, only the window's fills it had not seen).
     positions_rebuilt : int
         Distinct instruments with a net position after the rebuild.
+    rebuilt : bool, optional
+        Whether the tracker was rebuilt from the venue's whole fill window (a
+        cold start, or an incremental pass that found a divergence) rather
+        than topped up. Defaults to ``False``.
 
     """
 
@@ -114,6 +176,7 @@ class ReconResult:
     closed_orphans: int
     fills_applied: int
     positions_rebuilt: int
+    rebuilt: bool = False
 
     @property
     def changed(self) -> bool:
@@ -138,6 +201,8 @@ async def reconcile(
     *,
     since_ms: int | None = None,
     event_bus: EventBus | None = None,
+    perf: PerformanceService | None = None,
+    store: AsyncStore | None = None,
 ) -> ReconResult:
     """Converge the router's orders and the tracker's positions to ``broker``.
 
@@ -154,19 +219,32 @@ async def reconcile(
     ----------
     broker : Broker
         The venue adapter whose state is the truth. Its ``open_orders``,
-        ``balances`` and ``fills`` are read once each; nothing is written.
+        ``balances`` and ``fills`` are read once each (``fills`` twice when an
+        incremental pass falls back to a rebuild); nothing is written.
     router : OrderRouter
         The engine's tracked-order map, converged to the venue's open set.
     tracker : PositionTracker
         The engine's positions, rebuilt from the broker's fills.
     since_ms : int, optional
         Lower time bound (ms since the Unix epoch, UTC) passed to
-        :meth:`~trading_bot.brokers.base.Broker.fills`. ``None`` (default) pulls
+        :meth:`~trading_bot.brokers.base.Broker.fills`. When given, the window's
+        unseen fills are applied on top of the tracker's positions instead of
+        rebuilding them (see the module docstring). ``None`` (default) pulls
         the venue's full/default fill window — the safe choice on a cold start,
-        where the tracker is rebuilt from the complete fill history.
+        where the tracker is rebuilt from the complete fill history. Ignored
+        when ``store`` holds a watermark.
     event_bus : EventBus, optional
         If given, a single :class:`~trading_bot.application.events.LogEvent`
-        summarising the pass is emitted on it. Defaults to ``None`` (no event).
+        summarising the pass is emitted on it, and each fill applied on top of
+        the tracker is published as a ``FillEvent``. Defaults to ``None``.
+    perf : PerformanceService, optional
+        If given, it takes every fill of the pass it has not seen (on a rebuild
+        with ``store``, only those from the latest stored fill ``ts`` on).
+        Defaults to ``None``.
+    store : AsyncStore, optional
+        The engine's store. If given, the pass reads the previous pass's
+        watermark from it (incremental mode) and saves its own. Defaults to
+        ``None``: every pass follows ``since_ms``.
 
     Returns
     -------
@@ -176,8 +254,23 @@ async def reconcile(
     """
     # --- 1. Pull the venue's truth (one fetch each; no writes). ------------- #
     open_orders = await broker.open_orders()
-    await broker.balances()  # refetched for the reconcile contract; not diffed here.
-    broker_fills = await broker.fills(since_ms)
+    balances = await broker.balances()
+    watermark = None
+    if store is not None:
+        watermark = _decode(await store.get_state(RECONCILE_KEY))
+    if watermark is not None:
+        # Incremental: only the fills since the last pass, unless something
+        # moved that they do not explain.
+        window = [
+            fill
+            for fill in await broker.fills(watermark.ts)
+            if fill.fill_id not in watermark.fill_ids
+        ]
+        rebuild = _diverged(watermark, window, balances, tracker)
+        broker_fills = await broker.fills() if rebuild else window
+    else:
+        rebuild = since_ms is None
+        broker_fills = await broker.fills(since_ms)
 
     venue_open_cids = {order.client_order_id for order in open_orders}
 
@@ -196,12 +289,13 @@ async def reconcile(
 
     # Orphans: a non-terminal tracked order the venue reports neither as open nor
     # via any fill has no venue record — close it and evict it (the orphan rule).
+    # Only the router's live index is walked: terminal orders are history, not
+    # live state, and are left alone.
     closed_orphans = 0
-    for cid, order in router.tracked_orders().items():
+    for order in router.open_orders():
+        cid = order.client_order_id
         if cid in venue_open_cids:
             continue  # still live on the venue — keep it.
-        if order.is_terminal:
-            continue  # history, not live state — leave it.
         # Non-terminal but the venue does not list it as open. Whether or not it
         # has fills, it is no longer open on the venue: close-and-forget. Its
         # fills (if any) still rebuild the position in step 3.
@@ -210,34 +304,196 @@ async def reconcile(
         closed_orphans += 1
 
     # --- 3. Positions: rebuild from the broker's confirmed fills (truth). --- #
-    tracker.reset(broker_fills)
+    if rebuild:
+        tracker.reset(broker_fills)
+        fills_applied = len(broker_fills)
+        fresh = broker_fills
+    else:
+        # A window cannot rebuild: apply what the tracker has not seen yet.
+        fresh = [fill for fill in broker_fills if not tracker.has_seen(fill.fill_id)]
+        for fill in fresh:
+            tracker.apply(fill)
+            if event_bus is not None:
+                event_bus.emit(FillEvent(fill))
+        fills_applied = len(fresh)
+    if perf is not None:
+        # A rebuild's fills reach back past what ``perf`` still marks as seen
+        # (a restored snapshot keeps only the ids at its last ts). It has
+        # folded every stored fill, so it takes only those from the latest
+        # stored ts on; at that ts its seen ids skip the ones it has.
+        folded = None
+        if rebuild and store is not None:
+            _, folded = await store.fill_watermark()
+        for fill in fresh:
+            if folded is None or fill.ts >= folded:
+                perf.apply(fill)  # a no-op for a fill it has already folded
     positions_rebuilt = len(tracker.all_positions())
 
+    if store is not None:
+        store.store.set_state(
+            RECONCILE_KEY,
+            _encode(_advance(watermark, broker_fills, balances, tracker)),
+        )
+
     result = ReconResult(
         ingested_orders=ingested,
         adopted_orders=adopted,
         closed_orphans=closed_orphans,
-        fills_applied=len(broker_fills),
+        fills_applied=fills_applied,
         positions_rebuilt=positions_rebuilt,
+        rebuilt=rebuild,
     )
 
     if event_bus is not None:
-        event_bus.emit(
-            LogEvent(
-                message=(
-                    f"reconcile: ingested={result.ingested_orders} "
-                    f"adopted={result.adopted_orders} "
-                    f"closed_orphans={result.closed_orphans} "
-                    f"fills_applied={result.fills_applied} "
-                    f"positions_rebuilt={result.positions_rebuilt}"
-                ),
-                level="info",
-            )
+        event_bus.log(
+            "reconcile: ingested={ingested} adopted={adopted} "
+            "closed_orphans={orphans} fills_applied={fills} "
+            "positions_rebuilt={rebuilt} rebuilt={full}",
+            category="reconcile",
+            ingested=result.ingested_orders,
+            adopted=result.adopted_orders,
+            orphans=result.closed_orphans,
+            fills=result.fills_applied,
+            rebuilt=result.positions_rebuilt,
+            full=result.rebuilt,
         )
 
     return result
 
 
+# --- the watermark ----------------------------------------------------------- #
+
+
+@dataclass(frozen=True, slots=True)
+class _Watermark:
+    """Where the previous pass left the venue and the tracker."""
+
+    ts: int | None  # the latest venue fill ts seen (None: no fill yet)
+    fill_ids: frozenset[str]  # the ids of the fills at ``ts``
+    balances: dict[str, Money]
+    net_qty: dict[str, Money]  # the tracker's, keyed by ``BASE/QUOTE``
+
+
+def _net_qty(tracker: PositionTracker) -> dict[str, Money]:
+    net: dict[str, Money] = {}
+    for instrument, position in tracker.all_positions().items():
+        key = str(instrument)
+        net[key] = net.get(key, _ZERO) + position.net_qty
+    return net
+
+
+def _signed(fill: Fill) -> Money:
+    return fill.qty if fill.side is OrderSide.BUY else -fill.qty
+
+
+def _settle(balances: dict[str, Money], fills: Iterable[Fill]) -> dict[str, Money]:
+    """``balances`` after the venue settles ``fills``, before their fees."""
+    settled = dict(balances)
+    for fill in fills:
+        symbol = fill.instrument.symbol
+        cash = fill.qty * fill.price
+        cash = -cash if fill.side is OrderSide.BUY else cash
+        settled[symbol.base] = settled.get(symbol.base, _ZERO) + _signed(fill)
+        settled[symbol.quote] = settled.get(symbol.quote, _ZERO) + cash
+    return settled
+
+
+def _diverged(
+    watermark: _Watermark,
+    window: list[Fill],
+    balances: dict[str, Money],
+    tracker: PositionTracker,
+) -> bool:
+    """Whether more than ``window`` moved the venue or the tracker since."""
+    expected = _settle(watermark.balances, window)
+    touched: dict[str, int] = {}
+    for fill in window:
+        for asset in (fill.instrument.symbol.base, fill.instrument.symbol.quote):
+            touched[asset] = touched.get(asset, 0) + 1
+    # Each fee is taken, in its own units, from one asset the fill may not
+    # name: no balance can exceed its settlement, and the shortfalls add up to
+    # the fees.
+    fees = sum((fill.fee for fill in window), _ZERO)
+    charged = _ZERO
+    slack = _ZERO
+    for asset in expected.keys() | balances.keys():
+        actual = balances.get(asset)
+        shortfall = expected.get(asset, _ZERO) - (actual or _ZERO)
+        # One rounding per fill, in the last place the venue reports.
+        ulp = _ZERO if actual is None else Decimal(1).scaleb(_exponent(actual))
+        rounding = ulp * touched.get(asset, 0)
+        if shortfall < -rounding:
+            return True
+        charged += shortfall
+        slack += rounding
+    if abs(charged - fees) > slack:
+        return True
+
+    net = dict(watermark.net_qty)
+    for fill in window:
+        if tracker.has_seen(fill.fill_id):
+            key = str(fill.instrument)
+            net[key] = net.get(key, _ZERO) + _signed(fill)
+    current = _net_qty(tracker)
+    return any(
+        net.get(key, _ZERO) != current.get(key, _ZERO)
+        for key in net.keys() | current.keys()
+    )
+
+
+def _exponent(value: Decimal) -> int:
+    exponent = value.as_tuple().exponent
+    return exponent if isinstance(exponent, int) else 0
+
+
+def _advance(
+    watermark: _Watermark | None,
+    fills: list[Fill],
+    balances: dict[str, Money],
+    tracker: PositionTracker,
+) -> _Watermark:
+    """The watermark after a pass that read ``fills`` and ``balances``."""
+    ts = None if watermark is None else watermark.ts
+    ids = frozenset() if watermark is None else watermark.fill_ids
+    for fill in fills:
+        if ts is None or fill.ts > ts:
+            ts, ids = fill.ts, frozenset((fill.fill_id,))
+        elif fill.ts == ts:
+            ids |= {fill.fill_id}
+    return _Watermark(ts, ids, dict(balances), _net_qty(tracker))
+
+
+def _encode(watermark: _Watermark) -> str:
+    return json.dumps(
+        {
+            "version": _VERSION,
+            "ts": watermark.ts,
+            "fill_ids": sorted(watermark.fill_ids),
+            "balances": {k: str(v) for k, v in watermark.balances.items()},
+            "net_qty": {k: str(v) for k, v in watermark.net_qty.items()},
+        },
+        separators=(",", ":"),
+    )
+
+
+def _decode(text: str | None) -> _Watermark | None:
+    """The stored watermark; ``None`` if absent, of another version or malformed."""
+    if text is None:
+        return None
+    try:
+        data = json.loads(text)
+        if data.get("version") != _VERSION:
+            return None
+        return _Watermark(
+            data["ts"],
+            frozenset(data["fill_ids"]),
+            {k: money(v) for k, v in data["balances"].items()},
+            {k: money(v) for k, v in data["net_qty"].items()},
+        )
+    except (ValueError, TypeError, KeyError, AttributeError, ArithmeticError):
+        return None  # a full pass rewrites it
+
+
 def _close_orphan(order: Order) -> None:
     """Drive an orphan ``order`` to ``CANCELLED``, tolerant of the state machine.
 
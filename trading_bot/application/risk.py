@@ -9,8 +9,8 @@ tripped — raises :class:`~trading_bot.domain.errors.RiskLimitBreached` and is
 :meth:`~trading_bot.application.order_router.OrderRouter.submit`); a raise means
 no venue call and no half-tracked order.
 
-The four checks, in order (carried into the ADR)
-------------------------------------------------
+The checks, in order (carried into the ADR)
+-------------------------------------------
 :meth:`check` evaluates these in a fixed order and raises on the first breach:
 
 1. **Kill-switch first.** If :meth:`trip` has fired, *every* order is refused
@@ -32,6 +32,16 @@ The four checks, in order (carried into the ADR)
    predict the order's own PnL — fills are the source of PnL truth, and an order
    that has not filled has realised nothing). See *Daily-loss sourcing* below.
 
+5. **``max_gross_notional``** / **``max_net_notional``** — book-level limits
+   in quote units. The book is every instrument's resulting net position valued
+   at one price per instrument: the order's limit (or stop) price, else a
+   caller-supplied mark, else the last mark fed to :meth:`RiskManager.
+   record_marks` (the runners feed each step's latest close), else the
+   position's average entry price. Gross is ``sum(abs(net) * price)``; net is
+   ``abs(sum(net * price))``. An order that does not raise the measure is never
+   blocked by it. An order whose instrument has no price at all is refused while
+   either limit is set (fail closed).
+
 Each limit is independent and optional: a ``None`` limit (the
 :class:`~trading_bot.application.config.RiskConfig` default) is *unconstrained*
 and its check is skipped. An all-``None`` config + an un-tripped switch passes
@@ -63,6 +73,33 @@ by resetting the *provider's* source. There is deliberately no date-keyed magic
 inside the manager: the engine already owns scheduling, and an implicit clock
 inside a pure-ish gate would be a hidden, hard-to-test dependency.
 
+Batch evaluation (carried into the ADR)
+---------------------------------------
+:meth:`RiskManager.check_batch` gates a whole rebalance at once and returns one
+verdict per order instead of raising. It reads the current positions and the
+day's loss once, then walks the orders in the given order. Each order is checked
+against the book that the *accepted* orders before it produce: per-instrument
+nets and the gross/net notional are running totals, updated only when an order
+passes. So a refused leg never counts against the legs after it, and a batch
+given sells-first lets the sells free room for the buys. The pass is linear in
+the number of orders and stays in exact :class:`~decimal.Decimal` arithmetic
+(no float vectorisation), so verdicts match :meth:`RiskManager.check` to the
+last digit. :meth:`RiskManager.check` is the one-order case of the same pass.
+
+Time-to-flat (carried into the ADR)
+-----------------------------------
+:meth:`RiskManager.kill` flattens the book as fast as the venue allows. Through
+the router it uses :meth:`~trading_bot.application.order_router.OrderRouter.
+cancel_many` — one native batch cancel where the broker declares
+``BATCH_CANCEL``, otherwise concurrent single cancels paced by the broker's rate
+limiter. Broker-direct, it prefers the venue's account-wide ``CANCEL_ALL``
+(Kraken ``CancelAll``, Binance ``DELETE /openOrders`` per symbol), then a batch,
+then concurrent single cancels. The router path never uses ``CANCEL_ALL``: that
+would also cancel orders this engine does not own. The elapsed time from the
+kill call to the last cancel returning is reported as the **time-to-flat** in
+the kill's :class:`~trading_bot.application.events.LogEvent` and the returned
+:class:`KillReport`.
+
 The module is part of the application layer: it imports the pure domain and the
 event/position primitives, holds money as :class:`~decimal.Decimal` end to end,
 and performs no I/O.
@@ -70,21 +107,27 @@ and performs no I/O.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from trading_bot.brokers.base import Broker
+from trading_bot.brokers.base import Broker, Capability
 from trading_bot.domain.errors import RiskLimitBreached
 from trading_bot.domain.money import Money, money
 from trading_bot.domain.order import Order, OrderSide
 
 if TYPE_CHECKING:
     from trading_bot.application.config import RiskConfig
+    from trading_bot.application.events import EventBus
     from trading_bot.application.order_router import OrderRouter
     from trading_bot.application.position_tracker import PositionTracker
+    from trading_bot.domain.instrument import Instrument
+    from trading_bot.domain.position import Position
 
-__all__ = ["RiskManager"]
+__all__ = ["KillReport", "RiskManager"]
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +138,105 @@ _ZERO: Money = money("0")
 _KILL_SWITCH_LIMIT = "kill_switch"
 
 
+#: Most single cancels :meth:`RiskManager.kill` keeps in flight at once.
+_KILL_PARALLELISM = 16
+
+
+@dataclass(frozen=True, slots=True)
+class KillReport:
+    """The outcome of one :meth:`RiskManager.kill`.
+
+    Parameters
+    ----------
+    cancelled : int
+        Orders confirmed cancelled.
+    failed : int
+        Orders whose cancel failed (logged; the switch is tripped regardless).
+    seconds : float
+        Time-to-flat: from the kill call until the last cancel returned.
+
+    """
+
+    cancelled: int
+    failed: int
+    seconds: float
+
+
+class _NotionalBook:
+    """Running gross/net notional of the book for :meth:`RiskManager.check_batch`.
+
+    Values the current ``positions`` at one price per instrument, fixed up
+    front (see the module docstring), then takes each accepted order's change.
+    """
+
+    __slots__ = ("gross", "net", "gross_cap", "net_cap", "marks")
+
+    def __init__(
+        self,
+        config: RiskConfig,
+        positions: Mapping[Instrument, Position],
+        orders: Sequence[Order],
+        prices: Mapping[Instrument, Money] | None,
+        recorded: Mapping[Instrument, Money],
+    ) -> None:
+        self.gross_cap = config.max_gross_notional
+        self.net_cap = config.max_net_notional
+        marks = {
+            instrument: position.avg_entry_price
+            for instrument, position in positions.items()
+            if position.avg_entry_price is not None
+        }
+        marks.update(recorded)
+        marks.update(prices or {})
+        for order in orders:
+            price = order.limit_price
+            if price is None:
+                price = order.stop_price
+            if price is not None:
+                marks[order.instrument] = price
+        self.marks = marks
+        self.gross = _ZERO
+        self.net = _ZERO
+        for instrument, position in positions.items():
+            mark = marks.get(instrument)
+            if mark is not None:
+                self.gross += abs(position.net_qty) * mark
+                self.net += position.net_qty * mark
+
+    def add(
+        self, order: Order, before: Money, after: Money
+    ) -> RiskLimitBreached | None:
+        """Add the order's net change; return its breach (leaving the book as is)."""
+        price = self.marks.get(order.instrument)
+        if price is None:
+            # No price to value it with: refuse rather than under-count the book.
+            on_gross = self.gross_cap is not None
+            cap = self.gross_cap if on_gross else self.net_cap
+            assert cap is not None  # noqa: S101 - only built with a cap set
+            return RiskLimitBreached(
+                "max_gross_notional" if on_gross else "max_net_notional",
+                value=order.qty,
+                threshold=cap,
+                msg=f"no price to value {order.qty} {order.instrument} against",
+            )
+        gross = self.gross + (abs(after) - abs(before)) * price
+        net = self.net + (after - before) * price
+        if self.gross_cap is not None and gross > self.gross and gross > self.gross_cap:
+            return RiskLimitBreached(
+                "max_gross_notional", value=gross, threshold=self.gross_cap
+            )
+        if (
+            self.net_cap is not None
+            and abs(net) > abs(self.net)
+            and abs(net) > self.net_cap
+        ):
+            return RiskLimitBreached(
+                "max_net_notional", value=abs(net), threshold=self.net_cap
+            )
+        self.gross, self.net = gross, net
+        return None
+
+
 class RiskManager:
     """Pre-trade limit gate + kill-switch — refuses an order before it is placed.
 
@@ -123,6 +265,13 @@ class RiskManager:
         derives the day's loss as its negation. If ``None``, the manager reads
         the value last given to :meth:`record_daily_pnl` (default ``0`` until
         set) — so the daily-loss check only ever halts on an *observed* loss.
+    event_bus : EventBus, optional
+        Where :meth:`kill` emits its summary
+        :class:`~trading_bot.application.events.LogEvent` (with the
+        time-to-flat). ``None`` (default) only logs it.
+    clock : Callable[[], float], optional
+        Monotonic seconds timing :meth:`kill`. Defaults to
+        :func:`time.perf_counter`.
 
     Attributes
     ----------
@@ -145,13 +294,19 @@ class RiskManager:
         *,
         position_tracker: PositionTracker | None = None,
         daily_pnl_provider: Callable[[], Money] | None = None,
+        event_bus: EventBus | None = None,
+        clock: Callable[[], float] = time.perf_counter,
     ) -> None:
         self._config = config
+        self._bus = event_bus
+        self._clock = clock
         self._positions = position_tracker
         self._daily_pnl_provider = daily_pnl_provider
         # The locally-recorded daily realised PnL, used when no provider is
         # injected. Reset to zero by ``reset_day``.
         self._recorded_daily_pnl: Money = _ZERO
+        # The last mark fed per instrument, valuing the notional limits.
+        self._marks: dict[Instrument, Money] = {}
         self._tripped = False
         self._trip_reason: str | None = None
 
@@ -161,10 +316,11 @@ class RiskManager:
         """Raise :class:`RiskLimitBreached` if ``order`` may not be placed.
 
         The single pre-trade gate. Evaluates, in order, the kill-switch then the
-        ``max_order``, ``max_position`` and ``max_daily_loss`` limits (see the
-        module docstring), and raises on the **first** breach with a clear
-        ``limit``/``value``/``threshold``. Returns ``None`` (silently) when every
-        applicable check passes; ``None`` limits are skipped.
+        ``max_order``, ``max_position``, ``max_daily_loss`` and notional limits
+        (see the module docstring), and raises on the **first** breach with a
+        clear ``limit``/``value``/``threshold``. Returns ``None`` (silently) when
+        every applicable check passes; ``None`` limits are skipped. The
+        one-order case of :meth:`check_batch`.
 
         This method is read-only — it never mutates ``order`` or any state — so a
         caller that catches the raise is free to leave the order untracked (the
@@ -181,57 +337,94 @@ class RiskManager:
         RiskLimitBreached
             If the kill-switch is tripped, or any set limit would be breached.
 
+        """
+        breach = self.check_batch([order])[0]
+        if breach is not None:
+            raise breach
+
+    def check_batch(
+        self,
+        orders: Sequence[Order],
+        *,
+        prices: Mapping[Instrument, Money] | None = None,
+    ) -> list[RiskLimitBreached | None]:
+        """Gate a batch of orders against the book they produce together.
+
+        Each order is checked as by :meth:`check`, against the current positions
+        plus every order accepted before it in ``orders`` (see the module
+        docstring's batch section). Read-only, like :meth:`check`.
+
+        Parameters
+        ----------
+        orders : sequence of Order
+            The orders about to be submitted, in the order they would land.
+        prices : mapping of Instrument to Decimal, optional
+            Marks for valuing the book under the notional limits, for
+            instruments no order in the batch prices itself (MARKET orders, or
+            positions the batch does not touch). They take precedence over the
+            marks fed to :meth:`record_marks`. Defaults to none.
+
+        Returns
+        -------
+        list of RiskLimitBreached or None
+            One verdict per order, in input order: ``None`` if it may be placed,
+            else the breach that refuses it.
+
         """
         if self._tripped:
             # The kill-switch is a hard halt: refuse before any per-order maths.
-            raise RiskLimitBreached(
-                _KILL_SWITCH_LIMIT,
-                value=_ZERO,
-                threshold=_ZERO,
-            )
-
-        self._check_max_order(order)
-        self._check_max_position(order)
-        self._check_max_daily_loss()
-
-    def _check_max_order(self, order: Order) -> None:
-        """Breach if the order's size exceeds ``max_order``."""
-        cap = self._config.max_order
-        if cap is not None and order.qty > cap:
-            raise RiskLimitBreached("max_order", value=order.qty, threshold=cap)
-
-    def _check_max_position(self, order: Order) -> None:
-        """Breach if the **resulting** absolute net position exceeds ``max_position``."""
-        cap = self._config.max_position
-        if cap is None:
-            return
-        current = self._current_net(order)
-        resulting = current + self._signed_qty(order)
-        magnitude = abs(resulting)
-        if magnitude > cap:
-            raise RiskLimitBreached(
-                "max_position", value=magnitude, threshold=cap
+            return [
+                RiskLimitBreached(_KILL_SWITCH_LIMIT, value=_ZERO, threshold=_ZERO)
+                for _ in orders
+            ]
+        config = self._config
+        loss = self._daily_loss()
+        nets: dict[Instrument, Money] = {}
+        book: _NotionalBook | None = None
+        if config.max_gross_notional is not None or config.max_net_notional is not None:
+            positions = (
+                self._positions.all_positions() if self._positions is not None else {}
             )
-
-    def _check_max_daily_loss(self) -> None:
-        """Breach if the day's realised loss has already reached ``max_daily_loss``."""
-        cap = self._config.max_daily_loss
-        if cap is None:
-            return
+            book = _NotionalBook(config, positions, orders, prices, self._marks)
+        verdicts: list[RiskLimitBreached | None] = []
+        for order in orders:
+            instrument = order.instrument
+            before = nets.get(instrument)
+            if before is None:
+                before = self._current_net(instrument)
+            after = before + self._signed_qty(order)
+            breach: RiskLimitBreached | None = None
+            if config.max_order is not None and order.qty > config.max_order:
+                breach = RiskLimitBreached(
+                    "max_order", value=order.qty, threshold=config.max_order
+                )
+            elif config.max_position is not None and abs(after) > config.max_position:
+                breach = RiskLimitBreached(
+                    "max_position", value=abs(after), threshold=config.max_position
+                )
+            elif config.max_daily_loss is not None and loss >= config.max_daily_loss:
+                breach = RiskLimitBreached(
+                    "max_daily_loss", value=loss, threshold=config.max_daily_loss
+                )
+            elif book is not None:
+                breach = book.add(order, before, after)
+            if breach is None:
+                nets[instrument] = after
+            verdicts.append(breach)
+        return verdicts
+
+    def _daily_loss(self) -> Money:
+        """The day's realised loss magnitude (``0`` on a flat or profitable day)."""
         # daily_pnl is signed (loss negative); the loss magnitude is its negation,
         # floored at zero so a profitable day never registers as a "negative loss".
         daily_pnl = self._daily_pnl()
-        loss = -daily_pnl if daily_pnl < 0 else _ZERO
-        if loss >= cap:
-            raise RiskLimitBreached(
-                "max_daily_loss", value=loss, threshold=cap
-            )
+        return -daily_pnl if daily_pnl < 0 else _ZERO
 
-    def _current_net(self, order: Order) -> Money:
-        """Current signed net exposure for the order's instrument (flat if none)."""
+    def _current_net(self, instrument: Instrument) -> Money:
+        """Current signed net exposure for ``instrument`` (flat if none)."""
         if self._positions is None:
             return _ZERO
-        position = self._positions.position(order.instrument)
+        position = self._positions.position(instrument)
         return position.net_qty if position is not None else _ZERO
 
     @staticmethod
@@ -265,6 +458,26 @@ class RiskManager:
         """
         self._recorded_daily_pnl = daily_pnl
 
+    def record_marks(self, marks: Mapping[Instrument, Money]) -> None:
+        """Record the latest mark price of each instrument in ``marks``.
+
+        The feed that values MARKET orders and untouched positions under
+        ``max_gross_notional`` / ``max_net_notional`` (see the module
+        docstring). A later mark for an instrument replaces the earlier one.
+
+        Parameters
+        ----------
+        marks : mapping of Instrument to Decimal
+            The latest price per instrument (e.g. the last bar's close).
+
+        """
+        self._marks.update(marks)
+
+    @property
+    def recorded_daily_pnl(self) -> Money:
+        """The value last given to :meth:`record_daily_pnl` (``0`` after a reset)."""
+        return self._recorded_daily_pnl
+
     def reset_day(self) -> None:
         """Reset the recorded daily PnL to zero — the day-boundary roll-over.
 
@@ -322,7 +535,7 @@ class RiskManager:
         broker: Broker | None = None,
         *,
         reason: str = "kill-switch engaged",
-    ) -> None:
+    ) -> KillReport:
         """Cancel every open order and trip the kill-switch — the hard halt.
 
         The documented "panic" entry point. Cancels all currently-open orders,
@@ -330,12 +543,13 @@ class RiskManager:
         runs *before* the trip so the cancels themselves are not refused by the
         gate; cancelling is a *reducing* action and is never risk-gated.
 
-        Open orders are sourced from the ``router`` when given (its tracked
-        orders, cancelled via :meth:`~trading_bot.application.order_router.
-        OrderRouter.cancel` so local state transitions too); otherwise from the
-        ``broker`` directly (``broker.open_orders()`` → ``broker.cancel_order``).
-        Pass at least one. A cancellation that fails is logged and skipped so one
-        stuck order never blocks the halt — the switch is still tripped.
+        Open orders are sourced from the ``router`` when given (its live orders,
+        cancelled via :meth:`~trading_bot.application.order_router.OrderRouter.
+        cancel_many` so local state transitions too); otherwise from the
+        ``broker`` directly. Either way the fastest cancel the venue offers is
+        used (see the module docstring's time-to-flat section). Pass at least
+        one. A cancellation that fails is logged and skipped so one stuck order
+        never blocks the halt — the switch is still tripped.
 
         Parameters
         ----------
@@ -348,6 +562,11 @@ class RiskManager:
         reason : str, optional
             The trip reason recorded for the halt.
 
+        Returns
+        -------
+        KillReport
+            How many cancels succeeded and failed, and the time-to-flat.
+
         Raises
         ------
         ValueError
@@ -357,34 +576,91 @@ class RiskManager:
         if router is None and broker is None:
             raise ValueError("kill() needs a router or a broker to cancel against")
 
+        started = self._clock()
         if router is not None:
-            await self._cancel_via_router(router)
-        elif broker is not None:
-            await self._cancel_via_broker(broker)
+            cancelled, failed = await self._cancel_via_router(router)
+        else:
+            assert broker is not None  # noqa: S101 - narrowed by the check above
+            cancelled, failed = await self._cancel_via_broker(broker)
+        report = KillReport(
+            cancelled=cancelled, failed=failed, seconds=self._clock() - started
+        )
 
         self.trip(reason)
+        if self._bus is not None:
+            self._bus.log(
+                "kill-switch: {reason}; cancelled {cancelled} order(s), {failed} "
+                "failed, time-to-flat {ms:.1f}ms",
+                level="error" if report.failed else "warning",
+                category="risk",
+                reason=reason,
+                cancelled=report.cancelled,
+                failed=report.failed,
+                ms=report.seconds * 1000,
+            )
+        return report
 
-    async def _cancel_via_router(self, router: OrderRouter) -> None:
-        """Cancel every order the router tracks that is still live on a venue."""
-        for cid, order in router.tracked_orders().items():
-            # Only orders with a venue id are live on a venue; terminal/untracked
-            # ones cannot (and need not) be cancelled.
-            if order.venue_order_id is None or order.is_terminal:
-                continue
+    async def _cancel_via_router(self, router: OrderRouter) -> tuple[int, int]:
+        """Cancel every order the router tracks that is still live on a venue.
+
+        Goes through :meth:`~trading_bot.application.order_router.OrderRouter.
+        cancel_many`, so a broker with a native batch cancel flattens the book in
+        one request, and any other broker gets concurrent cancels. Returns
+        ``(cancelled, failed)``.
+        """
+        # Only orders with a venue id are live on a venue; terminal/untracked
+        # ones cannot (and need not) be cancelled.
+        live = [
+            order.client_order_id
+            for order in router.open_orders()
+            if order.venue_order_id is not None
+        ]
+        outcomes = await router.cancel_many(live, parallelism=_KILL_PARALLELISM)
+        failed = 0
+        for cid, outcome in zip(live, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                failed += 1
+                logger.error(
+                    "kill: failed to cancel order %s", cid, exc_info=outcome
+                )
+        return len(live) - failed, failed
+
+    async def _cancel_via_broker(self, broker: Broker) -> tuple[int, int]:
+        """Cancel every open order the broker reports, directly.
+
+        One account-wide ``cancel_all`` where declared; otherwise the open
+        orders are read and cancelled in one batch, or concurrently one by one.
+        Returns ``(cancelled, failed)``.
+        """
+        capabilities = broker.capabilities()
+        if Capability.CANCEL_ALL in capabilities:
             try:
-                await router.cancel(cid)
+                return await broker.cancel_all(), 0  # type: ignore[attr-defined]
             except Exception:
-                logger.exception("kill: failed to cancel order %s", cid)
-
-    async def _cancel_via_broker(self, broker: Broker) -> None:
-        """Cancel every open order the broker reports, directly."""
-        for order in await broker.open_orders():
-            venue_id = order.venue_order_id
-            if venue_id is None:
-                continue
+                logger.exception("kill: cancel_all failed; cancelling one by one")
+        venue_ids = [
+            order.venue_order_id
+            for order in await broker.open_orders()
+            if order.venue_order_id is not None
+        ]
+        if len(venue_ids) > 1 and Capability.BATCH_CANCEL in capabilities:
             try:
-                await broker.cancel_order(venue_id)
+                await broker.cancel_orders(venue_ids)  # type: ignore[attr-defined]
+                return len(venue_ids), 0
             except Exception:
-                logger.exception(
-                    "kill: failed to cancel venue order %s", venue_id
-                )
+                logger.exception("kill: batch cancel failed; cancelling one by one")
+        gate = asyncio.Semaphore(_KILL_PARALLELISM)
+
+        async def _one(venue_id: str) -> bool:
+            async with gate:
+                try:
+                    await broker.cancel_order(venue_id)
+                except Exception:
+                    logger.exception(
+                        "kill: failed to cancel venue order %s", venue_id
+                    )
+                    return False
+                return True
+
+        done = await asyncio.gather(*(_one(venue_id) for venue_id in venue_ids))
+        return sum(done), len(done) - sum(done)
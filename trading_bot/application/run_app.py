@@ -68,6 +68,7 @@ own (the runners' router/broker and the feed's client do).
 
 from __future__ import annotations
 
+import contextlib
 import itertools
 from collections.abc import Callable, Iterator, Mapping
 from dataclasses import dataclass, field
@@ -83,7 +84,11 @@ from trading_bot.application.portfolio import (
 from trading_bot.application.portfolio_feed import PortfolioFeed
 from trading_bot.application.portfolio_runner import PortfolioRunner
 from trading_bot.application.reconcile import reconcile
-from trading_bot.application.service_factory import Engine, build_engine
+from trading_bot.application.service_factory import (
+    Engine,
+    build_engine,
+    restore_engine,
+)
 from trading_bot.application.strategy import (
     SignalFn,
     Strategy,
@@ -91,6 +96,7 @@ from trading_bot.application.strategy import (
     ma_crossover_signal,
 )
 from trading_bot.application.strategy_runner import StrategyRunner
+from trading_bot.application.watchdog import LoopWatchdog
 from trading_bot.brokers.kraken import KrakenBroker
 from trading_bot.brokers.kraken_ws import KrakenPrivateWS
 from trading_bot.domain.errors import ConfigError
@@ -108,6 +114,7 @@ if TYPE_CHECKING:
     from trading_bot.application.data_feed import DataFeed
     from trading_bot.application.data_provider import DccdClient
     from trading_bot.domain.position import Position
+    from trading_bot.transport.http import AsyncHTTPClient
 
 __all__ = [
     "RunReport",
@@ -118,6 +125,8 @@ __all__ = [
     "build_runners",
     "build_portfolio_runners",
     "prepare_system",
+    "run_system",
+    "close_system",
     "run_app",
 ]
 
@@ -527,6 +536,7 @@ def build_runners(
             engine.tracker,
             event_bus=engine.bus,
             order_factory=_limit_at_close_factory(),
+            prefetch=strategy_cfg.prefetch,
         )
         runners.append(runner)
     return runners
@@ -627,6 +637,8 @@ def build_portfolio_runners(
             engine.router,
             engine.tracker,
             event_bus=engine.bus,
+            parallelism=portfolio_cfg.parallelism,
+            leg_order=portfolio_cfg.leg_order,
         )
         runners.append(runner)
     return runners
@@ -681,7 +693,15 @@ def _maybe_build_fill_streamer(
         return None
 
     async def _reconcile_on_reconnect() -> None:
-        await reconcile(broker, engine.router, engine.tracker, event_bus=engine.bus)
+        # Incremental with a store: one small fill request, not the whole window.
+        await reconcile(
+            broker,
+            engine.router,
+            engine.tracker,
+            event_bus=engine.bus,
+            perf=engine.perf,
+            store=engine.reader,
+        )
 
     ws = KrakenPrivateWS.from_broker(broker, on_connected=_reconcile_on_reconnect)
     return LiveFillStreamer(ws, engine.bus)
@@ -721,6 +741,10 @@ class PreparedSystem:
         The single-instrument runners, in config order.
     portfolio_runners : list of PortfolioRunner
         The portfolio runners, in config order.
+    watchdog : LoopWatchdog or None
+        The event-loop stall watchdog (reporting onto the engine bus) when
+        ``config.watchdog.enabled``, else ``None``. Built, not started: the
+        caller wraps the orchestrator run in it.
 
     """
 
@@ -728,6 +752,7 @@ class PreparedSystem:
     orchestrator: Orchestrator
     runners: list[StrategyRunner]
     portfolio_runners: list[PortfolioRunner]
+    watchdog: LoopWatchdog | None = None
 
 
 async def prepare_system(
@@ -736,6 +761,8 @@ async def prepare_system(
     dccd_client: DccdClient | None = None,
     max_steps: int | None = None,
     reconcile_on_start: bool = True,
+    http: AsyncHTTPClient | None = None,
+    clock: Callable[[], int] | None = None,
 ) -> PreparedSystem:
     """Build the declared system up to (but not running) the orchestrator.
 
@@ -748,19 +775,31 @@ async def prepare_system(
     dashboard over the same engine while the orchestrator runs). See
     :func:`run_app` for the parameter meanings.
     """
-    engine = build_engine(config, db_path=config.storage.db_path)
+    engine = build_engine(
+        config, db_path=config.storage.db_path, http=http, clock=clock
+    )
     # Recover idempotency state across a restart: seed the router's dedup map from
     # the persisted store (the append-only order history) so a re-submit of any
     # previously-recorded order id is de-duplicated — closing the crash-restart
     # double-submit window for ids the in-memory map lost. Done *before* reconcile,
-    # which then converges to the venue's current truth.
-    if engine.store is not None:
-        engine.router.restore(engine.store.orders())
+    # which then converges to the venue's current truth. With snapshots, positions
+    # and performance come back from the latest one plus the stored fills after
+    # it; reconcile then only fetches the venue's fills from there on. Both reads
+    # run on the store's reader threads, off the event loop.
+    since_ms = await restore_engine(engine)
     # Reconcile, don't assume: converge the fresh engine's empty maps to the
     # broker's truth (open orders + fills) before the first order is placed.
+    # With the watermark the previous pass left in the store, only the venue's
+    # newer fills are fetched (a full rebuild only if the balances disagree).
     if reconcile_on_start:
         await reconcile(
-            engine.broker, engine.router, engine.tracker, event_bus=engine.bus
+            engine.broker,
+            engine.router,
+            engine.tracker,
+            since_ms=since_ms,
+            event_bus=engine.bus,
+            perf=engine.perf,
+            store=engine.reader,
         )
     # Reject any instrument claimed by two runners up front — across both the
     # single-instrument strategies and the portfolios (the shared per-instrument
@@ -781,11 +820,21 @@ async def prepare_system(
     fill_streamer = _maybe_build_fill_streamer(config, engine)
     if fill_streamer is not None:
         orchestrator.add(fill_streamer)  # type: ignore[arg-type]
+    watchdog = (
+        LoopWatchdog(
+            engine.bus,
+            interval=config.watchdog.interval,
+            threshold=config.watchdog.threshold,
+        )
+        if config.watchdog.enabled
+        else None
+    )
     return PreparedSystem(
         engine=engine,
         orchestrator=orchestrator,
         runners=runners,
         portfolio_runners=portfolio_runners,
+        watchdog=watchdog,
     )
 
 
@@ -836,12 +885,49 @@ def _build_report(
     )
 
 
+async def run_system(system: PreparedSystem) -> RunReport:
+    """Run a :func:`prepare_system` result to completion and report on it.
+
+    The second half of :func:`run_app`, split out so an interface can wrap the
+    run in its own observers (the CLI's out-of-process event stream) between
+    building the system and running it. Runs the orchestrator inside the
+    system's watchdog (if any), drains the bus, and builds the
+    :class:`RunReport`.
+    """
+    async with system.watchdog or contextlib.nullcontext():
+        results = await system.orchestrator.run()
+        # An async bus may still hold fills for the tracker / performance view.
+        await system.engine.bus.drain()
+    if system.engine.snapshots is not None:
+        await system.engine.snapshots.drain()
+        system.engine.snapshots.save()
+    if system.engine.store is not None:
+        system.engine.store.flush()  # a write-behind store commits its queue
+    return _build_report(system, results)
+
+
+def close_system(system: PreparedSystem) -> None:
+    """Release a run system's store: its reader threads first, then the store.
+
+    Stopping the :attr:`~trading_bot.application.service_factory.Engine.reader`
+    pool first lets any read still in flight finish on an open store. Closing
+    the store commits a write-behind queue. A no-op without a store.
+    """
+    engine = system.engine
+    if engine.reader is not None:
+        engine.reader.close()
+    if engine.store is not None:
+        engine.store.close()
+
+
 async def run_app(
     config: AppConfig,
     *,
     dccd_client: DccdClient | None = None,
     max_steps: int | None = None,
     reconcile_on_start: bool = True,
+    http: AsyncHTTPClient | None = None,
+    clock: Callable[[], int] | None = None,
 ) -> RunReport:
     """Run the whole declared system from one config and return a summary.
 
@@ -874,11 +960,18 @@ async def run_app(
     recovers state after a restart. The pass emits one
     :class:`~trading_bot.application.events.LogEvent` on the engine bus.
 
+    With ``config.watchdog.enabled`` the run is wrapped in a
+    :class:`~trading_bot.application.watchdog.LoopWatchdog`: event-loop lag is
+    sampled into a histogram and any stall past the threshold lands on the engine
+    bus as a warning ``LogEvent`` carrying the stack that blocked the loop. With
+    ``config.events.dispatch == "async"`` the bus is drained before the report is
+    built, so it reflects every fill.
+
     When a store is configured, the router's dedup map is first **restored** from
-    the persisted order history (``engine.router.restore(engine.store.orders())``),
-    so a re-submit of any previously-recorded order id is de-duplicated after a
-    restart even before reconcile runs — closing the crash-restart double-submit
-    window for ids the in-memory map lost.
+    the persisted order history (:func:`~trading_bot.application.service_factory.
+    restore_orders`), so a re-submit of any previously-recorded order id is
+    de-duplicated after a restart even before reconcile runs — closing the
+    crash-restart double-submit window for ids the in-memory map lost.
 
     Reconciling **after a disconnect** is also wired for a real-money live Kraken
     run: the private fill stream (:class:`~trading_bot.application.live_fills.
@@ -905,6 +998,15 @@ async def run_app(
         Whether to reconcile the engine to the broker before running (default
         ``True``, enforcing the startup invariant). Pass ``False`` only to skip
         the pass in a test/offline context where the broker reads are irrelevant.
+    http : AsyncHTTPClient or None, optional
+        The HTTP client a venue broker sends through (forwarded to
+        :func:`~trading_bot.application.service_factory.build_engine`). ``None``
+        (default) lets the adapter build its own.
+    clock : Callable[[], int] or None, optional
+        The paper broker's millisecond clock (forwarded to the factory). ``None``
+        (default) keeps its deterministic clock. Together with ``dccd_client``
+        and ``http`` these are the seams the record/replay journal
+        (:mod:`trading_bot.application.journal`) plugs into.
 
     Returns
     -------
@@ -929,6 +1031,10 @@ async def run_app(
         dccd_client=dccd_client,
         max_steps=max_steps,
         reconcile_on_start=reconcile_on_start,
+        http=http,
+        clock=clock,
     )
-    results = await system.orchestrator.run()
-    return _build_report(system, results)
+    try:
+        return await run_system(system)
+    finally:
+        close_system(system)
@@ -49,23 +49,29 @@ name the simulator explicitly.
 from __future__ import annotations
 
 import pathlib
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Protocol, runtime_checkable
 
 from trading_bot.application.config import AppConfig, BrokerConfig
 from trading_bot.application.events import EventBus
+from trading_bot.application.log_events import LogPolicy, LogRing
 from trading_bot.application.order_router import OrderRouter
 from trading_bot.application.performance_service import PerformanceService
 from trading_bot.application.position_tracker import PositionTracker
 from trading_bot.application.risk import RiskManager
+from trading_bot.application.snapshot import Snapshotter, restore_snapshot
 from trading_bot.brokers.base import Broker
 from trading_bot.brokers.binance import TESTNET_API_BASE, BinanceBroker
 from trading_bot.brokers.kraken import KrakenBroker
 from trading_bot.brokers.paper import PaperBroker
 from trading_bot.domain.errors import BrokerError, LiveTradingNotEnabled
+from trading_bot.storage.async_store import AsyncStore
+from trading_bot.storage.journal_store import JournalStore
 from trading_bot.storage.sqlite_store import SqliteStore
+from trading_bot.transport.http import AsyncHTTPClient
 
-__all__ = ["Engine", "build_engine"]
+__all__ = ["Engine", "build_engine", "restore_engine", "restore_orders"]
 
 #: Venue keys recognised as live (non-simulated) adapters.
 _LIVE_VENUES = ("kraken", "binance")
@@ -76,6 +82,8 @@ _TESTNET_VENUES = ("binance",)
 _PAPER_VENUE = "paper"
 #: The go-live runbook the live-opt-in refusals point users at.
 _RUNBOOK = "doc/dev/09-go-live.md"
+#: Milliseconds per day (``storage.archive_after_days`` to the store's ms).
+_DAY_MS = 86_400_000
 
 
 @runtime_checkable
@@ -128,9 +136,21 @@ class Engine:
         The read-side PnL/KPI view, subscribed to the bus's fills.
     risk : RiskManager
         The pre-trade gate + kill-switch the router consults before every order.
-    store : SqliteStore or None
-        The append-only order/fill history, attached to the bus. ``None`` when
-        no ``db_path`` was given to :func:`build_engine`.
+    store : SqliteStore or JournalStore or None
+        The append-only order/fill history, attached to the bus (the backend
+        per ``config.storage.backend``). ``None`` when no ``db_path`` was given
+        to :func:`build_engine`.
+    logs : LogRing or None
+        The pageable in-memory log sink the dashboard reads. ``None`` when
+        ``config.events.log_buffer`` is ``0``.
+    snapshots : Snapshotter or None
+        Saves the engine's fill-derived state to the store every
+        ``config.storage.snapshot_every`` fills. ``None`` without a store or
+        without that setting.
+    reader : AsyncStore or None
+        Non-blocking reads of ``store`` for async code (the API handlers, the
+        startup restore), run on ``config.storage.read_workers`` reader threads.
+        ``None`` without a store.
 
     """
 
@@ -141,11 +161,18 @@ class Engine:
     tracker: PositionTracker
     perf: PerformanceService
     risk: RiskManager
-    store: SqliteStore | None
+    store: SqliteStore | JournalStore | None
+    logs: LogRing | None = None
+    snapshots: Snapshotter | None = None
+    reader: AsyncStore | None = None
 
 
 def build_engine(
-    config: AppConfig, *, db_path: str | pathlib.Path | None = None
+    config: AppConfig,
+    *,
+    db_path: str | pathlib.Path | None = None,
+    http: AsyncHTTPClient | None = None,
+    clock: Callable[[], int] | None = None,
 ) -> Engine:
     """Assemble a fully-wired :class:`Engine` from ``config``.
 
@@ -153,19 +180,28 @@ def build_engine(
     EventBus`, selects the broker per ``config.mode`` (paper by default; live
     only with credentials — see the module docstring), constructs the tracker,
     performance service, risk manager and router onto that bus, optionally
-    attaches a :class:`~trading_bot.storage.sqlite_store.SqliteStore`, and
-    returns them in a frozen :class:`Engine`.
+    attaches a store (:class:`~trading_bot.storage.sqlite_store.SqliteStore`
+    or :class:`~trading_bot.storage.journal_store.JournalStore`), and returns
+    them in a frozen :class:`Engine`.
 
     Parameters
     ----------
     config : AppConfig
         The validated engine configuration (mode, brokers, risk limits).
     db_path : str or pathlib.Path, optional
-        Where to persist order/fill history. When given, a
-        :class:`~trading_bot.storage.sqlite_store.SqliteStore` is created and
-        attached to the bus (so it fills itself from the event stream); when
+        Where to persist order/fill history. When given, the store
+        ``config.storage.backend`` names is created there and attached to the
+        bus (so it fills itself from the event stream); when
         ``None`` (default) the engine runs with no store
         (:attr:`Engine.store` is ``None``).
+    http : AsyncHTTPClient, optional
+        The HTTP client a venue adapter (live / testnet) sends through. ``None``
+        (default) lets the adapter build its own rate-limited client. Ignored by
+        the paper simulator. The seam a recording / replaying client plugs into
+        (see :mod:`trading_bot.application.journal`).
+    clock : Callable[[], int], optional
+        The paper simulator's millisecond clock. ``None`` (default) keeps its
+        deterministic clock. Ignored by venue adapters.
 
     Returns
     -------
@@ -186,9 +222,17 @@ def build_engine(
         never falls back to paper.
 
     """
-    bus = EventBus()
+    events = config.events
+    bus = EventBus(
+        dispatch=events.dispatch,
+        maxsize=events.queue_size,
+        log_policy=LogPolicy(sample=events.log_sample, rate=events.log_rate)
+        if events.log_sample or events.log_rate
+        else None,
+    )
+    logs = LogRing(bus, capacity=events.log_buffer) if events.log_buffer else None
 
-    broker = _build_broker(config, bus)
+    broker = _build_broker(config, bus, http=http, clock=clock)
 
     tracker = PositionTracker(event_bus=bus)
     # Seed the equity curve with the configured starting capital so the KPI
@@ -206,13 +250,52 @@ def build_engine(
         config.risk,
         position_tracker=tracker,
         daily_pnl_provider=perf.realised_pnl,
+        event_bus=bus,
     )
-    router = OrderRouter(broker, bus, risk_manager=risk)
-
-    store: SqliteStore | None = None
-    if db_path is not None:
-        store = SqliteStore(db_path)
+    store: SqliteStore | JournalStore | None = None
+    if db_path is not None and config.storage.backend == "journal":
+        store = JournalStore(
+            db_path,
+            flush_rows=config.storage.flush_rows,
+            flush_interval=config.storage.flush_interval,
+        )
+    elif db_path is not None:
+        days = config.storage.archive_after_days
+        store = SqliteStore(
+            db_path,
+            write_behind=config.storage.write_behind,
+            flush_rows=config.storage.flush_rows,
+            flush_interval=config.storage.flush_interval,
+            archive_after=None if days is None else int(days * _DAY_MS),
+            archive_interval=config.storage.archive_interval,
+        )
+    if store is not None:
         store.attach(bus)
+    # Subscribed after the tracker, the performance service and the store, so
+    # a snapshot taken from its fill handler sees all three settled.
+    snapshots = (
+        Snapshotter(
+            store,
+            tracker,
+            perf,
+            risk,
+            every=config.storage.snapshot_every,
+            event_bus=bus,
+        )
+        if store is not None and config.storage.snapshot_every is not None
+        else None
+    )
+
+    # With a store and a retention window, terminal orders are archived out of
+    # the router's memory (dedup then falls back to the store).
+    retention = config.storage.order_retention if store is not None else None
+    router = OrderRouter(
+        broker,
+        bus,
+        risk_manager=risk,
+        archive=store if retention is not None else None,
+        retention=retention,
+    )
 
     return Engine(
         config=config,
@@ -223,10 +306,88 @@ def build_engine(
         perf=perf,
         risk=risk,
         store=store,
+        logs=logs,
+        snapshots=snapshots,
+        reader=(
+            AsyncStore(store, workers=config.storage.read_workers)
+            if store is not None
+            else None
+        ),
     )
 
 
-def _build_broker(config: AppConfig, bus: EventBus) -> Broker:
+def restore_orders(engine: Engine) -> int:
+    """Seed the engine's router dedup map from its store — before reconcile.
+
+    Recovers idempotency state across a restart (see
+    :meth:`~trading_bot.application.order_router.OrderRouter.restore`). Without
+    ``storage.order_retention`` every stored order is restored, as the router
+    would hold them all. With it, only the live orders and those written within
+    the retention window are loaded
+    (:meth:`~trading_bot.storage.sqlite_store.SqliteStore.orders_to_restore`):
+    exactly what the router would still hold in memory. Older ids dedup through
+    the store, the router's archive. Boot time then tracks the live book, not
+    the history.
+
+    Parameters
+    ----------
+    engine : Engine
+        The freshly built engine. A no-op without a store.
+
+    Returns
+    -------
+    int
+        How many ids were newly registered.
+
+    """
+    store = engine.store
+    if store is None:
+        return 0
+    retention = engine.config.storage.order_retention
+    if retention is None:
+        return engine.router.restore(store.iter_orders())
+    window_ms = int(retention * 1000)
+    return engine.router.restore(store.orders_to_restore(window_ms=window_ms))
+
+
+async def restore_engine(engine: Engine) -> int | None:
+    """Restore ``engine`` from its store off the event loop — before reconcile.
+
+    Runs :func:`restore_orders` and, with snapshots,
+    :func:`~trading_bot.application.snapshot.restore_snapshot` on the engine's
+    :attr:`~Engine.reader` threads, so a long history read at startup (or when
+    the supervisor starts a unit beside running ones) does not block the loop.
+    Nothing else touches the fresh engine meanwhile; neither restore emits on
+    the bus. An engine without a reader restores inline.
+
+    Parameters
+    ----------
+    engine : Engine
+        The freshly built engine. A no-op without a store.
+
+    Returns
+    -------
+    int or None
+        The latest stored fill ``ts`` when snapshots are on (the startup
+        reconcile's fill lower bound), else ``None``.
+
+    """
+    if engine.reader is None:
+        restore_orders(engine)
+        return restore_snapshot(engine) if engine.snapshots is not None else None
+    await engine.reader.run(restore_orders, engine)
+    if engine.snapshots is None:
+        return None
+    return await engine.reader.run(restore_snapshot, engine)
+
+
+def _build_broker(
+    config: AppConfig,
+    bus: EventBus,
+    *,
+    http: AsyncHTTPClient | None = None,
+    clock: Callable[[], int] | None = None,
+) -> Broker:
     """Select and construct the broker for ``config`` — paper-by-default.
 
     In paper mode (the default), always a bus-wired
@@ -252,7 +413,7 @@ def _build_broker(config: AppConfig, bus: EventBus) -> Broker:
 
     if config.mode == "paper" or venue == _PAPER_VENUE:
         # Paper-by-default: the simulator, wired to the bus so its fills fan out.
-        return PaperBroker(event_bus=bus)
+        return PaperBroker(event_bus=bus, clock=clock)
 
     # Testnet path: a venue's sandbox (paper money on the real testnet venue). The
     # adapter is **hard-pinned** to the testnet endpoint (it cannot reach mainnet),
@@ -261,7 +422,7 @@ def _build_broker(config: AppConfig, bus: EventBus) -> Broker:
     # broker is what opts in; a venue with no testnet raises.
     first: BrokerConfig | None = config.brokers[0] if config.brokers else None
     if first is not None and first.testnet:
-        broker = _build_testnet_venue(venue)
+        broker = _build_testnet_venue(venue, http=http)
         if not broker.has_credentials:
             raise BrokerError(
                 f"testnet for venue {venue!r} requires credentials; set the "
@@ -285,7 +446,7 @@ def _build_broker(config: AppConfig, bus: EventBus) -> Broker:
     # Opt-in is set: build the real adapter, but only if it can actually trade.
     # Never silently downgrade to paper.
     if venue in _LIVE_VENUES:
-        broker = _build_live_venue(venue)
+        broker = _build_live_venue(venue, http=http)
         if not broker.has_credentials:
             raise BrokerError(
                 f"live mode requires credentials for venue {venue!r}; "
@@ -353,22 +514,26 @@ def _selected_venue(config: AppConfig) -> str:
     return first.exchange.lower()
 
 
-def _build_live_venue(venue: str) -> _LiveBroker:
+def _build_live_venue(
+    venue: str, *, http: AsyncHTTPClient | None = None
+) -> _LiveBroker:
     """Construct the live adapter for ``venue`` (reads credentials from env)."""
     if venue == "kraken":
         # KrakenBroker reads KRAKEN_API_KEY / KRAKEN_API_SECRET from the
         # environment; ``has_credentials`` reports whether both are present.
-        return KrakenBroker()
+        return KrakenBroker(http=http)
     if venue == "binance":
         # BinanceBroker reads BINANCE_API_KEY / BINANCE_API_SECRET (and the
         # optional BINANCE_API_BASE testnet toggle) from the environment;
         # ``has_credentials`` reports whether both key + secret are present.
-        return BinanceBroker()
+        return BinanceBroker(http=http)
     # Unreachable: callers gate on ``_LIVE_VENUES`` first. Defensive only.
     raise BrokerError(f"no live adapter for venue {venue!r}")
 
 
-def _build_testnet_venue(venue: str) -> _LiveBroker:
+def _build_testnet_venue(
+    venue: str, *, http: AsyncHTTPClient | None = None
+) -> _LiveBroker:
     """Construct a venue's **testnet** adapter, hard-pinned to its sandbox URL.
 
     Only venues in :data:`_TESTNET_VENUES` have a testnet. The base URL is forced
@@ -381,7 +546,7 @@ def _build_testnet_venue(venue: str) -> _LiveBroker:
     if venue == "binance":
         # Hard-pin the testnet base URL (explicit arg overrides the env default),
         # so this adapter is structurally incapable of hitting api.binance.com.
-        return BinanceBroker(base_url=TESTNET_API_BASE)
+        return BinanceBroker(base_url=TESTNET_API_BASE, http=http)
     raise BrokerError(
         f"venue {venue!r} has no testnet/sandbox; testnet is available for "
         f"{sorted(_TESTNET_VENUES)!r} only (Kraken has no public spot testnet — "
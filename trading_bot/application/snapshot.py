@@ -0,0 +1,451 @@
+"""Engine snapshots — restart from saved state instead of refolding history.
+
+Without snapshots a restart rebuilds the engine's fill-derived state from
+scratch: :func:`~trading_bot.application.reconcile.reconcile` refolds every fill
+the venue returns into the tracker, and the
+:class:`~trading_bot.application.performance_service.PerformanceService` starts
+empty, so its equity curve is lost. Both costs grow with the trading history.
+
+A :class:`Snapshotter` (built by the factory when ``storage.snapshot_every`` is
+set) saves the fill-derived state to the store's ``state`` table every
+``snapshot_every`` fills and at shutdown. :func:`restore_snapshot` loads it at
+startup and folds only the stored fills after it.
+
+What a snapshot holds (carried into the ADR)
+--------------------------------------------
+* the tracker's per-instrument :class:`~trading_bot.domain.position.Position`;
+* the performance service's positions, running realised PnL and fees, and its
+  equity points;
+* the risk manager's recorded daily PnL (a provider-backed manager reads the
+  restored performance service);
+* the **fill watermark**: the rowid of the newest stored fill (every stored fill
+  up to it is folded into the state above) and the latest fill ``ts``.
+
+Consistency
+-----------
+The snapshot is taken with every consumer settled on the same fill. On a sync
+bus the snapshotter subscribes after the tracker, the performance service and
+the store, so its handler runs once they have all handled the fill; on an async
+bus it first awaits :meth:`~trading_bot.application.events.EventBus.drain`. The
+watermark is read from the store (which flushes a write-behind queue first), and
+the snapshot rows are written in one transaction.
+
+With an event loop running, the fill handler only schedules the save. The task
+commits the store's queue in a worker thread, settles the bus, takes the state
+on the loop (waiting on the store only for the fills queued meanwhile), and
+writes the rows in a worker thread again. Without a loop the handler saves in
+place.
+
+The equity curve is the one part that grows with the history. It is written in
+append-only chunks (one per save, holding only the points added since the
+previous save), and a save copies only those points out of the performance
+service, so it costs the new points. A restart parses the stored points rather
+than refolding the fills behind them.
+
+Restart
+-------
+:func:`restore_snapshot` loads the snapshot (or, with none, starts from empty),
+folds the stored fills after the watermark and returns the latest fill ``ts``.
+The startup reconcile then asks the venue only for fills from that ``ts`` on and
+applies the ones the engine has not seen on top of the restored positions,
+instead of rebuilding them from the venue's whole fill history.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import json
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from trading_bot.application.events import Event, EventBus, FillEvent
+from trading_bot.domain.instrument import Instrument, Symbol
+from trading_bot.domain.money import Money, money
+from trading_bot.domain.position import Position
+
+if TYPE_CHECKING:
+    from trading_bot.application.performance_service import PerformanceService
+    from trading_bot.application.position_tracker import PositionTracker
+    from trading_bot.application.risk import RiskManager
+    from trading_bot.application.service_factory import Engine
+    from trading_bot.storage.journal_store import JournalStore
+    from trading_bot.storage.sqlite_store import SqliteStore
+
+__all__ = [
+    "SNAPSHOT_KEY",
+    "EngineSnapshot",
+    "Snapshotter",
+    "load_snapshot",
+    "restore_snapshot",
+]
+
+logger = logging.getLogger(__name__)
+
+#: The ``state`` key of the latest snapshot; its equity chunks use
+#: ``f"{SNAPSHOT_KEY}.equity.{index}"``.
+SNAPSHOT_KEY = "engine.snapshot"
+
+#: Format version. A snapshot of another version is ignored (a full refold).
+_VERSION = 1
+
+
+def _now_ms() -> int:
+    return time.time_ns() // 1_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class EngineSnapshot:
+    """The engine's fill-derived state as of one stored fill.
+
+    Parameters
+    ----------
+    fill_seq : int
+        Rowid of the newest stored fill folded into this state (``0``: none).
+    fill_ts : int or None
+        The latest ``ts`` among those fills (ms since the Unix epoch, UTC).
+    positions : tuple of Position
+        The tracker's positions.
+    perf_positions : tuple of Position
+        The performance service's positions.
+    realised_pnl, fees_paid : Money
+        The performance service's running totals.
+    equity : tuple of Money
+        The performance service's equity curve from point ``equity_from`` on.
+    v0 : Money
+        The starting capital the equity curve is anchored at.
+    daily_pnl : Money
+        The risk manager's recorded daily PnL.
+    taken_at : int
+        When the snapshot was taken (ms since the Unix epoch, UTC).
+    equity_from : int, optional
+        Index of ``equity``'s first point in the whole curve. Defaults to ``0``
+        (the whole curve); a save holds only the points since the last one.
+
+    """
+
+    fill_seq: int
+    fill_ts: int | None
+    positions: tuple[Position, ...]
+    perf_positions: tuple[Position, ...]
+    realised_pnl: Money
+    fees_paid: Money
+    equity: tuple[Money, ...]
+    v0: Money
+    daily_pnl: Money
+    taken_at: int
+    equity_from: int = 0
+
+
+class Snapshotter:
+    """Save an :class:`EngineSnapshot` to the store every ``every`` fills.
+
+    Subscribe it last: its :class:`~trading_bot.application.events.FillEvent`
+    handler assumes the tracker, the performance service and the store have
+    already handled the fill (see the module docstring). With a running event
+    loop the handler saves in a background task, off the emit path.
+    :meth:`save` takes a snapshot on demand (the runners call it at shutdown,
+    after draining the bus and :meth:`drain`).
+
+    Parameters
+    ----------
+    store : SqliteStore or JournalStore
+        Where snapshots go (its ``state`` table) and where the watermark is read.
+    tracker : PositionTracker
+        The engine's positions.
+    perf : PerformanceService
+        The engine's performance view.
+    risk : RiskManager
+        The engine's risk manager.
+    every : int
+        Fills between snapshots. Must be at least ``1``.
+    event_bus : EventBus, optional
+        If given, the snapshotter counts its fills. ``None`` leaves only
+        :meth:`save`.
+    clock : Callable[[], int], optional
+        Milliseconds since the Unix epoch, stamped on each snapshot.
+
+    Raises
+    ------
+    ValueError
+        If ``every < 1``.
+
+    """
+
+    def __init__(
+        self,
+        store: SqliteStore | JournalStore,
+        tracker: PositionTracker,
+        perf: PerformanceService,
+        risk: RiskManager,
+        *,
+        every: int,
+        event_bus: EventBus | None = None,
+        clock: Callable[[], int] = _now_ms,
+    ) -> None:
+        if every < 1:
+            raise ValueError(f"every must be at least 1, got {every}")
+        self._store = store
+        self._tracker = tracker
+        self._perf = perf
+        self._risk = risk
+        self._every = every
+        self._clock = clock
+        self._bus = event_bus
+        # Fills since the last snapshot, and the pending async save (if any).
+        self._count = 0
+        self._task: asyncio.Task[None] | None = None
+        # Equity chunks written so far, and the points they hold.
+        self._chunks = 0
+        self._points = 0
+        if event_bus is not None:
+            event_bus.subscribe(self._on_event, types=(FillEvent,), name="Snapshotter")
+
+    def _on_event(self, event: Event) -> None:
+        self._count += 1
+        if self._count < self._every:
+            return
+        self._count = 0
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop to keep free, and every consumer has handled the fill.
+            self.save()
+            return
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._save_settled())
+
+    async def _save_settled(self) -> None:
+        try:
+            await asyncio.to_thread(self._store.flush)
+            if self._bus is not None:
+                await self._bus.drain()
+            snapshot = self.take(equity_from=self._points)
+            await asyncio.to_thread(self._write, snapshot)
+        except Exception:
+            logger.exception("engine snapshot failed")
+
+    async def drain(self) -> None:
+        """Wait for a save started by the fill handler, if one is running."""
+        if self._task is not None:
+            await self._task
+
+    def resume(self, snapshot: EngineSnapshot | None) -> None:
+        """Continue the equity chunks of ``snapshot`` (``None``: start over)."""
+        if snapshot is None:
+            self._chunks = self._points = 0
+            return
+        head = _read_head(self._store)
+        self._chunks = 0 if head is None else int(head["equity_chunks"])
+        self._points = len(snapshot.equity)
+
+    def take(self, *, equity_from: int = 0) -> EngineSnapshot:
+        """The engine's current state and watermark (nothing is written).
+
+        Parameters
+        ----------
+        equity_from : int, optional
+            First equity point to copy. Defaults to ``0`` (the whole curve).
+
+        """
+        fill_seq, fill_ts = self._store.fill_watermark()
+        return EngineSnapshot(
+            fill_seq=fill_seq,
+            fill_ts=fill_ts,
+            positions=tuple(self._tracker.all_positions().values()),
+            perf_positions=tuple(self._perf.all_positions().values()),
+            realised_pnl=self._perf.realised_pnl(),
+            fees_paid=self._perf.fees_paid(),
+            equity=self._perf.equity_since(equity_from),
+            v0=self._perf.v0,
+            daily_pnl=self._risk.recorded_daily_pnl,
+            taken_at=self._clock(),
+            equity_from=equity_from,
+        )
+
+    def save(self) -> EngineSnapshot:
+        """Take a snapshot and write it to the store, in one transaction.
+
+        Returns
+        -------
+        EngineSnapshot
+            The snapshot written; its ``equity`` holds the points added since
+            the previous save.
+
+        """
+        snapshot = self.take(equity_from=self._points)
+        self._write(snapshot)
+        return snapshot
+
+    def _write(self, snapshot: EngineSnapshot) -> None:
+        """Write ``snapshot``'s equity as the next chunk, then its head."""
+        chunks = self._chunks + (1 if snapshot.equity else 0)
+        with self._store.transaction():
+            if snapshot.equity:
+                self._store.set_state(
+                    f"{SNAPSHOT_KEY}.equity.{self._chunks}",
+                    json.dumps([str(point) for point in snapshot.equity]),
+                )
+            self._store.set_state(SNAPSHOT_KEY, _encode(snapshot, chunks))
+        self._chunks = chunks
+        self._points = snapshot.equity_from + len(snapshot.equity)
+
+
+def load_snapshot(store: SqliteStore | JournalStore) -> EngineSnapshot | None:
+    """The latest snapshot in ``store``, or ``None``.
+
+    ``None`` also when the stored snapshot has another format version or an
+    equity chunk is missing; the caller then refolds the history instead.
+    """
+    head = _read_head(store)
+    if head is None:
+        return None
+    equity: list[Money] = []
+    for index in range(int(head["equity_chunks"])):
+        chunk = store.get_state(f"{SNAPSHOT_KEY}.equity.{index}")
+        if chunk is None:
+            return None
+        equity.extend(money(point) for point in json.loads(chunk))
+    if len(equity) != head["equity_points"]:
+        return None
+    return EngineSnapshot(
+        fill_seq=int(head["fill_seq"]),
+        fill_ts=head["fill_ts"],
+        positions=tuple(_decode_position(item) for item in head["positions"]),
+        perf_positions=tuple(
+            _decode_position(item) for item in head["perf_positions"]
+        ),
+        realised_pnl=money(head["realised_pnl"]),
+        fees_paid=money(head["fees_paid"]),
+        equity=tuple(equity),
+        v0=money(head["v0"]),
+        daily_pnl=money(head["daily_pnl"]),
+        taken_at=int(head["taken_at"]),
+    )
+
+
+def restore_snapshot(engine: Engine) -> int | None:
+    """Load the store's latest snapshot into ``engine`` and fold the fills after it.
+
+    The tracker, the performance service and the risk manager's recorded daily
+    PnL are set from the snapshot, then every stored fill after its watermark is
+    applied to the tracker and the performance service. Without a snapshot (or
+    with one the store's fills do not reach, i.e. from another database) the
+    whole stored history is folded once. Fills stored at the watermark's ``ts``
+    are marked seen, so a venue re-delivering them is not counted twice.
+
+    Parameters
+    ----------
+    engine : Engine
+        The freshly built engine. A no-op without a store.
+
+    Returns
+    -------
+    int or None
+        The latest stored fill ``ts`` (the lower bound for the startup
+        reconcile's fill fetch), or ``None`` when the store holds no fills.
+
+    """
+    store = engine.store
+    if store is None:
+        return None
+    snapshot = load_snapshot(store)
+    if snapshot is not None and snapshot.fill_seq > store.fill_watermark()[0]:
+        snapshot = None  # written against another history
+    after = 0
+    if snapshot is not None:
+        seen: list[str] = []
+        if snapshot.fill_ts is not None:
+            seen = store.fill_ids(since=snapshot.fill_ts, upto=snapshot.fill_seq)
+        engine.tracker.restore(snapshot.positions, seen)
+        equity = snapshot.equity
+        shift = engine.perf.v0 - snapshot.v0
+        if shift:
+            equity = tuple(point + shift for point in equity)
+        engine.perf.restore(
+            snapshot.perf_positions,
+            realised_pnl=snapshot.realised_pnl,
+            fees_paid=snapshot.fees_paid,
+            equity=equity,
+            seen_fill_ids=seen,
+        )
+        engine.risk.record_daily_pnl(snapshot.daily_pnl)
+        after = snapshot.fill_seq
+    # The store keeps only an instrument's symbol; give the tail's fills the
+    # restored instruments (with their precisions) so they land on the same key.
+    known = {
+        position.instrument.symbol: position.instrument
+        for position in (snapshot.positions if snapshot is not None else ())
+    }
+    for fill in store.iter_fills(after=after):
+        instrument = known.get(fill.instrument.symbol)
+        if instrument is not None and instrument != fill.instrument:
+            fill = dataclasses.replace(fill, instrument=instrument)
+        engine.tracker.apply(fill)
+        engine.perf.apply(fill)
+    if engine.snapshots is not None:
+        engine.snapshots.resume(snapshot)
+    return store.fill_watermark()[1]
+
+
+# --- encoding --------------------------------------------------------------- #
+
+
+def _read_head(store: SqliteStore | JournalStore) -> dict[str, Any] | None:
+    text = store.get_state(SNAPSHOT_KEY)
+    if text is None:
+        return None
+    head: dict[str, Any] = json.loads(text)
+    return head if head.get("version") == _VERSION else None
+
+
+def _encode(snapshot: EngineSnapshot, chunks: int) -> str:
+    return json.dumps(
+        {
+            "version": _VERSION,
+            "fill_seq": snapshot.fill_seq,
+            "fill_ts": snapshot.fill_ts,
+            "taken_at": snapshot.taken_at,
+            "positions": [_encode_position(p) for p in snapshot.positions],
+            "perf_positions": [_encode_position(p) for p in snapshot.perf_positions],
+            "realised_pnl": str(snapshot.realised_pnl),
+            "fees_paid": str(snapshot.fees_paid),
+            "v0": str(snapshot.v0),
+            "daily_pnl": str(snapshot.daily_pnl),
+            "equity_chunks": chunks,
+            "equity_points": snapshot.equity_from + len(snapshot.equity),
+        }
+    )
+
+
+def _encode_position(position: Position) -> dict[str, Any]:
+    instrument = position.instrument
+    avg = position.avg_entry_price
+    return {
+        "base": instrument.symbol.base,
+        "quote": instrument.symbol.quote,
+        "price_precision": instrument.price_precision,
+        "qty_precision": instrument.qty_precision,
+        "net_qty": str(position.net_qty),
+        "avg_entry_price": None if avg is None else str(avg),
+        "realised_pnl": str(position.realised_pnl),
+        "fees_paid": str(position.fees_paid),
+    }
+
+
+def _decode_position(item: dict[str, Any]) -> Position:
+    avg = item["avg_entry_price"]
+    return Position(
+        instrument=Instrument(
+            Symbol(item["base"], item["quote"]),
+            price_precision=item["price_precision"],
+            qty_precision=item["qty_precision"],
+        ),
+        net_qty=money(item["net_qty"]),
+        avg_entry_price=None if avg is None else money(avg),
+        realised_pnl=money(item["realised_pnl"]),
+        fees_paid=money(item["fees_paid"]),
+    )
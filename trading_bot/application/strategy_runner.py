@@ -46,6 +46,21 @@ Because each window is the feed's causal prefix ``frame[: t + 1]`` and the runne
 never reads beyond the window handed to it, **causality is preserved by
 construction** — the runner cannot peek ahead even if it wanted to.
 
+Pipelined prefetch (carried into the ADR)
+-----------------------------------------
+By default the next window is pulled only after the current step's submission
+returns, so feed I/O (a dccd read) and the venue round-trip never overlap. With
+``prefetch=N`` (``N > 0``) :meth:`run` instead pulls windows on a background
+producer — each ``next(feed)`` runs in a worker thread, since the feed is
+synchronous and may block on disk — into a queue bounded at ``N`` windows, while
+the loop steps the windows in **strict feed order** from the queue. Everything
+observable is unchanged: the stop check still sits at the top of each iteration
+(between steps, never mid-submit), step indices and ids are identical, and a feed
+error surfaces at the step it would have surfaced at. Windows read ahead but not
+yet stepped when the loop stops are simply discarded — a prefetched window is
+data, never an order. Prefetching only *reads* ahead; it cannot see a bar before
+the feed yields it, so causality is unaffected.
+
 Per-step idempotency (carried into the ADR)
 -------------------------------------------
 Each step's order carries a **deterministic** ``client_order_id`` of the form
@@ -73,10 +88,11 @@ performs no I/O of its own (the router/broker do).
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+import contextlib
+from collections.abc import AsyncGenerator, Callable, Iterator
 from typing import TYPE_CHECKING
 
-from trading_bot.application.events import EventBus, LogEvent
+from trading_bot.application.events import EventBus
 from trading_bot.domain.money import Money, money
 from trading_bot.domain.order import Order, OrderSide, OrderType
 from trading_bot.domain.position import Position
@@ -101,6 +117,18 @@ OrderFactory = Callable[["Strategy", Money, "pl.DataFrame"], Order]
 
 _ZERO: Money = money("0")
 
+#: Marks the end of the feed on the prefetch queue.
+_END = object()
+
+
+class _FeedFailure:
+    """Carries a feed exception through the prefetch queue to its step."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
 
 class StrategyRunner:
     """Drive a :class:`Strategy` over a :class:`DataFeed`, routing the deltas.
@@ -144,6 +172,15 @@ class StrategyRunner:
         Whatever it returns, the runner overrides the ``client_order_id`` with
         its deterministic per-step id (so idempotency is the runner's, not the
         factory's, concern).
+    prefetch : int, optional
+        How many windows :meth:`run` may read ahead of the step in flight (see
+        the module docstring's pipelined prefetch). ``0`` (default) reads each
+        window only after the previous step finishes. Must be ``>= 0``.
+
+    Raises
+    ------
+    ValueError
+        If ``prefetch`` is negative.
 
     Examples
     --------
@@ -162,19 +199,24 @@ class StrategyRunner:
         *,
         event_bus: EventBus | None = None,
         order_factory: OrderFactory | None = None,
+        prefetch: int = 0,
     ) -> None:
+        if prefetch < 0:
+            raise ValueError(f"prefetch must be non-negative, got {prefetch}")
         self._strategy = strategy
         self._feed = feed
         self._router = router
         self._tracker = tracker
         self._bus = event_bus
         self._order_factory = order_factory
+        self._prefetch = prefetch
         # Monotonic step index — also the per-step client-order-id seed. It is an
         # instance counter so a fresh runner over the same feed reproduces the
         # same ids (deterministic re-run), while a *single* runner re-driven via
         # repeated ``run`` calls keeps advancing (never reusing an id within one
         # instance's lifetime).
         self._step_index = 0
+        self._window_bytes = 0
 
     @property
     def strategy(self) -> Strategy:
@@ -186,6 +228,11 @@ class StrategyRunner:
         """The next step index (== number of windows processed so far)."""
         return self._step_index
 
+    @property
+    def window_bytes(self) -> int:
+        """Estimated size (bytes) of the last window stepped (``0`` before any)."""
+        return self._window_bytes
+
     async def run(
         self,
         max_steps: int | None = None,
@@ -224,28 +271,94 @@ class StrategyRunner:
         """
         submitted = 0
         processed = 0
-        for bars in self._feed:
-            # Check the cooperative stop *before* processing this window: a step
-            # that has begun always finishes (no order torn mid-submit); a stop
-            # only takes effect at this between-steps boundary.
-            if stop_event is not None and stop_event.is_set():
-                break
-            if max_steps is not None and processed >= max_steps:
-                break
-            order = await self.step(bars)
-            if order is not None:
-                submitted += 1
-            processed += 1
-            # When a stop signal is in play (the orchestrator's looping/live
-            # case), yield control to the event loop once per iteration. A step
-            # that submits nothing (warmup / on-target) never ``await``s a venue,
-            # so without this a tight sync loop over a live feed would starve the
-            # loop — and the cooperative ``shutdown`` coroutine could never run.
-            # This is a between-steps boundary, so it never interrupts a submit.
-            if stop_event is not None:
-                await asyncio.sleep(0)
+        async with contextlib.aclosing(self._windows(max_steps)) as windows:
+            async for bars in windows:
+                # Check the cooperative stop *before* processing this window: a
+                # step that has begun always finishes (no order torn
+                # mid-submit); a stop only takes effect at this between-steps
+                # boundary.
+                if stop_event is not None and stop_event.is_set():
+                    break
+                if max_steps is not None and processed >= max_steps:
+                    break
+                order = await self.step(bars)
+                if order is not None:
+                    submitted += 1
+                processed += 1
+                # When a stop signal is in play (the orchestrator's looping/live
+                # case), yield control to the event loop once per iteration. A
+                # step that submits nothing (warmup / on-target) never
+                # ``await``s a venue, so without this a tight sync loop over a
+                # live feed would starve the loop — and the cooperative
+                # ``shutdown`` coroutine could never run. This is a
+                # between-steps boundary, so it never interrupts a submit.
+                if stop_event is not None:
+                    await asyncio.sleep(0)
         return submitted
 
+    async def _windows(
+        self, max_steps: int | None
+    ) -> AsyncGenerator[pl.DataFrame, None]:
+        """The feed's windows in order — pulled inline, or prefetched when enabled."""
+        if self._prefetch == 0:
+            for bars in self._feed:
+                yield bars
+            return
+        # A window the loop will never step (past ``max_steps``) is not worth a
+        # read, so the producer stops there too.
+        limit = max_steps
+        queue: asyncio.Queue[object] = asyncio.Queue(maxsize=self._prefetch)
+        producer = asyncio.ensure_future(
+            self._produce(iter(self._feed), queue, limit)
+        )
+        try:
+            while True:
+                item = await queue.get()
+                if item is _END:
+                    return
+                if isinstance(item, _FeedFailure):
+                    raise item.error
+                yield item  # type: ignore[misc]
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+    @staticmethod
+    async def _produce(
+        windows: Iterator[pl.DataFrame],
+        queue: asyncio.Queue[object],
+        limit: int | None,
+    ) -> None:
+        """Read windows off-loop, in order, into the bounded prefetch queue.
+
+        On cancellation the read already running in its worker thread cannot be
+        interrupted, so it is joined before the feed is closed — the feed is
+        never closed (or left reading) under a thread still inside ``next``.
+        """
+        read = 0
+        try:
+            while limit is None or read < limit:
+                pending = asyncio.ensure_future(
+                    asyncio.to_thread(next, windows, _END)
+                )
+                try:
+                    bars = await asyncio.shield(pending)
+                except asyncio.CancelledError:
+                    await asyncio.gather(pending, return_exceptions=True)
+                    raise
+                await queue.put(bars)
+                if bars is _END:
+                    return
+                read += 1
+        except Exception as exc:  # noqa: BLE001 - re-raised at its step by the loop
+            await queue.put(_FeedFailure(exc))
+            return
+        finally:
+            close = getattr(windows, "close", None)
+            if close is not None:
+                close()
+        await queue.put(_END)
+
     async def step(self, bars: pl.DataFrame) -> Order | None:
         """Process **one** causal window: evaluate, diff, and maybe submit.
 
@@ -277,7 +390,13 @@ class StrategyRunner:
         # consumes its slot — keeping ``f"{name}-{step}"`` aligned 1:1 with the
         # bar sequence (re-run determinism does not depend on order outcomes).
         self._step_index += 1
+        self._window_bytes = int(bars.estimated_size())
 
+        if bars.height and "c" in bars.columns:
+            # The window's close is the mark the risk gate values orders at.
+            self._router.record_marks(
+                {self._strategy.instrument: money(str(bars["c"][-1]))}
+            )
         signal = self._strategy.evaluate(bars)
         current = self._tracker.position(self._strategy.instrument)
         net_qty = current.net_qty if current is not None else _ZERO
@@ -307,15 +426,17 @@ class StrategyRunner:
         order = self._build_order(delta, bars, step)
         submitted = await self._router.submit(order)
         if self._bus is not None:
-            self._bus.emit(
-                LogEvent(
-                    message=(
-                        f"{self._strategy.name} step {step}: "
-                        f"{submitted.side.value} {submitted.qty} "
-                        f"{submitted.instrument} "
-                        f"(delta={delta}, cid={submitted.client_order_id})"
-                    )
-                )
+            self._bus.log(
+                "{name} step {step}: {side} {qty} {instrument} "
+                "(delta={delta}, cid={cid})",
+                category="strategy",
+                name=self._strategy.name,
+                step=step,
+                side=submitted.side.value,
+                qty=submitted.qty,
+                instrument=submitted.instrument,
+                delta=delta,
+                cid=submitted.client_order_id,
             )
         return submitted
 
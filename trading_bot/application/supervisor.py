@@ -28,6 +28,22 @@ UI obtains (a typed confirmation), never a casual flip. Paper ↔ testnet need n
 confirmation. The usual factory gates (credentials, the risk-limit requirement)
 still apply when the live engine is actually built on :meth:`start`.
 
+Resource accounting (carried into the ADR)
+------------------------------------------
+Every unit carries a :class:`UnitUsage` on its :class:`StrategyStatus`, so the
+unit eating the box can be found before more are added. :meth:`StrategySupervisor
+.step` brackets each step with :func:`time.thread_time` (CPU of the loop thread)
+and :func:`time.perf_counter` (wall latency): the CPU delta is what the step
+itself burnt — signal evaluation, frame work, the synchronous parts of routing —
+because the daemon steps units one at a time. Latency percentiles come from the
+last :data:`LATENCY_WINDOW` steps. Per-unit **RSS** is not observable inside one
+process, so the memory figures are an attributable *estimate*: the last
+evaluated window's Arrow buffers (:meth:`polars.DataFrame.estimated_size`) plus
+the shallow size of the router's tracked orders — counted, not walked: the
+router's running ``tracked_count`` times :data:`TRACKED_ORDER_BYTES` — with the
+peak kept since the unit was started. Counters reset on
+:meth:`StrategySupervisor.start` (a fresh engine).
+
 This module is part of the application layer: it composes the factory and the
 runners, holds money as :class:`~decimal.Decimal`, and performs venue I/O only
 through the engines it builds (reconcile on start; the runners' router/broker).
@@ -35,13 +51,21 @@ through the engines it builds (reconcile on start; the runners' router/broker).
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import collections
+import statistics
+import time
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Literal
 
 from trading_bot.application.reconcile import reconcile
 from trading_bot.application.run_app import build_portfolio_runners, build_runners
-from trading_bot.application.service_factory import Engine, build_engine
+from trading_bot.application.service_factory import (
+    Engine,
+    build_engine,
+    restore_engine,
+)
 from trading_bot.domain.errors import ConfigError, LiveTradingNotEnabled
+from trading_bot.domain.order import Order
 
 if TYPE_CHECKING:
     from trading_bot.application.config import AppConfig
@@ -49,15 +73,54 @@ if TYPE_CHECKING:
     from trading_bot.application.portfolio_runner import PortfolioRunner
     from trading_bot.application.strategy_runner import StrategyRunner
     from trading_bot.domain.money import Money
-    from trading_bot.domain.order import Order
 
-__all__ = ["StrategyMode", "StrategyStatus", "StrategySupervisor"]
+__all__ = ["StrategyMode", "StrategyStatus", "StrategySupervisor", "UnitUsage"]
 
 #: The deployment mode of a managed strategy.
 StrategyMode = Literal["paper", "testnet", "live"]
 
 _KIND = Literal["strategy", "portfolio"]
 
+#: How many recent step latencies a unit keeps for its percentiles.
+LATENCY_WINDOW = 512
+
+#: Shallow bytes charged per tracked order: the slotted :class:`Order` (plus its
+#: GC header) and its dedup-map entry (hash, key and value pointers).
+TRACKED_ORDER_BYTES = Order.__basicsize__ + 16 + 3 * 8
+
+
+@dataclass(frozen=True, slots=True)
+class UnitUsage:
+    """A unit's resource accounting since it was (last) started.
+
+    Attributes
+    ----------
+    steps : int
+        Steps taken.
+    cpu_seconds : float
+        Cumulative loop-thread CPU time spent inside those steps.
+    memory_bytes : int
+        Current attributable memory estimate: the last evaluated window plus the
+        router's tracked-order map (see the module docstring).
+    peak_memory_bytes : int
+        The largest ``memory_bytes`` seen.
+    tracked_orders : int
+        Size of the unit router's tracked-order map (terminal orders included).
+    latency_p50, latency_p95, latency_p99 : float or None
+        Step wall-latency percentiles (seconds) over the last
+        :data:`LATENCY_WINDOW` steps; ``None`` before the first step.
+
+    """
+
+    steps: int = 0
+    cpu_seconds: float = 0.0
+    memory_bytes: int = 0
+    peak_memory_bytes: int = 0
+    tracked_orders: int = 0
+    latency_p50: float | None = None
+    latency_p95: float | None = None
+    latency_p99: float | None = None
+
 
 @dataclass(frozen=True, slots=True)
 class StrategyStatus:
@@ -82,6 +145,9 @@ class StrategyStatus:
     open_orders : int
         The number of orders the unit's router currently tracks as non-terminal
         (``0`` when stopped).
+    usage : UnitUsage
+        CPU / memory / tracked-order / latency accounting since the unit was
+        started (all zero for a never-started unit).
 
     """
 
@@ -92,6 +158,7 @@ class StrategyStatus:
     running: bool
     realised_pnl: Money | None
     open_orders: int
+    usage: UnitUsage = field(default_factory=UnitUsage)
 
 
 @dataclass
@@ -106,6 +173,26 @@ class _Unit:
     engine: Engine | None = None
     runner: StrategyRunner | PortfolioRunner | None = None
     running: bool = False
+    steps: int = 0
+    cpu_seconds: float = 0.0
+    peak_memory_bytes: int = 0
+    latencies: collections.deque[float] = field(
+        default_factory=lambda: collections.deque(maxlen=LATENCY_WINDOW)
+    )
+
+    def reset_usage(self) -> None:
+        """Zero the accounting (a fresh engine starts a fresh tally)."""
+        self.steps = 0
+        self.cpu_seconds = 0.0
+        self.peak_memory_bytes = 0
+        self.latencies.clear()
+
+    def memory_bytes(self) -> int:
+        """The attributable memory estimate: last window + tracked orders (O(1))."""
+        if self.runner is None or self.engine is None:
+            return 0
+        tracked = self.engine.router.tracked_count
+        return self.runner.window_bytes + tracked * TRACKED_ORDER_BYTES
 
 
 class StrategySupervisor:
@@ -156,6 +243,20 @@ class StrategySupervisor:
         """The managed strategy names, in registration order."""
         return list(self._units)
 
+    def span_of(self, name: str) -> int | None:
+        """The unit's bar ``span`` (seconds) — its data's close cadence.
+
+        A strategy's ``data.span`` or a portfolio's ``data.span``; ``None`` for a
+        single-instrument strategy that declares no data source. The daemon's
+        :class:`~trading_bot.application.bar_scheduler.BarCloseScheduler` wakes
+        each unit on these boundaries.
+        """
+        unit = self._unit(name)
+        if unit.kind == "strategy":
+            data = unit.config.strategies[0].data
+            return data.span if data is not None else None
+        return unit.config.portfolios[0].data.span
+
     def _unit(self, name: str) -> _Unit:
         try:
             return self._units[name]
@@ -216,10 +317,16 @@ class StrategySupervisor:
         if unit.running:
             return
         engine = build_engine(unit.config, db_path=unit.config.storage.db_path)
-        if engine.store is not None:
-            engine.router.restore(engine.store.orders())
+        # Off the loop: other units may be trading on it.
+        since_ms = await restore_engine(engine)
         await reconcile(
-            engine.broker, engine.router, engine.tracker, event_bus=engine.bus
+            engine.broker,
+            engine.router,
+            engine.tracker,
+            since_ms=since_ms,
+            event_bus=engine.bus,
+            perf=engine.perf,
+            store=engine.reader,
         )
         if unit.kind == "strategy":
             runners = build_runners(
@@ -232,11 +339,23 @@ class StrategySupervisor:
             )
             unit.runner = pruns[0]
         unit.engine = engine
+        unit.reset_usage()
         unit.running = True
 
     async def stop(self, name: str) -> None:
-        """Tear down the unit's engine — it is no longer stepped. Idempotent."""
+        """Tear down the unit's engine — it is no longer stepped. Idempotent.
+
+        Its store, if any, is closed (committing any write-behind queue).
+        """
         unit = self._unit(name)
+        if unit.engine is not None and unit.engine.store is not None:
+            await unit.engine.bus.drain()
+            if unit.engine.snapshots is not None:
+                await unit.engine.snapshots.drain()
+                unit.engine.snapshots.save()
+            if unit.engine.reader is not None:
+                unit.engine.reader.close()
+            unit.engine.store.close()
         unit.running = False
         unit.runner = None
         unit.engine = None
@@ -281,20 +400,30 @@ class StrategySupervisor:
         .step_latest` (or
         :meth:`~trading_bot.application.portfolio_runner.PortfolioRunner
         .rebalance_latest`). A no-op (returns ``None``) when the unit is stopped.
-        This is what the daemon's scheduler calls per tick.
+        This is what the daemon's scheduler calls per tick. The step's CPU time,
+        wall latency and memory estimate are tallied into the unit's
+        :class:`UnitUsage` (a failing step is tallied too).
         """
         unit = self._unit(name)
         if not unit.running or unit.runner is None:
             return None
-        if unit.kind == "strategy":
-            from trading_bot.application.strategy_runner import StrategyRunner
+        cpu_start = time.thread_time()
+        wall_start = time.perf_counter()
+        try:
+            if unit.kind == "strategy":
+                from trading_bot.application.strategy_runner import StrategyRunner
 
-            assert isinstance(unit.runner, StrategyRunner)
-            return await unit.runner.step_latest()
-        from trading_bot.application.portfolio_runner import PortfolioRunner
+                assert isinstance(unit.runner, StrategyRunner)
+                return await unit.runner.step_latest()
+            from trading_bot.application.portfolio_runner import PortfolioRunner
 
-        assert isinstance(unit.runner, PortfolioRunner)
-        return await unit.runner.rebalance_latest()
+            assert isinstance(unit.runner, PortfolioRunner)
+            return await unit.runner.rebalance_latest()
+        finally:
+            unit.latencies.append(time.perf_counter() - wall_start)
+            unit.cpu_seconds += time.thread_time() - cpu_start
+            unit.steps += 1
+            unit.peak_memory_bytes = max(unit.peak_memory_bytes, unit.memory_bytes())
 
     async def start_all(self) -> None:
         """Start every managed unit (the daemon's boot — each in its config mode)."""
@@ -333,11 +462,7 @@ class StrategySupervisor:
         open_orders = 0
         if unit.running and unit.engine is not None:
             realised = unit.engine.perf.realised_pnl()
-            open_orders = sum(
-                1
-                for order in unit.engine.router.tracked_orders().values()
-                if not order.is_terminal
-            )
+            open_orders = len(unit.engine.router.open_orders())
         return StrategyStatus(
             name=unit.name,
             kind=unit.kind,
@@ -346,9 +471,37 @@ class StrategySupervisor:
             running=unit.running,
             realised_pnl=realised,
             open_orders=open_orders,
+            usage=_usage_of(unit),
         )
 
 
+def _usage_of(unit: _Unit) -> UnitUsage:
+    """Snapshot a unit's accounting into a :class:`UnitUsage`."""
+    p50 = p95 = p99 = None
+    if unit.latencies:
+        ordered = sorted(unit.latencies)
+        if len(ordered) == 1:
+            p50 = p95 = p99 = ordered[0]
+        else:
+            cuts = statistics.quantiles(ordered, n=100, method="inclusive")
+            p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    tracked = (
+        unit.engine.router.tracked_count
+        if unit.running and unit.engine is not None
+        else 0
+    )
+    return UnitUsage(
+        steps=unit.steps,
+        cpu_seconds=unit.cpu_seconds,
+        memory_bytes=unit.memory_bytes() if unit.running else 0,
+        peak_memory_bytes=unit.peak_memory_bytes,
+        tracked_orders=tracked,
+        latency_p50=p50,
+        latency_p95=p95,
+        latency_p99=p99,
+    )
+
+
 def _mode_of(config: AppConfig) -> StrategyMode:
     """Infer a :data:`StrategyMode` from an :class:`AppConfig`'s mode/brokers."""
     if config.mode == "paper":
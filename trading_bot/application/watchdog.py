@@ -0,0 +1,334 @@
+"""The :class:`LoopWatchdog` — measure event-loop lag and catch the code that stalls it.
+
+Signals, dccd reads and SQLite writes all run **synchronously** on the event loop,
+so one slow call delays everything else scheduled on it: order submission, the
+fill stream, the dashboard's SSE heartbeats. Such a stall is invisible from inside
+the loop while it lasts — no coroutine runs until the blocking call returns — so
+the watchdog splits the work between the loop and a helper thread.
+
+Lag measurement (carried into the ADR)
+--------------------------------------
+A heartbeat task sleeps ``interval`` seconds in a loop and measures how late it
+woke: ``lag = (woke - slept_at) - interval``. On a healthy loop the lag is a
+fraction of a millisecond; a blocking call shows up as a lag of roughly its
+duration. Every measurement goes into a :class:`LagHistogram` (fixed
+latency-style buckets, so the distribution is cheap to keep forever and to
+export as a metric), together with the count and the worst lag seen.
+
+Stack capture (carried into the ADR)
+------------------------------------
+The heartbeat can only *report* a stall after it ended — by then the blocking
+frame is gone. A daemon helper thread therefore polls the heartbeat's deadline
+and, once the loop is more than ``threshold`` seconds overdue, snapshots the loop
+thread's current stack (:func:`sys._current_frames`) **while it is still
+blocked**. One stack is captured per stall. When the loop recovers, the heartbeat
+pairs the measured lag with that stack into a :class:`StallReport`, emits it as a
+``"warning"`` :class:`~trading_bot.application.events.LogEvent` on the bus (so it
+reaches the dashboard and any log subscriber), logs it, and keeps the last
+``keep`` reports on :attr:`LoopWatchdog.stalls`. The thread never touches the bus
+or the loop itself — everything user-visible happens back on the loop.
+
+Cost
+----
+One timer wake-up per ``interval`` on the loop and one poll per ``interval`` on
+the thread; nothing is done per event or per order. Off by default — enabled per
+run via :class:`~trading_bot.application.config.WatchdogConfig`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import collections
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from trading_bot.application.events import EventBus
+
+__all__ = [
+    "LagHistogram",
+    "LoopWatchdog",
+    "StallReport",
+]
+
+logger = logging.getLogger(__name__)
+
+#: Default histogram bucket upper bounds, in seconds (an implicit ``+inf`` last).
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+class LagHistogram:
+    """A fixed-bucket histogram of event-loop lag samples (seconds).
+
+    Parameters
+    ----------
+    bounds : tuple of float, optional
+        Increasing bucket upper bounds (seconds). A final ``+inf`` bucket is
+        implicit. Defaults to :data:`DEFAULT_BUCKETS`.
+
+    Examples
+    --------
+    >>> hist = LagHistogram(bounds=(0.01, 0.1))
+    >>> for lag in (0.0, 0.05, 3.0):
+    ...     hist.observe(lag)
+    >>> hist.buckets()
+    [(0.01, 1), (0.1, 1), (inf, 1)]
+    >>> hist.count, hist.max
+    (3, 3.0)
+
+    """
+
+    def __init__(self, bounds: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        if list(bounds) != sorted(set(bounds)):
+            raise ValueError(f"bucket bounds must be strictly increasing, got {bounds}")
+        self._bounds = tuple(bounds)
+        self._counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, lag: float) -> None:
+        """Record one lag sample (seconds)."""
+        self._counts[bisect.bisect_left(self._bounds, lag)] += 1
+        self.count += 1
+        self.total += lag
+        self.max = max(self.max, lag)
+
+    def buckets(self) -> list[tuple[float, int]]:
+        """``(upper bound, count)`` per bucket — non-cumulative, ``inf`` last."""
+        return list(zip((*self._bounds, float("inf")), self._counts, strict=True))
+
+    def quantile(self, q: float) -> float:
+        """The bucket upper bound at or below which a ``q`` fraction of samples fall.
+
+        An upper-bound estimate (bucket resolution); ``0.0`` with no samples and
+        :attr:`max` when the quantile lands in the ``+inf`` bucket.
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"q must be within [0, 1], got {q}")
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, n in self.buckets():
+            seen += n
+            if seen >= rank and n:
+                return self.max if bound == float("inf") else bound
+        return self.max  # pragma: no cover - the loop always reaches count
+
+    def snapshot(self) -> dict[str, object]:
+        """A JSON-friendly view: count, mean, max, p50/p99 and the buckets."""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "buckets": [
+                ["+Inf" if bound == float("inf") else bound, n]
+                for bound, n in self.buckets()
+            ],
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class StallReport:
+    """One event-loop stall: how long the loop was blocked, and by what.
+
+    Parameters
+    ----------
+    lag : float
+        The measured lag (seconds) past the heartbeat's deadline.
+    stack : str or None
+        The loop thread's stack captured *during* the stall, formatted with
+        :func:`traceback.format_stack`. ``None`` when the stall ended before the
+        helper thread's next poll.
+    at_ns : int
+        Wall-clock time (ns UTC) the stall was reported.
+
+    """
+
+    lag: float
+    stack: str | None
+    at_ns: int
+
+
+class LoopWatchdog:
+    """Continuously measure event-loop lag; capture and report stalls.
+
+    See the module docstring for the heartbeat / helper-thread split. Use it as
+    an async context manager around the code to watch (or call :meth:`start` /
+    :meth:`stop`), from inside the running loop.
+
+    Parameters
+    ----------
+    event_bus : EventBus or None, optional
+        Where each stall is emitted as a ``"warning"``
+        :class:`~trading_bot.application.events.LogEvent`. ``None`` (default)
+        only logs and records it.
+    interval : float, optional
+        Heartbeat period (seconds) — also the lag sampling rate. Defaults to
+        ``0.1``. Must be positive.
+    threshold : float, optional
+        Lag (seconds) at which a stall is captured and reported. Defaults to
+        ``0.5``. Must be positive.
+    keep : int, optional
+        How many recent :class:`StallReport`\\ s :attr:`stalls` retains.
+        Defaults to ``32``.
+    on_stall : Callable[[StallReport], None] or None, optional
+        Called on the loop with each stall (e.g. the daemon's console printer).
+    clock : Callable[[], float], optional
+        Monotonic seconds, shared by the heartbeat and the thread. Defaults to
+        :func:`time.monotonic`.
+
+    Raises
+    ------
+    ValueError
+        If ``interval`` or ``threshold`` is not positive, or ``keep < 1``.
+
+    """
+
+    def __init__(
+        self,
+        event_bus: EventBus | None = None,
+        *,
+        interval: float = 0.1,
+        threshold: float = 0.5,
+        keep: int = 32,
+        on_stall: Callable[[StallReport], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval}")
+        if threshold <= 0:
+            raise ValueError(f"threshold must be positive, got {threshold}")
+        if keep < 1:
+            raise ValueError(f"keep must be at least 1, got {keep}")
+        self._bus = event_bus
+        self._interval = interval
+        self._threshold = threshold
+        self._on_stall = on_stall
+        self._clock = clock
+        self.histogram = LagHistogram()
+        self.stalls: collections.deque[StallReport] = collections.deque(maxlen=keep)
+        self._task: asyncio.Task[None] | None = None
+        self._thread: threading.Thread | None = None
+        self._halt = threading.Event()
+        self._loop_thread_id: int | None = None
+        # The heartbeat's current deadline, and the stack the thread captured for
+        # it. Plain attribute reads/writes: the thread only reads ``_deadline``
+        # and the loop only reads ``_captured`` after the stall, under ``_lock``.
+        self._deadline = 0.0
+        self._lock = threading.Lock()
+        self._captured: tuple[float, str] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the heartbeat is active."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the heartbeat task and the helper thread (idempotent).
+
+        Must be called from the running event loop being watched.
+        """
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._deadline = self._clock() + self._interval
+        self._halt.clear()
+        self._task = asyncio.get_running_loop().create_task(
+            self._heartbeat(), name="loop-watchdog"
+        )
+        self._thread = threading.Thread(
+            target=self._watch, name="loop-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    async def stop(self) -> None:
+        """Stop the heartbeat and join the helper thread (idempotent)."""
+        self._halt.set()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._thread is not None:
+            await asyncio.to_thread(self._thread.join)
+            self._thread = None
+
+    async def __aenter__(self) -> LoopWatchdog:
+        self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.stop()
+
+    def snapshot(self) -> dict[str, object]:
+        """The lag histogram plus the stall count — a metrics-endpoint payload."""
+        return {
+            "lag": self.histogram.snapshot(),
+            "stalls": len(self.stalls),
+            "threshold": self._threshold,
+        }
+
+    async def _heartbeat(self) -> None:
+        """Sleep ``interval`` forever; record each wake-up's lag; report stalls."""
+        while True:
+            slept_at = self._clock()
+            self._deadline = slept_at + self._interval
+            await asyncio.sleep(self._interval)
+            lag = max(0.0, self._clock() - self._deadline)
+            self.histogram.observe(lag)
+            if lag >= self._threshold:
+                self._report(lag)
+
+    def _report(self, lag: float) -> None:
+        """Pair the lag with the stack captured for this deadline and publish it."""
+        with self._lock:
+            captured, self._captured = self._captured, None
+        stack = captured[1] if captured and captured[0] == self._deadline else None
+        report = StallReport(lag=lag, stack=stack, at_ns=time.time_ns())
+        self.stalls.append(report)
+        message = f"event loop stalled for {lag:.3f}s (threshold {self._threshold:g}s)"
+        if stack is not None:
+            message = f"{message}; blocked in:\n{stack.rstrip()}"
+        logger.warning(message)
+        if self._bus is not None:
+            self._bus.log(message, level="warning", category="watchdog")
+        if self._on_stall is not None:
+            try:
+                self._on_stall(report)
+            except Exception:
+                logger.exception("LoopWatchdog on_stall callback error")
+
+    def _watch(self) -> None:
+        """Helper thread: snapshot the loop thread's stack once it is overdue."""
+        poll = min(self._interval, self._threshold / 2)
+        while not self._halt.wait(poll):
+            deadline = self._deadline
+            if self._clock() - deadline < self._threshold:
+                continue
+            with self._lock:
+                if self._captured is not None and self._captured[0] == deadline:
+                    continue  # this stall is already captured
+            frame = sys._current_frames().get(self._loop_thread_id or 0)  # noqa: SLF001
+            if frame is None:
+                continue
+            stack = "".join(traceback.format_stack(frame))
+            with self._lock:
+                self._captured = (deadline, stack)
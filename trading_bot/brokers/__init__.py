@@ -17,6 +17,12 @@ Public surface:
 
 * :class:`~trading_bot.brokers.base.Broker` — the async, runtime-checkable
   :class:`~typing.Protocol` every venue adapter satisfies;
+* :class:`~trading_bot.brokers.base.BatchBroker` — the optional batch
+  place/cancel extension of the port (``BATCH_ORDERS`` / ``BATCH_CANCEL``);
+* :class:`~trading_bot.brokers.base.BulkCancelBroker` — the optional
+  account-wide cancel (``CANCEL_ALL``) the broker-direct kill path uses;
+* :class:`~trading_bot.brokers.base.AmendBroker` — the optional in-place amend
+  or cancel-replace of a live order (``AMEND``);
 * :class:`~trading_bot.brokers.base.Capability` — the operations an adapter may
   declare it supports;
 * :func:`~trading_bot.brokers.base.require` — the gate that raises
@@ -39,14 +45,25 @@ Public surface:
 
 from __future__ import annotations
 
-from trading_bot.brokers.base import Broker, BrokerError, Capability, require
+from trading_bot.brokers.base import (
+    AmendBroker,
+    BatchBroker,
+    Broker,
+    BrokerError,
+    BulkCancelBroker,
+    Capability,
+    require,
+)
 from trading_bot.brokers.binance import BinanceBroker
 from trading_bot.brokers.kraken import KrakenBroker
 from trading_bot.brokers.kraken_ws import KrakenPrivateWS
 from trading_bot.brokers.paper import PaperBroker
 
 __all__ = [
+    "AmendBroker",
+    "BatchBroker",
     "Broker",
+    "BulkCancelBroker",
     "Capability",
     "require",
     "BrokerError",
@@ -40,6 +40,7 @@ mypy on each concrete adapter.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from enum import Enum
 from typing import Protocol, runtime_checkable
 
@@ -50,7 +51,10 @@ from trading_bot.domain.money import Money
 from trading_bot.domain.order import Order
 
 __all__ = [
+    "AmendBroker",
+    "BatchBroker",
     "Broker",
+    "BulkCancelBroker",
     "Capability",
     "BrokerError",
     "require",
@@ -85,6 +89,14 @@ class Capability(Enum):
     TICKER = "ticker"
     #: A private/authenticated WebSocket feed of order & fill updates.
     PRIVATE_WS = "private_ws"
+    #: :meth:`BatchBroker.place_orders` — submit several same-pair orders in one call.
+    BATCH_ORDERS = "batch_orders"
+    #: :meth:`BatchBroker.cancel_orders` — cancel several live orders in one call.
+    BATCH_CANCEL = "batch_cancel"
+    #: :meth:`BulkCancelBroker.cancel_all` — cancel every open order on the account.
+    CANCEL_ALL = "cancel_all"
+    #: :meth:`AmendBroker.amend_order` — reprice/resize a live order in one call.
+    AMEND = "amend"
 
 
 @runtime_checkable
@@ -217,6 +229,156 @@ class Broker(Protocol):
         ...
 
 
+@runtime_checkable
+class BatchBroker(Broker, Protocol):
+    """A :class:`Broker` that can also place and cancel orders in batches.
+
+    Batch endpoints are optional — most venues place one order per request — so
+    they live on this sub-protocol rather than on :class:`Broker` itself, and an
+    adapter declares them through :attr:`Capability.BATCH_ORDERS` /
+    :attr:`Capability.BATCH_CANCEL`. The
+    :class:`~trading_bot.application.order_router.OrderRouter` uses them when it
+    has several orders for one pair pending at once (a rebalance, a kill); the
+    caller still drives every :class:`Order` state machine, one per result.
+
+    Attributes
+    ----------
+    max_batch_size : int
+        The most orders the venue accepts in one batch request; the adapter
+        splits longer batches into chunks of this size itself.
+
+    """
+
+    #: The most orders one venue batch request may carry.
+    max_batch_size: int
+
+    async def place_orders(self, orders: Sequence[Order]) -> list[str | Exception]:
+        """Submit ``orders`` (all for one instrument) and report each outcome.
+
+        Parameters
+        ----------
+        orders : sequence of Order
+            The orders to submit, all on the same instrument. As with
+            :meth:`Broker.place_order` the adapter only transmits them.
+
+        Returns
+        -------
+        list of str or Exception
+            One slot per order, in input order: its venue order id, or the
+            exception that order failed with — a
+            :class:`~trading_bot.domain.errors.BrokerError` for a venue
+            rejection, or a :class:`~trading_bot.transport.http.
+            AmbiguousRequestError` when the batch request failed with an unknown
+            outcome (every order in that request then carries it; reconcile
+            before any retry).
+
+        Raises
+        ------
+        BrokerError
+            If the orders span more than one instrument.
+
+        """
+        ...
+
+    async def cancel_orders(self, venue_order_ids: Sequence[str]) -> None:
+        """Cancel the live orders identified by ``venue_order_ids``.
+
+        Parameters
+        ----------
+        venue_order_ids : sequence of str
+            The venue order ids (as returned by :meth:`place_orders` or
+            :meth:`Broker.place_order`).
+
+        Raises
+        ------
+        BrokerError
+            If the venue rejects or fails the cancellation.
+
+        """
+        ...
+
+
+@runtime_checkable
+class BulkCancelBroker(Broker, Protocol):
+    """A :class:`Broker` with a venue-side "cancel everything" endpoint.
+
+    Declared through :attr:`Capability.CANCEL_ALL`. It cancels **every** open
+    order on the account — including orders this engine did not place — so the
+    engine only uses it where that is the intent: the broker-direct kill-switch
+    path, which already cancels whatever the venue reports open.
+    """
+
+    async def cancel_all(self) -> int:
+        """Cancel every open order on the account.
+
+        Returns
+        -------
+        int
+            How many orders the venue reports cancelled.
+
+        Raises
+        ------
+        BrokerError
+            If the venue rejects or fails the request.
+
+        """
+        ...
+
+
+@runtime_checkable
+class AmendBroker(Broker, Protocol):
+    """A :class:`Broker` that can reprice or resize a live order in one call.
+
+    Declared through :attr:`Capability.AMEND`. Without it, repricing costs a
+    cancel plus a fresh submit: two round-trips, a gap with nothing on the book,
+    and a new ``client_order_id``. Depending on the venue the amend is done in
+    place (the venue id is kept) or as an atomic cancel-replace (the order gets a
+    new venue id); the adapter reports which id the order lives under now.
+    """
+
+    async def amend_order(
+        self,
+        order: Order,
+        *,
+        qty: Money | None = None,
+        limit_price: Money | None = None,
+    ) -> str:
+        """Amend the live ``order`` on the venue to ``qty`` / ``limit_price``.
+
+        Parameters
+        ----------
+        order : Order
+            The live order, as currently tracked (its ``venue_order_id`` names
+            the venue order). As with :meth:`Broker.place_order` the adapter only
+            reads it; the caller drives :meth:`~trading_bot.domain.order.Order.
+            amend` once this returns.
+        qty : Decimal, optional
+            The new *total* quantity, fills included. ``None`` keeps it.
+        limit_price : Decimal, optional
+            The new limit price. ``None`` keeps it.
+
+        Returns
+        -------
+        str
+            The venue order id the amended order lives under — the same id for
+            an in-place amend, a new one for a cancel-replace.
+
+        Raises
+        ------
+        BrokerError
+            If the venue rejects the amend. The venue order is unchanged.
+        ReplaceFailed
+            If a cancel-replace cancelled the order but placed no replacement.
+        MissingOrder
+            If the venue has no live order under that id.
+        AmbiguousRequestError
+            If the request failed with an unknown outcome; reconcile before
+            retrying.
+
+        """
+        ...
+
+
 def require(broker: Broker, capability: Capability) -> None:
     """Assert ``broker`` declares ``capability``; raise :class:`NoCapability` if not.
 
@@ -52,6 +52,18 @@ makes its venue id the **composite** ``"{SYMBOL}:{orderId}"`` (e.g.
 this form and :meth:`cancel_order` splits it back. The id stays opaque text to
 the router / reconcile / store, so this is self-contained.
 
+Amending
+--------
+:meth:`BinanceBroker.amend_order` uses ``POST /order/cancelReplace`` in
+``STOP_ON_FAILURE`` mode: Binance cancels the resting order and places its
+replacement in one request, and places nothing if the cancel fails. The
+replacement is a new Binance order, so the composite venue id changes. It
+carries the *remaining* quantity and reuses the ``client_order_id``. Like
+``/order`` it is sent at most once (``retry=False``). If the cancel succeeded
+but the new order was refused, the original order is gone. The
+:class:`~trading_bot.domain.errors.BrokerError` raised then says so, and the
+caller reconciles.
+
 Rate limit
 ----------
 Construction wires an :class:`~trading_bot.transport.http.AsyncHTTPClient` for the
@@ -69,8 +81,11 @@ Decimal` and never round-trip through ``float``.
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import hashlib
 import hmac
+import json
 import os
 import re
 import time
@@ -78,7 +93,7 @@ import urllib.parse
 from typing import TYPE_CHECKING, Any
 
 from trading_bot.brokers.base import Broker, Capability
-from trading_bot.domain.errors import BrokerError
+from trading_bot.domain.errors import BrokerError, ReplaceFailed
 from trading_bot.domain.fill import Fill
 from trading_bot.domain.instrument import (
     Instrument,
@@ -88,7 +103,7 @@ from trading_bot.domain.instrument import (
 )
 from trading_bot.domain.money import Money, money
 from trading_bot.domain.order import Order, OrderSide, OrderType
-from trading_bot.transport.http import AsyncHTTPClient
+from trading_bot.transport.http import AsyncHTTPClient, HTTPError
 from trading_bot.transport.ratelimit import RateLimiter
 
 if TYPE_CHECKING:
@@ -276,7 +291,9 @@ class BinanceBroker(Broker):
         """The :class:`Capability` set this adapter serves.
 
         All six REST operations are implemented (place/cancel/open-orders,
-        balances, fills, ticker). The private/authenticated WebSocket feed
+        balances, fills, ticker), plus the account-wide :meth:`cancel_all` and
+        the cancel-replace :meth:`amend_order`. The private/authenticated
+        WebSocket feed
         (:data:`~trading_bot.brokers.base.Capability.PRIVATE_WS`) is **not** part
         of this REST adapter (WS is deferred), so it is omitted.
         """
@@ -287,6 +304,8 @@ class BinanceBroker(Broker):
             Capability.BALANCES,
             Capability.FILLS,
             Capability.TICKER,
+            Capability.CANCEL_ALL,
+            Capability.AMEND,
         }
 
     # --- credentials ------------------------------------------------------- #
@@ -628,6 +647,127 @@ class BinanceBroker(Broker):
             "DELETE", "order", {"symbol": symbol, "orderId": order_id}
         )
 
+    async def cancel_all(self) -> int:
+        """Cancel every open order, one ``DELETE /openOrders`` per symbol.
+
+        Binance's bulk cancel is scoped to a symbol, so the symbols with open
+        orders are read first (``GET /openOrders``) and their bulk cancels are
+        sent concurrently — the client's rate limiter still paces them.
+
+        Returns
+        -------
+        int
+            How many orders Binance reports cancelled.
+
+        Raises
+        ------
+        BrokerError
+            Without credentials, or on a Binance error.
+
+        """
+        async with self._http:
+            payload = await self._signed_request("GET", "openOrders", {})
+            symbols = sorted({str(info.get("symbol", "")) for info in payload})
+            cancelled = await asyncio.gather(
+                *(
+                    self._signed_request("DELETE", "openOrders", {"symbol": symbol})
+                    for symbol in symbols
+                )
+            )
+        return sum(len(entries) for entries in cancelled if isinstance(entries, list))
+
+    async def amend_order(
+        self,
+        order: Order,
+        *,
+        qty: Money | None = None,
+        limit_price: Money | None = None,
+    ) -> str:
+        """Cancel-replace ``order`` via ``POST /order/cancelReplace``.
+
+        The replacement carries the order's remaining quantity (the new total
+        ``qty`` less what has filled) at ``limit_price``, under the same
+        ``newClientOrderId``. Sent once (``retry=False``).
+
+        Parameters
+        ----------
+        order : Order
+            The live order; its ``venue_order_id`` is the composite id.
+        qty : Decimal, optional
+            The new total quantity, fills included.
+        limit_price : Decimal, optional
+            The new limit price.
+
+        Returns
+        -------
+        str
+            The replacement's **new** composite venue id.
+
+        Raises
+        ------
+        BrokerError
+            Without credentials, if the order has no venue id, or if Binance
+            refuses the cancel-replace.
+        ReplaceFailed
+            If Binance cancelled the original order but refused the new one.
+        AmbiguousRequestError
+            On an ambiguous transient failure; reconcile before any retry.
+
+        """
+        if order.venue_order_id is None:
+            raise BrokerError(
+                f"Binance cancelReplace: order {order.client_order_id} has no "
+                "venue id"
+            )
+        symbol, order_id = self._split_venue_id(order.venue_order_id)
+        replacement = dataclasses.replace(
+            order,
+            qty=(order.qty if qty is None else qty) - order.filled_qty,
+            limit_price=order.limit_price if limit_price is None else limit_price,
+        )
+        params = {
+            **self._order_params(replacement),
+            "symbol": symbol,
+            "cancelReplaceMode": "STOP_ON_FAILURE",
+            "cancelOrderId": order_id,
+        }
+        try:
+            payload = await self._signed_request(
+                "POST", "order/cancelReplace", params, retry=False
+            )
+        except HTTPError as exc:
+            error = self._cancel_replace_error(order.client_order_id, exc)
+            if error is None:
+                raise
+            raise error from exc
+        new_id = (payload.get("newOrderResponse") or {}).get("orderId")
+        if new_id is None:
+            raise BrokerError(
+                f"Binance cancelReplace: no orderId returned for "
+                f"{order.client_order_id}"
+            )
+        return self._compose_venue_id(symbol, new_id)
+
+    @staticmethod
+    def _cancel_replace_error(cid: str, exc: HTTPError) -> BrokerError | None:
+        """Turn a refused cancel-replace into a :class:`BrokerError`.
+
+        Binance answers a failed cancel-replace with HTTP 400 and a body naming
+        which half failed: a :class:`ReplaceFailed` when the cancel went through.
+        ``None`` when the body is not such a report.
+        """
+        try:
+            body = json.loads(exc.body)
+        except ValueError:
+            return None
+        if not isinstance(body, dict) or "code" not in body:
+            return None
+        message = f"Binance cancelReplace: {body.get('msg')} (code {body['code']})"
+        data = body.get("data") or {}
+        if data.get("cancelResult") == "SUCCESS":
+            return ReplaceFailed(cid, f"{message}; the original order was cancelled")
+        return BrokerError(message)
+
     async def open_orders(self) -> list[Order]:
         """Return account-wide open orders as domain :class:`Order`s (``GET /openOrders``).
 
@@ -24,6 +24,27 @@ into the module-level :func:`_sign` helper (ported from the legacy
 Kraken's published vector deterministically — that vector is the *only* proof of
 signing correctness exercised here; real private calls are deferred (no key).
 
+The batch endpoints (``AddOrderBatch`` / ``CancelOrderBatch``) take a JSON body
+rather than a form; for those the signed ``postdata`` is the exact JSON string
+sent, and the rest of the scheme is unchanged.
+
+Batch orders
+------------
+:meth:`KrakenBroker.place_orders` sends up to 15 same-pair orders per
+``AddOrderBatch`` and :meth:`KrakenBroker.cancel_orders` up to 50 ids per
+``CancelOrderBatch`` (declared as ``BATCH_ORDERS`` / ``BATCH_CANCEL``). A batch is
+non-idempotent exactly like ``AddOrder``: it is sent once, and an ambiguous
+failure is reported against **every** order in that request.
+
+Amending
+--------
+:meth:`KrakenBroker.amend_order` uses ``AmendOrder``, which changes a resting
+order's price and/or quantity **in place**: the ``txid`` is kept, and so is the
+order's queue priority where Kraken allows it. The older ``EditOrder`` is not
+used, because it cancels the order and places a new one under a new ``txid``.
+An amend sets absolute values, so sending it twice has the same effect as
+sending it once, and it keeps the transport's retry.
+
 Credentials & posture
 ---------------------
 Credentials come from the environment (``KRAKEN_API_KEY`` /
@@ -45,6 +66,7 @@ from __future__ import annotations
 import base64
 import hashlib
 import hmac
+import json
 import os
 import time
 import urllib.parse
@@ -61,11 +83,11 @@ from trading_bot.domain.instrument import (
 )
 from trading_bot.domain.money import Money, money
 from trading_bot.domain.order import Order, OrderSide, OrderType
-from trading_bot.transport.http import AsyncHTTPClient
+from trading_bot.transport.http import AmbiguousRequestError, AsyncHTTPClient
 from trading_bot.transport.ratelimit import KrakenCallCounter, RateLimiter
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Mapping, Sequence
 
 __all__ = ["KrakenBroker"]
 
@@ -73,6 +95,10 @@ _API_BASE = "https://api.kraken.com"
 _PUBLIC = "/0/public"
 _PRIVATE = "/0/private"
 
+# Kraken's per-request limits for the batch endpoints.
+_ADD_BATCH_MAX = 15
+_CANCEL_BATCH_MAX = 50
+
 # Domain OrderType -> Kraken ``ordertype`` string. BEST_LIMIT renders as a plain
 # limit (its price is discovered by the caller before submission, so by the time
 # it reaches the broker it carries a concrete ``limit_price``).
@@ -91,7 +117,9 @@ _KRAKEN_TO_ORDERTYPE: dict[str, OrderType] = {
 }
 
 
-def _sign(path: str, data: Mapping[str, Any], secret: str) -> str:
+def _sign(
+    path: str, data: Mapping[str, Any], secret: str, postdata: str | None = None
+) -> str:
     """Compute Kraken's ``API-Sign`` for a private request.
 
     Pure function (no I/O, no clock): given the request ``path``, the body
@@ -116,6 +144,9 @@ def _sign(path: str, data: Mapping[str, Any], secret: str) -> str:
         preserved by ``urlencode``, so build it ``nonce``-first.
     secret : str
         The base64-encoded Kraken API secret.
+    postdata : str, optional
+        The exact body sent, when it is not the form encoding of ``data`` — the
+        JSON string of a batch endpoint. Defaults to ``urlencode(data)``.
 
     Returns
     -------
@@ -123,7 +154,8 @@ def _sign(path: str, data: Mapping[str, Any], secret: str) -> str:
         The ``API-Sign`` header value (base64).
 
     """
-    postdata = urllib.parse.urlencode(data)
+    if postdata is None:
+        postdata = urllib.parse.urlencode(data)
     encoded = (str(data["nonce"]) + postdata).encode()
     message = path.encode() + hashlib.sha256(encoded).digest()
     signature = hmac.new(base64.b64decode(secret), message, hashlib.sha512)
@@ -177,6 +209,9 @@ class KrakenBroker(Broker):
 
     name = "kraken"
 
+    #: ``AddOrderBatch`` accepts at most this many orders (all on one pair).
+    max_batch_size = _ADD_BATCH_MAX
+
     def __init__(
         self,
         *,
@@ -206,7 +241,9 @@ class KrakenBroker(Broker):
         """The :class:`Capability` set this adapter serves.
 
         All six REST operations are implemented (place/cancel/open-orders,
-        balances, fills, ticker). The private/authenticated WebSocket feed
+        balances, fills, ticker), plus the ``AddOrderBatch`` /
+        ``CancelOrderBatch`` batch endpoints, ``CancelAll`` and ``AmendOrder``.
+        The private/authenticated WebSocket feed
         (:data:`~trading_bot.brokers.base.Capability.PRIVATE_WS`) is **not** part
         of this REST adapter (it lands in the WS leaf), so it is omitted.
         """
@@ -217,6 +254,10 @@ class KrakenBroker(Broker):
             Capability.BALANCES,
             Capability.FILLS,
             Capability.TICKER,
+            Capability.BATCH_ORDERS,
+            Capability.BATCH_CANCEL,
+            Capability.CANCEL_ALL,
+            Capability.AMEND,
         }
 
     # --- credentials / nonce ----------------------------------------------- #
@@ -275,7 +316,12 @@ class KrakenBroker(Broker):
         return self._raise_on_error(payload, context=endpoint)
 
     async def _private_post(
-        self, endpoint: str, data: Mapping[str, Any], *, retry: bool = True
+        self,
+        endpoint: str,
+        data: Mapping[str, Any],
+        *,
+        retry: bool = True,
+        as_json: bool = False,
     ) -> dict[str, Any]:
         """Sign and POST a private endpoint, returning its ``result`` (or raise).
 
@@ -294,21 +340,31 @@ class KrakenBroker(Broker):
             ``True`` for **idempotent** endpoints (queries/reads — a duplicate is
             harmless); ``False`` for the **non-idempotent** ``AddOrder`` so a
             blind retry can never double-submit (see :meth:`place_order`).
+        as_json : bool, default False
+            Send the body as JSON (the batch endpoints) instead of a form. The
+            JSON string is serialised once and signed byte for byte.
         """
         self._require_credentials()
         path = f"{_PRIVATE}/{endpoint}"
         # Build the body nonce-first so the signed postdata is deterministic.
         body: dict[str, Any] = {"nonce": self._nonce()}
         body.update(data)
-        signature = _sign(path, body, self._api_secret)
+        postdata = json.dumps(body, separators=(",", ":")) if as_json else None
+        signature = _sign(path, body, self._api_secret, postdata)
         headers = {"API-Key": self._api_key, "API-Sign": signature}
 
         await self._counter.acquire_method(endpoint)
         url = f"{_API_BASE}{path}"
         async with self._http as client:
-            payload = await client.post(
-                url, data=body, headers=headers, retry=retry
-            )
+            if postdata is None:
+                payload = await client.post(
+                    url, data=body, headers=headers, retry=retry
+                )
+            else:
+                headers["Content-Type"] = "application/json"
+                payload = await client.post(
+                    url, content=postdata, headers=headers, retry=retry
+                )
         return self._raise_on_error(payload, context=endpoint)
 
     # --- public endpoints -------------------------------------------------- #
@@ -509,6 +565,173 @@ class KrakenBroker(Broker):
         """
         await self._private_post("CancelOrder", {"txid": venue_order_id})
 
+    async def place_orders(self, orders: Sequence[Order]) -> list[str | Exception]:
+        """Submit same-pair ``orders`` via ``AddOrderBatch``; one outcome per order.
+
+        Orders are sent in chunks of :attr:`max_batch_size` (15), each chunk one
+        ``AddOrderBatch`` request with ``retry=False`` — a batch is as
+        non-idempotent as ``AddOrder`` (see :meth:`place_order`). A trailing
+        chunk of one order goes through :meth:`place_order`, since Kraken wants
+        at least two orders per batch.
+
+        Parameters
+        ----------
+        orders : sequence of Order
+            The orders to submit, all on one instrument.
+
+        Returns
+        -------
+        list of str or Exception
+            Per order, in input order: Kraken's ``txid``, or the exception that
+            order failed with. A venue rejection of one order is a
+            :class:`BrokerError` in its slot; a whole-request failure (a rejected
+            batch, missing credentials) fills every slot of that chunk with the
+            same :class:`BrokerError`; an ambiguous transient failure fills them
+            with the :class:`~trading_bot.transport.http.AmbiguousRequestError`
+            — those orders may have landed, so reconcile before any retry.
+
+        Raises
+        ------
+        BrokerError
+            If the orders span more than one instrument.
+
+        """
+        if len({order.instrument.symbol for order in orders}) > 1:
+            raise BrokerError("Kraken AddOrderBatch: orders must share one pair")
+        results: list[str | Exception] = []
+        for start in range(0, len(orders), self.max_batch_size):
+            chunk = orders[start : start + self.max_batch_size]
+            results.extend(await self._add_order_batch(chunk))
+        return results
+
+    async def _add_order_batch(self, chunk: Sequence[Order]) -> list[str | Exception]:
+        """Place one chunk (at most 15 orders) and map Kraken's per-order results."""
+        if len(chunk) == 1:
+            try:
+                return [await self.place_order(chunk[0])]
+            except (BrokerError, AmbiguousRequestError) as exc:
+                return [exc]
+        pair = chunk[0].instrument.symbol.to_venue_symbol(self.name)
+        entries = []
+        for order in chunk:
+            params = self._add_order_params(order)
+            del params["pair"]  # carried once, at the batch level
+            entries.append(params)
+        try:
+            result = await self._private_post(
+                "AddOrderBatch",
+                {"pair": pair, "orders": entries},
+                retry=False,
+                as_json=True,
+            )
+        except (BrokerError, AmbiguousRequestError) as exc:
+            return [exc] * len(chunk)
+        placed = result.get("orders") or []
+        if len(placed) != len(chunk):
+            # Some of the chunk may be live, but not which: treat it as ambiguous.
+            ambiguous = AmbiguousRequestError(
+                f"{_API_BASE}{_PRIVATE}/AddOrderBatch",
+                f"{len(placed)} results for {len(chunk)} orders",
+            )
+            return [ambiguous] * len(chunk)
+        outcomes: list[str | Exception] = []
+        for order, entry in zip(chunk, placed, strict=True):
+            txid = entry.get("txid")
+            if entry.get("error") or not txid:
+                reason = entry.get("error") or "no txid returned"
+                outcomes.append(
+                    BrokerError(
+                        f"Kraken AddOrderBatch: {reason} for {order.client_order_id}"
+                    )
+                )
+            else:
+                outcomes.append(str(txid[0] if isinstance(txid, list) else txid))
+        return outcomes
+
+    async def cancel_orders(self, venue_order_ids: Sequence[str]) -> None:
+        """Cancel live orders by ``txid`` via ``CancelOrderBatch`` (50 per request).
+
+        Cancelling is idempotent, so the batch keeps the transport's retry.
+
+        Parameters
+        ----------
+        venue_order_ids : sequence of str
+            Kraken order ``txid``\\ s.
+
+        Raises
+        ------
+        BrokerError
+            Without credentials, or on a Kraken error.
+
+        """
+        for start in range(0, len(venue_order_ids), _CANCEL_BATCH_MAX):
+            chunk = list(venue_order_ids[start : start + _CANCEL_BATCH_MAX])
+            await self._private_post(
+                "CancelOrderBatch", {"orders": chunk}, as_json=True
+            )
+
+    async def cancel_all(self) -> int:
+        """Cancel every open order on the account (``CancelAll``).
+
+        Idempotent (a second call finds nothing to cancel), so it keeps the
+        transport's retry.
+
+        Returns
+        -------
+        int
+            Kraken's reported ``count`` of cancelled orders.
+
+        Raises
+        ------
+        BrokerError
+            Without credentials, or on a Kraken error.
+
+        """
+        result = await self._private_post("CancelAll", {})
+        return int(result.get("count", 0))
+
+    async def amend_order(
+        self,
+        order: Order,
+        *,
+        qty: Money | None = None,
+        limit_price: Money | None = None,
+    ) -> str:
+        """Amend ``order`` in place via ``AmendOrder``; the ``txid`` is kept.
+
+        Parameters
+        ----------
+        order : Order
+            The live order; its ``venue_order_id`` is the Kraken ``txid``.
+        qty : Decimal, optional
+            The new total quantity (Kraken's ``order_qty``).
+        limit_price : Decimal, optional
+            The new limit price.
+
+        Returns
+        -------
+        str
+            The unchanged ``txid``.
+
+        Raises
+        ------
+        BrokerError
+            Without credentials, if the order has no ``txid``, or on a Kraken
+            error.
+
+        """
+        if order.venue_order_id is None:
+            raise BrokerError(
+                f"Kraken AmendOrder: order {order.client_order_id} has no txid"
+            )
+        params: dict[str, str] = {"txid": order.venue_order_id}
+        if qty is not None:
+            params["order_qty"] = str(qty)
+        if limit_price is not None:
+            params["limit_price"] = str(limit_price)
+        await self._private_post("AmendOrder", params)
+        return order.venue_order_id
+
     async def open_orders(self) -> list[Order]:
         """Return Kraken's open orders rebuilt as domain :class:`Order`s (``OpenOrders``).
 
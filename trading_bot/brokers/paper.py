@@ -89,7 +89,7 @@ simulator, not a risk gate); margin/funding checks live in the engine.
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from itertools import count
 from typing import TYPE_CHECKING
@@ -104,7 +104,7 @@ from trading_bot.domain.order import Order, OrderSide, OrderType
 if TYPE_CHECKING:
     from trading_bot.application.events import EventBus
 
-__all__ = ["PaperBroker"]
+__all__ = ["PaperBroker", "deterministic_clock"]
 
 #: Basis-point denominator: ``fee = notional * fee_bps / _BPS_DENOMINATOR``.
 _BPS_DENOMINATOR: Money = money("10000")
@@ -114,8 +114,8 @@ _BPS_DENOMINATOR: Money = money("10000")
 _DEFAULT_CLOCK_BASE_MS = 1_704_067_200_000
 
 
-def _default_clock() -> Callable[[], int]:
-    """Build a deterministic clock: a fixed base time, +1ms per call."""
+def deterministic_clock() -> Callable[[], int]:
+    """Build the default deterministic clock: a fixed base time, +1ms per call."""
     ticker = count(_DEFAULT_CLOCK_BASE_MS)
     return lambda: next(ticker)
 
@@ -191,6 +191,9 @@ class PaperBroker(Broker):
 
     name = "paper"
 
+    #: The simulator has no request size limit; this just bounds a batch.
+    max_batch_size = 100
+
     def __init__(
         self,
         *,
@@ -223,7 +226,7 @@ class PaperBroker(Broker):
         self._fee_bps = fee_bps
         self._fill_model = fill_model
         self._balances: dict[str, Money] = dict(starting_balances or {})
-        self._clock = clock if clock is not None else _default_clock()
+        self._clock = clock if clock is not None else deterministic_clock()
         self._bus = event_bus
         self._partial_chunks = partial_chunks
         self._partial_fill_ratio = partial_fill_ratio
@@ -246,7 +249,8 @@ class PaperBroker(Broker):
         """The :class:`Capability` set this adapter serves.
 
         All six in-process operations are implemented (place/cancel/open-orders,
-        balances, fills, ticker). There is no private WebSocket feed for a
+        balances, fills, ticker), plus their batch forms, :meth:`cancel_all`
+        and :meth:`amend_order`. There is no private WebSocket feed for a
         simulator, so :data:`~trading_bot.brokers.base.Capability.PRIVATE_WS` is
         omitted.
         """
@@ -257,6 +261,10 @@ class PaperBroker(Broker):
             Capability.BALANCES,
             Capability.FILLS,
             Capability.TICKER,
+            Capability.BATCH_ORDERS,
+            Capability.BATCH_CANCEL,
+            Capability.CANCEL_ALL,
+            Capability.AMEND,
         }
 
     # --- price hooks ------------------------------------------------------- #
@@ -508,6 +516,113 @@ class PaperBroker(Broker):
         if record is None:
             raise MissingOrder(venue_order_id)
 
+    async def place_orders(self, orders: Sequence[Order]) -> list[str | Exception]:
+        """Simulate a batch placement: :meth:`place_order` per order, in order.
+
+        Parameters
+        ----------
+        orders : sequence of Order
+            The orders to simulate, all on one instrument.
+
+        Returns
+        -------
+        list of str or Exception
+            Per order, its synthetic venue id or the :class:`BrokerError` its
+            placement raised (e.g. no mark price).
+
+        Raises
+        ------
+        BrokerError
+            If the orders span more than one instrument.
+
+        """
+        if len({order.instrument for order in orders}) > 1:
+            raise BrokerError("paper batch: orders must share one instrument")
+        results: list[str | Exception] = []
+        for order in orders:
+            try:
+                results.append(await self.place_order(order))
+            except BrokerError as exc:
+                results.append(exc)
+        return results
+
+    async def cancel_orders(self, venue_order_ids: Sequence[str]) -> None:
+        """Cancel several live orders at once — all of them, or none.
+
+        Parameters
+        ----------
+        venue_order_ids : sequence of str
+            Synthetic ids returned by :meth:`place_order` / :meth:`place_orders`.
+
+        Raises
+        ------
+        MissingOrder
+            If any id is not live; no order is cancelled then.
+
+        """
+        for venue_order_id in venue_order_ids:
+            if venue_order_id not in self._open:
+                raise MissingOrder(venue_order_id)
+        for venue_order_id in venue_order_ids:
+            self._open.pop(venue_order_id, None)
+
+    async def cancel_all(self) -> int:
+        """Cancel every live order; return how many there were."""
+        cancelled = len(self._open)
+        self._open.clear()
+        return cancelled
+
+    async def amend_order(
+        self,
+        order: Order,
+        *,
+        qty: Money | None = None,
+        limit_price: Money | None = None,
+    ) -> str:
+        """Amend a live simulated order in place, keeping its venue id.
+
+        Emulates an in-place venue amend: the simulator's record takes the new
+        total ``qty`` and/or ``limit_price``. A resting order is only filled at
+        placement, so an amend never fills. **Port-pure**: ``order`` is only
+        read.
+
+        Parameters
+        ----------
+        order : Order
+            The live order; its ``venue_order_id`` names the simulated order.
+        qty : Decimal, optional
+            The new total quantity, fills included.
+        limit_price : Decimal, optional
+            The new limit price.
+
+        Returns
+        -------
+        str
+            The unchanged synthetic venue id.
+
+        Raises
+        ------
+        MissingOrder
+            If no live order is tracked under the order's venue id.
+        BrokerError
+            If ``qty`` does not exceed the simulated filled quantity.
+
+        """
+        venue_order_id = order.venue_order_id or order.client_order_id
+        record = self._open.get(venue_order_id)
+        if record is None:
+            raise MissingOrder(venue_order_id)
+        if qty is not None:
+            if qty <= record.filled_qty:
+                raise BrokerError(
+                    f"paper amend: qty {qty} must exceed filled "
+                    f"{record.filled_qty} for {venue_order_id}"
+                )
+            record.qty = qty
+        if limit_price is not None:
+            record.limit_price = limit_price
+        return venue_order_id
+
     async def open_orders(self) -> list[Order]:
         """Return the still-live (open / partially-filled) orders.
 
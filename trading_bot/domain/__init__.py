@@ -37,6 +37,7 @@ from trading_bot.domain.errors import (
     NoCapability,
     OrderError,
     OrderStatusError,
+    ReplaceFailed,
     RiskLimitBreached,
     SignalError,
     TradingBotError,
@@ -135,6 +136,7 @@ __all__ = [
     "RiskLimitBreached",
     "NoCapability",
     "BrokerError",
+    "ReplaceFailed",
     "SignalError",
     "ConfigError",
     "LiveTradingNotEnabled",
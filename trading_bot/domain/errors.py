@@ -25,6 +25,7 @@ __all__ = [
     "RiskLimitBreached",
     "NoCapability",
     "BrokerError",
+    "ReplaceFailed",
     "SignalError",
     "ConfigError",
     "LiveTradingNotEnabled",
@@ -57,6 +58,27 @@ class BrokerError(TradingBotError):
         super().__init__(msg)
 
 
+class ReplaceFailed(BrokerError):
+    """A cancel-replace cancelled the original order but placed no replacement.
+
+    Raised by an adapter whose amend is a venue-side cancel-replace when only the
+    new-order half failed: the order is no longer live on the venue, so the
+    caller must treat it as cancelled rather than as unchanged.
+
+    Parameters
+    ----------
+    order_id : str
+        Client id of the order whose original was cancelled.
+    msg : str
+        Human-readable detail of the failure.
+
+    """
+
+    def __init__(self, order_id: str, msg: str) -> None:
+        self.order_id = order_id
+        super().__init__(msg)
+
+
 class OrderError(TradingBotError):
     """An operation on a specific order failed.
 
@@ -168,16 +190,24 @@ class RiskLimitBreached(TradingBotError):
         The observed value.
     threshold : Decimal
         The limit that was exceeded.
+    msg : str, optional
+        Detail replacing ``"<value> exceeds <threshold>"`` in the message, for
+        a breach that is not a plain comparison.
 
     """
 
-    def __init__(self, limit: str, value: Decimal, threshold: Decimal) -> None:
+    def __init__(
+        self,
+        limit: str,
+        value: Decimal,
+        threshold: Decimal,
+        msg: str | None = None,
+    ) -> None:
         self.limit = limit
         self.value = value
         self.threshold = threshold
-        super().__init__(
-            f"risk limit {limit!r} breached: {value} exceeds {threshold}"
-        )
+        detail = msg if msg is not None else f"{value} exceeds {threshold}"
+        super().__init__(f"risk limit {limit!r} breached: {detail}")
 
 
 class SignalError(TradingBotError):
@@ -5,17 +5,23 @@ This module replaces the legacy ad-hoc status ``{None, 'open', 'canceled',
 state machine. An :class:`Order` is a **stateful aggregate**: it has identity
 (its mandatory ``client_order_id``) and mutates through explicit, guarded
 transitions — :meth:`Order.submit`, :meth:`Order.open`,
-:meth:`Order.apply_fill`, :meth:`Order.cancel`, :meth:`Order.reject`. Any
-transition the machine forbids raises :class:`~trading_bot.domain.errors.
-OrderStatusError`.
+:meth:`Order.apply_fill`, :meth:`Order.amend`, :meth:`Order.cancel`,
+:meth:`Order.reject`. Any transition the machine forbids raises
+:class:`~trading_bot.domain.errors.OrderStatusError`.
 
 Design choices (carried into the ADR):
 
 * **Mutable, not immutable-with-copy.** An order has a stable identity and a
   long, fill-by-fill life; threading a fresh copy through every partial fill
-  would add noise without buying safety. State only ever changes via the five
+  would add noise without buying safety. State only ever changes via the six
   guarded methods, never by reaching into the fields, so the machine stays the
   single source of truth.
+* **Amend keeps identity and status.** Repricing or resizing a resting order
+  (a venue amend or cancel-replace) is not a lifecycle transition: the order
+  keeps its ``client_order_id``, its status and its fills, and only its
+  ``limit_price`` / ``qty`` (and, after a cancel-replace, its
+  ``venue_order_id``) change. Only a live order can be amended, and never
+  below what has already filled.
 * **Tolerance rule (ported from legacy ``check_vol_exec``).** The default
   tolerance is ``0.1%`` (legacy ``tol=0.001``). After a fill, if the *unfilled*
   fraction ``(qty - filled_qty) / qty`` is strictly below ``tol``, the order is
@@ -133,8 +139,9 @@ class Order:
 
     The order is a *stateful aggregate*: create it, then drive it through its
     lifecycle with :meth:`submit`, :meth:`open`, :meth:`apply_fill`,
-    :meth:`cancel` and :meth:`reject`. Status, fills and the average fill price
-    only ever change through those methods.
+    :meth:`cancel` and :meth:`reject`, and reprice a resting order with
+    :meth:`amend`. Status, fills and the average fill price only ever change
+    through those methods.
 
     Parameters
     ----------
@@ -362,6 +369,69 @@ class Order:
         unfilled_fraction = (self.qty - self.filled_qty) / self.qty
         return unfilled_fraction < self.fill_tolerance
 
+    def amend(
+        self,
+        *,
+        qty: Money | None = None,
+        limit_price: Money | None = None,
+        venue_order_id: str | None = None,
+    ) -> None:
+        """Reprice and/or resize a live order in place; the status is unchanged.
+
+        Records a venue amend (or cancel-replace) the venue has accepted. The
+        order keeps its identity, status and fills.
+
+        Parameters
+        ----------
+        qty : Decimal, optional
+            The new *total* quantity, fills included. Must exceed
+            :attr:`filled_qty`.
+        limit_price : Decimal, optional
+            The new limit price. Only ``LIMIT`` and ``BEST_LIMIT`` orders carry
+            one. Must be positive.
+        venue_order_id : str, optional
+            The venue id the order now lives under, when the venue replaced it
+            with a new one (a cancel-replace). Must be non-empty.
+
+        Raises
+        ------
+        OrderStatusError
+            If the order is not live (``OPEN`` or ``PARTIALLY_FILLED``).
+        OrderError
+            If nothing is amended, ``qty`` does not exceed the filled quantity,
+            ``limit_price`` is not positive or not allowed for the order type,
+            or ``venue_order_id`` is empty.
+
+        """
+        if self.status not in _FILLABLE:
+            raise OrderStatusError(self.client_order_id, self.status.value, "amend")
+        if qty is None and limit_price is None:
+            raise OrderError(self.client_order_id, "amend needs a qty or limit_price")
+        if qty is not None and qty <= self.filled_qty:
+            raise OrderError(
+                self.client_order_id,
+                f"amended qty {qty} must exceed filled qty {self.filled_qty}",
+            )
+        if limit_price is not None:
+            if self.type not in (OrderType.LIMIT, OrderType.BEST_LIMIT):
+                raise OrderError(
+                    self.client_order_id,
+                    f"{self.type.name} order has no limit_price to amend",
+                )
+            if limit_price <= 0:
+                raise OrderError(
+                    self.client_order_id,
+                    f"limit_price must be positive, got {limit_price}",
+                )
+        if venue_order_id is not None and not venue_order_id:
+            raise OrderError(self.client_order_id, "venue_order_id must be non-empty")
+        if qty is not None:
+            self.qty = qty
+        if limit_price is not None:
+            self.limit_price = limit_price
+        if venue_order_id is not None:
+            self.venue_order_id = venue_order_id
+
     def cancel(self) -> None:
         """Cancel a live order (from ``SUBMITTED``, ``OPEN`` or partially filled).
 
@@ -60,6 +60,17 @@ function body**, so ``import trading_bot.domain.performance`` always succeeds.
 When fynance is absent the wrappers raise :class:`PerformanceDependencyError`
 (a :class:`~trading_bot.domain.errors.TradingBotError`).
 
+Columns instead of fills
+------------------------
+Over a long history (millions of fills read back from a columnar export),
+building one :class:`~trading_bot.domain.fill.Fill` and one
+:class:`~trading_bot.domain.position.Position` per row dominates the cost.
+:func:`fold_fill_columns` takes the history as aligned columns instead and
+returns the aggregate realised-PnL path plus the final positions; it shares its
+per-fill arithmetic with :meth:`Position.with_fill
+<trading_bot.domain.position.Position.with_fill>`, so both give the same
+numbers. The KPI wrappers already accept a ``float64`` array.
+
 The module is pure: no I/O, no async, deterministic in fill order.
 """
 
@@ -72,7 +83,9 @@ import numpy as np
 
 from trading_bot.domain.errors import TradingBotError
 from trading_bot.domain.fill import Fill
+from trading_bot.domain.instrument import Instrument
 from trading_bot.domain.money import Money, money
+from trading_bot.domain.position import Position, step_exposure
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
@@ -86,6 +99,7 @@ __all__ = [
     "pnl",
     "cum_pnl",
     "equity_curve",
+    "fold_fill_columns",
     "equity_array",
     "sharpe",
     "sortino",
@@ -367,6 +381,75 @@ def equity_curve(
     )
 
 
+def fold_fill_columns(
+    instruments: Sequence[Instrument],
+    signed_qty: Sequence[Money],
+    prices: Sequence[Money],
+    fees: Sequence[Money],
+) -> tuple[tuple[Money, ...], dict[Instrument, Position]]:
+    """Fold a fill history given as columns: the realised-PnL path and positions.
+
+    The columnar counterpart of folding :meth:`Position.with_fill
+    <trading_bot.domain.position.Position.with_fill>` per instrument over a
+    ``Sequence[Fill]``: the same rules, applied to four aligned columns (say, a
+    Parquet export's), with no :class:`~trading_bot.domain.fill.Fill` or
+    intermediate :class:`~trading_bot.domain.position.Position` built per row.
+    Money stays exact.
+
+    Parameters
+    ----------
+    instruments : Sequence[Instrument]
+        Each fill's instrument, in execution order (any mix of instruments).
+    signed_qty : Sequence[Money]
+        Each fill's signed quantity (``+qty`` for a BUY, ``-qty`` for a SELL).
+    prices, fees : Sequence[Money]
+        Each fill's price and fee.
+
+    Returns
+    -------
+    tuple
+        ``(path, positions)``: the aggregate realised PnL (net of fees, across
+        instruments) after each fill, and every instrument's final position.
+
+    Raises
+    ------
+    ValueError
+        If the columns differ in length.
+
+    """
+    if not len(instruments) == len(signed_qty) == len(prices) == len(fees):
+        raise ValueError("fill columns must have equal lengths")
+    # instrument -> [net_qty, avg_entry, realised_pnl, fees_paid]
+    books: dict[Instrument, list[Money]] = {}
+    path: list[Money] = []
+    total = _ZERO
+    for instrument, signed, price, fee in zip(
+        instruments, signed_qty, prices, fees, strict=True
+    ):
+        book = books.get(instrument)
+        if book is None:
+            book = books[instrument] = [_ZERO, _ZERO, _ZERO, _ZERO]
+        book[0], book[1], gross = step_exposure(book[0], book[1], signed, price)
+        realised = book[2] - fee + gross
+        # The aggregate moves by the instrument's realised-PnL delta, exactly as
+        # PerformanceService.apply adds it (same rounding, same path).
+        total += realised - book[2]
+        book[2] = realised
+        book[3] = book[3] + fee
+        path.append(total)
+    positions = {
+        instrument: Position(
+            instrument=instrument,
+            net_qty=net_qty,
+            avg_entry_price=None if net_qty == 0 else avg_entry,
+            realised_pnl=realised,
+            fees_paid=paid,
+        )
+        for instrument, (net_qty, avg_entry, realised, paid) in books.items()
+    }
+    return tuple(path), positions
+
+
 def equity_array(equity: Sequence[Money]) -> NDArray[np.float64]:
     """Convert an exact equity curve to a ``float64`` array for the KPI wrappers.
 
@@ -45,7 +45,8 @@ A **flip** is a fill that reverses the position's sign: a reducing fill whose
    flipping fill's price.
 
 Increases in the same direction take the quantity-weighted average of the old
-and the added exposure.
+and the added exposure. :func:`step_exposure` is that arithmetic on bare
+decimals, for folds that build no :class:`Position` per fill.
 
 One instrument per position
 ---------------------------
@@ -66,10 +67,10 @@ from trading_bot.domain.errors import InstrumentMismatch
 from trading_bot.domain.fill import Fill
 from trading_bot.domain.instrument import Instrument
 from trading_bot.domain.money import Money, money
-from trading_bot.domain.order import OrderSide
 
 __all__ = [
     "Position",
+    "step_exposure",
 ]
 
 _ZERO: Money = money("0")
@@ -186,53 +187,17 @@ class Position:
         if fill.instrument != self.instrument:
             raise InstrumentMismatch(str(self.instrument), str(fill.instrument))
 
-        net_qty = self.net_qty
         # Average entry of the open exposure; 0 when flat (the value is irrelevant
         # while flat — the opening branch overwrites it).
         avg_entry: Money = (
             self.avg_entry_price if self.avg_entry_price is not None else _ZERO
         )
+        net_qty, avg_entry, gross = step_exposure(
+            self.net_qty, avg_entry, fill.signed_qty, fill.price
+        )
         # Fees always accrue and always reduce realised PnL.
         fees_paid = self.fees_paid + fill.fee
-        realised_pnl = self.realised_pnl - fill.fee
-
-        signed = fill.signed_qty  # +qty for BUY, -qty for SELL
-        price = fill.price
-
-        if net_qty == 0:
-            # Opening from flat: the fill becomes the whole exposure.
-            net_qty = signed
-            avg_entry = price
-        elif (net_qty > 0) == (fill.side is OrderSide.BUY):
-            # Increasing exposure: quantity-weighted average of old + added.
-            old_mag = abs(net_qty)
-            add_mag = fill.qty
-            total_mag = old_mag + add_mag
-            avg_entry = (avg_entry * old_mag + price * add_mag) / total_mag
-            net_qty += signed
-        else:
-            # Opposite direction: this fill reduces (and maybe flips) exposure.
-            open_mag = abs(net_qty)
-            closed_mag = min(open_mag, fill.qty)
-            realised_pnl += _close_pnl(
-                was_long=net_qty > 0,
-                entry=avg_entry,
-                exit_price=price,
-                closed_qty=closed_mag,
-            )
-            new_net = net_qty + signed
-            if new_net == 0:
-                # Exact close back to flat.
-                net_qty = _ZERO
-                avg_entry = _ZERO
-            elif (new_net > 0) == (net_qty > 0):
-                # Partial close: same sign, entry unchanged, qty reduced.
-                net_qty = new_net
-            else:
-                # Flip: old side fully closed above; remainder opens at the
-                # flipping fill's price, which becomes the new average entry.
-                net_qty = new_net
-                avg_entry = price
+        realised_pnl = self.realised_pnl - fill.fee + gross
 
         return Position(
             instrument=self.instrument,
@@ -282,6 +247,63 @@ class Position:
         return position
 
 
+def step_exposure(
+    net_qty: Money, avg_entry: Money, signed: Money, price: Money
+) -> tuple[Money, Money, Money]:
+    """Advance an open exposure by one signed fill (the rules of :meth:`with_fill`).
+
+    The one place the increase / close / flip arithmetic lives, shared by
+    :meth:`Position.with_fill` and the column fold of
+    :func:`trading_bot.domain.performance.fold_fill_columns`, so the two cannot
+    diverge.
+
+    Parameters
+    ----------
+    net_qty : Decimal
+        Signed exposure before the fill.
+    avg_entry : Decimal
+        Its average entry price (any value while flat).
+    signed : Decimal
+        The fill's signed quantity (``+qty`` for a BUY, ``-qty`` for a SELL).
+    price : Decimal
+        The fill's price.
+
+    Returns
+    -------
+    tuple of Decimal
+        ``(net_qty, avg_entry, gross_pnl)`` after the fill; ``avg_entry`` is
+        ``0`` when flat and ``gross_pnl`` is the PnL realised by the fill,
+        before its fee.
+
+    """
+    if net_qty == 0:
+        # Opening from flat: the fill becomes the whole exposure.
+        return signed, price, _ZERO
+    if (net_qty > 0) == (signed > 0):
+        # Increasing exposure: quantity-weighted average of old + added.
+        old_mag = abs(net_qty)
+        add_mag = abs(signed)
+        avg_entry = (avg_entry * old_mag + price * add_mag) / (old_mag + add_mag)
+        return net_qty + signed, avg_entry, _ZERO
+    # Opposite direction: this fill reduces (and maybe flips) exposure.
+    gross = _close_pnl(
+        was_long=net_qty > 0,
+        entry=avg_entry,
+        exit_price=price,
+        closed_qty=min(abs(net_qty), abs(signed)),
+    )
+    new_net = net_qty + signed
+    if new_net == 0:
+        # Exact close back to flat.
+        return _ZERO, _ZERO, gross
+    if (new_net > 0) == (net_qty > 0):
+        # Partial close: same sign, entry unchanged, qty reduced.
+        return new_net, avg_entry, gross
+    # Flip: old side fully closed above; remainder opens at the flipping fill's
+    # price, which becomes the new average entry.
+    return new_net, price, gross
+
+
 def _close_pnl(
     *, was_long: bool, entry: Money, exit_price: Money, closed_qty: Money
 ) -> Money:
@@ -14,6 +14,9 @@ action is delegated to a use-case the
   (:mod:`trading_bot.interfaces.api`): positions / orders / PnL+KPI as JSON
   (money as Decimal strings) plus an SSE event stream. No endpoint ever places
   or cancels an order.
+* stream — the engine bus published on a Unix domain socket
+  (:mod:`trading_bot.interfaces.stream`) plus the client that reads it, so
+  observers run out of process. Read-only, like the API.
 
 The Jinja2 dashboard (``ui``) lands later.
 """
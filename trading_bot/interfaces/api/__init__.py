@@ -8,11 +8,13 @@ the factory wired and renders its state out — it holds **no** business logic a
 deliberately, **never mutates** the engine (no order is ever placed or cancelled
 through this API; see :func:`~trading_bot.interfaces.api.app.create_app`).
 
-The single entrypoint is :func:`~trading_bot.interfaces.api.app.create_app`.
+The single entrypoint is :func:`~trading_bot.interfaces.api.app.create_app`; its
+event stream is served by the :class:`~trading_bot.interfaces.api.sse.SseHub`.
 """
 
 from __future__ import annotations
 
 from trading_bot.interfaces.api.app import create_app, create_control_app
+from trading_bot.interfaces.api.sse import SseCursor, SseHub
 
-__all__ = ["create_app", "create_control_app"]
+__all__ = ["create_app", "create_control_app", "SseCursor", "SseHub"]
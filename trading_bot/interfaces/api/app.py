@@ -32,15 +32,18 @@ through :class:`_DecimalJSONResponse`, whose encoder stringifies any stray
 Sortino, max-drawdown, Calmar) are statistical estimators, not money, so they go
 out as JSON numbers (floats are fine there).
 
-SSE — mirrors dccd (carried into the ADR)
------------------------------------------
-``GET /api/events`` registers its own :class:`asyncio.Queue` on the bus via
-:meth:`~trading_bot.application.events.EventBus.add_queue`, an async generator
-``await``\\ s the queue and yields ``data: <json>\\n\\n`` frames (each event
-serialized with money as strings and tagged with a ``type`` discriminator), and
-:meth:`~trading_bot.application.events.EventBus.remove_queue` runs in a
-``finally`` so the queue is always unregistered on disconnect — exactly dccd's
-``/api/events`` shape.
+SSE — one hub, serialise once (carried into the ADR)
+----------------------------------------------------
+``create_app`` builds one :class:`~trading_bot.interfaces.api.sse.SseHub` per
+app: a single bus subscription that serialises each event **once** (money as
+strings, tagged with a ``type`` discriminator) into a shared ring buffer.
+``GET /api/events`` gives each client only a cursor into that ring; its async
+generator yields every newer ``id: <seq>\ndata: <json>\n\n`` frame as one write,
+or a heartbeat comment after 15 s of quiet. A reconnecting ``EventSource``
+resumes from ``Last-Event-ID``; a client that fell off the ring gets a ``gap``
+frame, and a burst of log events is coalesced per client (see
+:mod:`~trading_bot.interfaces.api.sse`). Nothing is registered per client, so
+a disconnect leaves nothing to clean up but the client count.
 
 The dashboard UI — a pure HTTP client mounted on the same app (carried into the ADR)
 ------------------------------------------------------------------------------------
@@ -59,7 +62,6 @@ on their existence so the API still builds if assets are absent.
 
 from __future__ import annotations
 
-import asyncio
 import json
 import math
 from collections.abc import Callable
@@ -79,6 +81,7 @@ from trading_bot.application.events import (
     LogEvent,
     OrderEvent,
 )
+from trading_bot.interfaces.api.sse import SseHub
 from trading_bot.interfaces.ui import STATIC_DIR, TEMPLATES_DIR
 
 if TYPE_CHECKING:
@@ -87,9 +90,11 @@ if TYPE_CHECKING:
         StrategyStatus,
         StrategySupervisor,
     )
+    from trading_bot.application.watchdog import LoopWatchdog
     from trading_bot.domain.fill import Fill
     from trading_bot.domain.order import Order
     from trading_bot.domain.position import Position
+    from trading_bot.storage import FillTotals
 
 __all__ = ["create_app", "create_control_app"]
 
@@ -202,6 +207,17 @@ def _fill_dict(fill: Fill) -> dict[str, Any]:
     }
 
 
+def _totals_dict(totals: FillTotals) -> dict[str, Any]:
+    """Serialise one :class:`~trading_bot.storage.FillTotals` (money as strings)."""
+    return {
+        "instrument": str(totals.instrument),
+        "fills": totals.fills,
+        "net_qty": _money_str(totals.net_qty),
+        "volume": _money_str(totals.volume),
+        "fees": _money_str(totals.fees),
+    }
+
+
 def _safe_ratio(compute: Callable[[], float]) -> float:
     """Evaluate a KPI ratio, returning ``0.0`` when it is undefined on this curve.
 
@@ -233,6 +249,11 @@ def _safe_ratio(compute: Callable[[], float]) -> float:
     return value if math.isfinite(value) else 0.0
 
 
+def _loop_metrics(watchdog: LoopWatchdog | None) -> dict[str, object] | None:
+    """The watchdog's lag histogram + stall count, or ``None`` with no watchdog."""
+    return watchdog.snapshot() if watchdog is not None else None
+
+
 def _event_dict(event: Event) -> dict[str, Any]:
     """Serialize a bus :class:`~trading_bot.application.events.Event` for SSE.
 
@@ -247,24 +268,34 @@ def _event_dict(event: Event) -> dict[str, Any]:
     if isinstance(event, FillEvent):
         return {"type": "fill", "fill": _fill_dict(event.fill)}
     if isinstance(event, LogEvent):
-        return {"type": "log", "message": event.message, "level": event.level}
+        return {
+            "type": "log",
+            "message": event.message,
+            "level": event.level,
+            "category": event.category,
+        }
     # Defensive: an unknown event type still streams a typed, JSON-safe frame.
     return {"type": "unknown", "repr": repr(event)}
 
 
+def _encode_event(event: Event) -> str:
+    """Render an event as its SSE ``data`` JSON (the hub calls this once per event)."""
+    return json.dumps(_event_dict(event), default=_default)
+
+
 # ---------------------------------------------------------------------------
 # Application factory
 # ---------------------------------------------------------------------------
 
-def create_app(engine: Engine) -> FastAPI:
+def create_app(engine: Engine, *, watchdog: LoopWatchdog | None = None) -> FastAPI:
     """Build the read-only FastAPI over a wired :class:`Engine`.
 
     Stores ``engine`` on ``app.state`` and registers the read-only GET endpoints
-    (``/api/health``, ``/api/positions``, ``/api/orders``, ``/api/kpi``) plus the
-    SSE stream (``/api/events``). Every response renders money as an exact
-    :class:`~decimal.Decimal` string (see the module docstring). **No** endpoint
-    mutates the engine — there is deliberately no route to place or cancel an
-    order.
+    (``/api/health``, ``/api/metrics``, ``/api/positions``, ``/api/orders``,
+    ``/api/kpi``, ``/api/logs``) plus the SSE stream (``/api/events``). Every
+    response renders money as an exact :class:`~decimal.Decimal` string (see
+    the module docstring). **No** endpoint mutates the engine — there is
+    deliberately no route to place or cancel an order.
 
     Parameters
     ----------
@@ -272,6 +303,9 @@ def create_app(engine: Engine) -> FastAPI:
         The fully-wired engine to expose. Read through ``app.state.engine`` by the
         handlers, so the wiring is explicit and the app is testable with a paper
         engine.
+    watchdog : LoopWatchdog or None, optional
+        The run's event-loop watchdog; ``GET /api/metrics`` reports its lag
+        histogram and stall count. ``None`` (default) reports ``"loop": null``.
 
     Returns
     -------
@@ -286,6 +320,8 @@ def create_app(engine: Engine) -> FastAPI:
         default_response_class=_DecimalJSONResponse,
     )
     app.state.engine = engine
+    app.state.watchdog = watchdog
+    app.state.sse_hub = SseHub(engine.bus, _encode_event)
 
     def _engine(request: Request) -> Engine:
         """Read the wired engine off ``app.state`` (explicit, testable access)."""
@@ -330,14 +366,20 @@ def create_app(engine: Engine) -> FastAPI:
 
     @app.get("/api/health")
     async def health(request: Request) -> dict[str, Any]:
-        """Liveness + a snapshot of what the engine is configured to run."""
+        """Liveness, what the engine runs, and the bus's subscriber queue depths."""
         eng = _engine(request)
         return {
             "status": "ok",
             "mode": eng.config.mode,
             "strategies": len(eng.config.strategies),
+            "bus": eng.bus.snapshot(),
         }
 
+    @app.get("/api/metrics")
+    async def metrics(request: Request) -> dict[str, Any]:
+        """Event-loop lag quantiles/buckets and stall count (``null`` when off)."""
+        return {"loop": _loop_metrics(request.app.state.watchdog)}
+
     # -- Positions ----------------------------------------------------------- #
 
     @app.get("/api/positions")
@@ -361,10 +403,18 @@ def create_app(engine: Engine) -> FastAPI:
 
     @app.get("/api/kpi")
     async def kpi(request: Request) -> dict[str, Any]:
-        """Aggregate PnL/KPI: money as Decimal strings, ratios as JSON numbers."""
-        perf = _engine(request).perf
+        """Aggregate PnL/KPI: money as Decimal strings, ratios as JSON numbers.
+
+        With a store, ``history`` adds per-instrument totals over the whole
+        stored fill history, summed inside SQLite (``[]`` without a store). The
+        query runs on the engine's store reader threads, never on the event
+        loop that submits orders.
+        """
+        eng = _engine(request)
+        perf = eng.perf
         equity = perf.equity_curve()
         equity_end = equity[-1] if equity else None
+        totals = await eng.reader.fill_totals() if eng.reader is not None else []
         return {
             "realised_pnl": _money_str(perf.realised_pnl()),
             "fees_paid": _money_str(perf.fees_paid()),
@@ -373,6 +423,41 @@ def create_app(engine: Engine) -> FastAPI:
             "sortino": _safe_ratio(perf.sortino),
             "max_drawdown": _safe_ratio(perf.max_drawdown),
             "calmar": _safe_ratio(perf.calmar),
+            "history": [_totals_dict(t) for t in totals],
+        }
+
+    # -- Logs ---------------------------------------------------------------- #
+
+    @app.get("/api/logs")
+    async def logs(
+        request: Request,
+        before: int | None = None,
+        limit: int = 100,
+        level: str | None = None,
+        category: str | None = None,
+    ) -> dict[str, Any]:
+        """A page of recent log lines, newest first, from the engine's log ring.
+
+        Page backwards by passing the returned ``next`` as ``before``; ``next``
+        is ``null`` on the last page (and always without a ring).
+        """
+        ring = _engine(request).logs
+        if ring is None:
+            return {"logs": [], "next": None}
+        limit = max(1, min(limit, 1000))
+        page = ring.page(before=before, limit=limit, level=level, category=category)
+        return {
+            "logs": [
+                {
+                    "seq": record.seq,
+                    "ts_ns": record.ts_ns,
+                    "level": record.level,
+                    "category": record.category,
+                    "message": record.message,
+                }
+                for record in page
+            ],
+            "next": page[-1].seq if len(page) == limit else None,
         }
 
     # -- SSE events ---------------------------------------------------------- #
@@ -381,36 +466,33 @@ def create_app(engine: Engine) -> FastAPI:
     async def events(request: Request) -> StreamingResponse:
         """Server-Sent-Events stream of order/fill/log events from the bus.
 
-        Registers a fresh queue on the engine's
-        :class:`~trading_bot.application.events.EventBus`, yields each event as a
-        ``data: <json>\\n\\n`` frame (money as Decimal strings, tagged with a
-        ``type``), and unregisters the queue in a ``finally`` on disconnect.
+        Serves the app's :class:`~trading_bot.interfaces.api.sse.SseHub` from a
+        per-client cursor (resuming after ``Last-Event-ID`` when sent): each
+        write carries every frame published since the last one, already
+        serialised (money as Decimal strings, tagged with a ``type``).
         """
-        bus = _engine(request).bus
-        queue = bus.add_queue()
+        hub: SseHub = request.app.state.sse_hub
+        last_event_id = request.headers.get("last-event-id")
 
         async def _generator() -> Any:
+            # Count the client before placing its cursor: the hub only keeps
+            # frames while someone is connected.
+            hub.attach()
+            cursor = hub.cursor(last_event_id)
             try:
                 # Flush an immediate comment so the client's EventSource leaves
                 # "connecting" without waiting for the first real event (mirrors
                 # dccd, where a buffering middleware otherwise stalls the start).
-                yield ": connected\n\n"
+                yield b": connected\n\n"
                 while True:
                     if await request.is_disconnected():
                         break
-                    try:
-                        # Bounded wait so the loop periodically wakes to re-check
-                        # disconnection (and so a hung consumer cannot pin the
-                        # queue forever); on timeout, send an SSE heartbeat
-                        # comment. Mirrors dccd's /api/events.
-                        event = await asyncio.wait_for(queue.get(), timeout=15.0)
-                        yield (
-                            f"data: {json.dumps(_event_dict(event), default=_default)}\n\n"
-                        )
-                    except asyncio.TimeoutError:
-                        yield ": heartbeat\n\n"
+                    # Bounded wait so the loop periodically wakes to re-check
+                    # disconnection; on timeout, send an SSE heartbeat comment.
+                    chunk = await hub.next_chunk(cursor, timeout=15.0)
+                    yield b": heartbeat\n\n" if chunk is None else chunk
             finally:
-                bus.remove_queue(queue)
+                hub.detach()
 
         return StreamingResponse(_generator(), media_type="text/event-stream")
 
@@ -458,11 +540,24 @@ def _status_dict(status: StrategyStatus) -> dict[str, Any]:
             str(status.realised_pnl) if status.realised_pnl is not None else None
         ),
         "open_orders": status.open_orders,
+        "usage": {
+            "steps": status.usage.steps,
+            "cpu_seconds": status.usage.cpu_seconds,
+            "memory_bytes": status.usage.memory_bytes,
+            "peak_memory_bytes": status.usage.peak_memory_bytes,
+            "tracked_orders": status.usage.tracked_orders,
+            "latency_p50": status.usage.latency_p50,
+            "latency_p95": status.usage.latency_p95,
+            "latency_p99": status.usage.latency_p99,
+        },
     }
 
 
 def create_control_app(
-    supervisor: StrategySupervisor, *, auth_token: str | None = None
+    supervisor: StrategySupervisor,
+    *,
+    auth_token: str | None = None,
+    watchdog: LoopWatchdog | None = None,
 ) -> FastAPI:
     """Build the daemon's **control** FastAPI over a :class:`StrategySupervisor`.
 
@@ -492,6 +587,9 @@ def create_control_app(
     auth_token : str or None, optional
         When set, require this token to log in (enables the auth guard). ``None``
         (default) leaves the app unauthenticated — loopback / tunnel only.
+    watchdog : LoopWatchdog or None, optional
+        The daemon's event-loop watchdog, reported by ``GET /api/metrics`` (as in
+        :func:`create_app`).
 
     Returns
     -------
@@ -513,6 +611,7 @@ def create_control_app(
         default_response_class=_DecimalJSONResponse,
     )
     app.state.supervisor = supervisor
+    app.state.watchdog = watchdog
     app.state.auth_enabled = bool(auth_token)
 
     def _sup(request: Request) -> StrategySupervisor:
@@ -546,9 +645,13 @@ def create_control_app(
         running = sum(1 for s in _sup(request).status() if s.running)
         return {"status": "ok", "strategies": len(names), "running": running}
 
+    @app.get("/api/metrics")
+    async def metrics(request: Request) -> dict[str, Any]:
+        return {"loop": _loop_metrics(request.app.state.watchdog)}
+
     @app.get("/api/strategies")
     async def strategies(request: Request) -> list[dict[str, Any]]:
-        """List every managed strategy with its mode / running / PnL."""
+        """List every managed strategy with its mode / running / PnL / usage."""
         return [_status_dict(s) for s in _sup(request).status()]
 
     @app.post("/api/strategies/{name}/start")
@@ -0,0 +1,238 @@
+"""The SSE broadcast hub — serialise each bus event once, fan it out to every client.
+
+``GET /api/events`` used to register one :class:`asyncio.Queue` per client and
+re-serialise every event in every client's generator: with N dashboards open the
+same event was JSON-encoded N times, and a client that fell behind silently lost
+events to ``QueueFull``. The :class:`SseHub` replaces that with one subscription
+on the bus and one shared buffer.
+
+Design (carried into the ADR)
+-----------------------------
+* **Serialise once.** The hub's bus handler encodes each event to a complete SSE
+  frame (``id: <seq>\\ndata: <json>\\n\\n``, as bytes) exactly once and appends it
+  to a bounded ring buffer under a monotonically increasing sequence number.
+  Order and fill frames are kept in the ring whether or not a client is
+  connected, so a lone dashboard whose ``EventSource`` reconnects after a blip
+  still resumes without a gap.
+* **Logs only while watched.** Clients :meth:`SseHub.attach` / :meth:`SseHub.detach`.
+  With none attached the hub subscribes to order and fill events only (to keep
+  the sequence honest), so :meth:`~trading_bot.application.events.EventBus.log`
+  stays free; the first client adds :class:`~trading_bot.application.events.
+  LogEvent`. Logs emitted while nobody watched are not reported as a gap.
+* **Per-client cursors, not per-client queues.** A client is just the last
+  sequence number it was sent (an :class:`SseCursor`). :meth:`SseHub.next_chunk`
+  waits for the head to move past the cursor, then returns every newer frame
+  joined into one write and advances the cursor. Clients share the bytes; a
+  slow client only costs a cursor.
+* **Gaps are reported, not hidden.** A cursor that fell behind the ring's oldest
+  frame gets a ``{"type": "gap", "missed": N}`` frame first, so the dashboard
+  knows to re-fetch its snapshot instead of trusting a partial stream.
+* **Last-Event-ID resume.** Frames carry ``id:`` lines, so a reconnecting
+  ``EventSource`` sends ``Last-Event-ID`` and resumes from the ring (or gets a
+  gap frame when the ring has moved on).
+* **Log coalescing.** Order and fill frames are state changes and are always
+  sent. Log frames are not: when one chunk for a client holds more than
+  ``max_logs`` of them, only the newest ``max_logs`` are sent and the rest
+  collapse into a single ``"N log events coalesced"`` log frame. The coalescing
+  is per client — a fast client sees every log line.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import itertools
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from trading_bot.application.events import FillEvent, LogEvent, OrderEvent
+
+if TYPE_CHECKING:
+    from trading_bot.application.events import Event, EventBus
+
+__all__ = ["SseCursor", "SseHub"]
+
+
+@dataclass(frozen=True, slots=True)
+class _Frame:
+    """One encoded event in the ring."""
+
+    seq: int
+    data: bytes
+    is_log: bool
+
+
+@dataclass(slots=True)
+class SseCursor:
+    """A client's position in the hub: the sequence number it was last sent.
+
+    Parameters
+    ----------
+    seq : int
+        The last sequence number delivered (``0`` = nothing yet).
+
+    """
+
+    seq: int
+
+
+class SseHub:
+    """Serialise bus events once into a shared ring; serve them per cursor.
+
+    Parameters
+    ----------
+    event_bus : EventBus
+        The bus to subscribe to: orders and fills always, logs while a client
+        is attached.
+    encode : Callable[[Event], str]
+        Renders an event as its JSON ``data`` payload (money as strings).
+    capacity : int, optional
+        Frames the ring keeps for slow or resuming clients. Defaults to
+        ``1024``.
+    max_logs : int, optional
+        Log frames sent per chunk before the rest are coalesced. Defaults to
+        ``20``.
+
+    Attributes
+    ----------
+    clients : int
+        How many clients are attached (read-only property).
+
+    Raises
+    ------
+    ValueError
+        If ``capacity`` or ``max_logs`` is below ``1``.
+
+    """
+
+    def __init__(
+        self,
+        event_bus: EventBus,
+        encode: Callable[[Event], str],
+        *,
+        capacity: int = 1024,
+        max_logs: int = 20,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        if max_logs < 1:
+            raise ValueError(f"max_logs must be at least 1, got {max_logs}")
+        self._encode = encode
+        self._max_logs = max_logs
+        self._ring: collections.deque[_Frame] = collections.deque(maxlen=capacity)
+        self._head = 0
+        self._waiters: set[asyncio.Future[None]] = set()
+        self._bus = event_bus
+        self._clients = 0
+        self._bus.subscribe(self.publish, types=(OrderEvent, FillEvent), name="SseHub")
+
+    @property
+    def clients(self) -> int:
+        """How many clients are attached."""
+        return self._clients
+
+    def attach(self) -> None:
+        """Count a connecting client; the first one also subscribes to logs."""
+        self._clients += 1
+        if self._clients == 1:
+            self._bus.unsubscribe(self.publish)
+            self._bus.subscribe(self.publish, name="SseHub")
+
+    def detach(self) -> None:
+        """Count a client leaving; the last one drops the log subscription."""
+        self._clients -= 1
+        if self._clients == 0:
+            self._bus.unsubscribe(self.publish)
+            self._bus.subscribe(
+                self.publish, types=(OrderEvent, FillEvent), name="SseHub"
+            )
+
+    @property
+    def head(self) -> int:
+        """The sequence number of the newest frame (``0`` before any event)."""
+        return self._head
+
+    def publish(self, event: Event) -> None:
+        """Bus handler: encode ``event`` once, append it, wake waiting clients.
+
+        With no client connected only orders and fills arrive here (cheap to
+        encode); they still go into the ring, so a client reconnecting with its
+        ``Last-Event-ID`` resumes from them.
+        """
+        self._head += 1
+        payload = self._encode(event)
+        self._ring.append(
+            _Frame(
+                self._head,
+                f"id: {self._head}\ndata: {payload}\n\n".encode(),
+                isinstance(event, LogEvent),
+            )
+        )
+        waiters, self._waiters = self._waiters, set()
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def cursor(self, last_event_id: str | None = None) -> SseCursor:
+        """A new client's cursor: at the head, or resuming after ``last_event_id``.
+
+        An unparsable id, or one ahead of the head (the hub restarted), starts
+        at the head.
+        """
+        try:
+            seq = int(last_event_id) if last_event_id is not None else self._head
+        except ValueError:
+            seq = self._head
+        return SseCursor(seq if 0 <= seq <= self._head else self._head)
+
+    async def next_chunk(self, cursor: SseCursor, *, timeout: float) -> bytes | None:
+        """Wait up to ``timeout`` seconds for frames past ``cursor``.
+
+        Returns
+        -------
+        bytes or None
+            Every newer frame (gap notice first, logs coalesced), joined into one
+            write, with ``cursor`` advanced to the head. ``None`` on timeout.
+
+        """
+        if cursor.seq >= self._head:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.add(waiter)
+            try:
+                await asyncio.wait_for(waiter, timeout)
+            except asyncio.TimeoutError:
+                return None
+            finally:
+                self._waiters.discard(waiter)
+        return self._collect(cursor)
+
+    def _collect(self, cursor: SseCursor) -> bytes:
+        """Render the frames after ``cursor`` and advance it to the head."""
+        chunks: list[bytes] = []
+        oldest = self._ring[0].seq if self._ring else self._head + 1
+        if cursor.seq + 1 < oldest:
+            missed = oldest - cursor.seq - 1
+            chunks.append(f'data: {{"type": "gap", "missed": {missed}}}\n\n'.encode())
+            cursor.seq = oldest - 1
+        frames = list(itertools.islice(self._ring, cursor.seq + 1 - oldest, None))
+        logs = [frame for frame in frames if frame.is_log]
+        skip = len(logs) - self._max_logs
+        last_skipped = logs[skip - 1].seq if skip > 0 else 0
+        for frame in frames:
+            if frame.is_log and frame.seq < last_skipped:
+                continue
+            if frame.seq == last_skipped:
+                message = json.dumps(
+                    {
+                        "type": "log",
+                        "message": f"{skip} log events coalesced",
+                        "level": "info",
+                    }
+                )
+                chunks.append(f"id: {frame.seq}\ndata: {message}\n\n".encode())
+                continue
+            chunks.append(frame.data)
+        cursor.seq = self._head
+        return b"".join(chunks)
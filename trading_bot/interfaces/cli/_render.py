@@ -22,8 +22,9 @@ produce :mod:`rich` renderables. They perform no I/O and hold no business logic.
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from decimal import Decimal
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from rich.table import Table
 
@@ -32,6 +33,7 @@ if TYPE_CHECKING:
     from trading_bot.domain.instrument import Instrument
     from trading_bot.domain.order import Order
     from trading_bot.domain.position import Position
+    from trading_bot.storage import FillTotals
 
 __all__ = [
     "fmt_money",
@@ -39,6 +41,8 @@ __all__ = [
     "positions_table",
     "open_orders_table",
     "kpi_table",
+    "fill_totals_table",
+    "strategies_table",
 ]
 
 
@@ -220,3 +224,108 @@ def kpi_table(perf: PerformanceService, *, title: str = "Performance (KPI)") ->
     table.add_row("Max drawdown", fmt_ratio(perf.max_drawdown()))
     table.add_row("Calmar", fmt_ratio(perf.calmar()))
     return table
+
+
+def fill_totals_table(
+    totals: Sequence[FillTotals], *, title: str = "Traded (history)"
+) -> Table:
+    """Build a :class:`rich.table.Table` of per-instrument fill totals.
+
+    One row per :class:`~trading_bot.storage.FillTotals` (``SqliteStore.
+    fill_totals``): fill count, net quantity, traded notional and fees, every
+    money column via :func:`fmt_money` (exact, no float).
+
+    Parameters
+    ----------
+    totals : Sequence[FillTotals]
+        The totals to render, in order.
+    title : str, optional
+        The table title. Default ``"Traded (history)"``.
+
+    Returns
+    -------
+    rich.table.Table
+        The rendered table.
+
+    """
+    table = Table(title=title)
+    table.add_column("Instrument")
+    table.add_column("Fills", justify="right")
+    table.add_column("Net qty", justify="right")
+    table.add_column("Volume", justify="right")
+    table.add_column("Fees", justify="right")
+    for row in totals:
+        table.add_row(
+            str(row.instrument),
+            str(row.fills),
+            fmt_money(row.net_qty),
+            fmt_money(row.volume),
+            fmt_money(row.fees),
+        )
+    return table
+
+
+def _fmt_seconds(value: float | None) -> str:
+    """A latency/CPU figure in ms (``"-"`` when unknown)."""
+    return "-" if value is None else f"{value * 1000:.1f}ms"
+
+
+def _fmt_bytes(value: int) -> str:
+    """A byte count in binary units (``B`` / ``KiB`` / ``MiB`` / ``GiB``)."""
+    size = float(value)
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GiB"
+
+
+def strategies_table(
+    rows: Sequence[Mapping[str, Any]], *, title: str = "Strategies"
+) -> Table:
+    """Build a :class:`rich.table.Table` of supervised units and their usage.
+
+    One row per unit, from the ``/api/strategies`` JSON shape (a status dict with
+    a nested ``usage``): name, mode, running, steps, CPU, current / peak memory
+    estimate, tracked orders and the p50 / p99 step latency.
+
+    Parameters
+    ----------
+    rows : sequence of mapping
+        The unit status dicts, as served by the control API.
+    title : str, optional
+        The table title. Default ``"Strategies"``.
+
+    Returns
+    -------
+    rich.table.Table
+        The rendered table.
+
+    """
+    table = Table(title=title)
+    table.add_column("Name")
+    table.add_column("Mode")
+    table.add_column("Running")
+    table.add_column("Steps", justify="right")
+    table.add_column("CPU", justify="right")
+    table.add_column("Memory", justify="right")
+    table.add_column("Peak", justify="right")
+    table.add_column("Tracked", justify="right")
+    table.add_column("p50", justify="right")
+    table.add_column("p99", justify="right")
+
+    for row in rows:
+        usage = row.get("usage") or {}
+        table.add_row(
+            str(row["name"]),
+            str(row["mode"]),
+            "yes" if row["running"] else "no",
+            str(usage.get("steps", 0)),
+            f"{usage.get('cpu_seconds', 0.0):.3f}s",
+            _fmt_bytes(usage.get("memory_bytes", 0)),
+            _fmt_bytes(usage.get("peak_memory_bytes", 0)),
+            str(usage.get("tracked_orders", 0)),
+            _fmt_seconds(usage.get("latency_p50")),
+            _fmt_seconds(usage.get("latency_p99")),
+        )
+    return table
@@ -9,6 +9,7 @@ This module defines :data:`app`, the :class:`typer.Typer` instance the
   (paper-by-default; ``--live`` is an explicit, guarded opt-in);
 * :func:`status` — show current positions + open orders;
 * :func:`kpi` — show the realised-PnL / fees / KPI table.
+* :func:`export` — copy a stored history to partitioned Parquet.
 
 The CLI holds **no business logic**: commands delegate to the use-cases the
 :func:`~trading_bot.application.service_factory.build_engine` factory wires, and
@@ -62,7 +63,13 @@ from trading_bot import __version__
 from trading_bot.application.config import AppConfig, StrategyConfig
 from trading_bot.application.data_feed import BARS_SCHEMA, InMemoryFeed
 from trading_bot.application.performance_service import PerformanceService
-from trading_bot.application.run_app import run_app
+from trading_bot.application.run_app import (
+    RunReport,
+    close_system,
+    prepare_system,
+    run_app,
+    run_system,
+)
 from trading_bot.application.service_factory import Engine, build_engine
 from trading_bot.application.strategy import (
     Strategy,
@@ -78,6 +85,9 @@ from trading_bot.interfaces.cli import _render
 if TYPE_CHECKING:
     from fastapi import FastAPI
 
+    from trading_bot.application.events import EventBus
+    from trading_bot.storage import JournalStore, SqliteStore
+
 app = typer.Typer(
     name="trading-bot",
     help="Execution & orchestration engine of the trading triptych.",
@@ -382,7 +392,7 @@ def _run_declared_system(config: AppConfig) -> None:
     a clean non-zero exit — no order placed.
     """
     try:
-        report = asyncio.run(run_app(config))
+        report = asyncio.run(_run_app_streaming(config))
     except Exception as exc:  # noqa: BLE001 - surface any build/config failure
         _console.print(f"[red]refusing to run:[/red] {exc}")
         raise typer.Exit(code=1) from exc
@@ -412,6 +422,34 @@ def _run_declared_system(config: AppConfig) -> None:
     _console.print(_render.positions_table(positions))
 
 
+def _event_stream(
+    config: AppConfig, bus: EventBus
+) -> contextlib.AbstractAsyncContextManager[object]:
+    """The configured out-of-process event stream, or a no-op context.
+
+    With ``config.events.socket_path`` set, an
+    :class:`~trading_bot.interfaces.stream.server.EventStreamServer` publishes the
+    engine bus on that Unix socket for the duration of the run.
+    """
+    if config.events.socket_path is None:
+        return contextlib.nullcontext()
+    from trading_bot.interfaces.stream import EventStreamServer
+
+    return EventStreamServer(bus, config.events.socket_path)
+
+
+async def _run_app_streaming(config: AppConfig) -> RunReport:
+    """:func:`~trading_bot.application.run_app.run_app`, inside the event stream."""
+    if config.events.socket_path is None:
+        return await run_app(config)
+    system = await prepare_system(config)
+    try:
+        async with _event_stream(config, system.engine.bus):
+            return await run_system(system)
+    finally:
+        close_system(system)
+
+
 def _run_and_serve(config: AppConfig, *, host: str, port: int) -> None:
     """Run the declared system **and** serve the live dashboard over one engine.
 
@@ -428,15 +466,18 @@ def _run_and_serve(config: AppConfig, *, host: str, port: int) -> None:
     """
     import uvicorn
 
-    from trading_bot.application.run_app import prepare_system
     from trading_bot.interfaces.api import create_app
 
     async def _serve() -> None:
         system = await prepare_system(config)
-        api = create_app(system.engine)
+        api = create_app(system.engine, watchdog=system.watchdog)
         server = uvicorn.Server(
             uvicorn.Config(api, host=host, port=port, log_level="warning")
         )
+        if system.watchdog is not None:
+            system.watchdog.start()  # stalls land on the engine bus → the dashboard
+        observers = contextlib.AsyncExitStack()
+        await observers.enter_async_context(_event_stream(config, system.engine.bus))
         orch_task = asyncio.create_task(system.orchestrator.run())
         _console.print(
             f"[green]live dashboard[/green] (mode={config.mode}) on "
@@ -445,6 +486,8 @@ def _run_and_serve(config: AppConfig, *, host: str, port: int) -> None:
         try:
             await server.serve()  # blocks until SIGINT (uvicorn owns the signal)
         finally:
+            if system.watchdog is not None:
+                await system.watchdog.stop()
             system.orchestrator.stop_event.set()
             if not orch_task.done():
                 with contextlib.suppress(Exception):
@@ -453,6 +496,12 @@ def _run_and_serve(config: AppConfig, *, host: str, port: int) -> None:
                 orch_task.cancel()
             with contextlib.suppress(asyncio.CancelledError, Exception):
                 await orch_task
+            await system.engine.bus.drain()
+            if system.engine.snapshots is not None:
+                await system.engine.snapshots.drain()
+                system.engine.snapshots.save()
+            await observers.aclose()
+            close_system(system)  # reader threads, then the store (and its queue)
 
     try:
         asyncio.run(_serve())
@@ -512,15 +561,46 @@ def _resolve_mode(
 # --- status ---------------------------------------------------------------- #
 
 
+def _open_store(
+    db_path: pathlib.Path, config_path: pathlib.Path | None = None
+) -> SqliteStore | JournalStore:
+    """Open the store at ``db_path`` on the backend that wrote it.
+
+    The ``storage.backend`` of the ``--config``, when one is given; otherwise a
+    directory is a :class:`~trading_bot.storage.JournalStore` and a file a
+    :class:`~trading_bot.storage.SqliteStore`.
+    """
+    from trading_bot.storage import JournalStore, SqliteStore
+
+    if config_path is not None:
+        backend = AppConfig.from_yaml(config_path).storage.backend
+    else:
+        backend = "journal" if db_path.is_dir() else "sqlite"
+    if backend == "journal":
+        return JournalStore(db_path)
+    return SqliteStore(db_path)
+
+
+#: ``--config`` of the commands that read a stored history.
+_STORE_CONFIG_HELP = (
+    "YAML AppConfig path. Its storage.backend says how to open --db; without "
+    "it, a directory is a journal store and a file a SQLite database."
+)
+
+
 @app.command()
 def status(
     db_path: pathlib.Path = typer.Option(
         ...,
         "--db",
-        help="SqliteStore database path to read positions/orders from.",
+        help="Store path (SQLite file or journal directory) to read "
+        "positions/orders from.",
+    ),
+    config_path: pathlib.Path | None = typer.Option(
+        None, "--config", "-c", help=_STORE_CONFIG_HELP
     ),
 ) -> None:
-    """Show positions + open orders read from a persisted :class:`SqliteStore`.
+    """Show positions + open orders read from a persisted store.
 
     The status command reads the **stored** order/fill history (written by a run
     with a store attached) rather than spinning a fresh engine: it rebuilds each
@@ -531,22 +611,21 @@ def status(
     """
     from trading_bot.application.position_tracker import PositionTracker
     from trading_bot.domain.order import OrderStatus
-    from trading_bot.storage.sqlite_store import SqliteStore
 
     if not db_path.exists():
         raise typer.BadParameter(f"database not found: {db_path}")
 
-    store = SqliteStore(db_path)
     tracker = PositionTracker()
-    for fill in store.fills():
-        tracker.apply(fill)
+    with _open_store(db_path, config_path) as store:
+        for fill in store.fills():
+            tracker.apply(fill)
 
-    open_orders = [
-        order
-        for order in store.orders()
-        if order.status
-        not in (OrderStatus.FILLED, OrderStatus.CANCELLED, OrderStatus.REJECTED)
-    ]
+        open_orders = [
+            order
+            for order in store.orders()
+            if order.status
+            not in (OrderStatus.FILLED, OrderStatus.CANCELLED, OrderStatus.REJECTED)
+        ]
 
     _console.print(_render.positions_table(tracker.all_positions()))
     _console.print(_render.open_orders_table(open_orders))
@@ -563,10 +642,18 @@ _KPI_DEFAULT_CAPITAL = 100_000.0
 
 @app.command()
 def kpi(
-    db_path: pathlib.Path = typer.Option(
-        ...,
+    db_path: pathlib.Path | None = typer.Option(
+        None,
         "--db",
-        help="SqliteStore database path to compute KPIs from.",
+        help="Store path (SQLite file or journal directory) to compute KPIs "
+        "from.",
+    ),
+    parquet: pathlib.Path | None = typer.Option(
+        None,
+        "--parquet",
+        help="Parquet export directory (see `export`) to compute KPIs from, "
+        "instead of --db. The fills are read as columns, which keeps millions "
+        "of fills fast.",
     ),
     capital: float | None = typer.Option(
         None,
@@ -580,14 +667,22 @@ def kpi(
         "--config",
         "-c",
         help="YAML AppConfig path. When given, its starting_capital anchors the "
-        "equity curve unless --capital overrides it.",
+        "equity curve unless --capital overrides it, and its storage.backend "
+        "says how to open --db.",
+    ),
+    fast: bool = typer.Option(
+        False,
+        "--fast",
+        help="Only show per-instrument totals (fills, net qty, volume, fees) "
+        "summed inside SQLite; no fill is read back, so it stays quick over "
+        "millions of fills. Skips the PnL / ratio table.",
     ),
 ) -> None:
     """Show realised PnL / fees / equity / KPI ratios from a stored fill history.
 
     Rebuilds a :class:`~trading_bot.application.performance_service.
-    PerformanceService` from the fills persisted in a :class:`SqliteStore` (the
-    fills are the PnL source of truth) and renders the KPI table — realised PnL,
+    PerformanceService` from the fills persisted in a store (the fills are the
+    PnL source of truth) and renders the KPI table — realised PnL,
     fees and the equity endpoint as exact :class:`~decimal.Decimal`, the Sharpe /
     Sortino / max-drawdown / Calmar ratios as floats.
 
@@ -596,6 +691,15 @@ def kpi(
     value (the ratio math needs the curve not to cross zero). The realised PnL /
     fees themselves are independent of the anchor.
 
+    With ``--fast`` only the per-instrument totals are shown, aggregated by the
+    store itself (:meth:`SqliteStore.fill_totals`); realised PnL and the ratios
+    need every fill folded in order, so they are left out.
+
+    With ``--parquet`` the history is read from a columnar export instead of
+    the database (:func:`~trading_bot.storage.columnar.scan_fills`), and folded
+    column-wise by :meth:`PerformanceService.from_frame`; the figures are the
+    same as over the database the export came from.
+
     Capital precedence
     ------------------
     The starting capital is resolved as **explicit ``--capital`` > config
@@ -603,17 +707,39 @@ def kpi(
     (``100000``)**. So ``--capital`` always wins; absent it, a loaded config's
     ``starting_capital`` is used; absent both, the built-in default applies.
     """
-    from trading_bot.storage.sqlite_store import SqliteStore
+    from trading_bot.storage.columnar import fill_totals, scan_fills
 
-    if not db_path.exists():
+    if (db_path is None) == (parquet is None):
+        raise typer.BadParameter("pass exactly one of --db and --parquet")
+    if db_path is not None and not db_path.exists():
         raise typer.BadParameter(f"database not found: {db_path}")
+    if parquet is not None and not parquet.is_dir():
+        raise typer.BadParameter(f"export directory not found: {parquet}")
+
+    if fast:
+        if parquet is not None:
+            totals = fill_totals(parquet)
+        else:
+            with _open_store(db_path, config_path) as store:  # type: ignore[arg-type]
+                totals = store.fill_totals()
+        _console.print(_render.fill_totals_table(totals))
+        return
 
     resolved_capital = _resolve_kpi_capital(capital, config_path)
 
-    store = SqliteStore(db_path)
-    perf = PerformanceService(v0=resolved_capital)
-    for fill in store.fills():
-        perf.apply(fill)
+    if parquet is not None:
+        frame = (
+            scan_fills(parquet)
+            .select("seq", "fill_id", "instrument", "side", "qty", "price", "fee")
+            .sort("seq")
+            .collect()
+        )
+        perf = PerformanceService.from_frame(frame, v0=resolved_capital)
+    else:
+        perf = PerformanceService(v0=resolved_capital)
+        with _open_store(db_path, config_path) as store:  # type: ignore[arg-type]
+            for fill in store.iter_fills():
+                perf.apply(fill)
 
     _console.print(_render.kpi_table(perf))
 
@@ -637,6 +763,80 @@ def _resolve_kpi_capital(
     return money(str(Decimal(str(_KPI_DEFAULT_CAPITAL))))
 
 
+# --- export ---------------------------------------------------------------- #
+
+
+@app.command()
+def export(
+    db_path: pathlib.Path = typer.Option(
+        ...,
+        "--db",
+        help="Store path (SQLite file or journal directory) to export.",
+    ),
+    out: pathlib.Path = typer.Option(
+        ...,
+        "--out",
+        "-o",
+        help="Parquet dataset directory (created if missing).",
+    ),
+    batch: int = typer.Option(
+        100_000, "--batch", min=1, help="Fills per Parquet part."
+    ),
+    config_path: pathlib.Path | None = typer.Option(
+        None, "--config", "-c", help=_STORE_CONFIG_HELP
+    ),
+) -> None:
+    """Export a stored history to partitioned Parquet, incrementally.
+
+    Writes the orders, fills and a snapshot of the key/value state of a store
+    under ``--out``, partitioned by UTC day and
+    instrument (:func:`~trading_bot.storage.columnar.export_parquet`). Only what
+    the store gained since the previous export into the same directory is
+    written. Read it back with polars or ``kpi --parquet``.
+    """
+    from trading_bot.storage.columnar import export_parquet
+
+    if not db_path.exists():
+        raise typer.BadParameter(f"database not found: {db_path}")
+
+    with _open_store(db_path, config_path) as store:
+        result = export_parquet(store, out, batch=batch)
+    _console.print(
+        f"exported {result.fills} fills, {result.orders} orders and "
+        f"{result.state} state keys to {out}"
+    )
+
+
+# --- vacuum ---------------------------------------------------------------- #
+
+
+@app.command()
+def vacuum(
+    db_path: pathlib.Path = typer.Option(
+        ..., "--db", help="SQLite store to convert to incremental auto-vacuum."
+    ),
+) -> None:
+    """Convert an older SQLite store so archiving hands its pages back.
+
+    Databases created before the schema set incremental auto-vacuum keep the
+    pages an archive pass frees. This runs the one full ``VACUUM``
+    (:meth:`~trading_bot.storage.SqliteStore.enable_incremental_vacuum`) that
+    converts them. It rewrites the whole file, so run it with no engine using
+    the store.
+    """
+    from trading_bot.storage import SqliteStore
+
+    if not db_path.is_file():
+        raise typer.BadParameter(f"SQLite database not found: {db_path}")
+
+    with SqliteStore(db_path) as store:
+        converted = store.enable_incremental_vacuum()
+    if converted:
+        _console.print(f"converted {db_path} to incremental auto-vacuum")
+    else:
+        _console.print(f"{db_path} already uses incremental auto-vacuum")
+
+
 # --- serve ----------------------------------------------------------------- #
 
 
@@ -725,6 +925,9 @@ async def _run_daemon(
     port: int = 8000,
     auth_token: str | None = None,
     dccd_client: object | None = None,
+    align_bars: bool = False,
+    settle: float = 2.0,
+    watch_data: bool = False,
 ) -> None:
     """Supervise the declared strategies and step them on a schedule until stopped.
 
@@ -738,6 +941,18 @@ async def _run_daemon(
     headless, the daemon installs its own ``SIGINT``/``SIGTERM`` handlers. Each step
     is idempotent over unchanged data, so a tick that finds nothing to do trades
     nothing.
+
+    With ``align_bars`` the fixed trigger is replaced by a
+    :class:`~trading_bot.application.bar_scheduler.BarCloseScheduler`: each unit is
+    stepped on its own data ``span``'s bar closes (plus ``settle`` seconds), units on
+    a shared boundary in one wake-up, and a unit without a data source on an
+    ``interval``-second span. ``watch_data`` additionally steps everything as soon
+    as a file under ``storage.data_path`` changes.
+
+    With ``config.watchdog.enabled`` a
+    :class:`~trading_bot.application.watchdog.LoopWatchdog` samples the daemon's
+    event-loop lag and prints each stall with the stack that blocked the loop; with
+    ``serve`` its lag histogram is reported at ``GET /api/metrics``.
     """
     from apscheduler.schedulers.asyncio import AsyncIOScheduler
     from apscheduler.triggers.cron import CronTrigger
@@ -748,6 +963,24 @@ async def _run_daemon(
     supervisor = StrategySupervisor(config, dccd_client=dccd_client)  # type: ignore[arg-type]
     await supervisor.start_all()
 
+    watchdog = None
+    if config.watchdog.enabled:
+        from trading_bot.application.watchdog import LoopWatchdog, StallReport
+
+        def _print_stall(report: StallReport) -> None:
+            _console.print(f"[yellow]event loop stalled {report.lag:.3f}s[/yellow]")
+            if report.stack is not None:
+                _console.print(report.stack.rstrip(), markup=False, highlight=False)
+
+        # The units each own an engine bus; the daemon's loop is shared, so its
+        # stalls go to the console (and the ``trading_bot`` logger).
+        watchdog = LoopWatchdog(
+            interval=config.watchdog.interval,
+            threshold=config.watchdog.threshold,
+            on_stall=_print_stall,
+        )
+        watchdog.start()
+
     async def _tick() -> None:
         try:
             stepped = await supervisor.step_all()
@@ -756,18 +989,47 @@ async def _run_daemon(
         except Exception as exc:  # noqa: BLE001 - never let a tick kill the daemon
             _console.print(f"[red]daemon tick error:[/red] {exc}")
 
-    trigger = (
-        CronTrigger.from_crontab(cron)
-        if cron is not None
-        else IntervalTrigger(seconds=interval)
-    )
     scheduler = AsyncIOScheduler()
-    scheduler.add_job(_tick, trigger)
-    scheduler.start()
+    bar_stop = asyncio.Event()
+    bar_task: asyncio.Future[int] | None = None
+    if align_bars:
+        from trading_bot.application.bar_scheduler import (
+            BarCloseScheduler,
+            path_data_version,
+        )
+
+        data_path = config.storage.data_path
+        bars = BarCloseScheduler(
+            supervisor,
+            default_span=max(1, math.ceil(interval)),
+            settle=settle,
+            data_version=(
+                path_data_version(data_path)
+                if watch_data and data_path is not None
+                else None
+            ),
+            on_step=lambda names: _console.print(
+                f"[dim]daemon tick: stepped {', '.join(names)}[/dim]"
+            ),
+            on_error=lambda name, exc: _console.print(
+                f"[red]daemon tick error ({name}):[/red] {exc}"
+            ),
+        )
+        bar_task = asyncio.ensure_future(bars.run(bar_stop))
+        spans = ", ".join(f"{span}s" for span in bars.groups())
+        tick = f"on bar close ({spans or 'no units'}) +{settle:g}s"
+    else:
+        trigger = (
+            CronTrigger.from_crontab(cron)
+            if cron is not None
+            else IntervalTrigger(seconds=interval)
+        )
+        scheduler.add_job(_tick, trigger)
+        scheduler.start()
+        tick = cron or f"every {interval:g}s"
     _console.print(
         f"[green]daemon started[/green] (mode={config.mode}): "
-        f"{len(supervisor.names())} strateg(ies), "
-        f"tick={cron or f'every {interval:g}s'}"
+        f"{len(supervisor.names())} strateg(ies), tick={tick}"
     )
     try:
         if serve:
@@ -782,7 +1044,9 @@ async def _run_daemon(
                     "bind 127.0.0.1 and tunnel (the control plane can trade)."
                 )
                 raise typer.Exit(code=1)
-            api = create_control_app(supervisor, auth_token=auth_token)
+            api = create_control_app(
+                supervisor, auth_token=auth_token, watchdog=watchdog
+            )
             if auth_token:
                 _console.print("[dim]control dashboard auth: token login enabled[/dim]")
             server = uvicorn.Server(
@@ -802,11 +1066,53 @@ async def _run_daemon(
             _console.print("[dim]Ctrl-C / SIGTERM to stop[/dim]")
             await stop.wait()
     finally:
-        scheduler.shutdown(wait=False)
+        if bar_task is not None:
+            bar_stop.set()
+            await asyncio.gather(bar_task, return_exceptions=True)
+        else:
+            scheduler.shutdown(wait=False)
+        if watchdog is not None:
+            await watchdog.stop()
         await supervisor.shutdown()
         _console.print("[green]daemon stopped[/green] (all strategies shut down)")
 
 
+@app.command()
+def strategies(
+    url: str = typer.Option(
+        "http://127.0.0.1:8000",
+        "--url",
+        help="Base URL of a running daemon's control dashboard (start --serve).",
+    ),
+    token: str | None = typer.Option(
+        None,
+        "--token",
+        envvar="TRADING_BOT_UI_TOKEN",
+        help="Control dashboard auth token, if it has one. Reads TRADING_BOT_UI_TOKEN.",
+    ),
+) -> None:
+    """Show a running daemon's units with their CPU / memory / latency accounting.
+
+    Reads ``/api/strategies`` from the control dashboard of a daemon started with
+    ``start --serve`` and renders one row per unit: mode, running, steps, CPU time
+    spent in its steps, the current / peak attributable memory estimate, the size
+    of its router's tracked-order map and its p50 / p99 step latency — the view to
+    check before adding more units to one box.
+    """
+    import httpx
+
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    try:
+        response = httpx.get(
+            f"{url.rstrip('/')}/api/strategies", headers=headers, timeout=10.0
+        )
+        response.raise_for_status()
+    except httpx.HTTPError as exc:
+        _console.print(f"[red]cannot read strategies from {url}:[/red] {exc}")
+        raise typer.Exit(code=1) from exc
+    _console.print(_render.strategies_table(response.json()))
+
+
 @app.command()
 def start(
     config_path: pathlib.Path | None = typer.Option(
@@ -822,6 +1128,23 @@ def start(
         "--cron",
         help="Crontab expression for re-evaluation (e.g. '5 0 * * *' = 00:05 daily).",
     ),
+    align_bars: bool = typer.Option(
+        False,
+        "--align-bars",
+        help="Step each strategy on its data span's bar closes instead of a fixed "
+        "--interval (units without data keep it). Not with --cron.",
+    ),
+    settle: float = typer.Option(
+        2.0,
+        "--settle",
+        help="With --align-bars: seconds to wait past each bar close before stepping.",
+    ),
+    watch_data: bool = typer.Option(
+        False,
+        "--watch-data",
+        help="With --align-bars: also step as soon as a file under storage.data_path "
+        "changes.",
+    ),
     serve: bool = typer.Option(
         False,
         "--serve",
@@ -846,12 +1169,18 @@ def start(
 
     The long-running process (systemd's ``ExecStart``): it builds a per-strategy
     supervisor, starts every declared strategy (in its configured mode — **paper by
-    default**), and re-evaluates them on an interval or cron until stopped. Each
+    default**), and re-evaluates them on an interval or cron — or, with
+    ``--align-bars``, on each strategy's own bar closes — until stopped. Each
     strategy runs in its **own** engine, so they can be switched between paper /
     testnet / live independently from the **control dashboard** (``--serve``). Going
     live still requires the explicit gates — the daemon never trades real money by
     merely starting, and the dashboard requires a typed confirmation to go live.
     """
+    if align_bars and cron is not None:
+        raise typer.BadParameter(
+            "--cron and --align-bars are exclusive: bar closes replace the cron "
+            "schedule"
+        )
     config = (
         AppConfig.from_yaml(config_path)
         if config_path is not None
@@ -867,6 +1196,9 @@ def start(
                 host=serve_host,
                 port=serve_port,
                 auth_token=serve_token,
+                align_bars=align_bars,
+                settle=settle,
+                watch_data=watch_data,
             )
         )
     except Exception as exc:  # noqa: BLE001 - surface any build/config failure cleanly
@@ -0,0 +1,28 @@
+"""trading_bot event stream — the engine bus, out of process, over a Unix socket.
+
+:class:`~trading_bot.interfaces.stream.server.EventStreamServer` publishes every
+bus event as a framed binary record (:mod:`~trading_bot.interfaces.stream.codec`,
+money as exact Decimal strings) to the clients of a Unix domain socket, and
+:func:`~trading_bot.interfaces.stream.client.subscribe` reads them back as the
+engine's own event types in another process. Observers (a risk monitor, a
+notebook, a second dashboard, a multi-worker aggregator) then run beside the
+engine instead of inside it. Like the API, the stream is read-only.
+"""
+
+from __future__ import annotations
+
+from trading_bot.interfaces.stream.client import subscribe
+from trading_bot.interfaces.stream.codec import (
+    StreamDecodeError,
+    decode_event,
+    encode_event,
+)
+from trading_bot.interfaces.stream.server import EventStreamServer
+
+__all__ = [
+    "EventStreamServer",
+    "StreamDecodeError",
+    "decode_event",
+    "encode_event",
+    "subscribe",
+]
@@ -0,0 +1,85 @@
+"""The event-stream client — subscribe to an engine's bus from another process.
+
+A tiny reader for :class:`~trading_bot.interfaces.stream.server.EventStreamServer`:
+connect to the Unix socket, check :data:`~trading_bot.interfaces.stream.codec.
+MAGIC`, then yield each frame decoded back into the engine's own event types,
+money as exact :class:`~decimal.Decimal`.
+
+Examples
+--------
+>>> async def watch(path):  # doctest: +SKIP
+...     async for event in subscribe(path, types=(FillEvent,)):
+...         print(event.fill.price)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import AsyncIterator
+
+from trading_bot.application.events import Event
+from trading_bot.interfaces.stream.codec import (
+    HEADER,
+    MAGIC,
+    StreamDecodeError,
+    decode_event,
+)
+
+__all__ = ["subscribe"]
+
+
+async def subscribe(
+    path: str | os.PathLike[str],
+    *,
+    types: tuple[type, ...] | None = None,
+) -> AsyncIterator[Event]:
+    """Yield the events published on the socket at ``path`` until it closes.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        The server's socket path.
+    types : tuple of type or None, optional
+        Only yield events of these classes. ``None`` (default) yields all.
+
+    Yields
+    ------
+    Event
+        Each published :class:`~trading_bot.application.events.OrderEvent`,
+        :class:`~trading_bot.application.events.FillEvent` or
+        :class:`~trading_bot.application.events.LogEvent`, in publish order.
+
+    Raises
+    ------
+    StreamDecodeError
+        If the peer is not an event stream, or a frame is malformed or cut off.
+    OSError
+        If the socket cannot be connected.
+
+    """
+    reader, writer = await asyncio.open_unix_connection(os.fspath(path))
+    try:
+        try:
+            magic = await reader.readexactly(len(MAGIC))
+        except asyncio.IncompleteReadError as exc:
+            raise StreamDecodeError("connection closed before the handshake") from exc
+        if magic != MAGIC:
+            raise StreamDecodeError(f"not an event stream (signature {magic!r})")
+        while True:
+            try:
+                header = await reader.readexactly(HEADER.size)
+            except asyncio.IncompleteReadError as exc:
+                if exc.partial:
+                    raise StreamDecodeError("truncated frame header") from exc
+                return  # clean end of stream
+            kind, length = HEADER.unpack(header)
+            try:
+                payload = await reader.readexactly(length)
+            except asyncio.IncompleteReadError as exc:
+                raise StreamDecodeError("truncated frame payload") from exc
+            event = decode_event(kind, payload)
+            if types is None or isinstance(event, types):
+                yield event
+    finally:
+        writer.close()
@@ -0,0 +1,192 @@
+"""The event-stream wire format — framed binary records with exact-Decimal bodies.
+
+Format (carried into the ADR)
+-----------------------------
+A connection starts with :data:`MAGIC`, then a flat sequence of frames, each a
+5-byte header — kind (``u8``) and payload length (big-endian ``u32``) — and the
+payload, the same framing as the record/replay journal
+(:mod:`trading_bot.application.journal`). The payload is compact UTF-8 JSON of
+the event's domain object. Money fields travel as Decimal **strings** and are
+parsed back with :func:`~trading_bot.domain.money.money`, so a consumer in
+another process sees exactly the ``Decimal`` the engine holds, with no float in
+between.
+
+=====  ============  =============================================================
+kind   event         payload
+=====  ============  =============================================================
+``1``  OrderEvent    the order's identity, terms and lifecycle state
+``2``  FillEvent     the fill, field for field
+``3``  LogEvent      ``{"message", "level", "category"}`` (rendered text)
+=====  ============  =============================================================
+
+Instruments travel as ``BASE/QUOTE``; their precision metadata belongs to the
+venue catalogue and is not sent (as in the SQLite store).
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from typing import Any
+
+from trading_bot.application.events import Event, FillEvent, LogEvent, OrderEvent
+from trading_bot.domain.errors import TradingBotError
+from trading_bot.domain.fill import Fill
+from trading_bot.domain.instrument import Instrument, Symbol
+from trading_bot.domain.money import Money, money
+from trading_bot.domain.order import Order, OrderSide, OrderStatus, OrderType
+
+__all__ = [
+    "MAGIC",
+    "HEADER",
+    "KIND_ORDER",
+    "KIND_FILL",
+    "KIND_LOG",
+    "StreamDecodeError",
+    "encode_event",
+    "decode_event",
+]
+
+#: Sent once when a connection opens; identifies the stream and its version.
+MAGIC = b"TBE\x01"
+#: The per-frame header: kind (``u8``) and payload length (big-endian ``u32``).
+HEADER = struct.Struct(">BI")
+
+KIND_ORDER = 1
+KIND_FILL = 2
+KIND_LOG = 3
+
+
+class StreamDecodeError(TradingBotError):
+    """A stream frame is malformed, truncated or of an unknown kind."""
+
+
+def _money_str(value: Money | None) -> str | None:
+    return None if value is None else str(value)
+
+
+def _money_or_none(value: str | None) -> Money | None:
+    return None if value is None else money(value)
+
+
+def _instrument(text: str) -> Instrument:
+    base, quote = text.split("/", 1)
+    return Instrument(Symbol(base, quote))
+
+
+def _order_body(order: Order) -> dict[str, Any]:
+    return {
+        "client_order_id": order.client_order_id,
+        "instrument": str(order.instrument),
+        "side": order.side.value,
+        "qty": str(order.qty),
+        "type": order.type.value,
+        "limit_price": _money_str(order.limit_price),
+        "stop_price": _money_str(order.stop_price),
+        "status": order.status.value,
+        "filled_qty": str(order.filled_qty),
+        "avg_fill_price": _money_str(order.avg_fill_price),
+        "venue_order_id": order.venue_order_id,
+        "reject_reason": order.reject_reason,
+    }
+
+
+def _order_from(body: dict[str, Any]) -> Order:
+    # Rebuilt like the store does: immutable terms through the constructor, the
+    # lifecycle state set directly (the sender's state is the truth).
+    order = Order(
+        client_order_id=body["client_order_id"],
+        instrument=_instrument(body["instrument"]),
+        side=OrderSide(body["side"]),
+        qty=money(body["qty"]),
+        type=OrderType(body["type"]),
+        limit_price=_money_or_none(body["limit_price"]),
+        stop_price=_money_or_none(body["stop_price"]),
+    )
+    order.status = OrderStatus(body["status"])
+    order.filled_qty = money(body["filled_qty"])
+    order.avg_fill_price = _money_or_none(body["avg_fill_price"])
+    order.venue_order_id = body["venue_order_id"]
+    order.reject_reason = body["reject_reason"]
+    return order
+
+
+def _fill_body(fill: Fill) -> dict[str, Any]:
+    return {
+        "fill_id": fill.fill_id,
+        "client_order_id": fill.client_order_id,
+        "instrument": str(fill.instrument),
+        "side": fill.side.value,
+        "qty": str(fill.qty),
+        "price": str(fill.price),
+        "fee": str(fill.fee),
+        "ts": fill.ts,
+    }
+
+
+def _fill_from(body: dict[str, Any]) -> Fill:
+    return Fill(
+        fill_id=body["fill_id"],
+        client_order_id=body["client_order_id"],
+        instrument=_instrument(body["instrument"]),
+        side=OrderSide(body["side"]),
+        qty=money(body["qty"]),
+        price=money(body["price"]),
+        fee=money(body["fee"]),
+        ts=int(body["ts"]),
+    )
+
+
+def encode_event(event: Event) -> bytes:
+    """Encode ``event`` as one complete frame (header + payload).
+
+    Raises
+    ------
+    TypeError
+        If ``event`` is not one of the bus's event types.
+
+    """
+    if isinstance(event, OrderEvent):
+        kind, body = KIND_ORDER, _order_body(event.order)
+    elif isinstance(event, FillEvent):
+        kind, body = KIND_FILL, _fill_body(event.fill)
+    elif isinstance(event, LogEvent):
+        kind, body = KIND_LOG, {
+            "message": event.message,
+            "level": event.level,
+            "category": event.category,
+        }
+    else:
+        raise TypeError(f"cannot encode {type(event).__name__}")
+    payload = json.dumps(body, separators=(",", ":")).encode()
+    return HEADER.pack(kind, len(payload)) + payload
+
+
+def decode_event(kind: int, payload: bytes) -> Event:
+    """Decode one frame's payload back into its event (exact ``Decimal`` money).
+
+    Raises
+    ------
+    StreamDecodeError
+        If the kind is unknown or the payload does not parse.
+
+    """
+    try:
+        body = json.loads(payload)
+        if kind == KIND_ORDER:
+            return OrderEvent(_order_from(body))
+        if kind == KIND_FILL:
+            return FillEvent(_fill_from(body))
+        if kind == KIND_LOG:
+            return LogEvent(
+                body["message"], body["level"], category=body["category"]
+            )
+    except (
+        ValueError,
+        KeyError,
+        TypeError,
+        ArithmeticError,
+        TradingBotError,
+    ) as exc:
+        raise StreamDecodeError(f"malformed kind-{kind} frame: {exc}") from exc
+    raise StreamDecodeError(f"unknown frame kind {kind}")
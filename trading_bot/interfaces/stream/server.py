@@ -0,0 +1,164 @@
+"""The :class:`EventStreamServer` — publish the engine bus on a Unix domain socket.
+
+Observers that run *inside* the engine (the dashboard, a risk monitor) share
+the event loop, and so the CPU, with order flow. The server moves them out:
+it subscribes once to the :class:`~trading_bot.application.events.EventBus`,
+encodes each event once (:func:`~trading_bot.interfaces.stream.codec.
+encode_event`), and writes the same bytes to every connected client.
+
+Never back-pressures the engine (carried into the ADR)
+------------------------------------------------------
+The bus handler only calls the non-blocking ``transport.write`` of each client
+connection — it never awaits a socket. A client whose unsent backlog passes
+``max_buffer`` bytes is disconnected (and logged) rather than allowed to grow
+memory without bound or slow the producer; it reconnects and resumes from live
+events. Clients only read: anything they send is ignored.
+
+One socket per process, one aggregator for many
+-----------------------------------------------
+In a multi-process deployment each worker publishes its own socket path; an
+aggregator opens one :func:`~trading_bot.interfaces.stream.client.subscribe`
+per path and merges the streams.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import os
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+from trading_bot.interfaces.stream.codec import MAGIC, encode_event
+
+if TYPE_CHECKING:
+    from trading_bot.application.events import Event, EventBus
+
+__all__ = ["EventStreamServer"]
+
+logger = logging.getLogger(__name__)
+
+
+class EventStreamServer:
+    """Serve every bus event, framed, to clients of a Unix domain socket.
+
+    Use it as an async context manager (or call :meth:`start` / :meth:`stop`)
+    from inside the running loop; events emitted while it is not running are
+    not sent.
+
+    Parameters
+    ----------
+    event_bus : EventBus
+        The bus to publish (every event type).
+    path : str or os.PathLike
+        The socket path. A stale socket file left by a crashed run is replaced.
+    max_buffer : int, optional
+        Unsent bytes a client may accumulate before it is disconnected.
+        Defaults to ``1 MiB``.
+
+    """
+
+    def __init__(
+        self,
+        event_bus: EventBus,
+        path: str | os.PathLike[str],
+        *,
+        max_buffer: int = 1 << 20,
+    ) -> None:
+        if max_buffer < 1:
+            raise ValueError(f"max_buffer must be at least 1, got {max_buffer}")
+        self._bus = event_bus
+        self._path = os.fspath(path)
+        self._max_buffer = max_buffer
+        self._server: asyncio.AbstractServer | None = None
+        self._clients: set[asyncio.StreamWriter] = set()
+        self.sent = 0
+        self.disconnected = 0
+
+    @property
+    def path(self) -> str:
+        """The socket path."""
+        return self._path
+
+    @property
+    def clients(self) -> int:
+        """How many clients are connected."""
+        return len(self._clients)
+
+    @property
+    def running(self) -> bool:
+        """Whether the socket is accepting clients."""
+        return self._server is not None
+
+    async def start(self) -> None:
+        """Bind the socket and subscribe to the bus (idempotent)."""
+        if self._server is not None:
+            return
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self._path)
+        self._server = await asyncio.start_unix_server(self._accept, path=self._path)
+        self._bus.subscribe(self._publish, name="EventStreamServer")
+
+    async def stop(self) -> None:
+        """Unsubscribe, disconnect every client and remove the socket (idempotent)."""
+        if self._server is None:
+            return
+        self._bus.unsubscribe(self._publish)
+        self._server.close()
+        for writer in list(self._clients):
+            writer.close()
+        self._clients.clear()
+        await self._server.wait_closed()
+        self._server = None
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self._path)
+
+    async def __aenter__(self) -> EventStreamServer:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.stop()
+
+    async def _accept(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Register a client, then hold the connection until it closes."""
+        writer.write(MAGIC)
+        self._clients.add(writer)
+        try:
+            while await reader.read(4096):
+                pass  # clients only read; ignore anything they send
+        except ConnectionError:
+            pass
+        finally:
+            self._clients.discard(writer)
+            writer.close()
+
+    def _publish(self, event: Event) -> None:
+        """Bus handler: encode once, write to every client, shed slow ones."""
+        if not self._clients:
+            return
+        frame = encode_event(event)
+        for writer in list(self._clients):
+            if writer.is_closing():
+                self._clients.discard(writer)
+                continue
+            if writer.transport.get_write_buffer_size() > self._max_buffer:
+                logger.warning(
+                    "event stream client on %s is %d bytes behind; disconnecting",
+                    self._path,
+                    writer.transport.get_write_buffer_size(),
+                )
+                self._clients.discard(writer)
+                self.disconnected += 1
+                writer.transport.abort()
+                continue
+            writer.write(frame)
+        self.sent += 1
@@ -146,7 +146,10 @@
       // source of truth); we only use the signal that *something* changed.
       try {
         var data = JSON.parse(ev.data);
-        if (data && (data.type === "order" || data.type === "fill")) {
+        // A "gap" means this client fell behind the server's buffer and missed
+        // events; re-fetching restores the truth either way.
+        if (data && (data.type === "order" || data.type === "fill" ||
+                     data.type === "gap")) {
           refresh();
         }
       } catch (e) {
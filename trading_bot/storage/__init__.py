@@ -3,14 +3,47 @@
 This package is the engine's **persistence** boundary: it records what the
 engine has seen and done (orders, broker-confirmed fills, a little key/value
 state) into a stdlib-:mod:`sqlite3`, WAL-mode database — the reconciliation
-source on restart. Money is persisted as ``str(Decimal)`` TEXT (never float);
-orders are UPSERTed (latest state) and fills are append-only (immutable facts).
+source on restart. Money is persisted as ``str(Decimal)`` TEXT (never float),
+with exact scaled-integer copies for SQL-side sums
+(:mod:`~trading_bot.storage.scaled`); orders are UPSERTed (latest state) and
+fills are append-only (immutable facts).
 
-See :class:`~trading_bot.storage.sqlite_store.SqliteStore`.
+See :class:`~trading_bot.storage.sqlite_store.SqliteStore`;
+:class:`~trading_bot.storage.journal_store.JournalStore` is an alternative
+backend with the same surface on a segmented append-only log, for high-rate
+order/fill streams (``storage.backend: journal``). For analysis,
+:func:`~trading_bot.storage.columnar.export_parquet` copies the history into a
+partitioned Parquet dataset, read back lazily with
+:func:`~trading_bot.storage.columnar.scan_fills` and friends. Async code reads
+either store through :class:`~trading_bot.storage.async_store.AsyncStore`,
+whose reads run on reader threads instead of the event loop.
 """
 
 from __future__ import annotations
 
-from trading_bot.storage.sqlite_store import SqliteStore
+from trading_bot.storage.async_store import AsyncStore
+from trading_bot.storage.columnar import (
+    ExportError,
+    ExportResult,
+    export_parquet,
+    scan_fills,
+    scan_orders,
+    scan_state,
+)
+from trading_bot.storage.journal_store import JournalStore, StoreCorruptError
+from trading_bot.storage.sqlite_store import FillTotals, SqliteStore, StoreWriteError
 
-__all__ = ["SqliteStore"]
+__all__ = [
+    "AsyncStore",
+    "ExportError",
+    "ExportResult",
+    "FillTotals",
+    "JournalStore",
+    "SqliteStore",
+    "StoreCorruptError",
+    "StoreWriteError",
+    "export_parquet",
+    "scan_fills",
+    "scan_orders",
+    "scan_state",
+]
@@ -0,0 +1,51 @@
+"""Helpers shared by the store backends — the stored form of instruments and status.
+
+:class:`~trading_bot.storage.sqlite_store.SqliteStore` and
+:class:`~trading_bot.storage.journal_store.JournalStore` persist the same
+primitives: an instrument as its ``BASE/QUOTE`` symbol string, an order status
+by its ``.value``, times as milliseconds since the Unix epoch (UTC). Keeping the
+conversions here means neither backend reaches into the other's private names.
+"""
+
+from __future__ import annotations
+
+import time
+
+from trading_bot.domain.instrument import Instrument, Symbol
+from trading_bot.domain.order import OrderStatus
+
+__all__ = [
+    "LIVE_STATUSES",
+    "instrument_from_text",
+    "instrument_to_text",
+    "now_ms",
+]
+
+#: Statuses an order can still leave (stored values); the rest are terminal.
+LIVE_STATUSES = tuple(
+    status.value
+    for status in OrderStatus
+    if status
+    not in (OrderStatus.FILLED, OrderStatus.CANCELLED, OrderStatus.REJECTED)
+)
+
+
+def now_ms() -> int:
+    """Wall-clock milliseconds since the Unix epoch (UTC)."""
+    return time.time_ns() // 1_000_000
+
+
+def instrument_to_text(instrument: Instrument) -> str:
+    """Render an instrument to its ``BASE/QUOTE`` symbol string for storage."""
+    return str(instrument.symbol)
+
+
+def instrument_from_text(text: str) -> Instrument:
+    """Rebuild an :class:`Instrument` from a ``BASE/QUOTE`` symbol string.
+
+    Trading metadata (``price_precision`` / ``qty_precision``) is *not*
+    persisted — it belongs to the venue's instrument catalogue, not the
+    order/fill history — so the rebuilt instrument carries only its symbol.
+    """
+    base, quote = text.split("/", 1)
+    return Instrument(Symbol(base, quote))
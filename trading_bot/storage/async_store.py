@@ -0,0 +1,259 @@
+"""The :class:`AsyncStore` — store reads for async code, off the event loop.
+
+The engine's event loop also drives order submission, so any store read made
+straight from a coroutine (a dashboard handler, the supervisor starting a unit,
+the startup restore) holds up every order behind it for as long as the query
+runs. A history query over a long fill table, or a read that first waits for a
+write-behind flush, is enough to stall a live order. :class:`AsyncStore` wraps
+a :class:`~trading_bot.storage.sqlite_store.SqliteStore` or a
+:class:`~trading_bot.storage.journal_store.JournalStore` and gives async code
+the same reads as coroutines that run on a small pool of reader threads.
+
+Design choices (carried into the ADR)
+-------------------------------------
+* **Reads go to a thread pool; writes stay where they are.** Writes come from
+  the bus (``OrderEvent`` / ``FillEvent``) and are already cheap on the loop: a
+  write-behind SQLite store only queues them and the journal store only buffers
+  them. Only the reads move, each one a single hop to the pool. Worker threads
+  start on the first read, so an engine that never reads asynchronously pays
+  nothing.
+
+* **Each worker reads on its own connection.** ``SqliteStore`` already gives
+  every reading thread its own reader connection. In WAL mode those run beside
+  the writer and never wait for a commit, so a slow dashboard query and the
+  order path do not contend on a lock. The journal store copies what it needs
+  under its lock and does the work (a bounded ``fill_totals`` fold, say)
+  outside it.
+
+* **Paged history hops once per page.** :meth:`AsyncStore.iter_fills`,
+  :meth:`AsyncStore.iter_orders` and :meth:`AsyncStore.orders_to_restore` are
+  async iterators. Each step pulls a whole ``batch`` from the store's keyset
+  iterator on a worker, not one row.
+
+* **Reads from a worker see committed state.** A worker is another thread, so
+  it does not see an open :meth:`~trading_bot.storage.SqliteStore.transaction`
+  of the loop's thread, and it flushes a write-behind queue (waiting on the
+  worker, not the loop) before it reads.
+
+:meth:`AsyncStore.run` runs any function that reads through the store, such
+as :func:`~trading_bot.application.service_factory.restore_orders`, on the
+same pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import itertools
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from trading_bot.domain.fill import Fill
+    from trading_bot.domain.instrument import Instrument
+    from trading_bot.domain.order import Order, OrderStatus
+    from trading_bot.storage.journal_store import JournalStore
+    from trading_bot.storage.sqlite_store import FillTotals, SqliteStore
+
+__all__ = ["AsyncStore"]
+
+_T = TypeVar("_T")
+
+
+def _take(rows: Iterator[_T], count: int) -> list[_T]:
+    """The next ``count`` items of ``rows`` (fewer at the end)."""
+    return list(itertools.islice(rows, count))
+
+
+class AsyncStore:
+    """Async, non-blocking reads over a store, run on reader threads.
+
+    Every method awaits the matching read of the wrapped store, which runs on a
+    worker thread. Iterators yield their rows page by page. The store itself
+    is not owned: :meth:`close` stops the workers and leaves the store open.
+
+    Parameters
+    ----------
+    store : SqliteStore or JournalStore
+        The store to read from.
+    workers : int, optional
+        Most reads running at once. Defaults to ``2``.
+
+    Raises
+    ------
+    ValueError
+        If ``workers < 1``.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from trading_bot.storage import SqliteStore
+    >>> store = SqliteStore(":memory:")
+    >>> store.set_state("mode", "paper")
+    >>> reader = AsyncStore(store)
+    >>> asyncio.run(reader.get_state("mode"))
+    'paper'
+    >>> reader.close(); store.close()
+
+    """
+
+    def __init__(
+        self, store: SqliteStore | JournalStore, *, workers: int = 2
+    ) -> None:
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        self._store = store
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="AsyncStore-reader"
+        )
+
+    @property
+    def store(self) -> SqliteStore | JournalStore:
+        """The wrapped store."""
+        return self._store
+
+    async def run(self, fn: Callable[..., _T], /, *args: Any, **kwargs: Any) -> _T:
+        """Run ``fn(*args, **kwargs)`` on a reader thread and return its result.
+
+        For code that reads through the store synchronously (a restore, a
+        report) and must not run on the event loop.
+
+        Raises
+        ------
+        RuntimeError
+            If the reader was closed.
+
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(fn, *args, **kwargs)
+        )
+
+    async def _pages(self, rows: Iterator[_T], batch: int) -> AsyncIterator[_T]:
+        """Yield ``rows``, pulling ``batch`` at a time on a reader thread."""
+        try:
+            while True:
+                page = await self.run(_take, rows, batch)
+                for row in page:
+                    yield row
+                if len(page) < batch:
+                    return
+        finally:
+            # Between pages the store's iterator holds no connection or lock,
+            # so closing it here (an early ``break``) does no IO.
+            close = getattr(rows, "close", None)
+            if close is not None:
+                close()
+
+    async def get_order(self, client_order_id: str) -> Order | None:
+        """The stored order with this id, or ``None`` (see ``get_order``)."""
+        return await self.run(self._store.get_order, client_order_id)
+
+    async def orders(self) -> list[Order]:
+        """Every stored order (see ``orders``)."""
+        return await self.run(self._store.orders)
+
+    async def fills(self, since_ms: int | None = None) -> list[Fill]:
+        """Every stored fill, optionally from ``since_ms`` on (see ``fills``)."""
+        return await self.run(self._store.fills, since_ms)
+
+    def iter_fills(
+        self,
+        *,
+        instrument: Instrument | None = None,
+        since: int | None = None,
+        until: int | None = None,
+        after: int = 0,
+        batch: int = 1000,
+    ) -> AsyncIterator[Fill]:
+        """Stored fills in insertion order, one page per hop (see ``iter_fills``).
+
+        Raises
+        ------
+        ValueError
+            If ``batch < 1``.
+
+        """
+        if batch < 1:
+            raise ValueError(f"batch must be at least 1, got {batch}")
+        rows = self._store.iter_fills(
+            instrument=instrument, since=since, until=until, after=after, batch=batch
+        )
+        return self._pages(rows, batch)
+
+    def iter_orders(
+        self,
+        *,
+        status: OrderStatus | None = None,
+        instrument: Instrument | None = None,
+        since: int | None = None,
+        until: int | None = None,
+        batch: int = 1000,
+    ) -> AsyncIterator[Order]:
+        """Stored orders in insertion order, one page per hop (see ``iter_orders``).
+
+        Raises
+        ------
+        ValueError
+            If ``batch < 1``.
+
+        """
+        if batch < 1:
+            raise ValueError(f"batch must be at least 1, got {batch}")
+        rows = self._store.iter_orders(
+            status=status, instrument=instrument, since=since, until=until, batch=batch
+        )
+        return self._pages(rows, batch)
+
+    def orders_to_restore(
+        self, *, window_ms: int, batch: int = 1000
+    ) -> AsyncIterator[Order]:
+        """Live and recently written orders (see ``orders_to_restore``).
+
+        Raises
+        ------
+        ValueError
+            If ``batch < 1``.
+
+        """
+        if batch < 1:
+            raise ValueError(f"batch must be at least 1, got {batch}")
+        rows = self._store.orders_to_restore(window_ms=window_ms, batch=batch)
+        return self._pages(rows, batch)
+
+    async def fill_totals(
+        self,
+        *,
+        instrument: Instrument | None = None,
+        since: int | None = None,
+        until: int | None = None,
+        by_day: bool = False,
+    ) -> list[FillTotals]:
+        """Exact per-instrument fill totals (see ``fill_totals``)."""
+        return await self.run(
+            self._store.fill_totals,
+            instrument=instrument,
+            since=since,
+            until=until,
+            by_day=by_day,
+        )
+
+    async def fill_watermark(self) -> tuple[int, int | None]:
+        """The newest fill's rowid and the latest fill ``ts``."""
+        return await self.run(self._store.fill_watermark)
+
+    async def fill_ids(self, *, since: int, upto: int | None = None) -> list[str]:
+        """Ids of the stored fills with ``ts >= since`` (and ``rowid <= upto``)."""
+        return await self.run(self._store.fill_ids, since=since, upto=upto)
+
+    async def get_state(self, key: str) -> str | None:
+        """The stored value for ``key``, or ``None``."""
+        return await self.run(self._store.get_state, key)
+
+    def close(self) -> None:
+        """Stop the reader threads once their reads finish. Idempotent.
+
+        The store stays open; close it after this.
+        """
+        self._executor.shutdown(wait=True)
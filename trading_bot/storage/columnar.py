@@ -0,0 +1,535 @@
+"""Columnar export of a store — partitioned Parquet, read lazily.
+
+The SQLite store is built for the engine's writes and its restart reads, not for
+analysis: a study over a year of fills meant walking every row back into Python.
+:func:`export_parquet` copies the store's orders, fills and key/value state into
+a Parquet dataset (from a :class:`SqliteStore` or a
+:class:`~trading_bot.storage.journal_store.JournalStore`), and
+:func:`scan_fills` / :func:`scan_orders` / :func:`scan_state` open it as
+:class:`polars.LazyFrame`\\ s, so a query reads only the partitions and columns
+it needs.
+
+Layout (carried into the ADR)
+-----------------------------
+::
+
+    root/
+      _watermark.json                       what has been exported so far
+      fills/day=2024-01-02/instrument=BTC%2FUSD/part-000000000001.parquet
+      orders/day=2024-01-02/instrument=BTC%2FUSD/part-...parquet
+      state/day=2024-01-02/state-1704153600000.parquet
+
+* **Partitioned by UTC day and instrument** (hive style, the symbol
+  URL-quoted), from each row's ``ts``. Orders stored before orders were
+  timestamped have no day (``__HIVE_DEFAULT_PARTITION__``, read back as null).
+* **Money is ``Decimal(38, 18)``,** exact, never float. Eighteen places hold any
+  venue's precision (ETH's wei included); a value that would not fit exactly
+  stops the export with :class:`ExportError` rather than being rounded.
+* **Columns are the store's,** plus ``seq``, the row's SQLite ``rowid`` (a
+  journal store's first-write position). Sorting fills on ``seq`` gives
+  execution order.
+
+Incremental (carried into the ADR)
+----------------------------------
+Each export resumes from a high-water mark kept in ``_watermark.json``:
+
+* **Fills are append-only,** so the mark is the last exported rowid. Fills are
+  written ``batch`` at a time, each chunk to ``part-<first seq>.parquet`` in
+  its partitions, and the mark is saved after every chunk. An export that dies
+  half-way is re-run from the last saved mark; it rewrites the same file names,
+  so no fill is exported twice.
+* **Orders are upserted,** so a later write to an order re-exports it. The mark
+  is the largest ``ts`` exported, and the next export takes ``ts >= mark``. An
+  order can therefore appear in several parts; :func:`scan_orders` keeps each
+  order's latest row unless asked for every version.
+* **State is small,** so every export writes a full snapshot of it, stamped
+  with the export time.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import time
+import urllib.parse
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from decimal import Context, Decimal
+from typing import TYPE_CHECKING, Any
+
+import polars as pl
+
+from trading_bot.domain.errors import TradingBotError
+from trading_bot.storage._common import instrument_from_text
+from trading_bot.storage.sqlite_store import FillTotals, SqliteStore
+
+if TYPE_CHECKING:
+    import sqlite3
+
+    from trading_bot.storage.journal_store import JournalStore
+
+    #: A row from ``iter_rows``: a ``sqlite3.Row`` or a journal store's dict.
+    _Row = sqlite3.Row | Mapping[str, Any]
+
+__all__ = [
+    "MONEY_SCALE",
+    "ExportError",
+    "ExportResult",
+    "export_parquet",
+    "fill_totals",
+    "scan_fills",
+    "scan_orders",
+    "scan_state",
+]
+
+#: Decimal places of every exported money column.
+MONEY_SCALE = 18
+
+_MONEY = pl.Decimal(38, MONEY_SCALE)
+
+#: A money value fits ``Decimal(38, 18)`` when it is below ``10**20`` in magnitude.
+_MONEY_DIGITS = 38 - MONEY_SCALE
+
+#: Multiplies two exported values without rounding (38 + 38 digits fit).
+_EXACT = Context(prec=2 * 38 + 4)
+
+#: A money literal ``Decimal(38, 18)`` holds as written.
+_PLAIN = r"^-?\d{1,20}(\.\d{0,18})?$"
+
+_WATERMARK = "_watermark.json"
+
+_PARTITIONS: dict[str, pl.DataType] = {"day": pl.Date(), "instrument": pl.String()}
+
+_FILL_SCHEMA: dict[str, pl.DataType] = {
+    "seq": pl.Int64(),
+    "fill_id": pl.String(),
+    "client_order_id": pl.String(),
+    "side": pl.String(),
+    "qty": _MONEY,
+    "price": _MONEY,
+    "fee": _MONEY,
+    "notional": _MONEY,
+    "ts": pl.Int64(),
+}
+
+_ORDER_SCHEMA: dict[str, pl.DataType] = {
+    "seq": pl.Int64(),
+    "client_order_id": pl.String(),
+    "venue_order_id": pl.String(),
+    "side": pl.String(),
+    "type": pl.String(),
+    "qty": _MONEY,
+    "limit_price": _MONEY,
+    "stop_price": _MONEY,
+    "status": pl.String(),
+    "filled_qty": _MONEY,
+    "avg_fill_price": _MONEY,
+    "ts": pl.Int64(),
+}
+
+_STATE_SCHEMA: dict[str, pl.DataType] = {
+    "key": pl.String(),
+    "value": pl.String(),
+    "ts": pl.Int64(),
+}
+
+
+class ExportError(TradingBotError):
+    """A stored value cannot be exported exactly.
+
+    Raised by :func:`export_parquet` when a money value has more than
+    :data:`MONEY_SCALE` decimal places or does not fit ``Decimal(38, 18)``.
+    Nothing past the last saved high-water mark is marked exported.
+
+    Parameters
+    ----------
+    column : str
+        The offending column.
+    value : str
+        The stored value.
+
+    """
+
+    def __init__(self, column: str, value: str) -> None:
+        self.column = column
+        self.value = value
+        super().__init__(
+            f"{column}={value} does not fit the exported Decimal(38, {MONEY_SCALE})"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ExportResult:
+    """What one :func:`export_parquet` call wrote.
+
+    Parameters
+    ----------
+    fills, orders, state : int
+        Rows written per table (state: the snapshot's size).
+    fill_mark : int
+        The fills high-water mark now saved (last exported rowid).
+    order_mark : int or None
+        The orders high-water mark now saved (largest exported ``ts``), or
+        ``None`` while no timestamped order has been exported.
+
+    """
+
+    fills: int
+    orders: int
+    state: int
+    fill_mark: int
+    order_mark: int | None
+
+
+def _now_ms() -> int:
+    """Wall-clock milliseconds since the Unix epoch (UTC)."""
+    return time.time_ns() // 1_000_000
+
+
+def _fits(value: Decimal) -> bool:
+    """Whether ``Decimal(38, 18)`` holds ``value`` exactly."""
+    exponent = value.normalize().as_tuple().exponent
+    return (
+        isinstance(exponent, int)
+        and exponent >= -MONEY_SCALE
+        and (not value or value.adjusted() < _MONEY_DIGITS)
+    )
+
+
+def _exact(column: str, text: str | None) -> Decimal | None:
+    """``text`` as a ``Decimal`` that ``Decimal(38, 18)`` holds exactly."""
+    if text is None:
+        return None
+    value = Decimal(text)
+    if not _fits(value):
+        raise ExportError(column, text)
+    return value
+
+
+def _odd(texts: pl.Series) -> pl.Series:
+    """Mask of the values that are not plain ``Decimal(38, 18)`` literals."""
+    return texts.is_not_null() & ~texts.str.contains(_PLAIN)
+
+
+def _frame(rows: list[_Row], schema: dict[str, pl.DataType]) -> pl.DataFrame:
+    """Build the export frame of ``rows`` (from ``iter_rows``), partition keys kept.
+
+    Money is checked and converted column-wise: a plain literal (at most 20
+    integer digits and 18 places) is exact by construction, so only the other
+    values (exponent notation, padded zeros) are checked one by one.
+    """
+    columns: dict[str, object] = {}
+    for name, dtype in schema.items():
+        if name == "notional":
+            continue
+        source = "_rowid" if name == "seq" else name
+        values = [row[source] for row in rows]
+        if dtype == _MONEY:
+            texts = pl.Series(name, values, dtype=pl.String)
+            for text in texts.filter(_odd(texts)).to_list():
+                _exact(name, text)
+            columns[name] = texts.cast(_MONEY)
+        else:
+            columns[name] = values
+    if "notional" in schema:
+        # ``qty * price`` can need more places than either factor; it is left
+        # null when it does not fit, and :func:`fill_totals` folds it in Python.
+        texts = pl.Series(
+            "notional",
+            [
+                str(_EXACT.multiply(Decimal(row["qty"]), Decimal(row["price"])))
+                for row in rows
+            ],
+        )
+        odd = _odd(texts)
+        if odd.any():
+            unfit = [
+                i
+                for i, text in zip(
+                    odd.arg_true().to_list(), texts.filter(odd).to_list(), strict=True
+                )
+                if not _fits(Decimal(text))
+            ]
+            texts = texts.scatter(unfit, None)
+        columns["notional"] = texts.cast(_MONEY)
+    columns["instrument"] = [row["instrument"] for row in rows]
+    return pl.DataFrame(
+        columns, schema={**schema, "instrument": pl.String()}
+    ).with_columns(day=pl.from_epoch("ts", time_unit="ms").dt.date())
+
+
+def _write_parts(frame: pl.DataFrame, directory: pathlib.Path, name: str) -> None:
+    """Write ``frame`` as ``name`` into each of its day/instrument partitions."""
+    for (day, instrument), part in frame.partition_by(
+        ["day", "instrument"], as_dict=True
+    ).items():
+        day_dir = "__HIVE_DEFAULT_PARTITION__" if day is None else day.isoformat()
+        target = (
+            directory
+            / f"day={day_dir}"
+            / f"instrument={urllib.parse.quote(str(instrument), safe='')}"
+        )
+        target.mkdir(parents=True, exist_ok=True)
+        part.drop("day", "instrument").write_parquet(target / name)
+
+
+def _chunks(rows: Iterable[_Row], size: int) -> Iterator[list[_Row]]:
+    """Group ``rows`` into lists of ``size``."""
+    chunk: list[_Row] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _load_marks(root: pathlib.Path) -> dict[str, int | None]:
+    """The saved high-water marks, or the start of history."""
+    path = root / _WATERMARK
+    if not path.exists():
+        return {"fills": 0, "orders": None}
+    return json.loads(path.read_text())  # type: ignore[no-any-return]
+
+
+def _save_marks(root: pathlib.Path, marks: dict[str, int | None]) -> None:
+    """Replace the watermark file atomically (write, then rename)."""
+    tmp = root / (_WATERMARK + ".tmp")
+    tmp.write_text(json.dumps(marks))
+    os.replace(tmp, root / _WATERMARK)
+
+
+def export_parquet(
+    store: SqliteStore | JournalStore,
+    root: str | os.PathLike[str],
+    *,
+    batch: int = 100_000,
+    clock: Callable[[], int] = _now_ms,
+) -> ExportResult:
+    """Export what ``store`` gained since the last export into ``root``.
+
+    See the module docstring for the layout and the high-water marks. Safe to
+    re-run at any time; a first run exports the whole history.
+
+    Parameters
+    ----------
+    store : SqliteStore or JournalStore
+        The store to read. It keeps running; rows committed during the export
+        are picked up by this one or the next.
+    root : str or PathLike
+        The dataset directory (created if missing).
+    batch : int, optional
+        Rows per Parquet part (and per saved fills mark). Defaults to
+        ``100_000``.
+    clock : Callable[[], int], optional
+        Milliseconds since the Unix epoch, stamping the state snapshot.
+
+    Returns
+    -------
+    ExportResult
+        Rows written and the marks saved.
+
+    Raises
+    ------
+    ExportError
+        If a money value does not fit ``Decimal(38, 18)`` exactly.
+    ValueError
+        If ``batch < 1``.
+
+    """
+    if batch < 1:
+        raise ValueError(f"batch must be at least 1, got {batch}")
+    root = pathlib.Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    marks = _load_marks(root)
+
+    fills = 0
+    for chunk in _chunks(
+        store.iter_rows("fills", after=marks["fills"] or 0, batch=batch), batch
+    ):
+        frame = _frame(chunk, _FILL_SCHEMA)
+        _write_parts(frame, root / "fills", f"part-{chunk[0]['_rowid']:012d}.parquet")
+        fills += len(chunk)
+        marks["fills"] = chunk[-1]["_rowid"]
+        _save_marks(root, marks)
+
+    # Named after the mark the pass starts from, so a re-run of a failed pass
+    # overwrites its own files.
+    start = marks["orders"]
+    orders = 0
+    newest = start
+    for chunk in _chunks(store.iter_rows("orders", since=start, batch=batch), batch):
+        frame = _frame(chunk, _ORDER_SCHEMA)
+        _write_parts(
+            frame,
+            root / "orders",
+            f"part-{start or 0:013d}-{chunk[0]['_rowid']:012d}.parquet",
+        )
+        orders += len(chunk)
+        stamps = [row["ts"] for row in chunk if row["ts"] is not None]
+        if stamps:
+            newest = max(stamps) if newest is None else max(newest, *stamps)
+    marks["orders"] = newest
+    _save_marks(root, marks)
+
+    now = clock()
+    rows: list[_Row] = list(store.iter_rows("state", batch=batch))
+    state = pl.DataFrame(
+        {
+            "key": [row["key"] for row in rows],
+            "value": [row["value"] for row in rows],
+            "ts": [now] * len(rows),
+        },
+        schema=_STATE_SCHEMA,
+    )
+    day = pl.select(pl.from_epoch(pl.lit(now), time_unit="ms").dt.date()).item()
+    target = root / "state" / f"day={day.isoformat()}"
+    target.mkdir(parents=True, exist_ok=True)
+    state.write_parquet(target / f"state-{now}.parquet")
+
+    return ExportResult(fills, orders, state.height, marks["fills"] or 0, newest)
+
+
+def _scan(
+    directory: pathlib.Path,
+    schema: dict[str, pl.DataType],
+    partitions: dict[str, pl.DataType],
+) -> pl.LazyFrame:
+    """Lazily scan a hive-partitioned directory; empty with ``schema`` if absent."""
+    if not any(directory.glob("**/*.parquet")):
+        return pl.LazyFrame(schema={**schema, **partitions})
+    return pl.scan_parquet(
+        directory / "**" / "*.parquet",
+        hive_partitioning=True,
+        hive_schema=partitions,
+    )
+
+
+def scan_fills(root: str | os.PathLike[str]) -> pl.LazyFrame:
+    """A lazy frame over every exported fill.
+
+    Columns: ``seq``, ``fill_id``, ``client_order_id``, ``side``, ``qty``,
+    ``price``, ``fee`` (``Decimal(38, 18)``), ``ts`` (ms UTC), plus the ``day``
+    and ``instrument`` partitions. Filters on ``day`` / ``instrument`` skip
+    whole partitions. Sort on ``seq`` for execution order.
+    """
+    return _scan(pathlib.Path(root) / "fills", _FILL_SCHEMA, _PARTITIONS)
+
+
+def scan_orders(root: str | os.PathLike[str], *, latest: bool = True) -> pl.LazyFrame:
+    """A lazy frame over the exported orders.
+
+    Parameters
+    ----------
+    root : str or PathLike
+        The dataset directory.
+    latest : bool, optional
+        Keep only each order's most recently exported row (the default). With
+        ``False``, every exported version of every order.
+
+    """
+    frame = _scan(pathlib.Path(root) / "orders", _ORDER_SCHEMA, _PARTITIONS)
+    if not latest:
+        return frame
+    return frame.sort("ts", "seq", nulls_last=False).unique(
+        "client_order_id", keep="last", maintain_order=True
+    )
+
+
+def scan_state(root: str | os.PathLike[str], *, latest: bool = True) -> pl.LazyFrame:
+    """A lazy frame over the exported state snapshots.
+
+    Parameters
+    ----------
+    root : str or PathLike
+        The dataset directory.
+    latest : bool, optional
+        Keep only the newest snapshot (the default). With ``False``, every
+        snapshot, told apart by ``ts``.
+
+    """
+    frame = _scan(pathlib.Path(root) / "state", _STATE_SCHEMA, {"day": pl.Date()})
+    if not latest:
+        return frame
+    return frame.filter(pl.col("ts") == pl.col("ts").max())
+
+
+def _canonical(value: Decimal | None) -> Decimal:
+    """A ``Decimal(38, 18)`` value without its padding zeros (``None`` is zero)."""
+    if value is None:
+        return Decimal(0)
+    text = format(value, "f")
+    return Decimal(text.rstrip("0").rstrip(".") if "." in text else text)
+
+
+def fill_totals(
+    root: str | os.PathLike[str], *, by_day: bool = False
+) -> list[FillTotals]:
+    """Per-instrument fill totals over an export, summed by polars.
+
+    The columnar twin of :meth:`SqliteStore.fill_totals
+    <trading_bot.storage.sqlite_store.SqliteStore.fill_totals>`, with the same
+    result for the same fills: quantities, notional and fees are summed as
+    ``Decimal(38, 18)``, and the rare fill whose notional did not fit is folded
+    in Python.
+
+    Parameters
+    ----------
+    root : str or PathLike
+        The dataset directory.
+    by_day : bool, optional
+        One row per instrument and UTC day instead of per instrument.
+
+    Returns
+    -------
+    list of FillTotals
+        Sorted by instrument (then day).
+
+    """
+    keys = ["instrument", "day"] if by_day else ["instrument"]
+    fills = scan_fills(root)
+    buy = pl.col("side") == "buy"
+    grouped = (
+        fills.filter(pl.col("notional").is_not_null())
+        .group_by(keys)
+        .agg(
+            pl.len().alias("fills"),
+            pl.col("qty").filter(buy).sum().alias("bought"),
+            pl.col("qty").filter(~buy).sum().alias("sold"),
+            pl.col("notional").filter(buy).sum().alias("buy_notional"),
+            pl.col("notional").filter(~buy).sum().alias("sell_notional"),
+            pl.col("fee").sum().alias("fees"),
+        )
+        .collect()
+    )
+    totals: dict[tuple[str, str | None], list[Decimal | int]] = {}
+    for row in grouped.iter_rows(named=True):
+        day = row["day"].isoformat() if by_day else None
+        totals[(row["instrument"], day)] = [
+            row["fills"],
+            *(
+                _canonical(row[name])
+                for name in ("bought", "sold", "buy_notional", "sell_notional", "fees")
+            ),
+        ]
+    zero = Decimal(0)
+    inexact = fills.filter(pl.col("notional").is_null()).collect()
+    for row in inexact.iter_rows(named=True):
+        day = row["day"].isoformat() if by_day else None
+        values = totals.setdefault(
+            (row["instrument"], day), [0, zero, zero, zero, zero, zero]
+        )
+        qty, price = _canonical(row["qty"]), _canonical(row["price"])
+        bought = row["side"] == "buy"
+        values[0] += 1
+        values[1 if bought else 2] += qty
+        values[3 if bought else 4] += qty * price
+        values[5] += _canonical(row["fee"])
+    return [
+        FillTotals(instrument_from_text(key[0]), key[1], *values)  # type: ignore[arg-type]
+        for key, values in sorted(
+            totals.items(), key=lambda item: (item[0][0], item[0][1] or "")
+        )
+    ]
@@ -0,0 +1,1480 @@
+"""The :class:`JournalStore` — order/fill history on a segmented append-only log.
+
+A second storage backend with the surface of
+:class:`~trading_bot.storage.sqlite_store.SqliteStore` (``upsert_order``,
+``record_fill``, ``set_state``, the paged readers, ``iter_rows``,
+``fill_totals``, ``attach``, ``transaction``, ``flush``, ``archive``), selected
+with ``storage.backend: journal``. The SQLite
+store turns every order update into an UPSERT of a B-tree row; under a high-rate
+order/fill stream that is most of the engine's I/O. This store only appends a
+record to a log file and keeps the state the records fold to in memory.
+
+Design choices (carried into the ADR)
+-------------------------------------
+* **One log, the latest state in memory.** Orders are held in a dict keyed by
+  ``client_order_id`` (in first-write order, like the SQLite rowids), fills in a
+  list with a ``fill_id`` index (a fill already recorded is dropped before it is
+  written), the state pairs in a dict, and running per-instrument, per-day fill
+  totals for :meth:`JournalStore.fill_totals`. Reads never touch the disk. The
+  price is memory: the whole history lives in the process, so this backend suits
+  an engine's working history, not a multi-year archive.
+
+* **Compact binary records, exact money.** A record is a kind byte, a big-endian
+  ``u32`` payload length, the payload, and a CRC-32 of all three. A payload
+  starts with its fixed-width fields (flags, one-byte side / type / status
+  codes from fixed tables, the ``i64`` timestamp) and goes on with LEB128
+  varints. A ``Decimal`` is a single varint packing its coefficient, sign and
+  zigzag exponent, so it round-trips digit for digit, exponent included
+  (``Decimal("30000.1")`` takes 4 bytes). A string is its UTF-8 length and
+  bytes. Like
+  the SQLite store, only the instrument's ``BASE/QUOTE`` symbol is kept. When
+  an order is written again with the very same terms (instrument, side, type,
+  quantity and prices, as the router does while the order works), the record
+  holds only its lifecycle fields: status, fills, venue id and time.
+
+* **Batched fsync.** A write appends to an in-memory buffer. A flusher thread
+  writes and fsyncs the buffer once ``flush_rows`` records are waiting or
+  ``flush_interval`` seconds after the first, whichever comes first; a writer
+  that gets a few batches ahead of the disk writes the buffer itself.
+  :meth:`JournalStore.flush` is the durability barrier, as for the write-behind
+  SQLite store: a write not yet flushed may be lost in a crash.
+  :meth:`JournalStore.transaction` frames its writes as one batch record, so they
+  survive a crash together or not at all, and fsyncs it when the block ends.
+
+* **Segments and compaction.** The log is split into ``seg-NNNNNNNN.tbj`` files
+  of about ``segment_bytes`` each. When a segment is full the store rolls to the
+  next one. Once superseded records (the older versions of an order or a state
+  key) outweigh both the live ones and one segment, it compacts: the live state
+  is written to ``snap-NNNNNNNN.tbj`` (a temporary file, fsynced, then renamed),
+  which covers every segment before ``N``, and those segments are deleted. The
+  snapshot is copied from memory and may hold records that reach segment ``N``
+  only afterwards. Replay is idempotent (orders and state are latest-wins, fills
+  are deduplicated by id), so meeting such a record twice is harmless.
+
+* **Recovery.** Opening the directory loads the newest snapshot and replays the
+  segments from it on. A record cut short or failing its CRC in the last segment
+  is a write torn by a crash: the segment is truncated there and a warning is
+  logged. Damage anywhere else raises :class:`StoreCorruptError`; it cannot be
+  the tail of an interrupted write.
+
+Optionally, :meth:`JournalStore.attach` subscribes the store to an
+:class:`~trading_bot.application.events.EventBus`, exactly as the SQLite store's.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import gc
+import logging
+import os
+import pathlib
+import re
+import struct
+import threading
+import time
+import zlib
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from decimal import MAX_PREC, Context, Decimal
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from trading_bot.domain.errors import TradingBotError
+from trading_bot.domain.fill import Fill
+from trading_bot.domain.instrument import Instrument
+from trading_bot.domain.order import Order, OrderSide, OrderStatus, OrderType
+from trading_bot.storage._common import (
+    LIVE_STATUSES,
+    instrument_from_text,
+    instrument_to_text,
+    now_ms,
+)
+from trading_bot.storage.sqlite_store import FillTotals, StoreWriteError
+
+if TYPE_CHECKING:
+    from trading_bot.application.events import Event, EventBus
+
+__all__ = ["MAGIC", "JournalStore", "StoreCorruptError"]
+
+logger = logging.getLogger(__name__)
+
+#: The first bytes of every segment and snapshot file.
+MAGIC = b"TBJS\x01"
+
+_HEADER = struct.Struct(">BI")
+# The fixed-width fields leading each record: flags, codes, ``ts``.
+_ORDER_HEAD = struct.Struct(">BBBBq")
+_UPDATE_HEAD = struct.Struct(">BBq")
+_FILL_HEAD = struct.Struct(">Bq")
+_CRC = struct.Struct(">I")
+#: Header plus CRC: the bytes a record adds to its payload.
+_FRAMING = _HEADER.size + _CRC.size
+
+# Record kinds.
+_ORDER = 1
+_FILL = 2
+_STATE = 3
+_BATCH = 4
+_UPDATE = 5
+
+_SEGMENT = re.compile(r"seg-(\d{8})\.tbj")
+_SNAPSHOT = re.compile(r"snap-(\d{8})\.tbj")
+
+# On-disk enum codes: append only, never reorder.
+_SIDES = (OrderSide.BUY, OrderSide.SELL)
+_TYPES = (
+    OrderType.MARKET,
+    OrderType.LIMIT,
+    OrderType.STOP_LOSS,
+    OrderType.BEST_LIMIT,
+)
+_STATUSES = (
+    OrderStatus.NEW,
+    OrderStatus.SUBMITTED,
+    OrderStatus.OPEN,
+    OrderStatus.PARTIALLY_FILLED,
+    OrderStatus.FILLED,
+    OrderStatus.CANCELLED,
+    OrderStatus.REJECTED,
+)
+_CODES: dict[object, int] = {
+    member: code
+    for table in (_SIDES, _TYPES, _STATUSES)
+    for code, member in enumerate(table)
+}
+
+_LIVE = frozenset(OrderStatus(value) for value in LIVE_STATUSES)
+
+#: Unbounded precision: sums and notionals are never rounded.
+_EXACT = Context(prec=MAX_PREC)
+_ZERO = Decimal(0)
+_ONE = Decimal(1)
+_DAY_MS = 86_400_000
+
+# A Decimal's zigzag exponent shares its varint in the low bits; one that does
+# not fit (beyond +-31) is marked with ``_EXP_SPILL`` and follows on its own.
+_EXP_BITS = 6
+_EXP_SPILL = (1 << _EXP_BITS) - 1
+
+# Order-record flags: which optional fields follow.
+_HAS_VENUE = 1
+_HAS_LIMIT = 2
+_HAS_STOP = 4
+_HAS_AVG = 8
+
+#: Batches a writer may run ahead of the disk before it writes the buffer itself.
+_BACKLOG = 4
+
+
+class StoreCorruptError(TradingBotError):
+    """A journal-store file is damaged somewhere other than its torn tail.
+
+    Raised while :class:`JournalStore` opens its directory: a snapshot, or a
+    segment before the last one, holds a record that is cut short, fails its
+    CRC or does not decode. The store refuses to open rather than drop history.
+    """
+
+
+class _OrderRow(NamedTuple):
+    """One order's latest stored state, as primitives."""
+
+    client_order_id: str
+    venue_order_id: str | None
+    instrument: str
+    side: OrderSide
+    type: OrderType
+    qty: Decimal
+    limit_price: Decimal | None
+    stop_price: Decimal | None
+    status: OrderStatus
+    filled_qty: Decimal
+    avg_fill_price: Decimal | None
+    ts: int
+
+
+# --- encoding ------------------------------------------------------------- #
+
+
+def _put_uint(out: bytearray, n: int) -> None:
+    while n > 0x7F:
+        out.append(n & 0x7F | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _put_text(out: bytearray, text: str) -> None:
+    data = text.encode()
+    _put_uint(out, len(data))
+    out += data
+
+
+def _put_decimal(out: bytearray, value: Decimal) -> None:
+    # Parsed from ``str(value)``, which is exact and several times faster than
+    # ``value.as_tuple()`` plus joining its digits.
+    text = str(value)
+    negative = text[0] == "-"
+    mantissa, _, power = text.lstrip("-").partition("E")
+    whole, _, fraction = mantissa.partition(".")
+    try:
+        coefficient = int(whole + fraction)
+        exponent = int(power or 0) - len(fraction)
+    except ValueError:
+        raise ValueError(f"cannot store the non-finite value {value}") from None
+    zigzag = exponent << 1 if exponent >= 0 else ~exponent << 1 | 1
+    packed = (coefficient << 1 | negative) << _EXP_BITS
+    if zigzag < _EXP_SPILL:
+        _put_uint(out, packed | zigzag)
+    else:
+        _put_uint(out, packed | _EXP_SPILL)
+        _put_uint(out, zigzag)
+
+
+def _frame(kind: int, payload: bytes | bytearray) -> bytes:
+    """``payload`` framed as one record: header, payload, CRC."""
+    record = _HEADER.pack(kind, len(payload)) + payload
+    return record + _CRC.pack(zlib.crc32(record))
+
+
+def _encode_order(row: _OrderRow) -> bytearray:
+    flags = (
+        (row.venue_order_id is not None) * _HAS_VENUE
+        | (row.limit_price is not None) * _HAS_LIMIT
+        | (row.stop_price is not None) * _HAS_STOP
+        | (row.avg_fill_price is not None) * _HAS_AVG
+    )
+    out = bytearray(
+        _ORDER_HEAD.pack(
+            flags, _CODES[row.side], _CODES[row.type], _CODES[row.status], row.ts
+        )
+    )
+    _put_text(out, row.client_order_id)
+    if row.venue_order_id is not None:
+        _put_text(out, row.venue_order_id)
+    _put_text(out, row.instrument)
+    _put_decimal(out, row.qty)
+    if row.limit_price is not None:
+        _put_decimal(out, row.limit_price)
+    if row.stop_price is not None:
+        _put_decimal(out, row.stop_price)
+    _put_decimal(out, row.filled_qty)
+    if row.avg_fill_price is not None:
+        _put_decimal(out, row.avg_fill_price)
+    return out
+
+
+def _encode_update(row: _OrderRow) -> bytearray:
+    """An order's lifecycle fields only (its terms are those already stored)."""
+    flags = (row.venue_order_id is not None) * _HAS_VENUE | (
+        row.avg_fill_price is not None
+    ) * _HAS_AVG
+    out = bytearray(_UPDATE_HEAD.pack(flags, _CODES[row.status], row.ts))
+    _put_text(out, row.client_order_id)
+    if row.venue_order_id is not None:
+        _put_text(out, row.venue_order_id)
+    _put_decimal(out, row.filled_qty)
+    if row.avg_fill_price is not None:
+        _put_decimal(out, row.avg_fill_price)
+    return out
+
+
+def _same_terms(old: _OrderRow, new: _OrderRow) -> bool:
+    """Whether ``new`` keeps ``old``'s terms (the money as the same objects)."""
+    return (
+        old.qty is new.qty
+        and old.limit_price is new.limit_price
+        and old.stop_price is new.stop_price
+        and old.side is new.side
+        and old.type is new.type
+        and old.instrument == new.instrument
+    )
+
+
+def _encode_fill(fill: Fill) -> bytearray:
+    out = bytearray(_FILL_HEAD.pack(_CODES[fill.side], fill.ts))
+    _put_text(out, fill.fill_id)
+    _put_text(out, fill.client_order_id)
+    _put_text(out, instrument_to_text(fill.instrument))
+    _put_decimal(out, fill.qty)
+    _put_decimal(out, fill.price)
+    _put_decimal(out, fill.fee)
+    return out
+
+
+def _encode_state(key: str, value: str) -> bytearray:
+    out = bytearray()
+    _put_text(out, key)
+    _put_text(out, value)
+    return out
+
+
+# --- decoding ------------------------------------------------------------- #
+
+
+class _Reader:
+    """A cursor over one record's payload."""
+
+    __slots__ = ("buf", "pos")
+
+    def __init__(self, buf: bytes, pos: int = 0) -> None:
+        self.buf = buf
+        self.pos = pos
+
+    def head(self, layout: struct.Struct) -> tuple[Any, ...]:
+        values = layout.unpack_from(self.buf, self.pos)
+        self.pos += layout.size
+        return values
+
+    def uint(self) -> int:
+        buf = self.buf
+        pos = self.pos
+        byte = buf[pos]
+        pos += 1
+        result = byte & 0x7F
+        shift = 7
+        while byte & 0x80:
+            byte = buf[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            shift += 7
+        self.pos = pos
+        return result
+
+    def text(self) -> str:
+        size = self.uint()
+        start = self.pos
+        self.pos += size
+        if self.pos > len(self.buf):
+            raise IndexError("text runs past the record")
+        return self.buf[start : self.pos].decode()
+
+    def decimal(self) -> Decimal:
+        packed = self.uint()
+        zigzag = packed & _EXP_SPILL
+        if zigzag == _EXP_SPILL:
+            zigzag = self.uint()
+        return _decimal(packed >> _EXP_BITS, zigzag)
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _decimal(signed: int, zigzag: int) -> Decimal:
+    """The ``Decimal`` of a stored coefficient and exponent (prices repeat)."""
+    exponent = ~(zigzag >> 1) if zigzag & 1 else zigzag >> 1
+    sign = "-" if signed & 1 else ""
+    return Decimal(f"{sign}{signed >> 1}E{exponent}")
+
+
+def _decode_order(payload: bytes) -> _OrderRow:
+    r = _Reader(payload)
+    flags, side, type_, status, ts = r.head(_ORDER_HEAD)
+    cid = r.text()
+    venue = r.text() if flags & _HAS_VENUE else None
+    instrument = r.text()
+    qty = r.decimal()
+    limit = r.decimal() if flags & _HAS_LIMIT else None
+    stop = r.decimal() if flags & _HAS_STOP else None
+    filled = r.decimal()
+    avg = r.decimal() if flags & _HAS_AVG else None
+    return _OrderRow(
+        cid,
+        venue,
+        instrument,
+        _SIDES[side],
+        _TYPES[type_],
+        qty,
+        limit,
+        stop,
+        _STATUSES[status],
+        filled,
+        avg,
+        ts,
+    )
+
+
+def _decode_update(payload: bytes, old: _OrderRow) -> _OrderRow:
+    r = _Reader(payload)
+    flags, status, ts = r.head(_UPDATE_HEAD)
+    r.text()  # the client order id, already looked up
+    venue = r.text() if flags & _HAS_VENUE else None
+    filled = r.decimal()
+    return old._replace(
+        venue_order_id=venue,
+        status=_STATUSES[status],
+        filled_qty=filled,
+        avg_fill_price=r.decimal() if flags & _HAS_AVG else None,
+        ts=ts,
+    )
+
+
+def _records(data: bytes, start: int) -> Iterator[tuple[int, bytes, int, int]]:
+    """Yield ``(kind, payload, start, end)`` per intact record; stop at a bad one."""
+    view = memoryview(data)
+    size = len(data)
+    pos = start
+    while size - pos >= _FRAMING:
+        kind, length = _HEADER.unpack_from(data, pos)
+        body = pos + _HEADER.size + length
+        end = body + _CRC.size
+        if end > size or zlib.crc32(view[pos:body]) != _CRC.unpack_from(data, body)[0]:
+            return
+        yield kind, data[pos + _HEADER.size : body], pos, end
+        pos = end
+
+
+@functools.lru_cache(maxsize=4096)
+def _utc_day(day: int) -> str:
+    """The ``YYYY-MM-DD`` of a day number (days since the Unix epoch, UTC)."""
+    return time.strftime("%Y-%m-%d", time.gmtime(day * 86_400))
+
+
+def _accumulate(
+    totals: dict[tuple[str, str], list[Any]], fill: Fill, *, undo: bool = False
+) -> None:
+    """Add ``fill`` to (or, with ``undo``, take it out of) per-day ``totals``."""
+    key = (instrument_to_text(fill.instrument), _utc_day(fill.ts // _DAY_MS))
+    values = totals.get(key)
+    if values is None:
+        values = totals[key] = [0, _ZERO, _ZERO, _ZERO, _ZERO, _ZERO]
+    qty, fee = fill.qty, fill.fee
+    notional = _EXACT.multiply(qty, fill.price)
+    if undo:
+        qty, fee, notional = (_EXACT.minus(v) for v in (qty, fee, notional))
+    buy = fill.side is OrderSide.BUY
+    values[0] += -1 if undo else 1
+    values[1 if buy else 2] = _EXACT.add(values[1 if buy else 2], qty)
+    values[3 if buy else 4] = _EXACT.add(values[3 if buy else 4], notional)
+    values[5] = _EXACT.add(values[5], fee)
+    if not values[0]:
+        del totals[key]
+
+
+def _fill_columns(rowid: int, fill: Fill) -> dict[str, Any]:
+    """``fill`` as the SQLite store's ``fills`` columns (see ``iter_rows``)."""
+    return {
+        "_rowid": rowid,
+        "fill_id": fill.fill_id,
+        "client_order_id": fill.client_order_id,
+        "instrument": instrument_to_text(fill.instrument),
+        "side": fill.side.value,
+        "qty": str(fill.qty),
+        "price": str(fill.price),
+        "fee": str(fill.fee),
+        "ts": fill.ts,
+    }
+
+
+def _order_columns(rowid: int, row: _OrderRow) -> dict[str, Any]:
+    """``row`` as the SQLite store's ``orders`` columns (see ``iter_rows``)."""
+
+    def text(value: Decimal | None) -> str | None:
+        return None if value is None else str(value)
+
+    return {
+        "_rowid": rowid,
+        "client_order_id": row.client_order_id,
+        "venue_order_id": row.venue_order_id,
+        "instrument": row.instrument,
+        "side": row.side.value,
+        "type": row.type.value,
+        "qty": str(row.qty),
+        "limit_price": text(row.limit_price),
+        "stop_price": text(row.stop_price),
+        "status": row.status.value,
+        "filled_qty": str(row.filled_qty),
+        "avg_fill_price": text(row.avg_fill_price),
+        "ts": row.ts,
+    }
+
+
+def _trimmed(value: Decimal) -> Decimal:
+    """``value`` without trailing fractional zeros, as the SQLite sums return it."""
+    exponent = value.as_tuple().exponent
+    if not isinstance(exponent, int) or exponent >= 0:
+        return value
+    trimmed = value.normalize(_EXACT)
+    if trimmed.as_tuple().exponent > 0:  # type: ignore[operator]
+        return trimmed.quantize(_ONE, context=_EXACT)
+    return trimmed
+
+
+class JournalStore:
+    """Order/fill history and engine state on a segmented append-only log.
+
+    A drop-in for :class:`~trading_bot.storage.sqlite_store.SqliteStore` where
+    the order/fill stream is write-heavy: the same write, read and bus surface,
+    over a directory of log segments and a snapshot (see the module docstring).
+    The directory's state is recovered on init.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        The store's directory. Created if absent, with its parents.
+    segment_bytes : int, optional
+        Size at which a segment is closed and the next one started. Defaults to
+        64 MiB.
+    flush_rows : int, optional
+        Records per fsync batch. Defaults to ``500``.
+    flush_interval : float, optional
+        Longest time (seconds) a buffered record waits for its fsync. Defaults
+        to ``0.02``.
+    clock : Callable[[], int], optional
+        Milliseconds since the Unix epoch, stamped on each order write.
+        Defaults to the wall clock.
+
+    Raises
+    ------
+    ValueError
+        If ``segment_bytes``, ``flush_rows`` or ``flush_interval`` is out of range.
+    StoreCorruptError
+        If a file other than the last segment is damaged.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> from trading_bot.domain import (
+    ...     Instrument, Symbol, Order, OrderSide, OrderType, money)
+    >>> path = tempfile.mkdtemp()
+    >>> store = JournalStore(path)
+    >>> o = Order("cid-1", Instrument(Symbol("BTC", "USD")), OrderSide.BUY,
+    ...           money("2"), OrderType.LIMIT, limit_price=money("30000"))
+    >>> store.upsert_order(o)
+    >>> store.close()
+    >>> with JournalStore(path) as again:
+    ...     again.get_order("cid-1").limit_price
+    Decimal('30000')
+
+    """
+
+    def __init__(
+        self,
+        path: str | pathlib.Path,
+        *,
+        segment_bytes: int = 64 << 20,
+        flush_rows: int = 500,
+        flush_interval: float = 0.02,
+        clock: Callable[[], int] = now_ms,
+    ) -> None:
+        if segment_bytes < 1:
+            raise ValueError(f"segment_bytes must be at least 1, got {segment_bytes}")
+        if flush_rows < 1:
+            raise ValueError(f"flush_rows must be at least 1, got {flush_rows}")
+        if flush_interval < 0:
+            raise ValueError(f"flush_interval must be >= 0, got {flush_interval}")
+        self._dir = pathlib.Path(path)
+        self._segment_bytes = segment_bytes
+        self._flush_rows = flush_rows
+        self._flush_interval = flush_interval
+        self._clock = clock
+        # ``_lock`` guards the in-memory state and the buffer and is held for a
+        # whole transaction; ``_io_lock`` serialises the file writes, rolls and
+        # compactions. Whoever needs both takes ``_io_lock`` first.
+        self._lock = threading.RLock()
+        self._io_lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._orders: dict[str, tuple[_OrderRow, int]] = {}
+        self._fills: list[Fill] = []
+        self._fill_seq: dict[str, int] = {}
+        self._max_ts: int | None = None
+        self._state: dict[str, tuple[str, int]] = {}
+        self._totals: dict[tuple[str, str], list[Any]] = {}
+        self._instruments: dict[str, Instrument] = {}
+        # Record bytes still current vs. superseded: the compaction trigger.
+        self._live = 0
+        self._dead = 0
+        self._buffer = bytearray()
+        self._pending = 0
+        self._tx_buffer = bytearray()
+        self._tx_owner: int | None = None
+        self._tx_depth = 0
+        # (record kind, key, the entry it replaced, record size) per write.
+        self._undo: list[tuple[int, str, Any, int]] = []
+        self._error: BaseException | None = None
+        self._stopping = False
+        self._closed = False
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._segment = self._recover()
+        self._fd = self._open_segment(self._segment)
+        self._segment_size = os.fstat(self._fd).st_size
+        self._thread = threading.Thread(
+            target=self._flush_loop, name="JournalStore-flusher", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def write_behind(self) -> bool:
+        """Always ``True``: writes are buffered and fsynced by the flusher thread."""
+        return True
+
+    # --- recovery ---------------------------------------------------------- #
+
+    def _recover(self) -> int:
+        """Load the newest snapshot and replay the segments after it.
+
+        Returns the number of the segment to append to.
+        """
+        for leftover in self._dir.glob("*.tmp"):
+            leftover.unlink()
+        snapshots = self._numbered(_SNAPSHOT)
+        segments = self._numbered(_SEGMENT)
+        base = snapshots[-1] if snapshots else 1
+        live = [n for n in segments if n >= base]
+        # Replay builds many objects and no cycles: the cyclic collector's
+        # passes over the growing index are pure overhead (about a third).
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            if snapshots:
+                self._replay(self._snapshot_path(base), tail=False)
+            for i, n in enumerate(live):
+                self._replay(self._segment_path(n), tail=i == len(live) - 1)
+        finally:
+            if collecting:
+                gc.enable()
+        # Left behind by a compaction interrupted before its clean-up.
+        for n in snapshots[:-1]:
+            self._snapshot_path(n).unlink()
+        for n in segments:
+            if n < base:
+                self._segment_path(n).unlink()
+        return live[-1] if live else base
+
+    def _numbered(self, pattern: re.Pattern[str]) -> list[int]:
+        return sorted(
+            int(match.group(1))
+            for match in map(pattern.fullmatch, os.listdir(self._dir))
+            if match is not None
+        )
+
+    def _replay(self, path: pathlib.Path, *, tail: bool) -> None:
+        """Fold ``path``'s records; truncate a torn ``tail``, else raise."""
+        data = path.read_bytes()
+        good = 0
+        # Per order id: its last full record in this file and the last update
+        # after that. Only those two are decoded; the versions they supersede
+        # are skipped after reading their id.
+        orders: dict[str, list[tuple[bytes, int] | None]] = {}
+        if data.startswith(MAGIC):
+            good = len(MAGIC)
+            for kind, payload, start, end in _records(data, good):
+                self._apply(kind, payload, end - start, path, orders)
+                good = end
+        elif not (tail and MAGIC.startswith(data)):
+            raise StoreCorruptError(f"{path.name}: not a journal-store file")
+        self._settle_orders(orders, path)
+        if good == len(data):
+            return
+        if not tail:
+            raise StoreCorruptError(f"{path.name}: damaged record at byte {good}")
+        logger.warning(
+            "%s: dropping a torn tail of %d bytes at byte %d",
+            path.name,
+            len(data) - good,
+            good,
+        )
+        os.truncate(path, good)
+
+    def _apply(
+        self,
+        kind: int,
+        payload: bytes,
+        size: int,
+        path: pathlib.Path,
+        orders: dict[str, list[tuple[bytes, int] | None]],
+    ) -> None:
+        """Fold one replayed record (orders: note it in ``orders``)."""
+        try:
+            if kind in (_ORDER, _UPDATE):
+                at = (_ORDER_HEAD if kind == _ORDER else _UPDATE_HEAD).size
+                size_byte = payload[at]  # the id's length, after the head
+                if size_byte < 0x80:
+                    cid = payload[at + 1 : at + 1 + size_byte].decode()
+                else:
+                    cid = _Reader(payload, at).text()
+                slot = orders.setdefault(cid, [None, None])
+                if kind == _UPDATE:
+                    self._dead += size  # as when it was written
+                    slot[1] = (payload, size)
+                    return
+                if slot[0] is not None:
+                    self._dead += slot[0][1]
+                orders[cid] = [(payload, size), None]
+            elif kind == _FILL:
+                fill = self._decode_fill(payload)
+                if fill.fill_id not in self._fill_seq:
+                    self._add_fill(fill, size)
+            elif kind == _STATE:
+                r = _Reader(payload)
+                key = r.text()
+                self._put_state(key, r.text(), size)
+            elif kind == _BATCH:
+                end = 0
+                for inner, body, start, end in _records(payload, 0):
+                    self._apply(inner, body, end - start, path, orders)
+                if end != len(payload):
+                    raise ValueError("damaged batch")
+            else:
+                raise ValueError(f"unknown record kind {kind}")
+        except (IndexError, ValueError, UnicodeDecodeError) as exc:
+            raise StoreCorruptError(f"{path.name}: {exc}") from exc
+
+    def _settle_orders(
+        self,
+        orders: dict[str, list[tuple[bytes, int] | None]],
+        path: pathlib.Path,
+    ) -> None:
+        """Decode each noted order's latest version into the index."""
+        try:
+            for cid, (full, update) in orders.items():
+                if full is not None:
+                    self._put_order(_decode_order(full[0]), full[1])
+                if update is None:
+                    continue
+                entry = self._orders.get(cid)
+                if entry is None:
+                    raise ValueError(f"update of unknown order {cid!r}")
+                self._orders[cid] = (_decode_update(update[0], entry[0]), entry[1])
+        except (IndexError, ValueError, UnicodeDecodeError) as exc:
+            raise StoreCorruptError(f"{path.name}: {exc}") from exc
+
+    def _decode_fill(self, payload: bytes) -> Fill:
+        r = _Reader(payload)
+        side, ts = r.head(_FILL_HEAD)
+        return Fill(
+            fill_id=r.text(),
+            client_order_id=r.text(),
+            instrument=self._instrument(r.text()),
+            side=_SIDES[side],
+            qty=r.decimal(),
+            price=r.decimal(),
+            fee=r.decimal(),
+            ts=ts,
+        )
+
+    def _instrument(self, text: str) -> Instrument:
+        """The (shared) symbol-only instrument for ``text``."""
+        instrument = self._instruments.get(text)
+        if instrument is None:
+            instrument = self._instruments[text] = instrument_from_text(text)
+        return instrument
+
+    # --- in-memory state --------------------------------------------------- #
+
+    def _put_order(
+        self, row: _OrderRow, size: int, *, update: bool = False
+    ) -> tuple[_OrderRow, int] | None:
+        previous = self._orders.get(row.client_order_id)
+        if update:
+            # A compaction folds the update into one full record, whose size the
+            # entry keeps; the update's own bytes are already superseded.
+            assert previous is not None
+            self._orders[row.client_order_id] = (row, previous[1])
+            self._dead += size
+            return previous
+        self._orders[row.client_order_id] = (row, size)
+        self._live += size
+        if previous is not None:
+            self._live -= previous[1]
+            self._dead += previous[1]
+        return previous
+
+    def _put_state(self, key: str, value: str, size: int) -> tuple[str, int] | None:
+        previous = self._state.get(key)
+        self._state[key] = (value, size)
+        self._live += size
+        if previous is not None:
+            self._live -= previous[1]
+            self._dead += previous[1]
+        return previous
+
+    def _add_fill(self, fill: Fill, size: int) -> None:
+        self._fills.append(fill)
+        self._fill_seq[fill.fill_id] = len(self._fills)
+        self._live += size
+        if self._max_ts is None or fill.ts > self._max_ts:
+            self._max_ts = fill.ts
+        _accumulate(self._totals, fill)
+
+    def _rollback(self) -> None:
+        """Undo the open transaction's writes, newest first."""
+        for kind, key, previous, size in reversed(self._undo):
+            if kind == _UPDATE:
+                self._orders[key] = previous
+                self._dead -= size
+                continue
+            self._live -= size
+            if kind == _FILL:
+                fill = self._fills.pop()
+                del self._fill_seq[fill.fill_id]
+                _accumulate(self._totals, fill, undo=True)
+                if fill.ts == self._max_ts:
+                    self._max_ts = max((f.ts for f in self._fills), default=None)
+                continue
+            table = self._orders if kind == _ORDER else self._state
+            if previous is None:
+                del table[key]
+            else:
+                table[key] = previous
+                self._live += previous[1]
+                self._dead -= previous[1]
+
+    # --- write path -------------------------------------------------------- #
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group the writes made inside the block into one atomic record.
+
+        The block's writes (from this thread) are framed as a single batch
+        record when it exits cleanly, and fsynced before the block returns; if
+        it raises, they are undone and nothing is written. Reads from this
+        thread see them as they are made. Nested blocks join the outermost one.
+        Other threads' writes and reads wait until it ends.
+
+        Raises
+        ------
+        StoreWriteError
+            If writing or fsyncing the batch fails.
+
+        """
+        with self._lock:
+            self._check_writable()
+            if self._tx_depth:
+                self._tx_depth += 1
+                try:
+                    yield
+                finally:
+                    self._tx_depth -= 1
+                return
+            self._tx_owner = threading.get_ident()
+            self._tx_depth = 1
+            try:
+                yield
+            except BaseException:
+                self._rollback()
+                raise
+            else:
+                if self._tx_buffer:
+                    self._buffer += _frame(_BATCH, self._tx_buffer)
+                    self._pending += 1
+            finally:
+                self._tx_buffer = bytearray()
+                self._undo = []
+                self._tx_depth = 0
+                self._tx_owner = None
+        self._sync()
+
+    def _append(self, kind: int, payload: bytearray) -> tuple[int, bool]:
+        """Buffer one record (``_lock`` held); return its size and whether to sync."""
+        record = _frame(kind, payload)
+        if self._tx_depth:
+            self._tx_buffer += record
+            return len(record), False
+        self._buffer += record
+        self._pending += 1
+        if self._pending in (1, self._flush_rows):
+            self._cond.notify()
+        return len(record), self._pending >= _BACKLOG * self._flush_rows
+
+    def _check_writable(self) -> None:
+        if self._closed:
+            raise ValueError("the store is closed")
+        self._raise_failed()
+
+    def _raise_failed(self) -> None:
+        if self._error is not None:
+            raise StoreWriteError(
+                f"journal write failed: {self._error}"
+            ) from self._error
+
+    def upsert_order(self, order: Order) -> None:
+        """Record ``order``'s current state as its latest, keyed by ``client_order_id``.
+
+        Appends one order record (only the lifecycle fields when the order's
+        terms are unchanged); the in-memory index then returns this state for
+        the order, stamped with the store's clock (its ``ts``).
+
+        Parameters
+        ----------
+        order : Order
+            The order aggregate to persist (its current snapshot).
+
+        """
+        row = _OrderRow(
+            order.client_order_id,
+            order.venue_order_id,
+            instrument_to_text(order.instrument),
+            order.side,
+            order.type,
+            order.qty,
+            order.limit_price,
+            order.stop_price,
+            order.status,
+            order.filled_qty,
+            order.avg_fill_price,
+            self._clock(),
+        )
+        with self._lock:
+            self._check_writable()
+            entry = self._orders.get(row.client_order_id)
+            kind = _UPDATE if entry and _same_terms(entry[0], row) else _ORDER
+            encode = _encode_update if kind == _UPDATE else _encode_order
+            size, due = self._append(kind, encode(row))
+            previous = self._put_order(row, size, update=kind == _UPDATE)
+            if self._tx_depth:
+                self._undo.append((kind, row.client_order_id, previous, size))
+        if due:
+            self._sync()
+
+    def record_fill(self, fill: Fill) -> None:
+        """Append ``fill`` unless a fill with its ``fill_id`` is already stored.
+
+        Re-recording the same execution is a silent no-op and writes nothing.
+        The stored fill keeps only its instrument's symbol, as in the SQLite
+        store.
+
+        Parameters
+        ----------
+        fill : Fill
+            The broker-confirmed execution to persist.
+
+        """
+        instrument = self._instrument(instrument_to_text(fill.instrument))
+        if fill.instrument != instrument:
+            fill = dataclasses.replace(fill, instrument=instrument)
+        payload = _encode_fill(fill)
+        with self._lock:
+            self._check_writable()
+            if fill.fill_id in self._fill_seq:
+                return
+            size, due = self._append(_FILL, payload)
+            self._add_fill(fill, size)
+            if self._tx_depth:
+                self._undo.append((_FILL, fill.fill_id, None, size))
+        if due:
+            self._sync()
+
+    def set_state(self, key: str, value: str) -> None:
+        """Set the engine-state ``value`` for ``key`` (the latest write wins).
+
+        Parameters
+        ----------
+        key : str
+            The state key.
+        value : str
+            The value to store.
+
+        """
+        payload = _encode_state(key, value)
+        with self._lock:
+            self._check_writable()
+            size, due = self._append(_STATE, payload)
+            previous = self._put_state(key, value, size)
+            if self._tx_depth:
+                self._undo.append((_STATE, key, previous, size))
+        if due:
+            self._sync()
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Block until every write buffered so far is written and fsynced.
+
+        The durability barrier; a no-op inside a :meth:`transaction` of this
+        thread (whose end is the barrier) and on a closed store.
+
+        Parameters
+        ----------
+        timeout : float or None, optional
+            Longest wait in seconds for a write already in progress. ``None``
+            (default) waits as long as it takes.
+
+        Raises
+        ------
+        StoreWriteError
+            If a write failed (now or earlier).
+        TimeoutError
+            If ``timeout`` passed first.
+
+        """
+        if self._tx_owner == threading.get_ident():
+            return
+        self._sync(timeout)
+
+    def _sync(self, timeout: float | None = None) -> None:
+        """Write and fsync the buffer; roll (and maybe compact) a full segment."""
+        if not self._io_lock.acquire(timeout=-1 if timeout is None else timeout):
+            raise TimeoutError(f"journal write still in progress after {timeout}s")
+        try:
+            with self._lock:
+                if self._closed:
+                    return
+                self._raise_failed()
+                data = self._buffer
+                if not data:
+                    return
+                self._buffer = bytearray()
+                self._pending = 0
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(self._fd, view) :]
+                os.fsync(self._fd)
+                self._segment_size += len(data)
+                if self._segment_size >= self._segment_bytes:
+                    self._roll()
+            except OSError as exc:
+                with self._lock:
+                    self._error = exc
+                raise StoreWriteError(f"journal write failed: {exc}") from exc
+        finally:
+            self._io_lock.release()
+
+    def _flush_loop(self) -> None:
+        """The flusher thread: fsync the buffer per size- / time-bounded batch."""
+        cond = self._cond
+        while True:
+            with cond:
+                cond.wait_for(lambda: self._pending or self._stopping)
+                deadline = time.monotonic() + self._flush_interval
+                while self._pending < self._flush_rows and not self._stopping:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    cond.wait(remaining)
+                if self._stopping:
+                    return  # ``close`` writes what is left
+            try:
+                self._sync()
+            except StoreWriteError:
+                return  # recorded; reported by the next write or flush
+
+    # --- segments and compaction ------------------------------------------- #
+
+    def _segment_path(self, n: int) -> pathlib.Path:
+        return self._dir / f"seg-{n:08d}.tbj"
+
+    def _snapshot_path(self, n: int) -> pathlib.Path:
+        return self._dir / f"snap-{n:08d}.tbj"
+
+    def _open_segment(self, n: int) -> int:
+        """Open segment ``n`` for appending, writing its magic if it is new."""
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+        fd = os.open(self._segment_path(n), flags, 0o644)
+        if os.fstat(fd).st_size == 0:
+            os.write(fd, MAGIC)
+            os.fsync(fd)
+            self._fsync_dir()
+        return fd
+
+    def _fsync_dir(self) -> None:
+        """Make the directory's entries (a new or renamed file) durable."""
+        fd = os.open(self._dir, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _roll(self, *, compact: bool = False) -> None:
+        """Start the next segment (``_io_lock`` held) and compact if it pays.
+
+        With ``compact``, compact whatever the superseded records weigh.
+        """
+        os.close(self._fd)
+        self._segment += 1
+        self._fd = self._open_segment(self._segment)
+        self._segment_size = len(MAGIC)
+        with self._lock:
+            due = compact or self._dead >= max(self._live, self._segment_bytes)
+        if due:
+            self._compact(self._segment)
+
+    def archive(self, before: int, *, batch: int = 1000) -> tuple[int, int]:
+        """Compact the log now; no row leaves the store.
+
+        The counterpart of :meth:`SqliteStore.archive
+        <trading_bot.storage.sqlite_store.SqliteStore.archive>`, which moves old
+        rows into month archives to keep its database small. Here the whole
+        history lives in memory (see the module docstring), so nothing moves:
+        the buffer is flushed, the store rolls to a new segment, and the live
+        state is compacted into a snapshot, which drops every superseded
+        record from disk.
+
+        Parameters
+        ----------
+        before : int
+            Accepted for parity with the SQLite store; no row is moved.
+        batch : int, optional
+            Accepted for parity. Defaults to ``1000``.
+
+        Returns
+        -------
+        tuple of int
+            ``(0, 0)``: no order and no fill was moved.
+
+        Raises
+        ------
+        ValueError
+            If the store is closed or ``batch < 1``.
+
+        """
+        if batch < 1:
+            raise ValueError(f"batch must be at least 1, got {batch}")
+        self._sync()
+        with self._io_lock:
+            with self._lock:
+                self._check_writable()
+            self._roll(compact=True)
+        return 0, 0
+
+    def _compact(self, base: int) -> None:
+        """Write the live state as snapshot ``base``; drop what it replaces."""
+        with self._lock:
+            orders = [row for row, _ in self._orders.values()]
+            fills = list(self._fills)
+            state = [(key, value) for key, (value, _) in self._state.items()]
+            self._dead = 0
+        tmp = self._dir / f"snap-{base:08d}.tmp"
+        with tmp.open("wb") as fh:
+            fh.write(MAGIC)
+            for row in orders:
+                fh.write(_frame(_ORDER, _encode_order(row)))
+            for fill in fills:
+                fh.write(_frame(_FILL, _encode_fill(fill)))
+            for key, value in state:
+                fh.write(_frame(_STATE, _encode_state(key, value)))
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, self._snapshot_path(base))
+        self._fsync_dir()
+        for n in self._numbered(_SEGMENT):
+            if n < base:
+                self._segment_path(n).unlink()
+        for n in self._numbered(_SNAPSHOT):
+            if n < base:
+                self._snapshot_path(n).unlink()
+
+    # --- read API ---------------------------------------------------------- #
+
+    def get_order(self, client_order_id: str) -> Order | None:
+        """Return the stored :class:`Order` for ``client_order_id``, or ``None``.
+
+        Rebuilt directly from its latest record, as
+        :meth:`SqliteStore.get_order
+        <trading_bot.storage.sqlite_store.SqliteStore.get_order>` does (the
+        state machine is not replayed).
+        """
+        with self._lock:
+            entry = self._orders.get(client_order_id)
+        return None if entry is None else self._to_order(entry[0])
+
+    def orders(self) -> list[Order]:
+        """Return every stored order, in first-write order."""
+        return list(self.iter_orders())
+
+    def fills(self, since_ms: int | None = None) -> list[Fill]:
+        """Return stored fills, optionally only those at/after ``since_ms``."""
+        return list(self.iter_fills(since=since_ms))
+
+    def iter_fills(
+        self,
+        *,
+        instrument: Instrument | None = None,
+        since: int | None = None,
+        until: int | None = None,
+        after: int = 0,
+        batch: int = 1000,
+    ) -> Iterator[Fill]:
+        """Yield stored fills in insertion order, ``batch`` at a time.
+
+        Takes the parameters of :meth:`SqliteStore.iter_fills
+        <trading_bot.storage.sqlite_store.SqliteStore.iter_fills>`; a fill's
+        rowid here is its 1-based position in the log (compaction keeps it).
+
+        Raises
+        ------
+        ValueError
+            If ``batch < 1``.
+
+        """
+        if batch < 1:
+            raise ValueError(f"batch must be at least 1, got {batch}")
+        text = None if instrument is None else instrument_to_text(instrument)
+        position = after
+        while True:
+            with self._lock:
+                page = self._fills[position : position + batch]
+            for fill in page:
+                if (
+                    (text is None or instrument_to_text(fill.instrument) == text)
+                    and (since is None or fill.ts >= since)
+                    and (until is None or fill.ts < until)
+                ):
+                    yield fill
+            if len(page) < batch:
+                return
+            position += batch
+
+    def iter_orders(
+        self,
+        *,
+        status: OrderStatus | None = None,
+        instrument: Instrument | None = None,
+        since: int | None = None,
+        until: int | None = None,
+        batch: int = 1000,
+    ) -> Iterator[Order]:
+        """Yield stored orders in first-write order.
+
+        Takes the parameters of :meth:`SqliteStore.iter_orders
+        <trading_bot.storage.sqlite_store.SqliteStore.iter_orders>`. The
+        matching orders are picked in one pass; ``batch`` is checked for parity.
+
+        Raises
+        ------
+        ValueError
+            If ``batch < 1``.
+
+        """
+        if batch < 1:
+            raise ValueError(f"batch must be at least 1, got {batch}")
+        text = None if instrument is None else instrument_to_text(instrument)
+        with self._lock:
+            rows = [
+                row
+                for row, _ in self._orders.values()
+                if (status is None or row.status is status)
+                and (text is None or row.instrument == text)
+                and (since is None or row.ts >= since)
+                and (until is None or row.ts < until)
+            ]
+        for row in rows:
+            yield self._to_order(row)
+
+    def orders_to_restore(
+        self, *, window_ms: int, batch: int = 1000
+    ) -> Iterator[Order]:
+        """Yield the live orders and those written in the last ``window_ms``."""
+        if batch < 1:
+            raise ValueError(f"batch must be at least 1, got {batch}")
+        cutoff = self._clock() - window_ms
+        with self._lock:
+            rows = [
+                row
+                for row, _ in self._orders.values()
+                if row.status in _LIVE or row.ts >= cutoff
+            ]
+        for row in rows:
+            yield self._to_order(row)
+
+    def fill_totals(
+        self,
+        *,
+        instrument: Instrument | None = None,
+        since: int | None = None,
+        until: int | None = None,
+        by_day: bool = False,
+    ) -> list[FillTotals]:
+        """Bought / sold quantity and notional and fees, exact ``Decimal``.
+
+        Equal to :meth:`SqliteStore.fill_totals
+        <trading_bot.storage.sqlite_store.SqliteStore.fill_totals>`. Without a
+        time bound the totals are the running ones kept as fills are recorded;
+        with one, the fills are folded on the spot.
+        """
+        text = None if instrument is None else instrument_to_text(instrument)
+        with self._lock:
+            if since is None and until is None:
+                daily = {
+                    key: list(values)
+                    for key, values in self._totals.items()
+                    if text is None or key[0] == text
+                }
+                fills: list[Fill] = []
+            else:
+                daily = {}
+                fills = list(self._fills)
+        for fill in fills:
+            if (
+                (text is None or instrument_to_text(fill.instrument) == text)
+                and (since is None or fill.ts >= since)
+                and (until is None or fill.ts < until)
+            ):
+                _accumulate(daily, fill)
+        totals: dict[tuple[str, str | None], list[Any]] = {}
+        for (symbol, day), values in daily.items():
+            key = (symbol, day if by_day else None)
+            merged = totals.get(key)
+            if merged is None:
+                totals[key] = values
+                continue
+            merged[0] += values[0]
+            for i in range(1, 6):
+                merged[i] = _EXACT.add(merged[i], values[i])
+        return [
+            FillTotals(
+                instrument_from_text(key[0]),
+                key[1],
+                values[0],
+                *(_trimmed(value) for value in values[1:]),
+            )
+            for key, values in sorted(
+                totals.items(), key=lambda item: (item[0][0], item[0][1] or "")
+            )
+        ]
+
+    def fill_watermark(self) -> tuple[int, int | None]:
+        """The newest fill's rowid (its position) and the latest fill ``ts``."""
+        with self._lock:
+            return len(self._fills), self._max_ts
+
+    def fill_ids(self, *, since: int, upto: int | None = None) -> list[str]:
+        """Ids of the stored fills with ``ts >= since`` (and ``rowid <= upto``)."""
+        with self._lock:
+            fills = self._fills if upto is None else self._fills[:upto]
+            return [fill.fill_id for fill in fills if fill.ts >= since]
+
+    def get_state(self, key: str) -> str | None:
+        """Return the stored value for ``key``, or ``None`` if the key is unknown."""
+        with self._lock:
+            entry = self._state.get(key)
+        return None if entry is None else entry[0]
+
+    def iter_rows(
+        self,
+        table: str,
+        *,
+        after: int = 0,
+        since: int | None = None,
+        batch: int = 1000,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield a table's rows as primitives keyed by column, for exporters.
+
+        Takes the parameters of :meth:`SqliteStore.iter_rows
+        <trading_bot.storage.sqlite_store.SqliteStore.iter_rows>` and yields its
+        columns (money as ``str(Decimal)``, enums by value, no scaled
+        integers), plus ``_rowid``: the row's 1-based position in first-write
+        order.
+
+        Raises
+        ------
+        ValueError
+            If ``table`` is unknown, ``since`` is given for ``state``, or
+            ``batch < 1``.
+
+        """
+        if table not in ("orders", "fills", "state"):
+            raise ValueError(f"unknown table {table!r}")
+        if since is not None and table == "state":
+            raise ValueError("the state table has no ts column")
+        if batch < 1:
+            raise ValueError(f"batch must be at least 1, got {batch}")
+        return self._rows(table, after, since, batch)
+
+    def _rows(
+        self, table: str, after: int, since: int | None, batch: int
+    ) -> Iterator[dict[str, Any]]:
+        if table == "fills":
+            position = after
+            while True:
+                with self._lock:
+                    page = self._fills[position : position + batch]
+                for rowid, fill in enumerate(page, position + 1):
+                    if since is None or fill.ts >= since:
+                        yield _fill_columns(rowid, fill)
+                if len(page) < batch:
+                    return
+                position += batch
+        with self._lock:
+            if table == "orders":
+                rows = [
+                    _order_columns(rowid, row)
+                    for rowid, (row, _) in enumerate(self._orders.values(), 1)
+                    if rowid > after and (since is None or row.ts >= since)
+                ]
+            else:
+                rows = [
+                    {"_rowid": rowid, "key": key, "value": value}
+                    for rowid, (key, (value, _)) in enumerate(self._state.items(), 1)
+                    if rowid > after
+                ]
+        yield from rows
+
+    def _to_order(self, row: _OrderRow) -> Order:
+        """Rebuild an :class:`Order` from its row, lifecycle fields set directly."""
+        order = Order(
+            client_order_id=row.client_order_id,
+            instrument=self._instrument(row.instrument),
+            side=row.side,
+            qty=row.qty,
+            type=row.type,
+            limit_price=row.limit_price,
+            stop_price=row.stop_price,
+        )
+        order.filled_qty = row.filled_qty
+        order.avg_fill_price = row.avg_fill_price
+        order.status = row.status
+        order.venue_order_id = row.venue_order_id
+        return order
+
+    # --- bus integration --------------------------------------------------- #
+
+    def attach(self, event_bus: EventBus) -> None:
+        """Subscribe the store to ``event_bus`` so it fills from the event stream.
+
+        Routes :class:`~trading_bot.application.events.OrderEvent` to
+        :meth:`upsert_order` and :class:`~trading_bot.application.events.
+        FillEvent` to :meth:`record_fill`, as a *critical* subscriber, exactly
+        like :meth:`SqliteStore.attach
+        <trading_bot.storage.sqlite_store.SqliteStore.attach>`.
+
+        Parameters
+        ----------
+        event_bus : EventBus
+            The bus to subscribe to.
+
+        """
+        from trading_bot.application.events import FillEvent, OrderEvent
+
+        def _on_event(event: Event) -> None:
+            if isinstance(event, OrderEvent):
+                self.upsert_order(event.order)
+            elif isinstance(event, FillEvent):
+                self.record_fill(event.fill)
+
+        event_bus.subscribe(
+            _on_event,
+            types=(OrderEvent, FillEvent),
+            critical=True,
+            name="JournalStore",
+        )
+
+    # --- lifecycle --------------------------------------------------------- #
+
+    def close(self) -> None:
+        """Write and fsync what is buffered, then close the log.
+
+        Idempotent. Any later write raises :class:`ValueError`.
+
+        Raises
+        ------
+        StoreWriteError
+            If a write failed; the store is closed regardless.
+
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join()
+        try:
+            self._sync()
+        finally:
+            with self._io_lock, self._lock:
+                if not self._closed:
+                    self._closed = True
+                    os.close(self._fd)
+
+    def __enter__(self) -> JournalStore:
+        """Enter the runtime context, returning the store."""
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        """Exit the runtime context, closing the store."""
+        self.close()
@@ -0,0 +1,154 @@
+"""Scaled-integer money — exact ``Decimal`` values as SQLite ``INTEGER`` columns.
+
+:class:`~trading_bot.storage.sqlite_store.SqliteStore` keeps every money column as
+``str(Decimal)`` TEXT, which is exact but opaque to SQL: summing a year of fees
+meant reading every row back into Python. Alongside the TEXT it now also stores
+each fill's quantity, price, fee and notional as an integer count of
+``10**-scale`` units, so ``SUM`` / ``GROUP BY`` run inside SQLite.
+
+Exactness rules (carried into the ADR)
+--------------------------------------
+* **The TEXT stays the truth.** A value is stored as an integer only when that is
+  exact: ``value * 10**scale`` is a whole number and fits a signed 64-bit
+  integer. Otherwise its integer column is ``NULL``, and an aggregate folds that
+  row from its TEXT in Python instead. A result is never rounded.
+* **One scale per instrument and column,** fixed by the first fill of the
+  instrument the store sees (:func:`scales_for`). The instrument's venue
+  precision wins when it is known. Otherwise the scale is the first value's own
+  decimal places, but never less than :data:`MIN_SCALES`. Notional
+  (``qty * price``) uses ``qty + price`` places, so it is exact whenever both
+  factors are.
+* **Sums cannot overflow.** SQLite's ``SUM`` of 64-bit integers raises on
+  overflow. Each column is summed in two halves, ``x / SPLIT`` and
+  ``x % SPLIT`` (:data:`SPLIT` is ``10**9``), and recombined in Python
+  (:func:`from_split`). Both halves stay far inside 64 bits for any realistic
+  row count.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+
+from trading_bot.domain.fill import Fill
+
+__all__ = [
+    "MIN_SCALES",
+    "SPLIT",
+    "Scales",
+    "from_scaled",
+    "from_split",
+    "scales_for",
+    "to_scaled",
+]
+
+#: Largest magnitude a SQLite ``INTEGER`` holds.
+_INT64_MAX = 2**63 - 1
+
+#: The divisor the split sums use (see the module docstring).
+SPLIT = 10**9
+
+#: The fewest decimal places each column gets when the venue precision is unknown.
+MIN_SCALES = {"qty": 8, "price": 2, "fee": 8}
+
+
+@dataclass(frozen=True, slots=True)
+class Scales:
+    """Decimal places of one instrument's scaled-integer columns.
+
+    Parameters
+    ----------
+    qty, price, fee : int
+        Places of the quantity, price and fee columns.
+
+    """
+
+    qty: int
+    price: int
+    fee: int
+
+    @property
+    def notional(self) -> int:
+        """Places of the notional column: those of ``qty * price``."""
+        return self.qty + self.price
+
+
+def _places(value: Decimal) -> int:
+    """The decimal places ``value`` is written with (``0`` for an integer)."""
+    exponent = value.as_tuple().exponent
+    return -exponent if isinstance(exponent, int) and exponent < 0 else 0
+
+
+def scales_for(fill: Fill) -> Scales:
+    """Choose the column scales for ``fill``'s instrument from its first fill.
+
+    The instrument's ``qty_precision`` / ``price_precision`` are used when set;
+    otherwise the fill's own places, floored at :data:`MIN_SCALES`. The fee
+    always uses its own places, floored the same way.
+    """
+    instrument = fill.instrument
+    qty = instrument.qty_precision
+    price = instrument.price_precision
+    return Scales(
+        qty=qty if qty is not None else max(MIN_SCALES["qty"], _places(fill.qty)),
+        price=(
+            price
+            if price is not None
+            else max(MIN_SCALES["price"], _places(fill.price))
+        ),
+        fee=max(MIN_SCALES["fee"], _places(fill.fee)),
+    )
+
+
+def to_scaled(value: Decimal, scale: int) -> int | None:
+    """``value`` as a count of ``10**-scale`` units, or ``None`` if inexact.
+
+    Integer arithmetic only; no :mod:`decimal` context rounding is involved.
+    ``None`` when ``value`` has more than ``scale`` significant places, is not
+    finite, or does not fit a signed 64-bit integer.
+
+    Examples
+    --------
+    >>> to_scaled(Decimal("30000.10"), 2)
+    3000010
+    >>> to_scaled(Decimal("0.123"), 2) is None
+    True
+
+    """
+    sign, digits, exponent = value.as_tuple()
+    if not isinstance(exponent, int):
+        return None
+    units = int("".join(map(str, digits)) or "0")
+    shift = exponent + scale
+    if shift >= 0:
+        units *= 10**shift
+    else:
+        units, remainder = divmod(units, 10**-shift)
+        if remainder:
+            return None
+    if sign:
+        units = -units
+    return units if -_INT64_MAX - 1 <= units <= _INT64_MAX else None
+
+
+def from_scaled(units: int, scale: int) -> Decimal:
+    """The exact ``Decimal`` for ``units`` of ``10**-scale``, trailing zeros cut.
+
+    Examples
+    --------
+    >>> from_scaled(3000010, 2)
+    Decimal('30000.1')
+
+    """
+    while scale > 0 and units % 10 == 0:
+        units //= 10
+        scale -= 1
+    return Decimal(f"{units}E-{scale}")
+
+
+def from_split(high: int | None, low: int | None, scale: int) -> Decimal:
+    """Recombine a split sum (``SUM(x / SPLIT)``, ``SUM(x % SPLIT)``) exactly.
+
+    ``None`` halves (a ``SUM`` over no rows) count as zero.
+    """
+    return from_scaled((high or 0) * SPLIT + (low or 0), scale)
@@ -3,10 +3,10 @@
 This is the persistence layer's single store: a stdlib-:mod:`sqlite3`,
 WAL-mode database recording everything the engine has *seen* and *done* — the
 **reconciliation source** (on restart the engine reconciles its local view
-against the broker's truth, but this store holds what it last knew). It mirrors
-dccd's ``storage/runs_sqlite.py`` pattern (WAL pragma, ``row_factory =
-sqlite3.Row``, a ``_conn`` context manager opening a fresh connection per
-operation, ``CREATE TABLE IF NOT EXISTS`` on init, parametrised SQL).
+against the broker's truth, but this store holds what it last knew). It started
+from dccd's ``storage/runs_sqlite.py`` pattern (WAL pragma, ``row_factory =
+sqlite3.Row``, ``CREATE TABLE IF NOT EXISTS`` on init, parametrised SQL) but
+holds its connections open rather than opening one per operation.
 
 It speaks **domain types** at its boundary: writes accept
 :class:`~trading_bot.domain.order.Order` / :class:`~trading_bot.domain.fill.Fill`
@@ -22,7 +22,10 @@ Design choices (carried into the ADR)
   :func:`~trading_bot.domain.money.money` on read is exact and round-trips
   losslessly. Enums are stored by ``.value`` and rebuilt via their constructor;
   the :class:`~trading_bot.domain.instrument.Symbol` is stored as its ``BASE/QUOTE``
-  string and split back on ``"/"``.
+  string and split back on ``"/"``. Fills also carry scaled-integer copies of
+  their money (``qty_i``, ``price_i``, ``fee_i``, ``notional_i``, per-instrument
+  scales in the ``scales`` table; see :mod:`~trading_bot.storage.scaled`), so
+  :meth:`SqliteStore.fill_totals` aggregates inside SQLite, still exactly.
 
 * **Orders are UPSERTed; fills are append-only.** An order is a *stateful
   aggregate*: its row is keyed by ``client_order_id`` and an
@@ -39,11 +42,64 @@ Design choices (carried into the ADR)
   The persisted row *is* the truth; replaying ``submit -> open -> apply_fill``
   would re-derive (and could disagree with) what the engine actually recorded.
 
-* **A fresh connection per operation.** Like dccd, every public method opens its
-  own connection through the :meth:`_conn` context manager. This keeps the store
-  trivially safe for the test usage (and for being shared across threads, since
-  no connection is held), at the cost of per-call connection overhead — fine for
-  an order/fill history written at human/venue rates.
+* **Long-lived connections: one writer, one reader per thread.** A fresh
+  ``sqlite3.connect`` per call paid the open/close syscalls, the pragma setup and
+  a cold page cache on every single write (~1k writes/s). The store now holds one
+  writer connection for its lifetime, serialised by a lock, and hands each
+  thread that reads its own reader connection (WAL lets readers run beside the
+  writer, so executor-based reads never wait on a commit). Every connection
+  keeps ``sqlite3``'s prepared-statement cache, so the fixed SQL below is
+  compiled once per connection, not once per call. An in-memory database has a
+  single connection, so its reads go through the writer.
+
+* **Explicit transactions.** Connections run in autocommit mode and every write
+  is wrapped in ``BEGIN IMMEDIATE ... COMMIT`` (``ROLLBACK`` on error) by the
+  store itself — never by :mod:`sqlite3`'s implicit transaction handling.
+  :meth:`SqliteStore.transaction` opens one around several writes so they
+  commit together (one fsync instead of one per row); the writes join it, and
+  reads from the same thread see its uncommitted rows.
+
+* **Write-behind, opt-in.** Even on a held connection, one commit per event puts
+  a journal write on the order path, since :meth:`attach` writes straight from
+  ``EventBus.emit``. With ``write_behind=True`` a write only appends to an
+  in-memory queue; a dedicated writer thread commits the queue in batches, one
+  transaction per ``flush_rows`` rows or per ``flush_interval`` seconds, whichever
+  comes first (runs of the same statement go through ``executemany``).
+  :meth:`SqliteStore.flush` is the durability barrier: it returns once every
+  write queued before it is committed. Callers flush before they rely on a row
+  surviving a crash (the router before it drops archived orders from memory,
+  the run before it reports). Reads flush first, so a thread always reads its
+  own writes. A write that was never flushed may be lost in a crash, and a
+  failed batch is reported as :class:`StoreWriteError` by the next flush.
+
+* **History is read in pages, by key.** :meth:`SqliteStore.iter_fills` and
+  :meth:`SqliteStore.iter_orders` yield rows in insertion order, ``batch`` at a
+  time, each page a fresh ``WHERE rowid > ? ... LIMIT ?`` query (keyset
+  pagination). No page re-scans the rows before it, and no read transaction stays
+  open between pages, so a long export never blocks a WAL checkpoint. Orders are
+  stamped with the time of their latest write (``ts``, ms UTC) and indexed on
+  ``status``, ``instrument`` and ``ts``; fills on ``ts`` and ``instrument``. That
+  lets :meth:`SqliteStore.orders_to_restore` load only the orders a restart needs
+  (the live ones plus the recently touched ones), whatever the history length.
+
+* **Month archives, opt-in.** A long-running daemon would keep every order and
+  fill in one file that outgrows the page cache. With ``archive_after`` set, an
+  archiver thread moves terminal orders and fills older than that into one
+  SQLite database per UTC month (``<db>.archive/YYYY-MM.db``, same tables,
+  same rowids), then hands the freed pages back with an incremental vacuum.
+  Live orders, ``state`` and ``scales`` always stay hot. The ids of the moved
+  rows stay too (``archived_orders``, ``archived_fills``), so writing an
+  archived order or fill again adds no second copy. Reads span the archives
+  transparently: point lookups fall back to the month the
+  ``archived_orders`` index names, paged reads merge them by rowid, and
+  :meth:`SqliteStore.fill_totals` adds up each database's sums. Reads with a
+  ``ts`` bound skip the months outside it. A move copies a batch and then
+  deletes it, with the batch noted in ``state`` in between. A crash mid-move
+  therefore leaves a note, and the next open redoes the move. Reads that span
+  databases hold off moves while they query, so no row is seen twice or
+  missed. New databases are created with incremental auto-vacuum; an older
+  file is converted once, offline, by
+  :meth:`SqliteStore.enable_incremental_vacuum` (``trading-bot vacuum``).
 
 Optionally, :meth:`attach` subscribes the store to an
 :class:`~trading_bot.application.events.EventBus` so it fills itself from the
@@ -53,13 +109,26 @@ engine's event stream (``OrderEvent -> upsert_order``,
 
 from __future__ import annotations
 
+import collections
+import datetime
+import heapq
+import itertools
+import json
+import logging
 import pathlib
+import re
 import sqlite3
-from contextlib import contextmanager
-from typing import TYPE_CHECKING, Generator
-
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from trading_bot.domain.errors import TradingBotError
 from trading_bot.domain.fill import Fill
-from trading_bot.domain.instrument import Instrument, Symbol
+from trading_bot.domain.instrument import Instrument
 from trading_bot.domain.money import money
 from trading_bot.domain.order import (
     Order,
@@ -67,16 +136,29 @@ from trading_bot.domain.order import (
     OrderStatus,
     OrderType,
 )
+from trading_bot.storage._common import (
+    LIVE_STATUSES,
+    instrument_from_text,
+    instrument_to_text,
+    now_ms,
+)
+from trading_bot.storage.scaled import (
+    SPLIT,
+    Scales,
+    from_split,
+    scales_for,
+    to_scaled,
+)
 
 if TYPE_CHECKING:
     from trading_bot.application.events import Event, EventBus
 
-__all__ = ["SqliteStore"]
+__all__ = ["FillTotals", "SqliteStore", "StoreWriteError"]
 
-_SCHEMA = """
-PRAGMA journal_mode=WAL;
-PRAGMA synchronous=NORMAL;
+logger = logging.getLogger(__name__)
 
+# The history tables, shared by the hot database and its month archives.
+_HISTORY = """
 CREATE TABLE IF NOT EXISTS orders (
     client_order_id TEXT PRIMARY KEY,
     venue_order_id  TEXT,
@@ -100,33 +182,205 @@ CREATE TABLE IF NOT EXISTS fills (
     qty             TEXT NOT NULL,
     price           TEXT NOT NULL,
     fee             TEXT NOT NULL,
-    ts              INTEGER NOT NULL
+    ts              INTEGER NOT NULL,
+    qty_i           INTEGER,
+    price_i         INTEGER,
+    fee_i           INTEGER,
+    notional_i      INTEGER
 );
 
+CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status);
+CREATE INDEX IF NOT EXISTS idx_orders_instrument ON orders(instrument);
+CREATE INDEX IF NOT EXISTS idx_orders_ts ON orders(ts);
+
 CREATE INDEX IF NOT EXISTS idx_fills_ts ON fills(ts);
 CREATE INDEX IF NOT EXISTS idx_fills_cid ON fills(client_order_id);
+CREATE INDEX IF NOT EXISTS idx_fills_instrument ON fills(instrument);
+"""
+
+_SCHEMA = f"""
+PRAGMA auto_vacuum=INCREMENTAL;
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+{_HISTORY}
+CREATE TABLE IF NOT EXISTS scales (
+    instrument TEXT PRIMARY KEY,
+    qty        INTEGER NOT NULL,
+    price      INTEGER NOT NULL,
+    fee        INTEGER NOT NULL
+);
 
 CREATE TABLE IF NOT EXISTS state (
     key   TEXT PRIMARY KEY,
     value TEXT
 );
+
+CREATE TABLE IF NOT EXISTS archived_orders (
+    client_order_id TEXT PRIMARY KEY,
+    month           TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS archived_fills (
+    fill_id TEXT PRIMARY KEY,
+    month   TEXT NOT NULL
+) WITHOUT ROWID;
 """
 
+_ARCHIVE_SCHEMA = f"""
+PRAGMA journal_mode=WAL;
+{_HISTORY}
+"""
 
-def _instrument_to_text(instrument: Instrument) -> str:
-    """Render an instrument to its ``BASE/QUOTE`` symbol string for storage."""
-    return str(instrument.symbol)
+#: Columns copied into a month archive, per archived table.
+_COLUMNS = {
+    "orders": "client_order_id, venue_order_id, instrument, side, type, qty,"
+    " limit_price, stop_price, status, filled_qty, avg_fill_price, ts",
+    "fills": "fill_id, client_order_id, instrument, side, qty, price, fee, ts,"
+    " qty_i, price_i, fee_i, notional_i",
+}
+
+#: Per archived table: the hot index of its archived keys, and the key column.
+_ARCHIVE_INDEX = {
+    "orders": ("archived_orders", "client_order_id"),
+    "fills": ("archived_fills", "fill_id"),
+}
+
+#: The ``state`` key of an archive move in progress (redone on the next open).
+_ARCHIVE_PENDING = "storage.archive_pending"
+#: A month archive's file name: ``YYYY-MM.db``.
+_ARCHIVE_NAME = re.compile(r"(\d{4})-(\d{2})\.db")
+
+# An order or fill already moved to a month archive is not written again: the
+# archive's copy stays the only one (an archived order is terminal, a fill
+# immutable).
+_UPSERT_ORDER = """
+INSERT INTO orders (
+    client_order_id, venue_order_id, instrument, side, type,
+    qty, limit_price, stop_price, status, filled_qty,
+    avg_fill_price, ts
+) SELECT ?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10, ?11, ?12
+WHERE NOT EXISTS (SELECT 1 FROM archived_orders WHERE client_order_id = ?1)
+ON CONFLICT(client_order_id) DO UPDATE SET
+    venue_order_id = excluded.venue_order_id,
+    instrument     = excluded.instrument,
+    side           = excluded.side,
+    type           = excluded.type,
+    qty            = excluded.qty,
+    limit_price    = excluded.limit_price,
+    stop_price     = excluded.stop_price,
+    status         = excluded.status,
+    filled_qty     = excluded.filled_qty,
+    avg_fill_price = excluded.avg_fill_price,
+    ts             = excluded.ts
+"""
 
+_ORDER_COLUMNS = (
+    "client_order_id", "venue_order_id", "instrument", "side", "type",
+    "qty", "limit_price", "stop_price", "status", "filled_qty",
+    "avg_fill_price", "ts",
+)
 
-def _instrument_from_text(text: str) -> Instrument:
-    """Rebuild an :class:`Instrument` from a ``BASE/QUOTE`` symbol string.
+_INSERT_FILL = """
+INSERT OR IGNORE INTO fills (
+    fill_id, client_order_id, instrument, side, qty, price, fee, ts,
+    qty_i, price_i, fee_i, notional_i
+) SELECT ?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10, ?11, ?12
+WHERE NOT EXISTS (SELECT 1 FROM archived_fills WHERE fill_id = ?1)
+"""
 
-    Trading metadata (``price_precision`` / ``qty_precision``) is *not*
-    persisted — it belongs to the venue's instrument catalogue, not the
-    order/fill history — so the rebuilt instrument carries only its symbol.
+_INSERT_SCALES = """
+INSERT OR IGNORE INTO scales (instrument, qty, price, fee) VALUES (?, ?, ?, ?)
+"""
+
+#: The scaled-integer fill columns, added in place to a database that predates them.
+_SCALED_COLUMNS = ("qty_i", "price_i", "fee_i", "notional_i")
+
+_SET_STATE = """
+INSERT INTO state (key, value) VALUES (?, ?)
+ON CONFLICT(key) DO UPDATE SET value = excluded.value
+"""
+
+
+class _Archive(NamedTuple):
+    """One month archive: rows with ``start <= ts < end`` (ms UTC)."""
+
+    month: str
+    path: pathlib.Path
+    start: int
+    end: int
+
+
+def _month_of(ts: int) -> tuple[str, int, int]:
+    """The UTC month holding ``ts``: its ``YYYY-MM`` name and ms bounds."""
+    day = datetime.datetime.fromtimestamp(ts / 1000, datetime.UTC)
+    return _month(day.year, day.month)
+
+
+def _month_parts(year: str, month: str) -> tuple[str, int, int]:
+    """``_month`` of a ``YYYY``, ``MM`` pair."""
+    return _month(int(year), int(month))
+
+
+def _month(year: int, month: int) -> tuple[str, int, int]:
+    first = datetime.datetime(year, month, 1, tzinfo=datetime.UTC)
+    after = datetime.datetime(
+        year + month // 12, month % 12 + 1, 1, tzinfo=datetime.UTC
+    )
+    return (
+        f"{year:04d}-{month:02d}",
+        int(first.timestamp()) * 1000,
+        int(after.timestamp()) * 1000,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class FillTotals:
+    """Aggregate fill figures for one instrument (and day), exact ``Decimal``.
+
+    Parameters
+    ----------
+    instrument : Instrument
+        The instrument (symbol only).
+    day : str or None
+        The UTC day (``YYYY-MM-DD``) for per-day totals, else ``None``.
+    fills : int
+        How many fills were aggregated.
+    bought, sold : Decimal
+        Base quantity bought / sold.
+    buy_notional, sell_notional : Decimal
+        Quote notional (``qty * price``) bought / sold.
+    fees : Decimal
+        Fees paid, in quote units.
+
+    """
+
+    instrument: Instrument
+    day: str | None
+    fills: int
+    bought: Decimal
+    sold: Decimal
+    buy_notional: Decimal
+    sell_notional: Decimal
+    fees: Decimal
+
+    @property
+    def net_qty(self) -> Decimal:
+        """Signed net position change (``bought - sold``)."""
+        return self.bought - self.sold
+
+    @property
+    def volume(self) -> Decimal:
+        """Traded notional, both sides."""
+        return self.buy_notional + self.sell_notional
+
+
+class StoreWriteError(TradingBotError):
+    """A write-behind batch failed to commit.
+
+    Raised by :meth:`SqliteStore.flush` (and by every later write or flush) once
+    the writer thread could not commit a batch; the batch's rows are lost. The
+    original :mod:`sqlite3` error is chained as ``__cause__``.
     """
-    base, quote = text.split("/", 1)
-    return Instrument(Symbol(base, quote))
 
 
 class SqliteStore:
@@ -144,8 +398,36 @@ class SqliteStore:
     db_path : str or pathlib.Path
         Path to the SQLite database file. Created if absent; parent directories
         are created too. Use ``":memory:"`` for an ephemeral in-memory store
-        (note: with a fresh connection per op, an in-memory DB does not persist
-        across operations — use a file path for anything real).
+        (it lives as long as the store; reads share the writer connection).
+    cached_statements : int, optional
+        Size of each connection's prepared-statement cache. Defaults to
+        ``128``, far more than the store's distinct statements.
+    write_behind : bool, optional
+        Queue writes and commit them in batches from a writer thread (see the
+        module docstring). Defaults to ``False``: every write commits before it
+        returns.
+    flush_rows : int, optional
+        Most rows per write-behind batch. Defaults to ``500``.
+    flush_interval : float, optional
+        Longest time (seconds) a queued write waits for its batch to fill.
+        Defaults to ``0.02``.
+    clock : Callable[[], int], optional
+        Milliseconds since the Unix epoch, stamped on each order write (the
+        ``ts`` column). Defaults to the wall clock.
+    archive_after : int or None, optional
+        Age (ms, by ``clock``) past which terminal orders and fills move to the
+        month archives, from an archiver thread (see :meth:`archive`). ``None``
+        (default) archives nothing. Archives already on disk are read either
+        way.
+    archive_interval : float, optional
+        Seconds between the archiver's passes. Defaults to ``3600``.
+
+    Raises
+    ------
+    ValueError
+        If ``flush_rows < 1``, ``flush_interval < 0``, ``archive_after < 0``,
+        ``archive_interval <= 0``, or ``archive_after`` is given for an
+        in-memory store.
 
     Examples
     --------
@@ -162,26 +444,374 @@ class SqliteStore:
 
     """
 
-    def __init__(self, db_path: str | pathlib.Path) -> None:
+    def __init__(
+        self,
+        db_path: str | pathlib.Path,
+        *,
+        cached_statements: int = 128,
+        write_behind: bool = False,
+        flush_rows: int = 500,
+        flush_interval: float = 0.02,
+        clock: Callable[[], int] = now_ms,
+        archive_after: int | None = None,
+        archive_interval: float = 3600.0,
+    ) -> None:
+        if flush_rows < 1:
+            raise ValueError(f"flush_rows must be at least 1, got {flush_rows}")
+        if flush_interval < 0:
+            raise ValueError(f"flush_interval must be >= 0, got {flush_interval}")
+        if archive_after is not None and archive_after < 0:
+            raise ValueError(f"archive_after must be >= 0, got {archive_after}")
+        if archive_interval <= 0:
+            raise ValueError(
+                f"archive_interval must be positive, got {archive_interval}"
+            )
         self._path = pathlib.Path(db_path)
-        if str(self._path) != ":memory:":
+        self._memory = str(self._path) == ":memory:"
+        if self._memory and archive_after is not None:
+            raise ValueError("an in-memory store has no month archives")
+        if not self._memory:
             self._path.parent.mkdir(parents=True, exist_ok=True)
-        with self._conn() as conn:
-            conn.executescript(_SCHEMA)
+        self._cached_statements = cached_statements
+        self._clock = clock
+        # The writer (and, in memory, the only) connection; ``_lock`` serialises
+        # its use across threads and is held for a whole transaction.
+        self._lock = threading.RLock()
+        self._writer = self._connect()
+        self._tx_owner: int | None = None
+        self._tx_depth = 0
+        # One reader per thread, created on first read; kept for ``close``.
+        # ``_reading`` counts reads in flight on them, so ``close`` waits for
+        # those to finish before closing another thread's connection.
+        self._local = threading.local()
+        self._readers: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Condition(threading.Lock())
+        self._reading = 0
+        self._closed = False
+        self._writer.executescript(_SCHEMA)
+        # Cache of the ``scales`` table (per-instrument scaled-integer places).
+        self._scales: dict[str, Scales] = {}
+        self._migrate()
+        # Month archives, oldest first; replaced (never mutated) when one is added.
+        self._archive_dir = self._path.with_suffix(".archive")
+        self._archives: list[_Archive] = [] if self._memory else self._scan_archives()
+        self._resume_archive()
+        self._index_archives()
+        self._vacuum_warned = False
+        # Write-behind: ``_queued`` / ``_committed`` count rows ever queued /
+        # settled, so a flush waits for the count it saw when it was called.
+        self._flush_rows = flush_rows
+        self._flush_interval = flush_interval
+        self._pending: collections.deque[tuple[str, tuple[object, ...]]] = (
+            collections.deque()
+        )
+        self._cond = threading.Condition()
+        # Order rows still on the queue (id -> (queue position, row)), so a
+        # point lookup sees them without waiting for their commit.
+        self._queued_orders: dict[str, tuple[int, tuple[object, ...]]] = {}
+        self._queued = 0
+        self._committed = 0
+        self._urgent = 0
+        self._stopping = False
+        self._error: BaseException | None = None
+        self._thread: threading.Thread | None = None
+        if write_behind:
+            self._thread = threading.Thread(
+                target=self._write_loop, name="SqliteStore-writer", daemon=True
+            )
+            self._thread.start()
+        self._archive_after = archive_after
+        self._archive_interval = archive_interval
+        self._archive_stop = threading.Event()
+        # Held across each archive move and by readers spanning the archives.
+        self._moving = threading.Lock()
+        self._archiver: threading.Thread | None = None
+        if archive_after is not None:
+            self._archiver = threading.Thread(
+                target=self._archive_loop, name="SqliteStore-archiver", daemon=True
+            )
+            self._archiver.start()
+
+    @property
+    def write_behind(self) -> bool:
+        """Whether writes are queued and committed by a writer thread."""
+        return self._thread is not None
+
+    def _migrate(self) -> None:
+        """Add and backfill the scaled-integer columns of an older database."""
+        conn = self._writer
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(fills)")}
+        missing = [name for name in _SCALED_COLUMNS if name not in columns]
+        with self._write() as conn:
+            for name in missing:
+                conn.execute(f"ALTER TABLE fills ADD COLUMN {name} INTEGER")
+            if missing:
+                rows = conn.execute("SELECT * FROM fills ORDER BY rowid").fetchall()
+                for row in rows:
+                    fill = _row_to_fill(row)
+                    scales = self._load_scales(conn, row["instrument"])
+                    if scales is None:
+                        scales = self._fix_scales(conn, fill)
+                    conn.execute(
+                        "UPDATE fills SET qty_i = ?, price_i = ?, fee_i = ?,"
+                        " notional_i = ? WHERE fill_id = ?",
+                        (*_scaled_row(fill, scales), fill.fill_id),
+                    )
+
+    def _scales_of(self, fill: Fill) -> Scales:
+        """The scales of ``fill``'s instrument, fixing them on its first fill."""
+        scales = self._scales.get(instrument_to_text(fill.instrument))
+        if scales is None:
+            with self._write() as conn:
+                scales = self._fix_scales(conn, fill)
+        return scales
+
+    def _fix_scales(self, conn: sqlite3.Connection, fill: Fill) -> Scales:
+        """Persist the scales for ``fill``'s instrument unless already set.
+
+        The first writer wins, across processes too: whatever the table holds
+        after the ``INSERT OR IGNORE`` is what this store uses.
+        """
+        key = instrument_to_text(fill.instrument)
+        chosen = scales_for(fill)
+        conn.execute(_INSERT_SCALES, (key, chosen.qty, chosen.price, chosen.fee))
+        scales = self._load_scales(conn, key)
+        assert scales is not None
+        return scales
+
+    def _load_scales(self, conn: sqlite3.Connection, key: str) -> Scales | None:
+        """Read (and cache) an instrument's scales; ``None`` if it has none yet."""
+        scales = self._scales.get(key)
+        if scales is None:
+            row = conn.execute(
+                "SELECT qty, price, fee FROM scales WHERE instrument = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                scales = self._scales[key] = Scales(
+                    row["qty"], row["price"], row["fee"]
+                )
+        return scales
+
+    def _connect(self, path: pathlib.Path | None = None) -> sqlite3.Connection:
+        """Open one connection: autocommit, ``sqlite3.Row`` rows, any thread."""
+        conn = sqlite3.connect(
+            str(self._path if path is None else path),
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=self._cached_statements,
+        )
+        conn.row_factory = sqlite3.Row
+        # ``journal_mode`` is stored in the file; ``synchronous`` is per connection.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
 
     @contextmanager
-    def _conn(self) -> Generator[sqlite3.Connection, None, None]:
-        """Yield a fresh connection (``sqlite3.Row`` rows), commit or rollback."""
-        conn = sqlite3.connect(str(self._path))
-        conn.row_factory = sqlite3.Row
+    def transaction(self) -> Iterator[None]:
+        """Group the writes made inside the block into one transaction.
+
+        Opens ``BEGIN IMMEDIATE`` on the writer connection, commits on a clean
+        exit and rolls back if the block raises. Writes (from this thread)
+        inside the block join it rather than committing one by one, and reads
+        from this thread see its uncommitted rows. Nested blocks join the
+        outermost one. Other threads' writes wait until it ends.
+
+        In write-behind mode the queue is flushed first and the block's writes
+        bypass it: the block is its own batch, committed when it ends.
+
+        Raises
+        ------
+        sqlite3.ProgrammingError
+            If the store is closed.
+        StoreWriteError
+            If flushing the write-behind queue fails.
+
+        Examples
+        --------
+        >>> with store.transaction():  # doctest: +SKIP
+        ...     for fill in fills:
+        ...         store.record_fill(fill)
+
+        """
+        self.flush()
+        with self._write():
+            yield
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Yield the writer inside a transaction (joining an open one)."""
+        with self._lock:
+            self._check_open()
+            conn = self._writer
+            if self._tx_depth:
+                self._tx_depth += 1
+                try:
+                    yield conn
+                finally:
+                    self._tx_depth -= 1
+                return
+            conn.execute("BEGIN IMMEDIATE")
+            self._tx_owner = threading.get_ident()
+            self._tx_depth = 1
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                self._scales.clear()  # it may cache a rolled-back scales row
+                raise
+            else:
+                conn.execute("COMMIT")
+            finally:
+                self._tx_depth = 0
+                self._tx_owner = None
+
+    @contextmanager
+    def _read(self, *, flush: bool = True) -> Iterator[sqlite3.Connection]:
+        """Yield this thread's reader (the writer in memory or in a transaction).
+
+        Queued writes are committed first unless ``flush`` is false. A read on
+        a reader connection is counted for its whole block, so :meth:`close`
+        never closes it mid-query; the block may also use this thread's
+        archive connections.
+        """
+        self._check_open()
+        if flush:
+            self.flush()
+        if self._memory or self._tx_owner == threading.get_ident():
+            with self._lock:
+                self._check_open()
+                yield self._writer
+            return
+        with self._readers_lock:
+            self._check_open()
+            conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+            if conn is None:
+                conn = self._connect()
+                self._readers.append(conn)
+                self._local.conn = conn
+            self._reading += 1
         try:
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
         finally:
-            conn.close()
+            with self._readers_lock:
+                self._reading -= 1
+                if not self._reading:
+                    self._readers_lock.notify_all()
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise sqlite3.ProgrammingError("the store is closed")
+
+    def _submit(
+        self, sql: str, params: tuple[object, ...], *, order_id: str | None = None
+    ) -> None:
+        """Run one write now, or queue it for the writer thread.
+
+        A queued write of ``order_id``'s row stays visible to :meth:`get_order`
+        until it is committed.
+        """
+        if self._thread is None or self._tx_owner == threading.get_ident():
+            with self._write() as conn:
+                conn.execute(sql, params)
+            return
+        with self._cond:
+            self._check_open()
+            self._raise_failed()
+            self._pending.append((sql, params))
+            self._queued += 1
+            if order_id is not None:
+                self._queued_orders[order_id] = (self._queued, params)
+            if len(self._pending) in (1, self._flush_rows):
+                self._cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Block until every write queued so far is committed.
+
+        The write-behind durability barrier; a no-op otherwise, and inside a
+        :meth:`transaction` of this thread (whose commit is the barrier).
+
+        Parameters
+        ----------
+        timeout : float or None, optional
+            Longest wait in seconds. ``None`` (default) waits as long as it takes.
+
+        Raises
+        ------
+        StoreWriteError
+            If a batch failed to commit (now or earlier).
+        TimeoutError
+            If ``timeout`` passed before the queue was committed.
+
+        """
+        if self._thread is None or self._tx_owner == threading.get_ident():
+            return
+        with self._cond:
+            target = self._queued
+            if self._committed < target:
+                self._urgent += 1
+                self._cond.notify_all()
+                try:
+                    done = self._cond.wait_for(
+                        lambda: self._committed >= target, timeout
+                    )
+                finally:
+                    self._urgent -= 1
+                if not done:
+                    raise TimeoutError(
+                        f"{target - self._committed} queued writes not committed "
+                        f"after {timeout}s"
+                    )
+            self._raise_failed()
+
+    def _raise_failed(self) -> None:
+        if self._error is not None:
+            raise StoreWriteError(
+                f"write-behind batch failed: {self._error}"
+            ) from self._error
+
+    def _write_loop(self) -> None:
+        """The writer thread: commit the queue in size- / time-bounded batches."""
+        cond = self._cond
+        while True:
+            with cond:
+                cond.wait_for(lambda: self._pending or self._stopping)
+                if not self._pending:
+                    return  # stopping, and nothing left to write
+                deadline = time.monotonic() + self._flush_interval
+                while (
+                    len(self._pending) < self._flush_rows
+                    and not (self._stopping or self._urgent)
+                ):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    cond.wait(remaining)
+                size = min(len(self._pending), self._flush_rows)
+                batch = [self._pending.popleft() for _ in range(size)]
+            error = self._commit_batch(batch)
+            with cond:
+                if error is not None and self._error is None:
+                    self._error = error
+                self._committed += size
+                # Drop only this batch's order rows: O(batch), not O(queue).
+                for sql, params in batch:
+                    if sql is _UPSERT_ORDER:
+                        cid = str(params[0])
+                        queued = self._queued_orders.get(cid)
+                        if queued is not None and queued[0] <= self._committed:
+                            del self._queued_orders[cid]
+                cond.notify_all()
+
+    def _commit_batch(
+        self, batch: list[tuple[str, tuple[object, ...]]]
+    ) -> BaseException | None:
+        """Commit one batch in a single transaction; return the error, if any."""
+        try:
+            with self._write() as conn:
+                for sql, group in itertools.groupby(batch, key=lambda op: op[0]):
+                    conn.executemany(sql, [params for _, params in group])
+        except Exception as exc:  # noqa: BLE001 - surfaced by the next flush
+            return exc
+        return None
 
     # --- write API --------------------------------------------------------- #
 
@@ -191,8 +821,10 @@ class SqliteStore:
         UPSERT semantics: the first call inserts; any later call with the same
         ``client_order_id`` overwrites every mutable column so the single row
         always reflects the order's **latest** state (``status``,
-        ``filled_qty``, ``avg_fill_price``, ``venue_order_id``). Money/qty are
-        stored as ``str(Decimal)`` TEXT; enums by ``.value``.
+        ``filled_qty``, ``avg_fill_price``, ``venue_order_id``) and ``ts`` is the
+        time of this write. Money/qty are stored as ``str(Decimal)`` TEXT; enums
+        by ``.value``. An order already moved to a month archive is terminal,
+        and its archived row stays the only one: the write is skipped.
 
         Parameters
         ----------
@@ -200,53 +832,35 @@ class SqliteStore:
             The order aggregate to persist (its current snapshot).
 
         """
-        with self._conn() as conn:
-            conn.execute(
-                """
-                INSERT INTO orders (
-                    client_order_id, venue_order_id, instrument, side, type,
-                    qty, limit_price, stop_price, status, filled_qty,
-                    avg_fill_price, ts
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(client_order_id) DO UPDATE SET
-                    venue_order_id = excluded.venue_order_id,
-                    instrument     = excluded.instrument,
-                    side           = excluded.side,
-                    type           = excluded.type,
-                    qty            = excluded.qty,
-                    limit_price    = excluded.limit_price,
-                    stop_price     = excluded.stop_price,
-                    status         = excluded.status,
-                    filled_qty     = excluded.filled_qty,
-                    avg_fill_price = excluded.avg_fill_price,
-                    ts             = excluded.ts
-                """,
-                (
-                    order.client_order_id,
-                    order.venue_order_id,
-                    _instrument_to_text(order.instrument),
-                    order.side.value,
-                    order.type.value,
-                    str(order.qty),
-                    None if order.limit_price is None else str(order.limit_price),
-                    None if order.stop_price is None else str(order.stop_price),
-                    order.status.value,
-                    str(order.filled_qty),
-                    None
-                    if order.avg_fill_price is None
-                    else str(order.avg_fill_price),
-                    None,
-                ),
-            )
+        self._submit(
+            _UPSERT_ORDER,
+            (
+                order.client_order_id,
+                order.venue_order_id,
+                instrument_to_text(order.instrument),
+                order.side.value,
+                order.type.value,
+                str(order.qty),
+                None if order.limit_price is None else str(order.limit_price),
+                None if order.stop_price is None else str(order.stop_price),
+                order.status.value,
+                str(order.filled_qty),
+                None if order.avg_fill_price is None else str(order.avg_fill_price),
+                self._clock(),
+            ),
+            order_id=order.client_order_id,
+        )
 
     def record_fill(self, fill: Fill) -> None:
         """Append ``fill`` to the fills table — append-only, no overwrite.
 
         ``INSERT OR IGNORE`` on the ``fill_id`` primary key: re-recording the
         same execution (a replayed :class:`~trading_bot.application.events.
-        FillEvent`, a reconciliation re-fetch) is a silent no-op. Fills are
-        immutable facts; they never mutate and never duplicate. Money/qty/fee
-        are stored as ``str(Decimal)`` TEXT.
+        FillEvent`, a reconciliation re-fetch) is a silent no-op, also once the
+        fill has moved to a month archive (the ``archived_fills`` index). Fills
+        are immutable facts; they never mutate and never duplicate. Money/qty/fee
+        are stored as ``str(Decimal)`` TEXT, and as scaled integers wherever
+        that is exact.
 
         Parameters
         ----------
@@ -254,25 +868,21 @@ class SqliteStore:
             The broker-confirmed execution to persist.
 
         """
-        with self._conn() as conn:
-            conn.execute(
-                """
-                INSERT OR IGNORE INTO fills (
-                    fill_id, client_order_id, instrument, side, qty, price,
-                    fee, ts
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    fill.fill_id,
-                    fill.client_order_id,
-                    _instrument_to_text(fill.instrument),
-                    fill.side.value,
-                    str(fill.qty),
-                    str(fill.price),
-                    str(fill.fee),
-                    fill.ts,
-                ),
-            )
+        scales = self._scales_of(fill)
+        self._submit(
+            _INSERT_FILL,
+            (
+                fill.fill_id,
+                fill.client_order_id,
+                instrument_to_text(fill.instrument),
+                fill.side.value,
+                str(fill.qty),
+                str(fill.price),
+                str(fill.fee),
+                fill.ts,
+                *_scaled_row(fill, scales),
+            ),
+        )
 
     def set_state(self, key: str, value: str) -> None:
         """Set the engine-state ``value`` for ``key`` (UPSERT by ``key``).
@@ -288,14 +898,306 @@ class SqliteStore:
             The value to store (callers serialise non-string state themselves).
 
         """
-        with self._conn() as conn:
+        self._submit(_SET_STATE, (key, value))
+
+    # --- month archives ---------------------------------------------------- #
+
+    def archive(self, before: int, *, batch: int = 1000) -> tuple[int, int]:
+        """Move terminal orders and fills older than ``before`` to month archives.
+
+        Rows go to ``<db>.archive/YYYY-MM.db`` by the UTC month of their ``ts``,
+        ``batch`` rows (or a few more, sharing a ``ts``) per move. Live orders
+        and each table's newest row stay, so rowids keep growing. Every read
+        still sees the moved rows. The freed pages are then returned to the
+        file system by incremental vacuum. A database created before the schema
+        set ``auto_vacuum`` keeps its freed pages for reuse instead, until
+        :meth:`enable_incremental_vacuum` converts it offline.
+
+        Each move is three short transactions, taking the writer lock for one
+        batch at a time. The move is noted in ``state`` before the rows are
+        copied, and the note is cleared as they are deleted. A move cut short
+        by a crash is redone on the next open.
+
+        Parameters
+        ----------
+        before : int
+            Rows with ``ts < before`` (ms since the Unix epoch, UTC) move.
+        batch : int, optional
+            Rows per move. Defaults to ``1000``.
+
+        Returns
+        -------
+        tuple of int
+            How many orders and how many fills were moved.
+
+        Raises
+        ------
+        ValueError
+            If the store is in memory or ``batch < 1``.
+
+        """
+        if self._memory:
+            raise ValueError("an in-memory store has no month archives")
+        if batch < 1:
+            raise ValueError(f"batch must be at least 1, got {batch}")
+        self.flush()
+        moved = {"orders": 0, "fills": 0}
+        for table in moved:
+            while not self._archive_stop.is_set():
+                # ``_moving`` first: a reader holding it may wait on a flush,
+                # which needs ``_lock``.
+                with self._moving, self._lock:
+                    self._check_open()
+                    move = self._next_move(table, before, batch)
+                    if move is None:
+                        break
+                    moved[table] += self._move(move)
+        if moved["orders"] or moved["fills"]:
+            self._vacuum()
+        return moved["orders"], moved["fills"]
+
+    def _archived(self, table: str) -> tuple[str, tuple[object, ...]]:
+        """The rows of ``table`` that may move: terminal orders, every fill."""
+        if table == "fills":
+            return "1", ()
+        marks = ", ".join("?" * len(LIVE_STATUSES))
+        return f"status NOT IN ({marks})", LIVE_STATUSES
+
+    def _next_move(
+        self, table: str, before: int, batch: int
+    ) -> dict[str, object] | None:
+        """The next ``batch`` of ``table`` to move: the oldest month first."""
+        conn = self._writer
+        condition, params = self._archived(table)
+        newest = conn.execute(f"SELECT max(rowid) FROM {table}").fetchone()[0]
+        oldest = conn.execute(
+            f"SELECT min(ts) FROM {table} WHERE ts < ? AND rowid < ? AND {condition}",
+            (before, newest or 0, *params),
+        ).fetchone()[0]
+        if oldest is None:
+            return None
+        month, _, end = _month_of(oldest)
+        upto = min(end, before)
+        # The ts after the batch's last row: the move takes whole ts values.
+        row = conn.execute(
+            f"SELECT ts FROM {table} WHERE ts >= ? AND ts < ? AND rowid < ?"
+            f" AND {condition} ORDER BY ts LIMIT 1 OFFSET ?",
+            (oldest, upto, newest, *params, batch - 1),
+        ).fetchone()
+        if row is not None and row[0] + 1 < upto:
+            upto = row[0] + 1
+        return {
+            "table": table,
+            "month": month,
+            "since": oldest,
+            "until": upto,
+            "below": newest,
+        }
+
+    def _move(self, move: dict[str, object]) -> int:
+        """Copy one noted batch to its month archive, then delete it here."""
+        table = str(move["table"])
+        condition, params = self._archived(table)
+        where = f"ts >= ? AND ts < ? AND rowid < ? AND {condition}"
+        bounds = (move["since"], move["until"], move["below"], *params)
+        columns = _COLUMNS[table]
+        path = self._archive_path(str(move["month"]))
+        with self._write() as conn:
+            conn.execute(_SET_STATE, (_ARCHIVE_PENDING, json.dumps(move)))
+        self._writer.execute("ATTACH DATABASE ? AS archive", (str(path),))
+        try:
+            with self._write() as conn:
+                # REPLACE: a re-archived order overwrites its older copy.
+                conn.execute(
+                    f"INSERT OR REPLACE INTO archive.{table} (rowid, {columns})"
+                    f" SELECT rowid, {columns} FROM main.{table} WHERE {where}",
+                    bounds,
+                )
+        finally:
+            self._writer.execute("DETACH DATABASE archive")
+        index, key = _ARCHIVE_INDEX[table]
+        with self._write() as conn:
             conn.execute(
-                """
-                INSERT INTO state (key, value) VALUES (?, ?)
-                ON CONFLICT(key) DO UPDATE SET value = excluded.value
-                """,
-                (key, value),
+                f"INSERT OR REPLACE INTO {index} ({key}, month)"
+                f" SELECT {key}, ? FROM main.{table} WHERE {where}",
+                (move["month"], *bounds),
             )
+            deleted = conn.execute(
+                f"DELETE FROM main.{table} WHERE {where}", bounds
+            ).rowcount
+            conn.execute("DELETE FROM state WHERE key = ?", (_ARCHIVE_PENDING,))
+        return int(deleted)
+
+    def _archive_path(self, month: str) -> pathlib.Path:
+        """The month's archive file, created (and listed) on first use."""
+        path = self._archive_dir / f"{month}.db"
+        if any(archive.month == month for archive in self._archives):
+            return path
+        self._archive_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path), isolation_level=None)
+        try:
+            conn.executescript(_ARCHIVE_SCHEMA)
+        finally:
+            conn.close()
+        _, start, end = _month_parts(*month.split("-"))
+        self._archives = sorted([*self._archives, _Archive(month, path, start, end)])
+        return path
+
+    def _scan_archives(self) -> list[_Archive]:
+        """The month archives on disk, oldest first."""
+        if not self._archive_dir.is_dir():
+            return []
+        archives = []
+        for path in self._archive_dir.iterdir():
+            match = _ARCHIVE_NAME.fullmatch(path.name)
+            if match is not None:
+                month, start, end = _month_parts(*match.groups())
+                archives.append(_Archive(month, path, start, end))
+        return sorted(archives)
+
+    def _resume_archive(self) -> None:
+        """Redo a move a crash cut short (its rows may be in both databases)."""
+        row = self._writer.execute(
+            "SELECT value FROM state WHERE key = ?", (_ARCHIVE_PENDING,)
+        ).fetchone()
+        if row is not None:
+            with self._lock:
+                self._move(json.loads(row["value"]))
+
+    def _index_archives(self) -> None:
+        """Index the keys of archives written before their index table was."""
+        if not self._archives:
+            return
+        missing = [
+            (table, index, key)
+            for table, (index, key) in _ARCHIVE_INDEX.items()
+            if not self._writer.execute(f"SELECT 1 FROM {index} LIMIT 1").fetchone()
+        ]
+        if not missing:
+            return
+        with self._lock:
+            for archive in self._archives:  # oldest first: a re-archive wins
+                self._writer.execute(
+                    "ATTACH DATABASE ? AS archive", (str(archive.path),)
+                )
+                try:
+                    with self._write() as conn:
+                        for table, index, key in missing:
+                            conn.execute(
+                                f"INSERT OR REPLACE INTO {index}"
+                                f" SELECT {key}, ? FROM archive.{table}",
+                                (archive.month,),
+                            )
+                finally:
+                    self._writer.execute("DETACH DATABASE archive")
+
+    def _vacuum(self, pages: int = 1024) -> None:
+        """Return free pages to the file system, ``pages`` per step."""
+        with self._lock:
+            self._check_open()
+            if self._writer.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                if not self._vacuum_warned:
+                    self._vacuum_warned = True
+                    logger.warning(
+                        "%s was created without incremental auto_vacuum; its "
+                        "freed pages stay in the file until it is converted "
+                        "offline (`trading-bot vacuum`)",
+                        self._path,
+                    )
+                return
+        while not self._archive_stop.is_set():
+            with self._lock:
+                self._check_open()
+                if not self._writer.execute("PRAGMA freelist_count").fetchone()[0]:
+                    return
+                # Each freed page is a result row; stepping through them frees them.
+                self._writer.execute(f"PRAGMA incremental_vacuum({pages})").fetchall()
+
+    def enable_incremental_vacuum(self) -> bool:
+        """Convert a database created without ``auto_vacuum`` so archiving shrinks it.
+
+        An offline step: the full ``VACUUM`` rewrites the whole file and holds
+        the writer lock until it is done, which takes minutes on a large
+        history. Run it with no engine using the store. A database created by
+        this version already has incremental auto-vacuum.
+
+        Returns
+        -------
+        bool
+            Whether the database was converted (``False`` if it already was).
+
+        Raises
+        ------
+        ValueError
+            If the store is in memory.
+
+        """
+        if self._memory:
+            raise ValueError("an in-memory store has no file to vacuum")
+        self.flush()
+        with self._lock:
+            self._check_open()
+            if self._writer.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+                return False
+            self._writer.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            self._writer.execute("VACUUM")
+            return True
+
+    def _archive_loop(self) -> None:
+        """The archiver thread: one :meth:`archive` pass per interval."""
+        assert self._archive_after is not None
+        while True:
+            try:
+                self.archive(self._clock() - self._archive_after)
+            except Exception:  # noqa: BLE001 - logged; the next pass retries
+                logger.exception("archiving the store failed")
+            if self._archive_stop.wait(self._archive_interval):
+                return
+
+    def _archives_for(
+        self, since: int | None = None, until: int | None = None
+    ) -> list[_Archive]:
+        """The archives that may hold rows with ``since <= ts < until``."""
+        return [
+            archive
+            for archive in self._archives
+            if (since is None or archive.end > since)
+            and (until is None or archive.start < until)
+        ]
+
+    @contextmanager
+    def _archive_view(
+        self,
+    ) -> Iterator[Callable[[list[_Archive]], list[sqlite3.Connection]]]:
+        """Read the hot database and archives with no archive move in between.
+
+        Yields a function from archives to connections: this thread's hot
+        reader first, then one per archive.
+        """
+        with self._read() as hot:
+            # This thread's open transaction holds the writer lock, so no move
+            # can run; waiting on ``_moving`` could deadlock with the archiver.
+            mine = self._tx_owner == threading.get_ident()
+            with nullcontext() if mine else self._moving:
+                yield lambda archives: [
+                    hot,
+                    *(self._archive_reader(archive) for archive in archives),
+                ]
+
+    def _archive_reader(self, archive: _Archive) -> sqlite3.Connection:
+        """This thread's connection to ``archive``."""
+        self._check_open()
+        conns: dict[pathlib.Path, sqlite3.Connection] | None = getattr(
+            self._local, "archives", None
+        )
+        if conns is None:
+            conns = self._local.archives = {}
+        conn = conns.get(archive.path)
+        if conn is None:
+            conn = conns[archive.path] = self._connect(archive.path)
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
 
     # --- read API ---------------------------------------------------------- #
 
@@ -307,12 +1209,30 @@ class SqliteStore:
         ``venue_order_id`` are set to the persisted values (the state machine is
         *not* replayed; the row is the truth). All money is exact
         :class:`~decimal.Decimal`.
+
+        A point lookup does not wait for queued writes: an order row still on
+        the write-behind queue is answered from the queue. An order missing
+        from the hot database is looked up in the one month archive the
+        ``archived_orders`` index names, so a new id costs one indexed query.
         """
-        with self._conn() as conn:
-            row = conn.execute(
-                "SELECT * FROM orders WHERE client_order_id = ?",
-                (client_order_id,),
-            ).fetchone()
+        with self._cond:
+            queued = self._queued_orders.get(client_order_id)
+        if queued is not None:
+            return _row_to_order(dict(zip(_ORDER_COLUMNS, queued[1], strict=True)))
+        sql = "SELECT * FROM orders WHERE client_order_id = ?"
+        with self._read(flush=False) as conn:
+            row = conn.execute(sql, (client_order_id,)).fetchone()
+            if row is None and self._archives:
+                # Committed with the move's delete, so never missed between them.
+                found = conn.execute(
+                    "SELECT month FROM archived_orders WHERE client_order_id = ?",
+                    (client_order_id,),
+                ).fetchone()
+                for archive in self._archives if found is not None else ():
+                    if archive.month == found[0]:
+                        row = self._archive_reader(archive).execute(
+                            sql, (client_order_id,)
+                        ).fetchone()
         return None if row is None else _row_to_order(row)
 
     def orders(self) -> list[Order]:
@@ -322,12 +1242,10 @@ class SqliteStore:
         -------
         list of Order
             All persisted orders (one row per ``client_order_id``), insertion
-            order. Money exact.
+            order. Money exact. Prefer :meth:`iter_orders` over a long history.
 
         """
-        with self._conn() as conn:
-            rows = conn.execute("SELECT * FROM orders ORDER BY rowid").fetchall()
-        return [_row_to_order(r) for r in rows]
+        return list(self.iter_orders())
 
     def fills(self, since_ms: int | None = None) -> list[Fill]:
         """Return stored fills, optionally only those at/after ``since_ms``.
@@ -342,23 +1260,391 @@ class SqliteStore:
         -------
         list of Fill
             The matching fills, in insertion (execution) order. Money exact.
+            Prefer :meth:`iter_fills` over a long history.
+
+        """
+        return list(self.iter_fills(since=since_ms))
+
+    def iter_fills(
+        self,
+        *,
+        instrument: Instrument | None = None,
+        since: int | None = None,
+        until: int | None = None,
+        after: int = 0,
+        batch: int = 1000,
+    ) -> Iterator[Fill]:
+        """Yield stored fills in insertion order, one keyset page at a time.
+
+        Parameters
+        ----------
+        instrument : Instrument or None, optional
+            Only fills of this instrument (matched on its symbol).
+        since, until : int or None, optional
+            Only fills with ``since <= ts < until`` (ms since the Unix epoch,
+            UTC). ``None`` leaves that side open.
+        after : int, optional
+            Only fills stored after the one with this rowid (a
+            :meth:`fill_watermark`). Defaults to ``0`` (all fills).
+        batch : int, optional
+            Rows fetched per query. Defaults to ``1000``.
+
+        Yields
+        ------
+        Fill
+            Each matching fill, money exact. Rows committed while iterating may
+            appear in a later page.
+
+        Raises
+        ------
+        ValueError
+            If ``batch < 1``.
+
+        """
+        where: list[str] = []
+        params: list[object] = []
+        if instrument is not None:
+            where.append("instrument = ?")
+            params.append(instrument_to_text(instrument))
+        if since is not None:
+            where.append("ts >= ?")
+            params.append(since)
+        if until is not None:
+            where.append("ts < ?")
+            params.append(until)
+        rows = self._pages(
+            "fills", where, params, batch, after=after, since=since, until=until
+        )
+        for row in rows:
+            yield _row_to_fill(row)
+
+    def iter_orders(
+        self,
+        *,
+        status: OrderStatus | None = None,
+        instrument: Instrument | None = None,
+        since: int | None = None,
+        until: int | None = None,
+        batch: int = 1000,
+    ) -> Iterator[Order]:
+        """Yield stored orders in insertion order, one keyset page at a time.
+
+        Parameters
+        ----------
+        status : OrderStatus or None, optional
+            Only orders currently in this status.
+        instrument : Instrument or None, optional
+            Only orders of this instrument (matched on its symbol).
+        since, until : int or None, optional
+            Only orders last written at ``since <= ts < until`` (ms since the
+            Unix epoch, UTC). Rows written before orders were timestamped have
+            no ``ts`` and match neither bound.
+        batch : int, optional
+            Rows fetched per query. Defaults to ``1000``.
+
+        Yields
+        ------
+        Order
+            Each matching order, money exact.
+
+        Raises
+        ------
+        ValueError
+            If ``batch < 1``.
+
+        """
+        where: list[str] = []
+        params: list[object] = []
+        if status is not None:
+            where.append("status = ?")
+            params.append(status.value)
+        if instrument is not None:
+            where.append("instrument = ?")
+            params.append(instrument_to_text(instrument))
+        if since is not None:
+            where.append("ts >= ?")
+            params.append(since)
+        if until is not None:
+            where.append("ts < ?")
+            params.append(until)
+        rows = self._pages("orders", where, params, batch, since=since, until=until)
+        for row in rows:
+            yield _row_to_order(row)
+
+    def orders_to_restore(
+        self, *, window_ms: int, batch: int = 1000
+    ) -> Iterator[Order]:
+        """Yield the orders a restart must know: live ones and recent ones.
+
+        Every order not yet terminal, plus every order written within the last
+        ``window_ms`` (by the store's clock), in insertion order. Older terminal
+        orders stay on disk; :meth:`get_order` still finds them.
+
+        Parameters
+        ----------
+        window_ms : int
+            How far back (milliseconds) a terminal order still counts as recent.
+        batch : int, optional
+            Rows fetched per query. Defaults to ``1000``.
+
+        Yields
+        ------
+        Order
+            Each such order, money exact.
+
+        """
+        marks = ", ".join("?" * len(LIVE_STATUSES))
+        # A UNION of two index searches; a plain ``OR`` scans the whole table.
+        where = [
+            f"rowid IN (SELECT rowid FROM orders WHERE status IN ({marks})"
+            " UNION SELECT rowid FROM orders WHERE ts >= ?)"
+        ]
+        recent = self._clock() - window_ms
+        params: list[object] = [*LIVE_STATUSES, recent]
+        # Archives hold terminal orders only: just the recent ones can match.
+        for row in self._pages("orders", where, params, batch, since=recent):
+            yield _row_to_order(row)
+
+    def iter_rows(
+        self,
+        table: str,
+        *,
+        after: int = 0,
+        since: int | None = None,
+        batch: int = 1000,
+    ) -> Iterator[sqlite3.Row]:
+        """Yield a table's raw rows by rowid, for exporters.
+
+        The primitives as stored (money as ``str(Decimal)`` TEXT) plus the
+        row's ``_rowid``; no domain object is built. Pages like
+        :meth:`iter_fills`.
+
+        Parameters
+        ----------
+        table : {"orders", "fills", "state"}
+            The table to read.
+        after : int, optional
+            Only rows with ``rowid > after``. Defaults to ``0`` (all rows).
+        since : int or None, optional
+            Only rows with ``ts >= since`` (``orders`` and ``fills`` only).
+        batch : int, optional
+            Rows fetched per query. Defaults to ``1000``.
+
+        Raises
+        ------
+        ValueError
+            If ``table`` is unknown, ``since`` is given for ``state``, or
+            ``batch < 1``.
+
+        """
+        if table not in ("orders", "fills", "state"):
+            raise ValueError(f"unknown table {table!r}")
+        where: list[str] = []
+        params: list[object] = []
+        if since is not None:
+            if table == "state":
+                raise ValueError("the state table has no ts column")
+            where.append("ts >= ?")
+            params.append(since)
+        return self._pages(table, where, params, batch, after=after, since=since)
+
+    def _pages(
+        self,
+        table: str,
+        where: list[str],
+        params: list[object],
+        batch: int,
+        *,
+        after: int = 0,
+        since: int | None = None,
+        until: int | None = None,
+    ) -> Iterator[sqlite3.Row]:
+        """Yield ``table``'s matching rows by rowid, ``batch`` per query.
+
+        Rows in the month archives (those that may hold ``since <= ts <
+        until``) are merged in by rowid.
+        """
+        if batch < 1:
+            raise ValueError(f"batch must be at least 1, got {batch}")
+        sql = f"SELECT rowid AS _rowid, * FROM {table} WHERE rowid > ?"
+        for clause in where:
+            sql += f" AND {clause}"
+        sql += " ORDER BY rowid LIMIT ?"
+        archives = [] if table == "state" else self._archives_for(since, until)
+        last = after
+        while True:
+            if not archives:
+                with self._read() as conn:
+                    rows = conn.execute(sql, (last, *params, batch)).fetchall()
+                yield from rows
+                if len(rows) < batch:
+                    return
+                last = rows[-1]["_rowid"]
+                continue
+            # One page from every database, read with no move in between. Up to
+            # the lowest last rowid of a full page, the merge misses no row.
+            with self._archive_view() as conns:
+                pages = [
+                    conn.execute(sql, (last, *params, batch)).fetchall()
+                    for conn in conns(archives)
+                ]
+            full = [page[-1]["_rowid"] for page in pages if len(page) == batch]
+            upto = min(full) if full else None
+            for row in heapq.merge(*pages, key=lambda row: row["_rowid"]):
+                if upto is not None and row["_rowid"] > upto:
+                    break
+                yield row
+            if upto is None:
+                return
+            last = upto
+
+    def fill_totals(
+        self,
+        *,
+        instrument: Instrument | None = None,
+        since: int | None = None,
+        until: int | None = None,
+        by_day: bool = False,
+    ) -> list[FillTotals]:
+        """Bought / sold quantity and notional and fees, summed inside SQLite.
+
+        The sums run over the scaled-integer columns, so no row is read back
+        into Python. The few rows whose money did not fit their instrument's
+        scale are folded from their TEXT instead. Either way the result is
+        exact.
+
+        Parameters
+        ----------
+        instrument : Instrument or None, optional
+            Only fills of this instrument.
+        since, until : int or None, optional
+            Only fills with ``since <= ts < until`` (ms since the Unix epoch,
+            UTC).
+        by_day : bool, optional
+            One row per instrument and UTC day instead of per instrument.
+
+        Returns
+        -------
+        list of FillTotals
+            Sorted by instrument (then day).
 
         """
-        with self._conn() as conn:
-            if since_ms is None:
-                rows = conn.execute(
-                    "SELECT * FROM fills ORDER BY rowid"
+        where = ["1"]
+        params: list[object] = []
+        if instrument is not None:
+            where.append("instrument = ?")
+            params.append(instrument_to_text(instrument))
+        if since is not None:
+            where.append("ts >= ?")
+            params.append(since)
+        if until is not None:
+            where.append("ts < ?")
+            params.append(until)
+        day = "date(ts / 1000, 'unixepoch')" if by_day else "NULL"
+        exact = " AND ".join(f"{name} IS NOT NULL" for name in _SCALED_COLUMNS)
+        sums = ", ".join(
+            f"SUM(CASE WHEN side = '{side}' THEN {column} / {SPLIT} END),"
+            f" SUM(CASE WHEN side = '{side}' THEN {column} % {SPLIT} END)"
+            for column in ("qty_i", "notional_i")
+            for side in ("buy", "sell")
+        )
+        condition = " AND ".join(where)
+        grouped: list[sqlite3.Row] = []
+        inexact: list[sqlite3.Row] = []
+        with self._archive_view() as conns:
+            for conn in conns(self._archives_for(since, until)):
+                grouped += conn.execute(
+                    f"SELECT instrument, {day} AS day, COUNT(*), {sums},"
+                    f" SUM(fee_i / {SPLIT}), SUM(fee_i % {SPLIT})"
+                    f" FROM fills WHERE {condition} AND {exact}"
+                    " GROUP BY instrument, day",
+                    params,
                 ).fetchall()
-            else:
-                rows = conn.execute(
-                    "SELECT * FROM fills WHERE ts >= ? ORDER BY rowid",
-                    (since_ms,),
+                inexact += conn.execute(
+                    f"SELECT *, {day} AS day FROM fills"
+                    f" WHERE {condition} AND NOT ({exact})",
+                    params,
                 ).fetchall()
-        return [_row_to_fill(r) for r in rows]
+        totals: dict[tuple[str, str | None], list[Decimal | int]] = {}
+        for row in grouped:
+            with self._read() as conn:
+                scales = self._load_scales(conn, row[0])
+            assert scales is not None  # set before the instrument's first fill
+            places = (scales.qty, scales.qty, scales.notional, scales.notional)
+            values: list[Decimal | int] = [row[2]]
+            for i, scale in enumerate(places):
+                values.append(from_split(row[3 + 2 * i], row[4 + 2 * i], scale))
+            values.append(from_split(row[11], row[12], scales.fee))
+            merged = totals.get((row[0], row[1]))
+            if merged is None:
+                totals[(row[0], row[1])] = values
+            else:  # the same instrument (and day) in another database
+                for i, value in enumerate(values):
+                    merged[i] += value
+        zero = Decimal(0)
+        for row in inexact:
+            fill = _row_to_fill(row)
+            values = totals.setdefault(
+                (row["instrument"], row["day"]), [0, zero, zero, zero, zero, zero]
+            )
+            buy = fill.side is OrderSide.BUY
+            values[0] += 1
+            values[1 if buy else 2] += fill.qty
+            values[3 if buy else 4] += fill.qty * fill.price
+            values[5] += fill.fee
+        return [
+            FillTotals(instrument_from_text(key[0]), key[1], *values)  # type: ignore[arg-type]
+            for key, values in sorted(
+                totals.items(), key=lambda item: (item[0][0], item[0][1] or "")
+            )
+        ]
+
+    def fill_watermark(self) -> tuple[int, int | None]:
+        """The newest stored fill's rowid and the latest fill ``ts``.
+
+        Both are ``0`` / ``None`` for an empty fills table. A caller that has
+        folded every fill up to the rowid resumes with
+        ``iter_fills(after=rowid)``.
+        """
+        # The newest fill never moves to an archive; the latest ts may have.
+        with self._archive_view() as conns:
+            # Two subqueries: each max() is then one index probe, not a scan.
+            rows = [
+                conn.execute(
+                    "SELECT (SELECT max(rowid) FROM fills),"
+                    " (SELECT max(ts) FROM fills)"
+                ).fetchone()
+                for conn in conns(self._archives)
+            ]
+        latest = [row[1] for row in rows if row[1] is not None]
+        return rows[0][0] or 0, max(latest) if latest else None
+
+    def fill_ids(self, *, since: int, upto: int | None = None) -> list[str]:
+        """Ids of the stored fills with ``ts >= since`` (searched on the ``ts`` index).
+
+        Parameters
+        ----------
+        since : int
+            Lower ``ts`` bound, inclusive (ms since the Unix epoch, UTC).
+        upto : int or None, optional
+            Only fills with ``rowid <= upto`` (a :meth:`fill_watermark`).
+
+        """
+        sql = "SELECT fill_id FROM fills WHERE ts >= ?"
+        params: list[object] = [since]
+        if upto is not None:
+            sql += " AND +rowid <= ?"  # ``+``: keep the search on the ts index
+            params.append(upto)
+        with self._archive_view() as conns:
+            return [
+                row[0]
+                for conn in conns(self._archives_for(since))
+                for row in conn.execute(sql, params)
+            ]
 
     def get_state(self, key: str) -> str | None:
         """Return the stored value for ``key``, or ``None`` if the key is unknown."""
-        with self._conn() as conn:
+        with self._read() as conn:
             row = conn.execute(
                 "SELECT value FROM state WHERE key = ?", (key,)
             ).fetchone()
@@ -372,9 +1658,11 @@ class SqliteStore:
         A thin adapter: it subscribes one handler that routes
         :class:`~trading_bot.application.events.OrderEvent` to
         :meth:`upsert_order` and :class:`~trading_bot.application.events.
-        FillEvent` to :meth:`record_fill` (other events are ignored). The store
-        works standalone without a bus; this just wires the engine's order/fill
-        stream straight into the history.
+        FillEvent` to :meth:`record_fill` (the subscription is typed, so other
+        events never reach it). It is a *critical* subscriber: on an async bus
+        its events are buffered, never dropped. The store works standalone
+        without a bus; this just wires the engine's order/fill stream straight
+        into the history.
 
         Parameters
         ----------
@@ -392,18 +1680,48 @@ class SqliteStore:
             elif isinstance(event, FillEvent):
                 self.record_fill(event.fill)
 
-        event_bus.subscribe(_on_event)
+        event_bus.subscribe(
+            _on_event,
+            types=(OrderEvent, FillEvent),
+            critical=True,
+            name="SqliteStore",
+        )
 
     # --- lifecycle --------------------------------------------------------- #
 
     def close(self) -> None:
-        """Close the store.
+        """Commit any queued writes, then close every connection.
+
+        Idempotent. Any later operation raises :class:`sqlite3.ProgrammingError`.
+        A transaction still open in another thread, and reads in flight on
+        other threads' reader connections, are waited for first.
+
+        Raises
+        ------
+        StoreWriteError
+            If a write-behind batch failed; the store is closed regardless.
 
-        A no-op for connection state (each operation opens and closes its own
-        connection), provided so callers can treat the store as a closable
-        resource symmetrically with a real connection-holding store.
         """
-        # Nothing to release: connections are per-operation (see ``_conn``).
+        self._archive_stop.set()
+        if self._archiver is not None:
+            self._archiver.join()
+        if self._thread is not None:
+            with self._cond:
+                self._stopping = True
+                self._cond.notify_all()
+            self._thread.join()
+        with self._lock:
+            if self._closed:
+                return
+            with self._readers_lock:
+                self._closed = True
+                self._readers_lock.wait_for(lambda: not self._reading)
+                for conn in self._readers:
+                    conn.close()
+                self._readers.clear()
+            self._writer.close()
+        with self._cond:
+            self._raise_failed()
 
     def __enter__(self) -> SqliteStore:
         """Enter the runtime context, returning the store."""
@@ -414,7 +1732,7 @@ class SqliteStore:
         self.close()
 
 
-def _row_to_order(row: sqlite3.Row) -> Order:
+def _row_to_order(row: sqlite3.Row | Mapping[str, Any]) -> Order:
     """Rebuild an :class:`Order` from a stored ``orders`` row (exact Decimal).
 
     Constructs the dataclass from the immutable fields, then sets the mutable
@@ -427,7 +1745,7 @@ def _row_to_order(row: sqlite3.Row) -> Order:
     avg_raw = row["avg_fill_price"]
     order = Order(
         client_order_id=str(row["client_order_id"]),
-        instrument=_instrument_from_text(str(row["instrument"])),
+        instrument=instrument_from_text(str(row["instrument"])),
         side=OrderSide(row["side"]),
         qty=money(str(row["qty"])),
         type=OrderType(row["type"]),
@@ -442,12 +1760,24 @@ def _row_to_order(row: sqlite3.Row) -> Order:
     return order
 
 
+def _scaled_row(fill: Fill, scales: Scales) -> tuple[int | None, ...]:
+    """``fill``'s ``(qty_i, price_i, fee_i, notional_i)``; ``None`` where inexact."""
+    qty = to_scaled(fill.qty, scales.qty)
+    price = to_scaled(fill.price, scales.price)
+    notional = None
+    if qty is not None and price is not None:
+        notional = qty * price  # exact, at ``scales.notional`` places
+        if not -(2**63) <= notional < 2**63:
+            notional = None
+    return qty, price, to_scaled(fill.fee, scales.fee), notional
+
+
 def _row_to_fill(row: sqlite3.Row) -> Fill:
     """Rebuild a :class:`Fill` from a stored ``fills`` row (exact Decimal)."""
     return Fill(
         fill_id=str(row["fill_id"]),
         client_order_id=str(row["client_order_id"]),
-        instrument=_instrument_from_text(str(row["instrument"])),
+        instrument=instrument_from_text(str(row["instrument"])),
         side=OrderSide(row["side"]),
         qty=money(str(row["qty"])),
         price=money(str(row["price"])),
@@ -0,0 +1,240 @@
+"""Tests for the :class:`BarCloseScheduler` — bar-close-aligned daemon wake-ups.
+
+Offline, on a fake clock: the injected ``sleep`` advances the fake ``now_ns``, so
+the tests assert exactly *when* each unit is stepped. Proves the boundary rule
+(next multiple of ``span`` + settle), span grouping (coinciding boundaries share a
+wake-up), the default span for a data-less unit, the data-version/notify hooks
+and the per-unit failure isolation. Async tests run un-decorated (``asyncio_mode =
+"auto"``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import pathlib
+import threading
+
+import pytest
+
+from trading_bot.application.bar_scheduler import (
+    BarCloseScheduler,
+    group_by_span,
+    next_bar_close,
+    path_data_version,
+)
+from trading_bot.application.config import AppConfig
+from trading_bot.application.supervisor import StrategySupervisor
+
+_S = 1_000_000_000
+
+
+class _FakeClock:
+    """A ns clock whose ``sleep`` advances time instead of waiting."""
+
+    def __init__(self, start_s: float) -> None:
+        self.now = int(start_s * _S)
+
+    def now_ns(self) -> int:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += int(seconds * _S)
+        await asyncio.sleep(0)
+
+
+class _FakeSupervisor:
+    """Records ``(name, now_s)`` per step; ``span_of`` from a fixed map."""
+
+    def __init__(self, spans: dict[str, int | None], clock: _FakeClock) -> None:
+        self._spans = spans
+        self._clock = clock
+        self.steps: list[tuple[str, float]] = []
+        self.fail: set[str] = set()
+
+    def names(self) -> list[str]:
+        return list(self._spans)
+
+    def span_of(self, name: str) -> int | None:
+        return self._spans[name]
+
+    async def step(self, name: str) -> None:
+        self.steps.append((name, self._clock.now / _S))
+        if name in self.fail:
+            raise RuntimeError(f"{name} broke")
+
+
+def test_next_bar_close_is_the_next_span_multiple() -> None:
+    assert next_bar_close(61 * _S, 60) == 120 * _S
+    # Exactly on a boundary: that one is done, the next is returned.
+    assert next_bar_close(120 * _S, 60) == 180 * _S
+    assert next_bar_close(0, 86400) == 86400 * _S
+    with pytest.raises(ValueError):
+        next_bar_close(0, 0)
+
+
+def test_group_by_span_preserves_order() -> None:
+    assert group_by_span({"a": 60, "b": 3600, "c": 60}) == {
+        60: ["a", "c"],
+        3600: ["b"],
+    }
+
+
+async def test_wakes_on_each_boundary_plus_settle() -> None:
+    clock = _FakeClock(start_s=100)
+    sup = _FakeSupervisor({"m1": 60}, clock)
+    sched = BarCloseScheduler(
+        sup, settle=2.0, now_ns=clock.now_ns, sleep=clock.sleep  # type: ignore[arg-type]
+    )
+    await sched.run(asyncio.Event(), max_wakeups=3)
+    assert sup.steps == [("m1", 122.0), ("m1", 182.0), ("m1", 242.0)]
+
+
+async def test_coinciding_boundaries_share_one_wakeup() -> None:
+    clock = _FakeClock(start_s=3500)
+    sup = _FakeSupervisor({"m1": 60, "h1": 3600, "m1b": 60}, clock)
+    sched = BarCloseScheduler(
+        sup, settle=0.0, now_ns=clock.now_ns, sleep=clock.sleep  # type: ignore[arg-type]
+    )
+    await sched.run(asyncio.Event(), max_wakeups=2)
+    # 3540: only the minutely group; 3600: both spans close together.
+    assert sup.steps == [
+        ("m1", 3540.0),
+        ("m1b", 3540.0),
+        ("m1", 3600.0),
+        ("h1", 3600.0),
+        ("m1b", 3600.0),
+    ]
+
+
+async def test_data_less_unit_uses_the_default_span() -> None:
+    clock = _FakeClock(start_s=0)
+    sup = _FakeSupervisor({"nodata": None}, clock)
+    sched = BarCloseScheduler(
+        sup,
+        default_span=30,
+        settle=0.0,
+        now_ns=clock.now_ns,
+        sleep=clock.sleep,  # type: ignore[arg-type]
+    )
+    await sched.run(asyncio.Event(), max_wakeups=2)
+    assert sup.steps == [("nodata", 30.0), ("nodata", 60.0)]
+
+
+async def test_failing_unit_does_not_stop_its_group() -> None:
+    clock = _FakeClock(start_s=0)
+    sup = _FakeSupervisor({"bad": 60, "good": 60}, clock)
+    sup.fail.add("bad")
+    errors: list[str] = []
+    sched = BarCloseScheduler(
+        sup,
+        settle=0.0,
+        on_error=lambda name, exc: errors.append(name),
+        now_ns=clock.now_ns,
+        sleep=clock.sleep,  # type: ignore[arg-type]
+    )
+    await sched.run(asyncio.Event(), max_wakeups=1)
+    assert [name for name, _ in sup.steps] == ["bad", "good"]
+    assert errors == ["bad"]
+
+
+async def test_notify_steps_every_unit_immediately() -> None:
+    sup = _FakeSupervisor({"d1": 86400, "h1": 3600}, _FakeClock(start_s=10))
+    sched = BarCloseScheduler(sup, settle=0.0, now_ns=lambda: 10 * _S)
+    stop = asyncio.Event()
+    task = asyncio.ensure_future(sched.run(stop, max_wakeups=1))
+    await asyncio.sleep(0)
+    sched.notify()
+    assert await asyncio.wait_for(task, timeout=2) == 1
+    assert [name for name, _ in sup.steps] == ["d1", "h1"]
+
+
+async def test_data_version_change_triggers_a_step() -> None:
+    clock = _FakeClock(start_s=10)
+    sup = _FakeSupervisor({"d1": 86400}, clock)
+    versions = iter([1, 1, 2])
+    sched = BarCloseScheduler(
+        sup,
+        settle=0.0,
+        data_version=lambda: next(versions, 2),
+        version_poll=1.0,
+        now_ns=clock.now_ns,
+        sleep=clock.sleep,  # type: ignore[arg-type]
+    )
+
+    # The main loop's day-long sleep is real here (it must not win), while the
+    # version poll advances on the fake clock.
+    async def _forever(seconds: float) -> None:
+        if seconds > 1.0:
+            await asyncio.Event().wait()
+        await clock.sleep(seconds)
+
+    sched._sleep = _forever  # noqa: SLF001 - split the two sleeps for the test
+    assert await asyncio.wait_for(sched.run(asyncio.Event(), max_wakeups=1), 2) == 1
+    assert [name for name, _ in sup.steps] == ["d1"]
+    assert sup.steps[0][1] < 86400
+
+
+async def test_data_version_is_probed_off_the_loop() -> None:
+    clock = _FakeClock(start_s=10)
+    sup = _FakeSupervisor({"d1": 86400}, clock)
+    loop_thread = threading.get_ident()
+    probed: list[int] = []
+
+    def _probe() -> int:
+        probed.append(threading.get_ident())
+        return len(probed)  # changes on every poll
+
+    sched = BarCloseScheduler(
+        sup, settle=0.0, data_version=_probe, version_poll=1.0, now_ns=clock.now_ns
+    )
+
+    async def _forever(seconds: float) -> None:
+        if seconds > 1.0:
+            await asyncio.Event().wait()
+        await clock.sleep(seconds)
+
+    sched._sleep = _forever  # noqa: SLF001 - split the two sleeps for the test
+    assert await asyncio.wait_for(sched.run(asyncio.Event(), max_wakeups=1), 2) == 1
+    assert probed and loop_thread not in probed
+
+
+async def test_stop_event_interrupts_a_long_sleep() -> None:
+    sup = _FakeSupervisor({"d1": 86400}, _FakeClock(start_s=0))
+    sched = BarCloseScheduler(sup, now_ns=lambda: 0)
+    stop = asyncio.Event()
+    task = asyncio.ensure_future(sched.run(stop))
+    await asyncio.sleep(0)
+    stop.set()
+    assert await asyncio.wait_for(task, timeout=2) == 0
+    assert sup.steps == []
+
+
+def test_path_data_version_tracks_the_newest_file(tmp_path: pathlib.Path) -> None:
+    probe = path_data_version(tmp_path)
+    (tmp_path / "sub").mkdir()
+    bars = tmp_path / "sub" / "bars.parquet"
+    bars.write_bytes(b"x")
+    before = probe()
+    future = before + 10 * _S
+    os.utime(bars, ns=(future, future))
+    assert probe() == future
+    assert path_data_version(tmp_path / "missing")() == 0
+
+
+def test_supervisor_span_of_reads_the_data_span() -> None:
+    config = AppConfig.model_validate(
+        {
+            "strategies": [
+                {
+                    "name": "hourly",
+                    "symbol": "BTC/USD",
+                    "data": {"exchange": "kraken", "span": 3600},
+                },
+                {"name": "nodata", "symbol": "ETH/USD"},
+            ]
+        }
+    )
+    sup = StrategySupervisor(config)
+    assert sup.span_of("hourly") == 3600
+    assert sup.span_of("nodata") is None
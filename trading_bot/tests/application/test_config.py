@@ -197,6 +197,38 @@ def test_blank_strategy_symbol_raises() -> None:
         )
 
 
+def test_negative_strategy_prefetch_raises() -> None:
+    """A negative window prefetch depth is rejected; ``0`` (inline) is the default."""
+    with pytest.raises(ValidationError):
+        AppConfig.model_validate(
+            {"strategies": [{"name": "ma", "symbol": "BTC/USD", "prefetch": -1}]}
+        )
+    cfg = AppConfig.model_validate({"strategies": [{"name": "ma", "symbol": "BTC/USD"}]})
+    assert cfg.strategies[0].prefetch == 0
+
+
+def test_order_retention_is_optional_and_non_negative() -> None:
+    """``storage.order_retention`` defaults to ``None`` (keep every order)."""
+    assert AppConfig().storage.order_retention is None
+    cfg = AppConfig.model_validate({"storage": {"order_retention": 3600}})
+    assert cfg.storage.order_retention == 3600
+    with pytest.raises(ValidationError):
+        AppConfig.model_validate({"storage": {"order_retention": -1}})
+
+
+def test_write_behind_defaults_off_and_validates_its_budget() -> None:
+    storage = AppConfig().storage
+    assert (storage.write_behind, storage.flush_rows, storage.flush_interval) == (
+        False,
+        500,
+        0.02,
+    )
+    with pytest.raises(ValidationError):
+        AppConfig.model_validate({"storage": {"flush_rows": 0}})
+    with pytest.raises(ValidationError):
+        AppConfig.model_validate({"storage": {"flush_interval": -0.1}})
+
+
 def test_from_yaml_round_trips(tmp_path) -> None:
     """``from_yaml`` parses a small YAML file into the expected shape."""
     yaml_text = textwrap.dedent(
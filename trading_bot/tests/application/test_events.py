@@ -4,14 +4,18 @@ These prove: each event type carries its payload with ``Decimal`` money intact;
 :meth:`EventBus.emit` reaches every subscribed handler; two :meth:`add_queue`
 consumers each receive every event (fan-out, not steal); :meth:`unsubscribe` and
 :meth:`remove_queue` stop delivery; a handler that raises does not break the
-others; and a full queue drops rather than blocking. Queue tests are async
-(``asyncio_mode=auto``).
+others; a full queue drops rather than blocking; typed subscriptions only see
+their event types; and the async dispatch mode defers handlers to per-subscriber
+workers in order, drops only for non-critical subscribers, and reports depth.
+Queue and async-dispatch tests are async (``asyncio_mode=auto``).
 """
 
 from __future__ import annotations
 
 from decimal import Decimal
 
+import pytest
+
 from trading_bot.application import (
     EventBus,
     FillEvent,
@@ -190,3 +194,125 @@ def test_subscribers_and_queues_all_receive() -> None:
     assert seen_b == [ev]
     assert q1.get_nowait() is ev
     assert q2.get_nowait() is ev
+
+
+# --- typed routing and async dispatch --------------------------------------- #
+
+
+def test_typed_subscription_only_sees_its_types() -> None:
+    """A ``types`` filter keeps other event types away from the handler."""
+    bus = EventBus()
+    fills: list = []
+    everything: list = []
+    bus.subscribe(fills.append, types=(FillEvent,))
+    bus.subscribe(everything.append)
+
+    fill = FillEvent(fill=_make_fill())
+    bus.emit(LogEvent(message="noise"))
+    bus.emit(fill)
+    bus.emit(OrderEvent(order=_make_order()))
+
+    assert fills == [fill]
+    assert len(everything) == 3
+
+
+async def test_async_dispatch_defers_and_preserves_order() -> None:
+    """Async mode returns from emit at once; drain delivers every event in order."""
+    bus = EventBus(dispatch="async")
+    seen: list[str] = []
+    bus.subscribe(lambda e: seen.append(e.message), name="log")
+
+    for i in range(5):
+        bus.emit(LogEvent(message=str(i)))
+    assert seen == []
+    [sub] = bus.snapshot()["subscribers"]  # type: ignore[misc]
+    assert sub["depth"] == 5
+
+    await bus.drain()
+    assert seen == ["0", "1", "2", "3", "4"]
+    [sub] = bus.snapshot()["subscribers"]  # type: ignore[misc]
+    assert (sub["depth"], sub["high_water"], sub["dropped"]) == (0, 5, 0)
+
+
+async def test_async_dispatch_drops_only_for_non_critical_subscribers() -> None:
+    """Past ``maxsize`` a normal subscriber drops; a critical one buffers."""
+    bus = EventBus(dispatch="async", maxsize=2)
+    lossy: list = []
+    lossless: list = []
+    bus.subscribe(lossy.append, name="lossy")
+    bus.subscribe(lossless.append, critical=True, name="lossless")
+
+    events = [LogEvent(message=str(i)) for i in range(4)]
+    for event in events:
+        bus.emit(event)
+    await bus.drain()
+
+    assert lossy == events[:2]
+    assert lossless == events
+    by_name = {s["name"]: s for s in bus.snapshot()["subscribers"]}  # type: ignore[attr-defined]
+    assert by_name["lossy"]["dropped"] == 2
+    assert by_name["lossless"]["dropped"] == 0
+    assert by_name["lossless"]["high_water"] == 4
+
+
+async def test_async_dispatch_keeps_inline_subscribers_synchronous() -> None:
+    """An inline subscriber (the tracker, the PnL feed) sees the event in emit."""
+    bus = EventBus(dispatch="async")
+    inline: list = []
+    buffered: list = []
+    bus.subscribe(inline.append, inline=True, name="inline")
+    bus.subscribe(buffered.append, name="buffered")
+
+    event = LogEvent(message="x")
+    bus.emit(event)
+    assert (inline, buffered) == ([event], [])
+    await bus.drain()
+    assert buffered == [event]
+
+
+async def test_drain_waits_for_an_unsubscribed_handlers_buffer() -> None:
+    """Events buffered before an unsubscribe are still delivered, and drained."""
+    bus = EventBus(dispatch="async")
+    seen: list = []
+    bus.subscribe(seen.append)
+    events = [LogEvent(message=str(i)) for i in range(3)]
+    for event in events:
+        bus.emit(event)
+    bus.unsubscribe(seen.append)
+
+    await bus.drain()
+    assert seen == events
+    bus.emit(LogEvent(message="after"))
+    await bus.drain()
+    assert seen == events
+
+
+async def test_async_dispatch_isolates_a_failing_handler() -> None:
+    """A raising async subscriber is logged; the others still get the event."""
+    bus = EventBus(dispatch="async")
+    seen: list = []
+
+    def _boom(event: object) -> None:
+        raise RuntimeError("boom")
+
+    bus.subscribe(_boom)
+    bus.subscribe(seen.append)
+    bus.emit(LogEvent(message="x"))
+    await bus.drain()
+    assert len(seen) == 1
+
+
+def test_async_dispatch_without_a_loop_delivers_inline() -> None:
+    """With no running loop, async mode falls back to in-order inline delivery."""
+    bus = EventBus(dispatch="async")
+    seen: list = []
+    bus.subscribe(seen.append)
+    bus.emit(LogEvent(message="now"))
+    assert [e.message for e in seen] == ["now"]
+
+
+def test_invalid_bus_parameters_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        EventBus(dispatch="threads")  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        EventBus(maxsize=0)
@@ -0,0 +1,260 @@
+"""Tests for the record-and-replay journal (:mod:`trading_bot.application.journal`).
+
+Offline: a fake dccd client (canned bars), ``pytest-httpx`` for the recorded venue
+responses, and a fake WS connector. Proves a recorded paper run replays to the
+identical report with no dccd client at all, that bar reads are journalled as
+row deltas and rebuilt exactly, that HTTP outcomes (including the ambiguity
+error) and WS sessions round-trip, and that a diverging replay raises
+:class:`~trading_bot.application.journal.JournalError`. Async tests run
+un-decorated (``asyncio_mode = "auto"``).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import pathlib
+
+import httpx
+import polars as pl
+import pytest
+
+from trading_bot.application.config import AppConfig
+from trading_bot.application.journal import (
+    MAGIC,
+    JournalError,
+    JournalReader,
+    JournalWriter,
+    RecordingClock,
+    RecordingDccdClient,
+    RecordingHTTPClient,
+    ReplayDccdClient,
+    ReplayHTTPClient,
+    VirtualClock,
+    record_app,
+    recording_connect,
+    replay_app,
+    replay_connect,
+)
+from trading_bot.application.run_app import run_app
+from trading_bot.brokers.paper import deterministic_clock
+from trading_bot.domain.instrument import Instrument, Symbol
+from trading_bot.domain.money import money
+from trading_bot.domain.signal import Signal
+from trading_bot.transport.http import AmbiguousRequestError
+
+BTC_USD = Instrument(Symbol("BTC", "USD"))
+
+
+def _dccd_ohlc(closes: list[float], *, span_s: int = 60) -> pl.DataFrame:
+    span_ns = span_s * 1_000_000_000
+    return pl.DataFrame(
+        {
+            "TS": [i * span_ns for i in range(len(closes))],
+            "open": closes,
+            "high": [c + 0.5 for c in closes],
+            "low": [c - 0.5 for c in closes],
+            "close": closes,
+            "volume": [1.0] * len(closes),
+            "quote_volume": list(closes),
+            "trades": [1] * len(closes),
+        }
+    )
+
+
+class _FakeDccdClient:
+    """Canned bars keyed by symbol; ``end_ns`` caps the rows (a growing store)."""
+
+    def __init__(self, frames: dict[str, pl.DataFrame]) -> None:
+        self._frames = frames
+
+    def read(self, exchange, symbol, data_type="ohlc", span=None, start_ns=None, end_ns=None):  # noqa: ANN001, ANN201
+        frame = self._frames[symbol]
+        if end_ns is not None:
+            frame = frame.filter(pl.col("TS") <= end_ns)
+        return frame
+
+    def backfill(self, *a, **k):  # noqa: ANN002, ANN003, ANN201  # pragma: no cover
+        return None
+
+
+def momentum_signal(bars: pl.DataFrame) -> Signal:
+    """Long while the last close is above the first, flat otherwise (no fynance)."""
+    closes = bars["c"]
+    long = bars.height > 1 and closes[-1] > closes[0] and closes[-1] >= closes[-2]
+    return Signal.exposure(BTC_USD, money("1" if long else "0"), ts=0)
+
+
+def _trend() -> list[float]:
+    return [100.0 + i for i in range(20)] + [119.0 - i for i in range(1, 21)]
+
+
+def _config() -> AppConfig:
+    return AppConfig.model_validate(
+        {
+            "mode": "paper",
+            "strategies": [
+                {
+                    "name": "btc-ma",
+                    "symbol": "BTC/USD",
+                    "data": {"exchange": "kraken", "span": 60},
+                    "signal": {
+                        "ref": "trading_bot.tests.application.test_journal:momentum_signal"
+                    },
+                    "reference_qty": "2",
+                }
+            ],
+        }
+    )
+
+
+async def test_recorded_run_replays_to_the_identical_report(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "run.tbj"
+    client = _FakeDccdClient({"BTC/USD": _dccd_ohlc(_trend())})
+
+    recorded = await record_app(_config(), path, dccd_client=client)
+    replayed = await replay_app(_config(), path)
+
+    assert path.read_bytes().startswith(MAGIC)
+    assert recorded.strategies[0].orders_submitted > 0
+    assert replayed == recorded
+    # Recording changes nothing: the unrecorded run reports the same.
+    assert await run_app(_config(), dccd_client=client) == recorded
+
+
+def test_bar_reads_are_recorded_as_deltas_and_rebuilt(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "bars.tbj"
+    bars = _dccd_ohlc(_trend())
+    client = _FakeDccdClient({"BTC/USD": bars})
+    span_ns = 60 * 1_000_000_000
+    reads = [5, 6, 9]  # a live poll surfacing 1 then 3 new closed bars
+    with JournalWriter(path) as journal:
+        recorder = RecordingDccdClient(client, journal)  # type: ignore[arg-type]
+        originals = [
+            recorder.read("kraken", "BTC/USD", "ohlc", 60, None, (n - 1) * span_ns)
+            for n in reads
+        ]
+
+    # Only the rows each poll added are journalled: 5, then 1, then 3.
+    deltas = JournalReader(path)
+    assert [deltas.next_bars()[1].height for _ in reads] == [5, 1, 3]
+
+    replay = ReplayDccdClient(JournalReader(path))
+    for n, original in zip(reads, originals, strict=True):
+        rebuilt = replay.read("kraken", "BTC/USD", "ohlc", 60, None, (n - 1) * span_ns)
+        assert rebuilt.equals(original)
+
+
+def test_replay_divergence_raises(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "bars.tbj"
+    client = _FakeDccdClient({"BTC/USD": _dccd_ohlc(_trend())})
+    with JournalWriter(path) as journal:
+        RecordingDccdClient(client, journal).read("kraken", "BTC/USD", "ohlc", 60)  # type: ignore[arg-type]
+
+    replay = ReplayDccdClient(JournalReader(path))
+    with pytest.raises(JournalError, match="diverged"):
+        replay.read("kraken", "ETH/USD", "ohlc", 60)
+    with pytest.raises(JournalError, match="exhausted"):
+        replay.read("kraken", "BTC/USD", "ohlc", 60)
+
+
+def test_clock_replays_readings_then_keeps_ticking(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "clock.tbj"
+    readings = iter([1_000, 1_005])
+    with JournalWriter(path) as journal:
+        clock = RecordingClock(journal, source=lambda: next(readings))
+        assert [clock(), clock()] == [1_000, 1_005]
+
+    virtual = VirtualClock(JournalReader(path))
+    assert [virtual(), virtual(), virtual()] == [1_000, 1_005, 1_006]
+
+    # By default the paper broker's own deterministic clock is recorded.
+    with JournalWriter(path) as journal:
+        assert RecordingClock(journal)() == deterministic_clock()()
+
+
+def test_bad_signature_and_truncation_are_rejected(tmp_path: pathlib.Path) -> None:
+    bogus = tmp_path / "bogus.tbj"
+    bogus.write_bytes(b"nope")
+    with pytest.raises(JournalError, match="not a trading_bot journal"):
+        JournalReader(bogus)
+    truncated = tmp_path / "trunc.tbj"
+    truncated.write_bytes(MAGIC + b"\x02\x00\x00\x00\x08abc")
+    with pytest.raises(JournalError, match="truncated"):
+        JournalReader(truncated)
+
+
+async def test_http_outcomes_round_trip(tmp_path: pathlib.Path, httpx_mock) -> None:  # noqa: ANN001
+    path = tmp_path / "http.tbj"
+    httpx_mock.add_response(status_code=200, json={"result": {"XXBT": "1.5"}})
+    httpx_mock.add_response(status_code=503)
+    with JournalWriter(path) as journal:
+        async with RecordingHTTPClient(journal) as http:
+            assert await http.post("https://api.test/Balance") == {
+                "result": {"XXBT": "1.5"}
+            }
+            with pytest.raises(AmbiguousRequestError):
+                await http.post("https://api.test/AddOrder", retry=False)
+
+    reader = JournalReader(path)
+    async with ReplayHTTPClient(reader) as replay:
+        assert await replay.post("https://api.test/Balance") == {
+            "result": {"XXBT": "1.5"}
+        }
+        with pytest.raises(AmbiguousRequestError):
+            await replay.post("https://api.test/AddOrder", retry=False)
+        with pytest.raises(JournalError):
+            await replay.post("https://api.test/Balance")
+
+
+async def test_any_transport_error_is_recorded_and_replayed(
+    tmp_path: pathlib.Path, httpx_mock  # noqa: ANN001
+) -> None:
+    path = tmp_path / "http.tbj"
+    httpx_mock.add_exception(httpx.ConnectError("refused"))
+    with JournalWriter(path) as journal:
+        async with RecordingHTTPClient(
+            journal, max_retries=1, backoff_base=0.0
+        ) as http:
+            with pytest.raises(httpx.ConnectError):
+                await http.get("https://api.test/Time")
+
+    async with ReplayHTTPClient(JournalReader(path)) as replay:
+        with pytest.raises(httpx.ConnectError, match="refused"):
+            await replay.get("https://api.test/Time")
+
+
+class _FakeWS:
+    def __init__(self, frames: list[str | bytes]) -> None:
+        self._frames = frames
+
+    async def send(self, message: object) -> None:
+        return None
+
+    async def __aiter__(self):  # noqa: ANN204
+        for frame in self._frames:
+            yield frame
+
+
+async def test_ws_sessions_round_trip(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "ws.tbj"
+    sessions = iter([["a", b"\x01b"], ["c"]])
+
+    @contextlib.asynccontextmanager
+    async def _connect(url: str):  # noqa: ANN202
+        yield _FakeWS(next(sessions))
+
+    with JournalWriter(path) as journal:
+        connect = recording_connect(journal, _connect)
+        for _ in range(2):
+            async with connect("wss://ws.test") as ws:
+                [frame async for frame in ws]
+
+    replay = replay_connect(JournalReader(path))
+    got = []
+    for _ in range(2):
+        async with replay("wss://ws.test") as ws:
+            got.append([frame async for frame in ws])
+    assert got == [["a", b"\x01b"], ["c"]]
+    with pytest.raises(JournalError):
+        async with replay("wss://ws.test"):
+            pass  # pragma: no cover
@@ -0,0 +1,129 @@
+"""Tests for structured log events: lazy rendering, sampling, rate limits, the ring.
+
+What is verified
+----------------
+* :meth:`EventBus.log` builds nothing when no one takes ``LogEvent`` and never
+  formats a template the consumer does not read;
+* :attr:`LogEvent.message` renders once (cached) and keeps field objects exact;
+* :class:`LogPolicy` samples deterministically and rate-limits per category,
+  never dropping a warning;
+* :class:`LogRing` pages newest-first with a ``before`` cursor and filters;
+* the engine factory wires the ring and the policy from ``events`` config.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from trading_bot.application.config import AppConfig
+from trading_bot.application.events import EventBus, FillEvent, LogEvent
+from trading_bot.application.log_events import LogPolicy, LogRing
+from trading_bot.application.service_factory import build_engine
+
+
+class _CountingField:
+    """A template field that counts how often it is formatted."""
+
+    def __init__(self) -> None:
+        self.formats = 0
+
+    def __format__(self, spec: str) -> str:
+        self.formats += 1
+        return "counted"
+
+
+def test_log_without_log_consumers_builds_nothing() -> None:
+    bus = EventBus()
+    fills: list = []
+    bus.subscribe(fills.append, types=(FillEvent,))
+    field = _CountingField()
+
+    assert not bus.wants(LogEvent)
+    bus.log("{x}", x=field)
+    assert fills == []
+    assert field.formats == 0
+
+
+def test_message_is_rendered_lazily_and_once() -> None:
+    bus = EventBus()
+    seen: list[LogEvent] = []
+    bus.subscribe(seen.append)  # type: ignore[arg-type]
+    field = _CountingField()
+
+    bus.log("leg {x} qty {qty}", category="portfolio", x=field, qty=Decimal("0.10"))
+    [event] = seen
+    assert field.formats == 0
+    assert event.fields is not None and event.fields["qty"] == Decimal("0.10")
+    assert event.message == "leg counted qty 0.10"
+    assert event.message == "leg counted qty 0.10"
+    assert field.formats == 1
+    assert event.category == "portfolio"
+
+
+def test_verbatim_message_and_bad_template() -> None:
+    assert LogEvent("literal {braces}").message == "literal {braces}"
+    broken = LogEvent("missing {name}", fields={"other": 1})
+    assert broken.message == "missing {name} {'other': 1}"
+
+
+def test_policy_samples_deterministically_per_category() -> None:
+    policy = LogPolicy(sample={"portfolio": 0.25, "*": 0.5})
+    kept = [policy.allow("portfolio", "info") for _ in range(8)]
+    assert kept.count(True) == 2
+    assert [policy.allow("other", "info") for _ in range(4)].count(True) == 2
+    assert policy.allow("portfolio", "warning")
+    assert policy.allow("portfolio", "error")
+    assert policy.suppressed["portfolio"] == 6
+
+
+def test_policy_rate_limits_with_a_token_bucket() -> None:
+    now = [0.0]
+    policy = LogPolicy(rate={"strategy": 2.0}, clock=lambda: now[0])
+    assert [policy.allow("strategy", "info") for _ in range(3)] == [True, True, False]
+    now[0] += 0.5  # one token back
+    assert [policy.allow("strategy", "info") for _ in range(2)] == [True, False]
+    assert policy.allow("risk", "info")  # other categories unlimited
+    assert policy.suppressed["strategy"] == 2
+
+
+def test_policy_rejects_bad_limits() -> None:
+    with pytest.raises(ValueError):
+        LogPolicy(sample={"x": 1.5})
+    with pytest.raises(ValueError):
+        LogPolicy(rate={"x": -1})
+
+
+def test_ring_pages_newest_first() -> None:
+    bus = EventBus()
+    ring = LogRing(bus, capacity=5)
+    for i in range(7):
+        bus.log("line {i}", category="odd" if i % 2 else "even", i=i)
+    bus.log("careful", level="warning")
+
+    assert len(ring) == 5 and ring.head == 8
+    first = ring.page(limit=2)
+    assert [r.message for r in first] == ["careful", "line 6"]
+    second = ring.page(before=first[-1].seq, limit=2)
+    assert [r.message for r in second] == ["line 5", "line 4"]
+    assert [r.message for r in ring.page(category="odd")] == ["line 5", "line 3"]
+    assert [r.level for r in ring.page(level="warning")] == ["warning"]
+    with pytest.raises(ValueError):
+        LogRing(bus, capacity=0)
+
+
+def test_factory_wires_ring_and_policy() -> None:
+    engine = build_engine(
+        AppConfig.model_validate(
+            {"events": {"log_sample": {"strategy": 0.5}, "log_buffer": 10}}
+        )
+    )
+    assert engine.logs is not None
+    for i in range(4):
+        engine.bus.log("tick {i}", category="strategy", i=i)
+    assert [r.message for r in engine.logs.page()] == ["tick 3", "tick 1"]
+
+    bare = build_engine(AppConfig.model_validate({"events": {"log_buffer": 0}}))
+    assert bare.logs is None
+    assert bare.bus.log_policy is None
@@ -12,7 +12,9 @@ These prove the router's safety contract:
 * a broker that raises :class:`BrokerError` on ``place_order`` drives the order to
   ``REJECTED``, emits a reject event, surfaces the error, and *records* the
   attempt so a re-submit of the same id does **not** re-call the broker;
-* ``cancel`` cancels on the broker and transitions the order, emitting an event.
+* ``cancel`` cancels on the broker and transitions the order, emitting an event;
+* on a broker with native batches, same-pair legs share one ``place_orders``
+  call and each leg's outcome lands on its own order.
 
 The final "real data" test routes a realistic sequence through the actual
 ``PaperBroker`` and asserts the lifecycle end to end. Async tests run un-decorated
@@ -25,7 +27,8 @@ import asyncio
 
 import pytest
 
-from trading_bot.application import EventBus, OrderEvent, OrderRouter
+from trading_bot.application import EventBus, OrderEvent, OrderRouter, RiskManager
+from trading_bot.application.config import RiskConfig
 from trading_bot.brokers.base import Broker, Capability
 from trading_bot.brokers.paper import PaperBroker
 from trading_bot.domain import (
@@ -33,13 +36,17 @@ from trading_bot.domain import (
     Instrument,
     MissingOrder,
     Order,
+    OrderError,
     OrderSide,
     OrderStatus,
     OrderType,
+    ReplaceFailed,
     RiskLimitBreached,
     Symbol,
     money,
 )
+from trading_bot.storage import SqliteStore
+from trading_bot.transport import AmbiguousRequestError
 
 BTC_USD = Instrument(Symbol("BTC", "USD"))
 
@@ -417,3 +424,445 @@ def test_restore_emits_no_events_and_never_clobbers_a_tracked_id() -> None:
     # Re-restoring the same id is a no-op (count 0) and does not replace the object.
     assert router.restore([_order("a")]) == 0
     assert router.get("a") is a  # original kept, not clobbered
+
+
+# --- submit_many (concurrent legs) ---------------------------------------- #
+
+
+class _LatencyBroker(_SpyBroker):
+    """Places after a short delay, recording the in-flight high-water mark and
+    the sequence ``place_order`` calls started in; fails ids in ``fail_ids``."""
+
+    def __init__(self, *, fail_ids: tuple[str, ...] = ()) -> None:
+        super().__init__()
+        self._fail_ids = fail_ids
+        self.in_flight = 0
+        self.peak = 0
+        self.started: list[str] = []
+
+    async def place_order(self, order: Order) -> str:
+        self.started.append(order.client_order_id)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        self.place_calls += 1
+        if order.client_order_id in self._fail_ids:
+            raise BrokerError("venue rejected the order")
+        self._ids += 1
+        return f"LAT-{self._ids}"
+
+
+def _leg(cid: str, side: OrderSide) -> Order:
+    return Order(
+        client_order_id=cid,
+        instrument=BTC_USD,
+        side=side,
+        qty=money("1"),
+        type=OrderType.LIMIT,
+        limit_price=money("30000"),
+    )
+
+
+async def test_submit_many_bounds_parallelism_and_keeps_input_order() -> None:
+    broker = _LatencyBroker(fail_ids=("leg-2",))
+    router = OrderRouter(broker, EventBus())
+    legs = [_leg(f"leg-{i}", OrderSide.BUY) for i in range(6)]
+
+    results = await router.submit_many(legs, parallelism=3)
+
+    assert broker.peak == 3
+    assert broker.started == [f"leg-{i}" for i in range(6)]
+    assert [getattr(r, "client_order_id", None) for r in results] == [
+        "leg-0", "leg-1", None, "leg-3", "leg-4", "leg-5"
+    ]
+    assert isinstance(results[2], BrokerError)
+    assert router.get("leg-2").status is OrderStatus.REJECTED  # type: ignore[union-attr]
+
+
+async def test_submit_many_keeps_a_slot_for_an_unexpected_leg_error() -> None:
+    """A leg failing with an arbitrary error fails only its slot, in input order."""
+
+    class _Flaky(_LatencyBroker):
+        async def place_order(self, order: Order) -> str:
+            if order.client_order_id == "leg-1":
+                raise RuntimeError("socket closed")
+            return await super().place_order(order)
+
+    router = OrderRouter(_Flaky(), EventBus())
+    legs = [_leg(f"leg-{i}", OrderSide.BUY) for i in range(3)]
+
+    results = await router.submit_many(legs, parallelism=3)
+
+    assert len(results) == 3
+    assert isinstance(results[1], RuntimeError)
+    assert [getattr(r, "client_order_id", None) for r in results] == [
+        "leg-0", None, "leg-2"
+    ]
+
+
+async def test_submit_many_dedups_and_respects_the_risk_gate() -> None:
+    class _RefuseBig:
+        tripped = False
+
+        def check(self, order: Order) -> None:
+            if order.client_order_id == "big":
+                raise RiskLimitBreached("max_order", order.qty, money("0"))
+
+        def check_batch(self, orders: list[Order]) -> list[None]:
+            return [None] * len(orders)  # leave every leg to the per-leg check
+
+    broker = _LatencyBroker()
+    router = OrderRouter(broker, EventBus(), risk_manager=_RefuseBig())  # type: ignore[arg-type]
+    await router.submit(_leg("done", OrderSide.BUY))
+    legs = [
+        _leg("done", OrderSide.BUY),
+        _leg("big", OrderSide.BUY),
+        _leg("new", OrderSide.BUY),
+        _leg("new", OrderSide.BUY),
+    ]
+
+    results = await router.submit_many(legs, parallelism=4)
+
+    assert isinstance(results[1], RiskLimitBreached)
+    assert results[2] is results[3]  # one venue order for the duplicated id
+    assert broker.place_calls == 2  # "done" (before) + "new" once; "big" never placed
+    assert router.get("big") is None
+
+
+async def test_submit_many_sells_first_settles_sells_before_buys() -> None:
+    broker = _LatencyBroker()
+    router = OrderRouter(broker, EventBus())
+    legs = [
+        _leg("b1", OrderSide.BUY),
+        _leg("s1", OrderSide.SELL),
+        _leg("b2", OrderSide.BUY),
+        _leg("s2", OrderSide.SELL),
+    ]
+
+    results = await router.submit_many(legs, parallelism=4, ordering="sells_first")
+
+    assert broker.started[:2] == ["s1", "s2"]
+    assert broker.peak == 2  # the two sells, then the two buys — never mixed
+    assert [r.client_order_id for r in results] == ["b1", "s1", "b2", "s2"]  # type: ignore[union-attr]
+
+
+async def test_submit_many_rejects_zero_parallelism() -> None:
+    router = OrderRouter(_SpyBroker(), EventBus())
+    with pytest.raises(ValueError, match="parallelism"):
+        await router.submit_many([_order()], parallelism=0)
+
+
+ETH_USD = Instrument(Symbol("ETH", "USD"))
+
+
+class _BatchBroker(_LatencyBroker):
+    """Adds native batches: records each ``place_orders`` / ``cancel_orders``
+    call; ids in ``fail_ids`` are rejected per order, ``ambiguous`` fails the
+    whole batch with an unknown outcome."""
+
+    max_batch_size = 15
+
+    def __init__(self, *, fail_ids: tuple[str, ...] = (), ambiguous: bool = False) -> None:
+        super().__init__(fail_ids=fail_ids)
+        self._ambiguous = ambiguous
+        self.batches: list[list[str]] = []
+        self.cancel_batches: list[list[str]] = []
+
+    def capabilities(self) -> set[Capability]:
+        return super().capabilities() | {Capability.BATCH_ORDERS, Capability.BATCH_CANCEL}
+
+    async def place_orders(self, orders):  # type: ignore[no-untyped-def]
+        self.batches.append([order.client_order_id for order in orders])
+        if self._ambiguous:
+            error = AmbiguousRequestError("https://venue/batch", "HTTP 503")
+            return [error] * len(orders)
+        results: list[str | Exception] = []
+        for order in orders:
+            if order.client_order_id in self._fail_ids:
+                results.append(BrokerError("venue rejected the order"))
+            else:
+                self._ids += 1
+                results.append(f"BATCH-{self._ids}")
+        return results
+
+    async def cancel_orders(self, venue_order_ids):  # type: ignore[no-untyped-def]
+        self.cancel_batches.append(list(venue_order_ids))
+
+
+async def test_submit_many_batches_same_pair_legs_and_maps_each_result() -> None:
+    broker = _BatchBroker(fail_ids=("b2",))
+    bus = EventBus()
+    seen = _capture(bus)
+    router = OrderRouter(broker, bus)
+    eth = Order(client_order_id="e1", instrument=ETH_USD, side=OrderSide.BUY,
+                qty=money("1"), type=OrderType.LIMIT, limit_price=money("2000"))
+    legs = [
+        _leg("b1", OrderSide.BUY),
+        eth,
+        _leg("b2", OrderSide.BUY),
+        _leg("b3", OrderSide.SELL),
+    ]
+
+    results = await router.submit_many(legs, parallelism=2)
+
+    assert broker.batches == [["b1", "b2", "b3"]]  # one venue call for the BTC legs
+    assert broker.started == ["e1"]  # the lone ETH leg went out singly
+    assert [getattr(r, "status", None) for r in results] == [
+        OrderStatus.OPEN, OrderStatus.OPEN, None, OrderStatus.OPEN
+    ]
+    assert isinstance(results[2], BrokerError)
+    assert router.get("b2").status is OrderStatus.REJECTED  # type: ignore[union-attr]
+    assert results[0].venue_order_id.startswith("BATCH-")  # type: ignore[union-attr]
+    assert len([e for e in seen if isinstance(e, OrderEvent)]) == 4
+
+
+async def test_ambiguous_batch_leaves_every_leg_untracked() -> None:
+    broker = _BatchBroker(ambiguous=True)
+    router = OrderRouter(broker, EventBus())
+    legs = [_leg("a1", OrderSide.BUY), _leg("a2", OrderSide.BUY)]
+
+    results = await router.submit_many(legs)
+
+    assert all(isinstance(r, AmbiguousRequestError) for r in results)
+    assert all(leg.status is OrderStatus.NEW for leg in legs)
+    assert router.get("a1") is None and router.get("a2") is None  # reconcile first
+
+
+async def test_batch_checks_risk_per_leg_before_placing() -> None:
+    class _RefuseBig:
+        tripped = False
+
+        def check(self, order: Order) -> None:
+            if order.client_order_id == "big":
+                raise RiskLimitBreached("max_order", order.qty, money("0"))
+
+        def check_batch(self, orders: list[Order]) -> list[None]:
+            return [None] * len(orders)  # leave every leg to the per-leg check
+
+    broker = _BatchBroker()
+    router = OrderRouter(broker, EventBus(), risk_manager=_RefuseBig())  # type: ignore[arg-type]
+    await router.submit(_leg("done", OrderSide.BUY))
+    legs = [
+        _leg("done", OrderSide.BUY),
+        _leg("big", OrderSide.BUY),
+        _leg("new", OrderSide.BUY),
+        _leg("new", OrderSide.BUY),
+    ]
+
+    results = await router.submit_many(legs)
+
+    assert broker.batches == [["new"]]  # dedup + risk applied before the batch
+    assert results[0] is router.get("done")
+    assert isinstance(results[1], RiskLimitBreached)
+    assert results[2] is results[3]
+    assert router.get("big") is None
+
+
+async def test_cancel_many_uses_one_batch_cancel() -> None:
+    broker = _BatchBroker()
+    router = OrderRouter(broker, EventBus())
+    legs = await router.submit_many([_leg(f"c{i}", OrderSide.BUY) for i in range(3)])
+
+    cancelled = await router.cancel_many(["c0", "c1", "c2"])
+
+    assert broker.cancel_batches == [[leg.venue_order_id for leg in legs]]  # type: ignore[union-attr]
+    assert broker.cancel_calls == 0
+    assert all(order.status is OrderStatus.CANCELLED for order in cancelled)  # type: ignore[union-attr]
+
+
+async def test_cancel_many_falls_back_per_order_and_captures_failures() -> None:
+    broker = PaperBroker(fill_model="partial", partial_fill_ratio=money("0.5"))
+    router = OrderRouter(broker, EventBus())
+    await router.submit_many([_order("p1"), _order("p2")])
+    await broker.cancel_order(router.get("p2").venue_order_id)  # type: ignore[arg-type,union-attr]
+
+    results = await router.cancel_many(["p1", "p2", "missing"])
+
+    assert results[0].status is OrderStatus.CANCELLED  # type: ignore[union-attr]
+    assert isinstance(results[1], MissingOrder)  # gone on the venue: attributed to p2
+    assert isinstance(results[2], MissingOrder)
+    assert await broker.open_orders() == []
+
+
+async def test_open_orders_index_tracks_live_orders_per_instrument() -> None:
+    router = OrderRouter(_SpyBroker(), EventBus())
+    btc = await router.submit(_order("i1"))
+    await router.submit(_order("i2"))
+    eth = await router.submit(Order(client_order_id="i3", instrument=ETH_USD,
+                                    side=OrderSide.BUY, qty=money("1"),
+                                    type=OrderType.LIMIT, limit_price=money("2000")))
+
+    assert [o.client_order_id for o in router.open_orders(BTC_USD)] == ["i1", "i2"]
+    assert router.open_orders(ETH_USD) == [eth]
+
+    await router.cancel("i2")
+    btc.apply_fill(money("1"), money("30000"))  # filled outside the router
+    assert router.open_orders(BTC_USD) == []
+    assert router.open_orders() == [eth]
+    assert router.tracked_count == 3  # history is still tracked, just not live
+
+
+async def test_terminal_orders_are_archived_and_still_deduped(tmp_path) -> None:
+    now = {"t": 0.0}
+    store = SqliteStore(tmp_path / "orders.db")
+    broker = _SpyBroker()
+    router = OrderRouter(broker, EventBus(), archive=store, retention=60.0,
+                         clock=lambda: now["t"])
+    await router.submit(_order("old"))
+    await router.submit(_order("live"))
+    await router.cancel("old")
+
+    now["t"] = 30.0
+    assert router.archive_terminal() == 0  # not yet past the retention window
+    now["t"] = 61.0
+    assert router.archive_terminal() == 1
+
+    assert router.get("old") is None and router.tracked_count == 1
+    assert store.get_order("old").status is OrderStatus.CANCELLED  # type: ignore[union-attr]
+    again = await router.submit(_order("old"))  # dedup falls back to the store
+    assert again.status is OrderStatus.CANCELLED
+    assert broker.place_calls == 2
+    assert router.archived == 1
+
+
+async def test_archiving_to_a_write_behind_store_waits_for_no_commit(tmp_path) -> None:
+    now = {"t": 0.0}
+    store = SqliteStore(tmp_path / "orders.db", write_behind=True, flush_interval=60)
+    broker = _SpyBroker()
+    router = OrderRouter(broker, EventBus(), archive=store, retention=10.0,
+                         clock=lambda: now["t"])
+    await router.submit(_order("old"))
+    await router.cancel("old")
+    now["t"] = 11.0
+    assert router.archive_terminal() == 1
+    assert store._committed == 0  # still queued: the router did not flush
+    again = await router.submit(_order("old"))  # dedup reads the queued row
+    assert again.status is OrderStatus.CANCELLED
+    assert broker.place_calls == 1
+    store.close()
+
+
+async def test_submit_sweeps_the_archive_every_half_window(tmp_path) -> None:
+    now = {"t": 0.0}
+    router = OrderRouter(
+        _SpyBroker(),
+        EventBus(),
+        archive=SqliteStore(tmp_path / "o.db"),
+        retention=10.0,
+        clock=lambda: now["t"],
+    )
+    await router.submit(_order("a"))
+    await router.cancel("a")
+    now["t"] = 11.0
+    await router.submit(_order("b"))
+    assert router.get("a") is None and router.archived == 1
+
+
+def test_retention_requires_an_archive() -> None:
+    with pytest.raises(ValueError, match="archive"):
+        OrderRouter(_SpyBroker(), EventBus(), retention=60.0)
+
+
+# --- amend ------------------------------------------------------------------ #
+
+
+class _ReplaceBroker(_SpyBroker):
+    """A spy with ``AMEND`` that cancel-replaces (a new venue id per amend)."""
+
+    name = "replace"
+
+    def __init__(self, *, fail_amend: bool = False, drop_original: bool = False) -> None:
+        super().__init__()
+        self.amend_calls: list[tuple[str | None, object, object]] = []
+        self._fail_amend = fail_amend
+        self._drop_original = drop_original
+
+    def capabilities(self) -> set[Capability]:
+        return super().capabilities() | {Capability.AMEND}
+
+    async def amend_order(self, order, *, qty=None, limit_price=None):  # type: ignore[no-untyped-def]
+        self.amend_calls.append((order.venue_order_id, qty, limit_price))
+        if self._fail_amend:
+            raise BrokerError("venue refused the amend")
+        if self._drop_original:
+            raise ReplaceFailed(order.client_order_id, "new order refused")
+        return f"SPY-R{len(self.amend_calls)}"
+
+
+async def test_amend_reprices_the_paper_order_in_place() -> None:
+    broker = PaperBroker(fill_model="partial", partial_fill_ratio=money("0.5"))
+    bus = EventBus()
+    seen = _capture(bus)
+    router = OrderRouter(broker, bus)
+    order = await router.submit(_order(cid="chase"))
+    venue_id = order.venue_order_id
+
+    amended = await router.amend("chase", qty=money("2"), limit_price=money("29900"))
+
+    assert amended is order
+    assert (order.client_order_id, order.venue_order_id) == ("chase", venue_id)
+    assert order.status is OrderStatus.OPEN
+    assert (order.qty, order.limit_price) == (money("2"), money("29900"))
+    [live] = await broker.open_orders()
+    assert (live.qty, live.limit_price) == (money("2"), money("29900"))
+    assert len(seen) == 2 and seen[-1].order is order
+
+
+async def test_amend_adopts_the_new_venue_id_of_a_cancel_replace() -> None:
+    broker = _ReplaceBroker()
+    router = OrderRouter(broker, EventBus())
+    order = await router.submit(_order(cid="cr"))
+
+    await router.amend(order, limit_price=money("30100"))
+
+    assert broker.amend_calls == [("SPY-1", None, money("30100"))]
+    assert order.venue_order_id == "SPY-R1"
+    assert router.get("cr") is order
+    assert router.open_orders() == [order]
+
+
+async def test_refused_amend_leaves_the_order_untouched() -> None:
+    broker = _ReplaceBroker(fail_amend=True)
+    rm = RiskManager(RiskConfig(max_order=money("1.5")))
+    router = OrderRouter(broker, EventBus(), risk_manager=rm)
+    order = await router.submit(_order(cid="keep"))
+
+    with pytest.raises(RiskLimitBreached):
+        await router.amend(order, qty=money("2"))
+    assert broker.amend_calls == []  # refused before the venue was asked
+    with pytest.raises(BrokerError):
+        await router.amend(order, limit_price=money("29000"))
+    assert (order.qty, order.limit_price, order.venue_order_id) == (
+        money("1"),
+        money("30000"),
+        "SPY-1",
+    )
+    with pytest.raises(OrderError, match="must exceed filled"):
+        await router.amend(order, qty=money("0"))
+
+
+async def test_half_failed_cancel_replace_cancels_the_tracked_order() -> None:
+    """The venue dropped the original: the order is CANCELLED and announced."""
+    bus = EventBus()
+    seen = _capture(bus)
+    router = OrderRouter(_ReplaceBroker(drop_original=True), bus)
+    order = await router.submit(_order(cid="gone"))
+
+    with pytest.raises(ReplaceFailed, match="new order refused"):
+        await router.amend(order, limit_price=money("30100"))
+
+    assert order.status is OrderStatus.CANCELLED
+    assert seen[-1].order is order and seen[-1].order.status is OrderStatus.CANCELLED
+    assert router.open_orders() == []
+
+
+async def test_amend_needs_the_amend_capability() -> None:
+    from trading_bot.domain import NoCapability
+
+    router = OrderRouter(_SpyBroker(), EventBus())
+    await router.submit(_order(cid="plain"))
+    with pytest.raises(NoCapability):
+        await router.amend("plain", limit_price=money("1"))
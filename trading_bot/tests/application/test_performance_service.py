@@ -12,6 +12,8 @@ These prove the service's read-side performance contract:
   is installed in the venv);
 * the short-series policy: 0 or 1 fills -> every KPI returns ``0.0``, no raise;
 * ``EventBus`` subscription drives the view (other events are ignored);
+* :meth:`PerformanceService.from_frame` over the same fills as columns equals
+  applying them one by one;
 * an end-to-end run where an
   :class:`~trading_bot.application.order_router.OrderRouter` submits to a
   :class:`~trading_bot.brokers.paper.PaperBroker` whose emitted fills update the
@@ -25,6 +27,7 @@ from __future__ import annotations
 
 from decimal import Decimal
 
+import polars as pl
 import pytest
 
 from trading_bot.application import (
@@ -393,3 +396,72 @@ def test_subscribed_service_dedups_reemitted_fill_event() -> None:
     # Realised PnL == one BUY 1@100 (fee 1) then one SELL 1@110 (fee 1): +10 - 2 = 8.
     assert svc.realised_pnl() == Decimal("8")
     assert svc.fees_paid() == Decimal("2")
+
+
+def test_from_frame_equals_applying_each_fill() -> None:
+    """The columnar build matches ``apply`` per fill, and ``apply`` continues it."""
+    fills = [
+        _fill(fill_id="F1", side=OrderSide.BUY, qty="2", price="100", fee="0.5"),
+        _fill(fill_id="F2", side=OrderSide.SELL, qty="1", price="3000",
+              instrument=ETH_USD, fee="0.25"),
+        _fill(fill_id="F3", side=OrderSide.BUY, qty="1", price="130"),
+        _fill(fill_id="F4", side=OrderSide.SELL, qty="5", price="120", fee="1"),
+        _fill(fill_id="F5", side=OrderSide.BUY, qty="1", price="2900",
+              instrument=ETH_USD),
+    ]
+    frame = pl.DataFrame(
+        {
+            "fill_id": [f.fill_id for f in fills] + ["F3"],  # a replayed fill
+            "instrument": [str(f.instrument.symbol) for f in fills] + ["BTC/USD"],
+            "side": [f.side.value for f in fills] + ["buy"],
+            "qty": [f.qty for f in fills] + [Decimal("1")],
+            "price": [f.price for f in fills] + [Decimal("130")],
+            "fee": [f.fee for f in fills] + [Decimal("0")],
+        },
+        schema_overrides={name: pl.Decimal(38, 18) for name in ("qty", "price", "fee")},
+    )
+    expected = PerformanceService(v0=money("1000"))
+    for fill in fills:
+        expected.apply(fill)
+
+    built = PerformanceService.from_frame(frame, v0=money("1000"))
+
+    assert built.equity_curve() == expected.equity_curve()
+    assert str(built.realised_pnl()) == str(expected.realised_pnl())
+    assert built.fees_paid() == expected.fees_paid() == Decimal("1.75")
+    for instrument in (BTC_USD, ETH_USD):
+        assert built.position(instrument) == expected.position(instrument)
+
+    more = _fill(fill_id="F6", side=OrderSide.BUY, qty="3", price="110")
+    built.apply(fills[0])  # already folded from the frame
+    built.apply(more)
+    expected.apply(more)
+    assert built.equity_curve() == expected.equity_curve()
+
+
+def test_from_frame_keeps_the_zeros_of_integer_scale_columns() -> None:
+    """A ``Decimal(38, 0)`` qty of 100 stays 100 and a zero fee stays 0."""
+    fills = [
+        _fill(fill_id="F1", side=OrderSide.BUY, qty="100", price="100", fee="0"),
+        _fill(fill_id="F2", side=OrderSide.SELL, qty="100", price="110", fee="10"),
+    ]
+    frame = pl.DataFrame(
+        {
+            "fill_id": [f.fill_id for f in fills],
+            "instrument": [str(f.instrument.symbol) for f in fills],
+            "side": [f.side.value for f in fills],
+            "qty": [f.qty for f in fills],
+            "price": [f.price for f in fills],
+            "fee": [f.fee for f in fills],
+        },
+        schema_overrides={name: pl.Decimal(38, 0) for name in ("qty", "price", "fee")},
+    )
+    expected = PerformanceService(v0=money("1000"))
+    for fill in fills:
+        expected.apply(fill)
+
+    built = PerformanceService.from_frame(frame, v0=money("1000"))
+
+    assert built.realised_pnl() == expected.realised_pnl() == Decimal("990")
+    assert built.fees_paid() == Decimal("10")
+    assert built.equity_curve() == expected.equity_curve()
@@ -263,6 +263,23 @@ def test_gross_cap_carried_onto_strategy() -> None:
     assert runners[0].strategy.gross_cap == money("1.5")
 
 
+def test_leg_parallelism_and_order_thread_into_the_runner() -> None:
+    """``parallelism`` / ``leg_order`` default to sequential-in-universe-order,
+    reject a parallelism below one, and reach the built runner."""
+    pf = _one_portfolio_config().portfolios[0]
+    assert (pf.parallelism, pf.leg_order) == (1, "given")
+    raw = _one_portfolio_config().model_dump(mode="json")
+    raw["portfolios"][0].update(parallelism=0)
+    with pytest.raises(ValidationError, match="parallelism"):
+        AppConfig.model_validate(raw)
+    raw["portfolios"][0].update(parallelism=16, leg_order="sells_first")
+    cfg = AppConfig.model_validate(raw)
+    engine = build_engine(cfg, db_path=None)
+    client = _daily_client({"BTCUSDT": [50000.0], "ETHUSDT": [2500.0]})
+    [runner] = build_portfolio_runners(cfg, engine, dccd_client=client)
+    assert (runner._parallelism, runner._leg_order) == (16, "sells_first")  # noqa: SLF001
+
+
 # --- store-key format (dccd store-key convention) -------------------------- #
 
 
@@ -30,6 +30,7 @@ from collections.abc import Mapping
 from decimal import Decimal
 
 import polars as pl
+import pytest
 
 from trading_bot.application import (
     EventBus,
@@ -506,3 +507,40 @@ async def test_rebalance_latest_returns_none_on_empty_feed() -> None:
     )
 
     assert await runner.rebalance_latest() is None
+
+
+# --- concurrent legs ------------------------------------------------------- #
+
+
+async def test_concurrent_sells_first_legs_route_the_same_book() -> None:
+    """``parallelism`` + ``sells_first`` change the sequencing, not the book."""
+    weights = {BTC: money("0.5"), ETH: money("-0.25")}
+    router, tracker, bus, _broker = _engine(risk=RiskConfig(max_order=money("5")))
+    seen: list[str] = []
+    bus.subscribe(lambda event: seen.append(getattr(event, "message", "")))
+    runner = PortfolioRunner(
+        _strategy(_weights_signal(weights)),
+        _ListFeed([], asof=1_700),
+        router,
+        tracker,
+        event_bus=bus,
+        parallelism=4,
+        leg_order="sells_first",
+    )
+
+    result = await runner.rebalance(_frames())
+
+    # Same per-leg outcome as the sequential run: BTC routes, ETH breaches.
+    assert result.submitted == 1
+    assert [f.symbol for f in result.failures] == [ETH]
+    assert tracker.position(Instrument(BTC)).net_qty == Decimal("1")
+    # Leg log lines are reported in universe order regardless of routing order.
+    legs = [m for m in seen if "step 0" in m]
+    assert "BTC/USDT" in legs[0] and "ETH/USDT" in legs[1]
+
+
+def test_parallelism_below_one_is_rejected() -> None:
+    router, tracker, _bus, _broker = _engine()
+    strat = _strategy(_weights_signal({BTC: money("0.5")}))
+    with pytest.raises(ValueError, match="parallelism"):
+        PortfolioRunner(strat, _ListFeed([], asof=1), router, tracker, parallelism=0)
@@ -146,6 +146,17 @@ def test_subscribed_tracker_updates_on_fill_events() -> None:
     _assert_same_position(tracker.position(BTC_USD), fills)
 
 
+async def test_async_bus_still_updates_the_tracker_inside_emit() -> None:
+    """On an async bus the tracker is inline: the next risk check sees the fill."""
+    bus = EventBus(dispatch="async")
+    tracker = PositionTracker(event_bus=bus)
+    fill = _fill(fill_id="F1", side=OrderSide.BUY, qty="2", price="30000", fee="6")
+
+    bus.emit(FillEvent(fill))
+
+    _assert_same_position(tracker.position(BTC_USD), [fill])
+
+
 def test_subscribed_tracker_ignores_non_fill_events() -> None:
     """A subscribed tracker ignores non-:class:`FillEvent` events (no crash)."""
     bus = EventBus()
@@ -17,8 +17,14 @@ The cases cover the two divergence directions:
   policy.
 
 Plus: positions equal ``Position.from_fills`` over the broker's fills; a second
-``reconcile`` is a no-op (``ReconResult`` all zeros / ``changed is False``); and
-the core safety property — no duplicated or lost order — holds across the pass.
+``reconcile`` is a no-op (``ReconResult`` all zeros / ``changed is False``); with
+``since_ms`` only the window's unseen fills are applied (and published); with
+a store, a pass fetches only the fills since the previous pass's watermark and
+rebuilds only when the balances or positions diverge from it (a fee taken
+from the base asset or BNB is not a divergence), a rebuild
+after a snapshot restore leaves the PnL as a refold of the venue's fills, and
+a malformed watermark counts as none; and the core safety property — no
+duplicated or lost order — holds across the pass.
 Async tests run un-decorated (``asyncio_mode = "auto"``).
 """
 
@@ -26,12 +32,17 @@ from __future__ import annotations
 
 from trading_bot.application import (
     EventBus,
+    FillEvent,
     LogEvent,
     OrderRouter,
+    PerformanceService,
     PositionTracker,
     ReconResult,
     reconcile,
 )
+from trading_bot.application.config import AppConfig
+from trading_bot.application.reconcile import RECONCILE_KEY
+from trading_bot.application.service_factory import build_engine, restore_engine
 from trading_bot.brokers import PaperBroker
 from trading_bot.domain import (
     Instrument,
@@ -43,6 +54,7 @@ from trading_bot.domain import (
     Symbol,
     money,
 )
+from trading_bot.storage import AsyncStore, SqliteStore
 
 BTC_USD = Instrument(Symbol("BTC", "USD"))
 ETH_USD = Instrument(Symbol("ETH", "USD"))
@@ -274,6 +286,36 @@ async def test_second_reconcile_is_a_noop() -> None:
     assert tracker.all_positions() == snapshot_positions
 
 
+async def test_reconcile_since_applies_only_unseen_window_fills() -> None:
+    """With ``since_ms`` the tracker is topped up from the window, not rebuilt."""
+    broker = PaperBroker(
+        prices={BTC_USD: money("30000")},
+        starting_balances={"USD": money("1000000")},
+    )
+    bus, router, tracker = _engine(broker)
+    published: list[FillEvent] = []
+    bus.subscribe(published.append, types=(FillEvent,))  # type: ignore[arg-type]
+
+    for cid, qty in (("a", "1"), ("b", "2"), ("c", "3")):
+        await broker.place_order(_limit(cid, qty=qty))
+    first, second, third = await broker.fills()
+    # As restored from a snapshot: the first two fills are already folded in.
+    tracker.restore([Position.from_fills([first, second])], [second.fill_id])
+
+    result = await reconcile(
+        broker, router, tracker, since_ms=second.ts, event_bus=bus
+    )
+
+    assert result.fills_applied == 1
+    assert [event.fill for event in published] == [third]
+    assert tracker.all_positions() == {
+        BTC_USD: Position.from_fills([first, second, third])
+    }
+    again = await reconcile(broker, router, tracker, since_ms=second.ts)
+    assert again.fills_applied == 0
+    assert tracker.position(BTC_USD) == Position.from_fills([first, second, third])
+
+
 def test_recon_result_changed_flag() -> None:
     """``ReconResult.changed`` reflects only the mutating counts."""
     assert ReconResult(0, 0, 0, 0, 0).changed is False
@@ -377,3 +419,235 @@ async def test_no_order_duplicated_or_lost_across_reconcile() -> None:
     # of a dict, but assert the engine's own 'shared' object was kept, not replaced
     # by the venue's reconstructed snapshot).
     assert tracked["shared"] is shared
+
+
+# --- incremental passes over a store watermark ----------------------------- #
+
+
+def _watched(broker: PaperBroker, monkeypatch) -> list[int | None]:  # noqa: ANN001
+    """Record the ``since_ms`` of every ``broker.fills`` request."""
+    requests: list[int | None] = []
+    fills = broker.fills
+
+    async def _fills(since_ms: int | None = None) -> list:
+        requests.append(since_ms)
+        return await fills(since_ms)
+
+    monkeypatch.setattr(broker, "fills", _fills)
+    return requests
+
+
+async def test_incremental_reconcile_fetches_only_newer_fills(monkeypatch) -> None:
+    """With a store, a pass asks only for the fills since the previous pass."""
+    broker = PaperBroker(
+        prices={BTC_USD: money("30000"), ETH_USD: money("2000")},
+        starting_balances={"USD": money("1000000")},
+    )
+    bus, router, tracker = _engine(broker)
+    perf = PerformanceService()
+    store = SqliteStore(":memory:")
+    reader = AsyncStore(store)
+    requests = _watched(broker, monkeypatch)
+
+    await broker.place_order(_limit("a", qty="2"))
+    await broker.place_order(_limit("b", qty="1", side=OrderSide.SELL))
+    first = await reconcile(broker, router, tracker, perf=perf, store=reader)
+    assert first.rebuilt and first.fills_applied == 2  # no watermark yet
+    assert store.get_state(RECONCILE_KEY) is not None
+    _, b = await broker.fills()
+
+    # One fill on the venue the engine missed; one it took from the stream.
+    await broker.place_order(_limit("c", qty="3", price="2000", instrument=ETH_USD))
+    await broker.place_order(_limit("d", qty="1"))
+    a, b, c, d = await broker.fills()
+    tracker.apply(d)
+    perf.apply(d)
+    published: list[FillEvent] = []
+    bus.subscribe(published.append, types=(FillEvent,))  # type: ignore[arg-type]
+    requests.clear()
+
+    second = await reconcile(
+        broker, router, tracker, event_bus=bus, perf=perf, store=reader
+    )
+    assert requests == [b.ts]  # one request, from the watermark on
+    assert not second.rebuilt and second.fills_applied == 1
+    assert [event.fill for event in published] == [c]
+    _assert_positions_match_broker_fills(tracker, [a, b, c, d])
+    assert perf.all_positions() == tracker.all_positions()
+
+    requests.clear()
+    third = await reconcile(broker, router, tracker, perf=perf, store=reader)
+    assert requests == [d.ts] and (third.rebuilt, third.fills_applied) == (False, 0)
+    reader.close()
+    store.close()
+
+
+async def test_incremental_reconcile_rebuilds_on_divergence(monkeypatch) -> None:
+    """Balances or positions the new fills do not explain force a full rebuild."""
+    broker = PaperBroker(
+        prices={BTC_USD: money("30000")},
+        starting_balances={"USD": money("1000000")},
+    )
+    _bus, router, tracker = _engine(broker)
+    store = SqliteStore(":memory:")
+    reader = AsyncStore(store)
+    await broker.place_order(_limit("a", qty="2"))
+    await reconcile(broker, router, tracker, store=reader)
+    await broker.place_order(_limit("b", qty="1"))
+
+    # A deposit the fills do not account for.
+    balances = broker.balances
+
+    async def _deposited() -> dict:
+        moved = await balances()
+        moved["USD"] += money("50")
+        return moved
+
+    monkeypatch.setattr(broker, "balances", _deposited)
+    a, b = await broker.fills()
+    requests = _watched(broker, monkeypatch)
+    result = await reconcile(broker, router, tracker, store=reader)
+    assert requests == [a.ts, None]  # the window, then the full fetch
+    assert result.rebuilt and result.fills_applied == 2
+    _assert_positions_match_broker_fills(tracker, [a, b])
+    assert not (await reconcile(broker, router, tracker, store=reader)).rebuilt
+
+    # A tracker that did not come from the saved state (a restart with no
+    # snapshot): its positions do not match the watermark's.
+    fresh = PositionTracker()
+    result = await reconcile(broker, router, fresh, store=reader)
+    assert result.rebuilt
+    _assert_positions_match_broker_fills(fresh, [a, b])
+    reader.close()
+    store.close()
+
+
+async def test_a_fee_outside_the_quote_asset_is_not_a_divergence(monkeypatch) -> None:
+    """A fee charged in the base asset or in BNB still tops the tracker up."""
+    broker = PaperBroker(
+        prices={BTC_USD: money("30000")},
+        starting_balances={"USD": money("1000000"), "BNB": money("5")},
+        fee_bps=money("0.01"),
+    )
+    _bus, router, tracker = _engine(broker)
+    store = SqliteStore(":memory:")
+    reader = AsyncStore(store)
+    await broker.place_order(_limit("a", qty="2"))
+    await reconcile(broker, router, tracker, store=reader)
+    await broker.place_order(_limit("b", qty="1"))
+    await broker.place_order(_limit("c", qty="1"))
+    a, b, c = await broker.fills()
+
+    # The venue took b's fee from BTC and c's from BNB, not from USD.
+    balances = broker.balances
+
+    async def _charged() -> dict:
+        moved = await balances()
+        moved["USD"] += b.fee + c.fee
+        moved["BTC"] -= b.fee
+        moved["BNB"] -= c.fee
+        return moved
+
+    monkeypatch.setattr(broker, "balances", _charged)
+    result = await reconcile(broker, router, tracker, store=reader)
+    assert not result.rebuilt and result.fills_applied == 2
+    _assert_positions_match_broker_fills(tracker, [a, b, c])
+
+    # More leaving than the fees account for is still a divergence.
+    await broker.place_order(_limit("d", qty="1"))
+
+    async def _withdrawn() -> dict:
+        moved = await _charged()
+        moved["BNB"] -= money("1")
+        return moved
+
+    monkeypatch.setattr(broker, "balances", _withdrawn)
+    assert (await reconcile(broker, router, tracker, store=reader)).rebuilt
+    reader.close()
+    store.close()
+
+
+async def test_rebuild_after_a_snapshot_restore_keeps_the_pnl(
+    tmp_path, monkeypatch
+) -> None:
+    """A divergence rebuild after a restart folds no fill twice into ``perf``."""
+    config = AppConfig.model_validate({"storage": {"snapshot_every": 1}})
+    db = tmp_path / "engine.db"
+    first = build_engine(config, db_path=db)
+    broker = first.broker
+    assert isinstance(broker, PaperBroker)
+    assert first.store is not None and first.reader is not None
+    assert first.snapshots is not None
+    for cid, side, price in (
+        ("a", OrderSide.BUY, "30000"),
+        ("b", OrderSide.SELL, "31000"),
+        ("c", OrderSide.BUY, "30500"),
+    ):
+        await first.router.submit(_limit(cid, side=side, price=price))
+    await reconcile(
+        broker, first.router, first.tracker, perf=first.perf, store=first.reader
+    )
+    await first.snapshots.drain()
+    first.snapshots.save()
+    first.reader.close()
+    first.store.close()
+
+    # Restart from the snapshot; the venue filled one more order meanwhile,
+    # and a deposit the fills do not explain forces the rebuild.
+    await broker.place_order(_limit("d", side=OrderSide.SELL, price="32000"))
+    balances = broker.balances
+
+    async def _deposited() -> dict:
+        moved = await balances()
+        moved["USD"] += money("50")
+        return moved
+
+    monkeypatch.setattr(broker, "balances", _deposited)
+    second = build_engine(config, db_path=db)
+    assert second.store is not None and second.reader is not None
+    since_ms = await restore_engine(second)
+    result = await reconcile(
+        broker,
+        second.router,
+        second.tracker,
+        since_ms=since_ms,
+        perf=second.perf,
+        store=second.reader,
+    )
+
+    assert result.rebuilt
+    expected = PerformanceService()
+    for fill in await broker.fills():
+        expected.apply(fill)
+    assert second.perf.realised_pnl() == expected.realised_pnl() != money("0")
+    assert second.perf.fees_paid() == expected.fees_paid()
+    assert second.perf.all_positions() == second.tracker.all_positions()
+    second.reader.close()
+    second.store.close()
+
+
+async def test_a_malformed_watermark_counts_as_none() -> None:
+    """An unreadable watermark is ignored; the pass runs as without one."""
+    broker = PaperBroker(
+        prices={BTC_USD: money("30000")},
+        starting_balances={"USD": money("1000000")},
+    )
+    _bus, router, tracker = _engine(broker)
+    store = SqliteStore(":memory:")
+    reader = AsyncStore(store)
+    await broker.place_order(_limit("a", qty="2"))
+    malformed = [
+        "{not json",
+        "[1]",
+        '{"version": 1}',
+        '{"version": 1, "ts": 0, "fill_ids": [], "balances": {"USD": "x"},'
+        ' "net_qty": {}}',
+    ]
+    for bad in malformed:
+        store.set_state(RECONCILE_KEY, bad)
+        result = await reconcile(broker, router, tracker, store=reader)
+        assert result.rebuilt  # no watermark, no since_ms: a full pass
+        _assert_positions_match_broker_fills(tracker, await broker.fills())
+    assert store.get_state(RECONCILE_KEY) != bad  # rewritten by the pass
+    reader.close()
+    store.close()
@@ -22,11 +22,13 @@ import pytest
 
 from trading_bot.application import (
     EventBus,
+    KillReport,
     OrderRouter,
     PositionTracker,
     RiskManager,
 )
 from trading_bot.application.config import RiskConfig
+from trading_bot.application.events import LogEvent
 from trading_bot.brokers.base import Broker, Capability
 from trading_bot.brokers.paper import PaperBroker
 from trading_bot.domain import (
@@ -316,6 +318,71 @@ async def test_kill_cancels_open_orders_directly_via_broker() -> None:
     assert rm.tripped is True
 
 
+async def test_kill_reports_time_to_flat_on_the_bus() -> None:
+    """kill() returns a KillReport and emits the time-to-flat as a LogEvent."""
+    broker = PaperBroker(fill_model="partial", partial_fill_ratio=money("0.5"))
+    bus = EventBus()
+    seen: list[LogEvent] = []
+    bus.subscribe(lambda event: seen.append(event))  # type: ignore[arg-type]
+    ticks = iter((10.0, 10.25))
+    rm = RiskManager(RiskConfig(), event_bus=bus, clock=lambda: next(ticks))
+    router = OrderRouter(broker, bus, risk_manager=rm)
+    await router.submit(_order(cid="t1"))
+    await router.submit(_order(cid="t2"))
+
+    report = await rm.kill(router=router, reason="panic")
+
+    assert report == KillReport(cancelled=2, failed=0, seconds=0.25)
+    [event] = [e for e in seen if isinstance(e, LogEvent)]
+    assert event.level == "warning"
+    assert "cancelled 2 order(s), 0 failed, time-to-flat 250.0ms" in event.message
+
+
+async def test_kill_via_broker_prefers_cancel_all() -> None:
+    """A broker declaring CANCEL_ALL is flattened in one account-wide call."""
+    broker = PaperBroker(fill_model="partial", partial_fill_ratio=money("0.5"))
+    router = OrderRouter(broker, EventBus())
+    await router.submit(_order(cid="c1"))
+    await router.submit(_order(cid="c2"))
+    assert Capability.CANCEL_ALL in broker.capabilities()
+
+    report = await RiskManager(RiskConfig()).kill(broker=broker)
+
+    assert (report.cancelled, report.failed) == (2, 0)
+    assert await broker.open_orders() == []
+
+
+class _SlowCancelBroker(_SpyBroker):
+    """A spy whose cancels take a while; records the peak cancels in flight."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._in_flight = 0
+        self.peak = 0
+
+    async def cancel_order(self, venue_order_id: str) -> None:
+        self._in_flight += 1
+        self.peak = max(self.peak, self._in_flight)
+        await asyncio.sleep(0.01)
+        self._in_flight -= 1
+        await super().cancel_order(venue_order_id)
+
+
+async def test_kill_cancels_concurrently_without_bulk_support() -> None:
+    """Without a batch cancel, the kill's single cancels overlap."""
+    broker = _SlowCancelBroker()
+    rm = RiskManager(RiskConfig())
+    router = OrderRouter(broker, EventBus(), risk_manager=rm)
+    for i in range(5):
+        await router.submit(_order(cid=f"s{i}"))
+
+    report = await rm.kill(router=router)
+
+    assert (report.cancelled, report.failed) == (5, 0)
+    assert broker.cancel_calls == 5
+    assert broker.peak == 5
+
+
 async def test_kill_requires_router_or_broker() -> None:
     """kill() with neither a router nor a broker is a programming error."""
     rm = RiskManager(RiskConfig())
@@ -323,6 +390,129 @@ async def test_kill_requires_router_or_broker() -> None:
         await rm.kill()
 
 
+# --- batch evaluation ------------------------------------------------------ #
+
+ETH_USD = Instrument(Symbol("ETH", "USD"))
+
+
+def _leg(
+    cid: str,
+    side: OrderSide,
+    qty: str,
+    price: str | None = "30000",
+    instrument: Instrument = BTC_USD,
+) -> Order:
+    return Order(
+        client_order_id=cid,
+        instrument=instrument,
+        side=side,
+        qty=money(qty),
+        type=OrderType.LIMIT if price is not None else OrderType.MARKET,
+        limit_price=money(price) if price is not None else None,
+    )
+
+
+def _limits(verdicts: list[RiskLimitBreached | None]) -> list[str | None]:
+    return [None if v is None else v.limit for v in verdicts]
+
+
+def test_check_batch_accumulates_nets_over_accepted_legs_only() -> None:
+    """Each leg sees the nets of the legs accepted before it, never a refused one."""
+    rm = RiskManager(RiskConfig(max_position=money("3"), max_order=money("2")))
+    verdicts = rm.check_batch(
+        [
+            _leg("a", OrderSide.BUY, "2"),
+            _leg("b", OrderSide.BUY, "2"),  # 2 + 2 = 4 > 3
+            _leg("c", OrderSide.BUY, "5"),  # max_order
+            _leg("d", OrderSide.BUY, "1"),  # 2 + 1 = 3, "b" never counted
+        ]
+    )
+    assert _limits(verdicts) == [None, "max_position", "max_order", None]
+    assert verdicts[1] is not None and verdicts[1].value == money("4")
+
+
+def test_check_batch_gross_notional_lets_sells_free_room_for_buys() -> None:
+    """Gross notional is gated on the whole book; reducing legs make room."""
+    tracker = PositionTracker()
+    tracker.apply(_fill("seed", OrderSide.BUY, "2"))  # 2 BTC @ 30000 = 60000
+    rm = RiskManager(
+        RiskConfig(max_gross_notional=money("100000")), position_tracker=tracker
+    )
+    sell = _leg("s", OrderSide.SELL, "1")
+    buy = _leg("e1", OrderSide.BUY, "30", price="2000", instrument=ETH_USD)
+    more = _leg("e2", OrderSide.BUY, "10", price="2000", instrument=ETH_USD)
+
+    assert _limits(rm.check_batch([sell, buy, more])) == [
+        None,
+        None,
+        "max_gross_notional",  # 30000 + 60000 + 20000 = 110000
+    ]
+    # Buys first: the book is still 60000 when the first buy lands.
+    assert _limits(rm.check_batch([buy, sell])) == ["max_gross_notional", None]
+
+
+def test_check_batch_net_notional_never_blocks_a_hedge() -> None:
+    rm = RiskManager(RiskConfig(max_net_notional=money("10000")))
+    verdicts = rm.check_batch(
+        [
+            _leg("b1", OrderSide.BUY, "0.2"),  # net +6000
+            _leg("e", OrderSide.SELL, "1", price="2000", instrument=ETH_USD),  # 4000
+            _leg("b2", OrderSide.BUY, "0.3"),  # 4000 + 9000 = 13000
+            _leg("e2", OrderSide.SELL, "2", price="2000", instrument=ETH_USD),  # 0
+        ]
+    )
+    assert _limits(verdicts) == [None, None, "max_net_notional", None]
+    assert verdicts[2] is not None and verdicts[2].value == money("13000")
+
+
+def test_check_batch_refuses_unpriced_legs_unless_marked() -> None:
+    """A notional limit fails closed on a leg it cannot value."""
+    rm = RiskManager(RiskConfig(max_gross_notional=money("50000")))
+    market = _leg("m", OrderSide.BUY, "1", price=None)
+    assert _limits(rm.check_batch([market])) == ["max_gross_notional"]
+    assert rm.check_batch([market], prices={BTC_USD: money("30000")}) == [None]
+    with pytest.raises(RiskLimitBreached, match="no price to value 1 BTC/USD"):
+        rm.check(market)
+
+
+def test_recorded_marks_value_market_orders() -> None:
+    """A mark fed by the bar path values MARKET legs; ``prices`` still wins."""
+    rm = RiskManager(RiskConfig(max_gross_notional=money("50000")))
+    market = _leg("m", OrderSide.BUY, "1", price=None)
+    rm.record_marks({BTC_USD: money("30000")})
+    assert rm.check_batch([market]) == [None]
+    rm.record_marks({BTC_USD: money("60000")})
+    [breach] = rm.check_batch([market])
+    assert breach is not None and breach.value == money("60000")
+    assert rm.check_batch([market], prices={BTC_USD: money("30000")}) == [None]
+
+
+def test_check_batch_refuses_every_leg_when_halted() -> None:
+    rm = RiskManager(RiskConfig(max_daily_loss=money("100")))
+    rm.record_daily_pnl(money("-150"))
+    legs = [_leg("a", OrderSide.BUY, "1"), _leg("b", OrderSide.SELL, "1")]
+    assert _limits(rm.check_batch(legs)) == ["max_daily_loss"] * 2
+    rm.trip("halt")
+    assert _limits(rm.check_batch(legs)) == ["kill_switch"] * 2
+
+
+async def test_submit_many_refuses_legs_past_the_book_limit() -> None:
+    """The router gates a batch's book once; refused legs never reach the broker."""
+    broker = _SpyBroker()
+    rm = RiskManager(RiskConfig(max_gross_notional=money("50000")))
+    router = OrderRouter(broker, EventBus(), risk_manager=rm)
+
+    results = await router.submit_many(
+        [_leg("x", OrderSide.BUY, "1"), _leg("y", OrderSide.BUY, "1")]
+    )
+
+    assert isinstance(results[0], Order)
+    assert isinstance(results[1], RiskLimitBreached)
+    assert results[1].limit == "max_gross_notional"
+    assert broker.place_calls == 1
+    assert router.get("y") is None
+
+
 # --- None limits = unconstrained ------------------------------------------- #
 
 
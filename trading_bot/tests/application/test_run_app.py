@@ -484,7 +484,7 @@ async def test_run_app_reconciles_on_startup(monkeypatch: pytest.MonkeyPatch) ->
 
     calls: list[tuple[object, object, object]] = []
 
-    async def _spy(broker, router, tracker, *, since_ms=None, event_bus=None):  # noqa: ANN001, ANN202
+    async def _spy(broker, router, tracker, *, since_ms=None, **kwargs):  # noqa: ANN001, ANN003, ANN202
         calls.append((broker, router, tracker))
         return ReconResult(0, 0, 0, 0, 0)
 
@@ -582,7 +582,7 @@ async def test_run_app_startup_reconcile_converges_to_venue(
     assert tracker.all_positions() == {}
 
     monkeypatch.setattr(
-        run_app_mod, "build_engine", lambda cfg, db_path=None: engine
+        run_app_mod, "build_engine", lambda cfg, db_path=None, **seams: engine
     )
     await run_app(config)  # reconcile_on_start defaults True
 
@@ -616,6 +616,34 @@ async def test_run_app_restores_dedup_when_store_present(
     assert calls == [1]  # restore called exactly once (a store was configured)
 
 
+async def test_run_app_closes_the_reader_threads_before_the_store(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    """On the way out `run_app` stops `Engine.reader`, then closes the store."""
+    from trading_bot.storage import AsyncStore, SqliteStore
+
+    closed: list[str] = []
+    reader_close, store_close = AsyncStore.close, SqliteStore.close
+
+    def _reader(self: AsyncStore) -> None:
+        closed.append("reader")
+        reader_close(self)
+
+    def _store(self: SqliteStore) -> None:
+        closed.append("store")
+        store_close(self)
+
+    monkeypatch.setattr(AsyncStore, "close", _reader)
+    monkeypatch.setattr(SqliteStore, "close", _store)
+
+    db = str(tmp_path / "engine.db")
+    await run_app(
+        AppConfig.model_validate({"mode": "paper", "storage": {"db_path": db}})
+    )
+
+    assert closed == ["reader", "store"]
+
+
 async def test_run_app_skips_restore_without_store(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
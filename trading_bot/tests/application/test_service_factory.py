@@ -25,7 +25,11 @@ from trading_bot.application.order_router import OrderRouter
 from trading_bot.application.performance_service import PerformanceService
 from trading_bot.application.position_tracker import PositionTracker
 from trading_bot.application.risk import RiskManager
-from trading_bot.application.service_factory import Engine, build_engine
+from trading_bot.application.service_factory import (
+    Engine,
+    build_engine,
+    restore_orders,
+)
 from trading_bot.brokers.binance import TESTNET_API_BASE, BinanceBroker
 from trading_bot.brokers.kraken import KrakenBroker
 from trading_bot.brokers.paper import PaperBroker
@@ -180,6 +184,38 @@ def test_db_path_attaches_sqlite_store(tmp_path) -> None:
     assert engine.store.get_order("cid-store") is not None
 
 
+async def test_restore_orders_loads_live_and_recent_only(tmp_path) -> None:
+    """With a retention window, boot restores the live book plus recent orders."""
+    db = tmp_path / "engine.db"
+    ancient = SqliteStore(db, clock=lambda: 0)
+    for cid, live in (("old-done", False), ("old-live", True)):
+        order = Order(cid, _BTCUSD, OrderSide.BUY, money("1"), OrderType.MARKET)
+        order.submit()
+        if not live:
+            order.reject("test")
+        ancient.upsert_order(order)
+    ancient.close()
+    with SqliteStore(db) as recent:
+        order = Order("new-done", _BTCUSD, OrderSide.BUY, money("1"), OrderType.MARKET)
+        order.submit()
+        order.reject("test")
+        recent.upsert_order(order)
+
+    config = AppConfig.model_validate({"storage": {"order_retention": 3600}})
+    engine = build_engine(config, db_path=db)
+    assert restore_orders(engine) == 2
+    assert engine.router.get("old-live") is not None
+    assert engine.router.get("new-done") is not None
+    assert engine.router.get("old-done") is None
+    # The old id still dedups, through the store: the broker is never called.
+    again = Order("old-done", _BTCUSD, OrderSide.BUY, money("1"), OrderType.MARKET)
+    assert (await engine.router.submit(again)).status.value == "rejected"
+    assert await engine.broker.open_orders() == []
+
+    everything = build_engine(AppConfig(), db_path=db)
+    assert restore_orders(everything) == 3
+
+
 def test_live_mode_not_enabled_refuses_regardless_of_credentials(
     monkeypatch,
 ) -> None:
@@ -376,6 +412,38 @@ async def test_engine_is_live_end_to_end() -> None:
     assert len(engine.perf.equity_curve()) == 1
 
 
+async def test_async_bus_engine_settles_after_drain(tmp_path) -> None:
+    """``events.dispatch: async``: store/tracker/perf update off the order path.
+
+    ``submit`` returns before the fill is folded; after ``bus.drain()`` every
+    critical consumer holds it, and the snapshot names each typed subscriber.
+    """
+    cfg = AppConfig.model_validate({"events": {"dispatch": "async"}})
+    engine = build_engine(cfg, db_path=tmp_path / "engine.db")
+    assert engine.bus.dispatch == "async"
+    engine.broker.set_price(_BTCUSD, money("100"))
+
+    order = Order(
+        client_order_id="cid-async",
+        instrument=_BTCUSD,
+        side=OrderSide.BUY,
+        qty=money("2"),
+        type=OrderType.MARKET,
+    )
+    await engine.router.submit(order)
+    assert engine.store is not None
+    assert engine.store.fills() == []
+
+    await engine.bus.drain()
+    assert engine.tracker.position(_BTCUSD).net_qty == money("2")
+    assert len(engine.perf.equity_curve()) == 1
+    assert [f.client_order_id for f in engine.store.fills()] == ["cid-async"]
+    subscribers = {s["name"]: s for s in engine.bus.snapshot()["subscribers"]}  # type: ignore[attr-defined]
+    assert subscribers["PositionTracker"]["types"] == ["FillEvent"]
+    assert subscribers["SqliteStore"]["critical"] is True
+    assert all(s["depth"] == 0 for s in subscribers.values())
+
+
 # --- testnet path: a venue sandbox between paper and live -------------------- #
 
 
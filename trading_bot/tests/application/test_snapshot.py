@@ -0,0 +1,236 @@
+"""Tests for :mod:`trading_bot.application.snapshot` — restart from a snapshot.
+
+What is verified
+----------------
+* a restart that loads the latest snapshot and folds only the fills stored
+  after its watermark ends in the same positions, performance totals, equity
+  curve and risk daily PnL as a full refold of the stored history;
+* saves write the equity curve in append-only chunks that load back whole;
+* on an async bus the snapshot is taken once every consumer has drained, and
+  with a running loop the fill handler leaves the save to a background task;
+* a snapshot the store's fills do not reach is ignored (a full refold), and the
+  factory only builds a snapshotter with a store and ``snapshot_every``;
+* the startup path restores before reconciling and reconciles from the
+  watermark, and a run's shutdown leaves a snapshot behind.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+
+import pytest
+
+from trading_bot.application.config import AppConfig
+from trading_bot.application.events import FillEvent
+from trading_bot.application.performance_service import PerformanceService
+from trading_bot.application.position_tracker import PositionTracker
+from trading_bot.application.reconcile import ReconResult
+from trading_bot.application.run_app import prepare_system, run_system
+from trading_bot.application.service_factory import Engine, build_engine
+from trading_bot.application.snapshot import (
+    SNAPSHOT_KEY,
+    load_snapshot,
+    restore_snapshot,
+)
+from trading_bot.domain import Fill, Instrument, OrderSide, Position, Symbol, money
+from trading_bot.storage import SqliteStore
+
+_BTC = Instrument(Symbol("BTC", "USD"), price_precision=1, qty_precision=4)
+_ETH = Instrument(Symbol("ETH", "USD"))
+
+
+def _fill(i: int) -> Fill:
+    """A deterministic mix of buys, sells and flips over two instruments."""
+    return Fill(
+        f"F{i}",
+        f"cid-{i}",
+        _ETH if i % 5 == 0 else _BTC,
+        OrderSide.SELL if i % 3 == 0 else OrderSide.BUY,
+        money(f"0.{i % 7 + 1}"),
+        money(f"{30000 + (i * 37) % 500}.5"),
+        money("0.03"),
+        1_700_000_000_000 + i // 2,
+    )
+
+
+def _config(every: int = 7, **storage: object) -> AppConfig:
+    return AppConfig.model_validate(
+        {
+            "starting_capital": "1000",
+            "storage": {"snapshot_every": every, **storage},
+        }
+    )
+
+
+def _refold(store: SqliteStore) -> tuple[PositionTracker, PerformanceService]:
+    """A fresh tracker and performance service over every stored fill."""
+    tracker = PositionTracker()
+    perf = PerformanceService(v0=money("1000"))
+    for fill in store.iter_fills():
+        tracker.apply(fill)
+        perf.apply(fill)
+    return tracker, perf
+
+
+def _by_symbol(positions: dict[Instrument, Position]) -> dict[Symbol, tuple]:
+    """Positions keyed by symbol (the store does not keep the precisions)."""
+    return {
+        inst.symbol: (p.net_qty, p.avg_entry_price, p.realised_pnl, p.fees_paid)
+        for inst, p in positions.items()
+    }
+
+
+def _assert_matches_refold(engine: Engine) -> None:
+    assert engine.store is not None
+    tracker, perf = _refold(engine.store)
+    assert _by_symbol(engine.tracker.all_positions()) == _by_symbol(
+        tracker.all_positions()
+    )
+    assert _by_symbol(engine.perf.all_positions()) == _by_symbol(
+        perf.all_positions()
+    )
+    assert engine.perf.realised_pnl() == perf.realised_pnl()
+    assert engine.perf.fees_paid() == perf.fees_paid()
+    assert engine.perf.equity_curve() == perf.equity_curve()
+
+
+def test_restart_from_snapshot_equals_full_refold(tmp_path) -> None:
+    db = tmp_path / "engine.db"
+    first = build_engine(_config(), db_path=db)
+    first.risk.record_daily_pnl(money("-12.5"))
+    for i in range(53):
+        first.bus.emit(FillEvent(_fill(i)))
+    assert first.store is not None
+    first.store.close()  # no shutdown snapshot: the last 4 fills are the tail
+
+    second = build_engine(_config(), db_path=db)
+    assert second.store is not None
+    snapshot = load_snapshot(second.store)
+    assert snapshot is not None and snapshot.fill_seq == 49
+
+    assert restore_snapshot(second) == _fill(52).ts
+    _assert_matches_refold(second)
+    assert second.risk.recorded_daily_pnl == money("-12.5")
+    # Only the tail was folded; fills at the watermark's ts are marked seen.
+    assert not second.tracker.has_seen("F10")
+    assert second.tracker.has_seen("F48") and second.tracker.has_seen("F52")
+
+    # The restored positions keep their instruments' precisions.
+    assert _BTC in second.tracker.all_positions()
+    # Fills after the restart continue from the restored state.
+    for i in range(53, 60):
+        second.bus.emit(FillEvent(_fill(i)))
+    _assert_matches_refold(second)
+    second.store.close()
+
+
+def test_equity_is_saved_in_append_only_chunks(tmp_path) -> None:
+    engine = build_engine(_config(every=10), db_path=tmp_path / "engine.db")
+    assert engine.store is not None and engine.snapshots is not None
+    for i in range(25):
+        engine.bus.emit(FillEvent(_fill(i)))
+    saved = engine.snapshots.save()
+    assert (saved.equity_from, len(saved.equity)) == (20, 5)  # only the new points
+    engine.snapshots.save()  # nothing new: no new chunk
+
+    chunks = [
+        json.loads(engine.store.get_state(f"{SNAPSHOT_KEY}.equity.{n}") or "[]")
+        for n in range(4)
+    ]
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5, 0]
+    snapshot = load_snapshot(engine.store)
+    assert snapshot is not None
+    assert snapshot.equity == engine.perf.equity_curve()
+    assert snapshot.fill_seq == 25
+
+
+async def test_async_bus_snapshots_once_drained(tmp_path) -> None:
+    config = AppConfig.model_validate(
+        {
+            "starting_capital": "1000",
+            "storage": {"snapshot_every": 5},
+            "events": {"dispatch": "async"},
+        }
+    )
+    engine = build_engine(config, db_path=tmp_path / "engine.db")
+    assert engine.store is not None
+    for i in range(12):
+        engine.bus.emit(FillEvent(_fill(i)))
+    await engine.bus.drain()
+    assert engine.snapshots is not None and engine.snapshots._task is not None
+    await engine.snapshots._task
+
+    snapshot = load_snapshot(engine.store)
+    assert snapshot is not None
+    _, perf = _refold(engine.store)
+    # The snapshot's state is exactly the fold up to its watermark.
+    assert snapshot.fill_seq == len(snapshot.equity)
+    assert snapshot.equity == perf.equity_curve()[: snapshot.fill_seq]
+
+
+async def test_fill_handler_saves_off_the_emit_path(tmp_path) -> None:
+    engine = build_engine(_config(every=5), db_path=tmp_path / "engine.db")
+    assert engine.store is not None and engine.snapshots is not None
+    for i in range(5):
+        engine.bus.emit(FillEvent(_fill(i)))
+    assert engine.store.get_state(SNAPSHOT_KEY) is None  # only scheduled
+    await engine.snapshots.drain()
+
+    snapshot = load_snapshot(engine.store)
+    assert snapshot is not None and snapshot.fill_seq == 5
+    assert snapshot.equity == engine.perf.equity_curve()
+
+
+def test_foreign_snapshot_is_ignored(tmp_path) -> None:
+    engine = build_engine(_config(), db_path=tmp_path / "engine.db")
+    assert engine.store is not None and engine.snapshots is not None
+    for i in range(9):
+        engine.bus.emit(FillEvent(_fill(i)))
+    head = json.loads(engine.store.get_state(SNAPSHOT_KEY) or "{}")
+    engine.store.set_state(SNAPSHOT_KEY, json.dumps({**head, "fill_seq": 99}))
+    engine.store.close()
+
+    again = build_engine(_config(), db_path=tmp_path / "engine.db")
+    assert restore_snapshot(again) == _fill(8).ts
+    _assert_matches_refold(again)
+    assert again.tracker.has_seen("F0")  # refolded from the first fill
+
+
+def test_factory_builds_a_snapshotter_only_when_configured(tmp_path) -> None:
+    assert build_engine(_config()).snapshots is None
+    assert build_engine(AppConfig(), db_path=tmp_path / "a.db").snapshots is None
+    assert build_engine(_config(), db_path=tmp_path / "b.db").snapshots is not None
+    with pytest.raises(ValueError, match="snapshot_every"):
+        _config(every=0)
+
+
+async def test_startup_restores_then_reconciles_from_the_watermark(
+    tmp_path, monkeypatch
+) -> None:
+    db = tmp_path / "engine.db"
+    seeded = build_engine(_config(), db_path=db)
+    for i in range(20):
+        seeded.bus.emit(FillEvent(_fill(i)))
+    assert seeded.store is not None
+    seeded.store.close()
+
+    seen: dict[str, object] = {}
+
+    async def _spy(broker, router, tracker, *, since_ms=None, **kwargs):  # noqa: ANN001, ANN003, ANN202
+        seen["since_ms"] = since_ms
+        seen["positions"] = tracker.all_positions()
+        return ReconResult(0, 0, 0, 0, 0)
+
+    run_app_mod = importlib.import_module("trading_bot.application.run_app")
+    monkeypatch.setattr(run_app_mod, "reconcile", _spy)
+    system = await prepare_system(_config(db_path=str(db)))
+    assert seen["since_ms"] == _fill(19).ts
+    assert seen["positions"] == system.engine.tracker.all_positions() != {}
+    _assert_matches_refold(system.engine)
+
+    await run_system(system)
+    store = system.engine.store
+    assert store is not None
+    snapshot = load_snapshot(store)
+    assert snapshot is not None and snapshot.fill_seq == 20
@@ -23,6 +23,7 @@ Async tests run un-decorated (``asyncio_mode = "auto"``).
 from __future__ import annotations
 
 import asyncio
+import threading
 from collections.abc import Iterator
 from decimal import Decimal
 
@@ -35,10 +36,12 @@ from trading_bot.application import (
     LogEvent,
     OrderRouter,
     PositionTracker,
+    RiskManager,
     Strategy,
     StrategyRunner,
     ma_crossover_signal,
 )
+from trading_bot.application.config import RiskConfig
 from trading_bot.brokers import PaperBroker
 from trading_bot.domain import (
     Instrument,
@@ -619,3 +622,189 @@ async def test_step_latest_evaluates_latest_window_and_is_idempotent() -> None:
     again = tracker.position(BTC_USD)
     assert again is not None
     assert again.net_qty == Decimal("-2")  # unchanged
+
+
+# --- pipelined prefetch ----------------------------------------------------- #
+
+
+class _CountingFeed:
+    """Yields ``inner``'s windows, counting reads; optionally fails after ``fail_at``."""
+
+    def __init__(self, inner: InMemoryFeed, *, fail_at: int | None = None) -> None:
+        self._inner = inner
+        self._fail_at = fail_at
+        self.reads = 0
+
+    def __iter__(self) -> Iterator[pl.DataFrame]:
+        for window in self._inner:
+            if self._fail_at is not None and self.reads == self._fail_at:
+                raise RuntimeError("feed broke")
+            self.reads += 1
+            yield window
+
+    def latest(self) -> pl.DataFrame:
+        return self._inner.latest()
+
+
+def _alternating(bars: pl.DataFrame) -> Signal:
+    """Long on odd-length windows, flat on even ones — an order every step."""
+    return Signal.exposure(BTC_USD, money("1" if bars.height % 2 else "0"), ts=0)
+
+
+def _pipelined(
+    frame: pl.DataFrame, *, prefetch: int, fail_at: int | None = None
+) -> tuple[StrategyRunner, PaperBroker, PositionTracker, _CountingFeed]:
+    bus = EventBus()
+    tracker = PositionTracker(event_bus=bus)
+    broker = PaperBroker(
+        prices={BTC_USD: money("100")},
+        fee_bps=money("0"),
+        fill_model="immediate",
+        starting_balances={"USD": money("10000000"), "BTC": money("0")},
+        event_bus=bus,
+    )
+    feed = _CountingFeed(InMemoryFeed(frame), fail_at=fail_at)
+    strat = Strategy(name="pipe", instrument=BTC_USD, signal_fn=_alternating,
+                     reference_qty=money("1"))
+    runner = StrategyRunner(
+        strat, feed, OrderRouter(broker, bus), tracker, prefetch=prefetch  # type: ignore[arg-type]
+    )
+    return runner, broker, tracker, feed
+
+
+async def test_prefetch_matches_inline_run_exactly() -> None:
+    """A prefetched run submits the same ids, in the same order, to the same end state."""
+    frame = _bars([100.0] * 9)
+    outcomes = []
+    for prefetch in (0, 3):
+        runner, broker, tracker, _feed = _pipelined(frame, prefetch=prefetch)
+        n = await runner.run()
+        cids = [order.client_order_id for order in await broker.open_orders()]
+        fills = [fill.client_order_id for fill in await broker.fills()]
+        outcomes.append((n, runner.step_index, cids, fills, tracker.position(BTC_USD)))
+    assert outcomes[0] == outcomes[1]
+    assert outcomes[1][3] == [f"pipe-{i}" for i in range(9)]
+
+
+async def test_prefetch_reads_ahead_within_its_bound() -> None:
+    """While a step awaits its submission the feed is read ahead — never past the bound."""
+    frame = _bars([100.0] * 12)
+    runner, _broker, _tracker, feed = _pipelined(frame, prefetch=2)
+    router = runner._router  # noqa: SLF001 - wrap the submit to make it slow
+    real_submit = router.submit
+    lead: list[int] = []
+
+    async def _slow_submit(order):  # noqa: ANN001, ANN202
+        await asyncio.sleep(0.01)
+        lead.append(feed.reads - runner.step_index)
+        return await real_submit(order)
+
+    router.submit = _slow_submit  # type: ignore[method-assign]
+    await runner.run()
+    # Reads overlapped the submits (the feed got ahead) but at most ``prefetch``
+    # queued windows + the one in flight + the one stepping.
+    assert max(lead) >= 1
+    assert max(lead) <= 2 + 1
+
+
+async def test_prefetch_keeps_stop_between_steps() -> None:
+    """With read-ahead, a stop set during step 0 still ends the run after step 0."""
+    frame = _bars([100.0] * 6)
+    runner, broker, _tracker, _feed = _pipelined(frame, prefetch=3)
+    stop = asyncio.Event()
+    router = runner._router  # noqa: SLF001
+    real_submit = router.submit
+
+    async def _submit_then_stop(order):  # noqa: ANN001, ANN202
+        routed = await real_submit(order)
+        stop.set()
+        return routed
+
+    router.submit = _submit_then_stop  # type: ignore[method-assign]
+    assert await runner.run(stop_event=stop) == 1
+    assert runner.step_index == 1
+    assert len(await broker.fills()) == 1
+
+
+async def test_prefetch_surfaces_feed_error_at_its_step() -> None:
+    """A feed failure read ahead is raised only once the earlier windows are stepped."""
+    runner, broker, _tracker, _feed = _pipelined(
+        _bars([100.0] * 6), prefetch=4, fail_at=2
+    )
+    with pytest.raises(RuntimeError, match="feed broke"):
+        await runner.run()
+    assert runner.step_index == 2
+    assert len(await broker.fills()) == 2
+
+
+async def test_prefetch_respects_max_steps_without_over_reading() -> None:
+    runner, _broker, _tracker, feed = _pipelined(_bars([100.0] * 8), prefetch=4)
+    assert await runner.run(max_steps=3) == 3
+    assert feed.reads == 3
+
+
+def test_negative_prefetch_is_rejected() -> None:
+    strat = Strategy(name="x", instrument=BTC_USD, signal_fn=_alternating)
+    with pytest.raises(ValueError, match="prefetch"):
+        StrategyRunner(strat, InMemoryFeed(_bars([1.0])), None, None, prefetch=-1)  # type: ignore[arg-type]
+
+
+async def test_cancelled_prefetch_joins_the_read_then_closes_the_feed() -> None:
+    """Cancelling a run waits out the in-flight threaded read, then closes the feed."""
+    inner = InMemoryFeed(_bars([100.0] * 4))
+    entered, gate = threading.Event(), threading.Event()
+    events: list[str] = []
+
+    class _BlockingFeed:
+        def __iter__(self) -> Iterator[pl.DataFrame]:
+            try:
+                for i, window in enumerate(inner):
+                    if i == 1:
+                        entered.set()
+                        gate.wait(5)
+                        events.append("read")
+                    yield window
+            finally:
+                events.append("closed")
+
+        def latest(self) -> pl.DataFrame:
+            return inner.latest()
+
+    runner, *_ = _pipelined(_bars([100.0] * 4), prefetch=1)
+    runner._feed = _BlockingFeed()  # noqa: SLF001 - swap in the blocking feed
+    task = asyncio.ensure_future(runner.run())
+    await asyncio.to_thread(entered.wait, 5)
+    task.cancel()
+    await asyncio.sleep(0.02)
+    # The worker thread is still inside ``next``: the run has not torn down yet.
+    assert not task.done()
+    assert events == []
+    gate.set()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert events == ["read", "closed"]
+
+
+async def test_step_feeds_the_close_as_the_risk_mark() -> None:
+    """A MARKET order passes a notional cap: the window close values it."""
+    bus = EventBus()
+    tracker = PositionTracker(event_bus=bus)
+    broker = PaperBroker(
+        prices={BTC_USD: money("100")},
+        fee_bps=money("0"),
+        fill_model="immediate",
+        starting_balances={"USD": money("1000"), "BTC": money("0")},
+        event_bus=bus,
+    )
+    risk = RiskManager(
+        RiskConfig(max_gross_notional=money("150")), position_tracker=tracker
+    )
+    strat = Strategy(name="mark", instrument=BTC_USD, signal_fn=_alternating,
+                     reference_qty=money("1"))
+    runner = StrategyRunner(
+        strat, InMemoryFeed(_bars([100.0])), OrderRouter(broker, bus, risk_manager=risk),
+        tracker,
+    )
+    order = await runner.step(_bars([100.0]))
+    assert order is not None and order.type is OrderType.MARKET
+    assert [fill.client_order_id for fill in await broker.fills()] == ["mark-0"]
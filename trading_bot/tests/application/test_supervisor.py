@@ -13,8 +13,15 @@ import polars as pl
 import pytest
 
 from trading_bot.application.config import AppConfig
-from trading_bot.application.supervisor import StrategySupervisor
+from trading_bot.application.supervisor import (
+    TRACKED_ORDER_BYTES,
+    StrategySupervisor,
+    UnitUsage,
+)
 from trading_bot.domain.errors import ConfigError, LiveTradingNotEnabled
+from trading_bot.domain.instrument import Instrument, Symbol
+from trading_bot.domain.money import money
+from trading_bot.domain.signal import Signal
 
 
 def _dccd_ohlc(closes: list[float], *, span_s: int = 60) -> pl.DataFrame:
@@ -197,3 +204,68 @@ async def test_start_all_step_all_shutdown() -> None:
     await sup.shutdown()
     assert not any(s.running for s in sup.status())
     assert await sup.step_all() == 0  # nothing running → nothing stepped
+
+
+def trend_signal(bars: pl.DataFrame) -> Signal:
+    """Long 1 while the last close is above the first (no fynance needed)."""
+    closes = bars["c"]
+    long = bars.height > 1 and closes[-1] > closes[0]
+    return Signal.exposure(Instrument(Symbol("BTC", "USD")), money("1" if long else "0"), ts=0)
+
+
+async def test_usage_accounts_cpu_memory_orders_and_latency() -> None:
+    """Each step is tallied; stop zeroes the live figures; start resets the tally."""
+    raw = _config().model_dump()
+    raw["strategies"][0]["signal"] = {
+        "ref": "trading_bot.tests.application.test_supervisor:trend_signal"
+    }
+    sup = StrategySupervisor(
+        AppConfig.model_validate(raw),
+        dccd_client=_FakeDccdClient({"BTC/USD": _dccd_ohlc([100.0 + i for i in range(30)])}),
+    )
+    assert sup.status("btc-ma")[0].usage == UnitUsage()
+
+    await sup.start("btc-ma")
+    for _ in range(3):
+        await sup.step("btc-ma")
+    usage = sup.status("btc-ma")[0].usage
+    assert usage.steps == 3
+    assert usage.cpu_seconds >= 0.0
+    assert usage.tracked_orders == 1  # first step goes long; then on target
+    assert usage.memory_bytes > 0
+    assert usage.peak_memory_bytes >= usage.memory_bytes
+    assert usage.latency_p50 is not None and usage.latency_p50 > 0
+    assert usage.latency_p50 <= usage.latency_p95 <= usage.latency_p99  # type: ignore[operator]
+
+    await sup.stop("btc-ma")
+    stopped = sup.status("btc-ma")[0].usage
+    assert (stopped.steps, stopped.memory_bytes, stopped.tracked_orders) == (3, 0, 0)
+
+    await sup.start("btc-ma")
+    assert sup.status("btc-ma")[0].usage.steps == 0
+
+
+async def test_memory_estimate_counts_orders_without_copying_the_map() -> None:
+    """Each step charges the tracked count — the order map is never copied or walked."""
+    raw = _config().model_dump()
+    raw["strategies"][0]["signal"] = {
+        "ref": "trading_bot.tests.application.test_supervisor:trend_signal"
+    }
+    sup = StrategySupervisor(
+        AppConfig.model_validate(raw),
+        dccd_client=_FakeDccdClient({"BTC/USD": _dccd_ohlc([100.0 + i for i in range(30)])}),
+    )
+    await sup.start("btc-ma")
+    unit = sup._unit("btc-ma")  # noqa: SLF001 - reach the unit's router
+    assert unit.engine is not None and unit.runner is not None
+
+    def _no_copy() -> dict[str, object]:
+        raise AssertionError("memory accounting copied the tracked-order map")
+
+    unit.engine.router.tracked_orders = _no_copy  # type: ignore[method-assign,assignment]
+    await sup.step("btc-ma")
+    await sup.step("btc-ma")
+    tracked = unit.engine.router.tracked_count
+    assert unit.memory_bytes() == (
+        unit.runner.window_bytes + tracked * TRACKED_ORDER_BYTES
+    )
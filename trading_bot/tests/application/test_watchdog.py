@@ -0,0 +1,100 @@
+"""Tests for the :class:`LoopWatchdog` — event-loop lag sampling and stall capture.
+
+The stall tests block the loop for real (a short :func:`time.sleep` on the loop
+thread) so the helper thread's stack snapshot is exercised end to end: the
+reported stack must name the blocking function. Async tests run un-decorated
+(``asyncio_mode = "auto"``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from trading_bot.application.config import AppConfig
+from trading_bot.application.events import EventBus, LogEvent
+from trading_bot.application.run_app import prepare_system
+from trading_bot.application.watchdog import LagHistogram, LoopWatchdog, StallReport
+
+
+def test_histogram_buckets_and_quantiles() -> None:
+    hist = LagHistogram(bounds=(0.01, 0.1, 1.0))
+    for lag in (0.0, 0.002, 0.05, 0.5, 4.0):
+        hist.observe(lag)
+    assert hist.buckets() == [(0.01, 2), (0.1, 1), (1.0, 1), (float("inf"), 1)]
+    assert (hist.count, hist.max) == (5, 4.0)
+    assert hist.quantile(0.4) == 0.01
+    assert hist.quantile(0.6) == 0.1
+    assert hist.quantile(1.0) == 4.0  # lands in +inf → the observed max
+    snap = hist.snapshot()
+    assert snap["count"] == 5
+    assert snap["buckets"][-1] == ["+Inf", 1]
+
+
+def test_histogram_rejects_bad_input() -> None:
+    with pytest.raises(ValueError):
+        LagHistogram(bounds=(0.1, 0.01))
+    with pytest.raises(ValueError):
+        LagHistogram().quantile(1.5)
+    assert LagHistogram().quantile(0.5) == 0.0
+
+
+def _block_the_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+async def test_stall_is_reported_with_the_blocking_stack() -> None:
+    bus = EventBus()
+    seen: list[LogEvent] = []
+    bus.subscribe(lambda event: seen.append(event))  # type: ignore[arg-type]
+    stalls: list[StallReport] = []
+    async with LoopWatchdog(
+        bus, interval=0.01, threshold=0.1, on_stall=stalls.append
+    ) as watchdog:
+        await asyncio.sleep(0.05)
+        _block_the_loop(0.4)
+        await asyncio.sleep(0.05)
+
+    assert len(stalls) == 1
+    report = stalls[0]
+    assert report.lag >= 0.2
+    assert report.stack is not None and "_block_the_loop" in report.stack
+    assert list(watchdog.stalls) == [report]
+    [event] = [e for e in seen if isinstance(e, LogEvent)]
+    assert event.level == "warning"
+    assert "event loop stalled" in event.message
+    assert "_block_the_loop" in event.message
+    assert watchdog.histogram.count >= 2
+    assert watchdog.histogram.max >= 0.2
+    assert not watchdog.running
+
+
+async def test_healthy_loop_records_lag_without_stalls() -> None:
+    async with LoopWatchdog(interval=0.005, threshold=0.5) as watchdog:
+        await asyncio.sleep(0.06)
+    assert watchdog.histogram.count >= 3
+    assert not watchdog.stalls
+    assert watchdog.snapshot()["stalls"] == 0
+
+
+def test_invalid_parameters_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        LoopWatchdog(interval=0)
+    with pytest.raises(ValueError):
+        LoopWatchdog(threshold=-1)
+    with pytest.raises(ValueError):
+        LoopWatchdog(keep=0)
+
+
+async def test_prepare_system_builds_a_watchdog_only_when_enabled() -> None:
+    off = await prepare_system(AppConfig(), reconcile_on_start=False)
+    assert off.watchdog is None
+    on = await prepare_system(
+        AppConfig.model_validate({"watchdog": {"enabled": True, "threshold": 0.25}}),
+        reconcile_on_start=False,
+    )
+    assert isinstance(on.watchdog, LoopWatchdog)
+    assert on.watchdog.snapshot()["threshold"] == 0.25
+    assert not on.watchdog.running
@@ -38,7 +38,7 @@ from trading_bot.domain import (
     money,
     parse_binance_symbol,
 )
-from trading_bot.domain.errors import LiveTradingNotEnabled
+from trading_bot.domain.errors import LiveTradingNotEnabled, ReplaceFailed
 from trading_bot.transport import AmbiguousRequestError, AsyncHTTPClient
 
 BTC_USDT = Instrument(Symbol("BTC", "USDT"), price_precision=2, qty_precision=5)
@@ -109,7 +109,7 @@ def test_constructible_without_credentials(monkeypatch: pytest.MonkeyPatch) -> N
     assert broker.has_credentials is False
 
 
-def test_capabilities_declares_six_rest_ops() -> None:
+def test_capabilities_declares_rest_ops_cancel_all_and_amend() -> None:
     broker = BinanceBroker(api_key="", api_secret="")
     caps = broker.capabilities()
     assert caps == {
@@ -119,6 +119,8 @@ def test_capabilities_declares_six_rest_ops() -> None:
         Capability.BALANCES,
         Capability.FILLS,
         Capability.TICKER,
+        Capability.CANCEL_ALL,
+        Capability.AMEND,
     }
     # The private WS feed is deferred — not part of this REST adapter.
     assert Capability.PRIVATE_WS not in caps
@@ -305,6 +307,101 @@ async def test_cancel_order_splits_composite_id(
     assert q["orderId"] == "123456"
 
 
+async def test_cancel_all_deletes_open_orders_per_symbol(
+    httpx_mock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """cancel_all reads the open symbols, then bulk-cancels each one."""
+    httpx_mock.add_response(
+        method="GET",
+        json=[
+            {"symbol": "BTCUSDT", "orderId": 1},
+            {"symbol": "ETHUSDT", "orderId": 2},
+            {"symbol": "BTCUSDT", "orderId": 3},
+        ],
+    )
+    httpx_mock.add_response(
+        method="DELETE",
+        json=[{"symbol": "BTCUSDT", "orderId": 1}, {"symbol": "BTCUSDT", "orderId": 3}],
+    )
+    httpx_mock.add_response(
+        method="DELETE", json=[{"symbol": "ETHUSDT", "orderId": 2}]
+    )
+    broker = _broker(monkeypatch)
+
+    assert await broker.cancel_all() == 3
+
+    deletes = [r for r in httpx_mock.get_requests() if r.method == "DELETE"]
+    assert sorted(_query_of(r)["symbol"] for r in deletes) == ["BTCUSDT", "ETHUSDT"]
+    assert all(
+        str(r.url).startswith("https://api.binance.com/api/v3/openOrders?")
+        and _signature_valid(r)
+        for r in deletes
+    )
+
+
+def _live_limit(venue_id: str = "BTCUSDT:123456") -> Order:
+    """A live, partly filled 0.5 BTC limit buy resting on Binance."""
+    order = Order(
+        client_order_id="chase-1",
+        instrument=BTC_USDT,
+        side=OrderSide.BUY,
+        qty=money("0.5"),
+        type=OrderType.LIMIT,
+        limit_price=money("37000"),
+    )
+    order.submit()
+    order.open(venue_id)
+    order.apply_fill(money("0.2"), money("37000"))
+    return order
+
+
+async def test_amend_order_cancel_replaces_the_remaining_qty(
+    httpx_mock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    httpx_mock.add_response(
+        json={
+            "cancelResult": "SUCCESS",
+            "newOrderResult": "SUCCESS",
+            "cancelResponse": {"symbol": "BTCUSDT", "orderId": 123456},
+            "newOrderResponse": {"symbol": "BTCUSDT", "orderId": 123999},
+        }
+    )
+    broker = _broker(monkeypatch)
+
+    venue_id = await broker.amend_order(_live_limit(), limit_price=money("37100"))
+
+    assert venue_id == "BTCUSDT:123999"
+    request = httpx_mock.get_request()
+    assert request.method == "POST"
+    assert str(request.url).startswith(
+        "https://api.binance.com/api/v3/order/cancelReplace?"
+    )
+    assert _signature_valid(request)
+    q = _query_of(request)
+    assert q["cancelReplaceMode"] == "STOP_ON_FAILURE"
+    assert q["cancelOrderId"] == "123456"
+    assert (q["symbol"], q["side"], q["type"]) == ("BTCUSDT", "BUY", "LIMIT")
+    assert (q["quantity"], q["price"]) == ("0.3", "37100")  # 0.5 less 0.2 filled
+    assert q["newClientOrderId"] == "chase-1"
+
+
+async def test_amend_order_reports_a_half_failed_cancel_replace(
+    httpx_mock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    httpx_mock.add_response(
+        status_code=400,
+        json={
+            "code": -2021,
+            "msg": "Order cancel-replace partially failed.",
+            "data": {"cancelResult": "SUCCESS", "newOrderResult": "FAILURE"},
+        },
+    )
+    broker = _broker(monkeypatch)
+
+    with pytest.raises(ReplaceFailed, match="original order was cancelled"):
+        await broker.amend_order(_live_limit(), qty=money("0.6"))
+
+
 async def test_place_then_cancel_round_trips_composite_id(
     httpx_mock, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -15,6 +15,8 @@ correctness. One opt-in ``@pytest.mark.network`` test hits Kraken's real
 
 from __future__ import annotations
 
+import json
+import urllib.parse
 from decimal import Decimal
 
 import httpx
@@ -108,7 +110,7 @@ def test_constructible_without_credentials() -> None:
     assert broker.has_credentials is False
 
 
-def test_capabilities_declares_six_rest_ops() -> None:
+def test_capabilities_declares_rest_and_batch_ops() -> None:
     broker = KrakenBroker(api_key="", api_secret="")
     caps = broker.capabilities()
     assert caps == {
@@ -118,6 +120,10 @@ def test_capabilities_declares_six_rest_ops() -> None:
         Capability.BALANCES,
         Capability.FILLS,
         Capability.TICKER,
+        Capability.BATCH_ORDERS,
+        Capability.BATCH_CANCEL,
+        Capability.CANCEL_ALL,
+        Capability.AMEND,
     }
     # The private WS feed belongs to the WS leaf, not this REST adapter.
     assert Capability.PRIVATE_WS not in caps
@@ -237,6 +243,125 @@ async def test_cancel_order_posts_txid(
     assert "txid=OXXXXX-YYYYY-ZZZZZ" in request.content.decode()
 
 
+def _limit(cid: str, price: str = "37500") -> Order:
+    return Order(
+        client_order_id=cid,
+        instrument=BTC_USD,
+        side=OrderSide.BUY,
+        qty=money("0.5"),
+        type=OrderType.LIMIT,
+        limit_price=money(price),
+    )
+
+
+async def test_place_orders_sends_one_signed_json_batch(
+    httpx_mock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """``AddOrderBatch`` carries the pair once, signs the exact JSON body, and
+    maps each per-order entry (txid or error) back to its order's slot."""
+    from trading_bot.brokers.kraken import _sign
+
+    httpx_mock.add_response(
+        json={
+            "error": [],
+            "result": {
+                "orders": [
+                    {"txid": "OAAAAA-11111-AAAAAA", "descr": {}},
+                    {"error": "EOrder:Insufficient funds"},
+                ]
+            },
+        }
+    )
+    broker = _broker(monkeypatch)
+
+    results = await broker.place_orders([_limit("b1"), _limit("b2", "37000")])
+
+    assert results[0] == "OAAAAA-11111-AAAAAA"
+    assert isinstance(results[1], BrokerError)
+    assert "Insufficient funds" in str(results[1])
+    request = httpx_mock.get_request()
+    assert str(request.url) == "https://api.kraken.com/0/private/AddOrderBatch"
+    assert request.headers["Content-Type"] == "application/json"
+    body = json.loads(request.content)
+    assert body["pair"] == "XBTUSD"
+    assert body["orders"] == [
+        {"type": "buy", "ordertype": "limit", "volume": "0.5", "price": "37500"},
+        {"type": "buy", "ordertype": "limit", "volume": "0.5", "price": "37000"},
+    ]
+    expected = _sign(
+        "/0/private/AddOrderBatch", body, _VECTOR_SECRET, request.content.decode()
+    )
+    assert request.headers["API-Sign"] == expected
+
+
+async def test_place_orders_ambiguous_failure_marks_every_order(
+    httpx_mock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A 5xx on a batch is sent once and reported as ambiguous for each order."""
+    httpx_mock.add_response(status_code=503, text="upstream down")
+    sleep = _RecordingSleep()
+    http = AsyncHTTPClient(exchange="kraken", max_retries=3, sleep=sleep)
+    broker = _broker(monkeypatch, http=http)
+
+    results = await broker.place_orders([_limit("a1"), _limit("a2")])
+
+    assert all(isinstance(r, AmbiguousRequestError) for r in results)
+    assert len(httpx_mock.get_requests()) == 1
+    assert sleep.calls == []
+
+
+async def test_place_orders_chunks_at_fifteen(
+    httpx_mock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Sixteen orders: one full ``AddOrderBatch``, then a lone ``AddOrder``."""
+    httpx_mock.add_response(
+        url="https://api.kraken.com/0/private/AddOrderBatch",
+        json={
+            "error": [],
+            "result": {"orders": [{"txid": f"OB-{i}"} for i in range(15)]},
+        },
+    )
+    httpx_mock.add_response(
+        url="https://api.kraken.com/0/private/AddOrder",
+        json={"error": [], "result": {"txid": ["OS-15"]}},
+    )
+    broker = _broker(monkeypatch)
+
+    results = await broker.place_orders([_limit(f"c{i}") for i in range(16)])
+
+    assert results == [f"OB-{i}" for i in range(15)] + ["OS-15"]
+    assert [r.url.path for r in httpx_mock.get_requests()] == [
+        "/0/private/AddOrderBatch",
+        "/0/private/AddOrder",
+    ]
+
+
+async def test_place_orders_rejects_mixed_pairs(monkeypatch: pytest.MonkeyPatch) -> None:
+    broker = _broker(monkeypatch)
+    eth = Order(
+        client_order_id="e1",
+        instrument=Instrument(Symbol("ETH", "USD")),
+        side=OrderSide.BUY,
+        qty=money("1"),
+        type=OrderType.MARKET,
+    )
+    with pytest.raises(BrokerError, match="one pair"):
+        await broker.place_orders([_limit("b1"), eth])
+
+
+async def test_cancel_orders_posts_json_batch(
+    httpx_mock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    httpx_mock.add_response(json={"error": [], "result": {"count": 2}})
+    broker = _broker(monkeypatch)
+
+    await broker.cancel_orders(["OAAAAA-1", "OBBBBB-2"])
+
+    request = httpx_mock.get_request()
+    assert str(request.url) == "https://api.kraken.com/0/private/CancelOrderBatch"
+    assert json.loads(request.content)["orders"] == ["OAAAAA-1", "OBBBBB-2"]
+
+
 async def test_balances_returns_decimal_map(
     httpx_mock, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -578,3 +703,38 @@ async def test_real_kraken_public_btc_usd() -> None:
     price = await broker.ticker(inst)
     assert isinstance(price, Decimal)
     assert price > 0
+
+
+async def test_cancel_all_posts_cancel_all(
+    httpx_mock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    httpx_mock.add_response(json={"error": [], "result": {"count": 4}})
+    broker = _broker(monkeypatch)
+
+    assert await broker.cancel_all() == 4
+
+    request = httpx_mock.get_request()
+    assert str(request.url) == "https://api.kraken.com/0/private/CancelAll"
+    assert request.headers["API-Sign"]
+
+
+async def test_amend_order_posts_amend_order_and_keeps_the_txid(
+    httpx_mock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    httpx_mock.add_response(json={"error": [], "result": {"amend_id": "TAMEND"}})
+    broker = _broker(monkeypatch)
+    order = _limit("cid-a")
+    order.submit()
+    order.open("OXXXXX-1")
+
+    venue_id = await broker.amend_order(
+        order, qty=money("0.75"), limit_price=money("37400")
+    )
+
+    assert venue_id == "OXXXXX-1"
+    request = httpx_mock.get_request()
+    assert str(request.url) == "https://api.kraken.com/0/private/AmendOrder"
+    body = urllib.parse.parse_qs(request.content.decode())
+    assert body["txid"] == ["OXXXXX-1"]
+    assert body["order_qty"] == ["0.75"]
+    assert body["limit_price"] == ["37400"]
@@ -79,8 +79,8 @@ def test_name_is_paper() -> None:
     assert PaperBroker().name == "paper"
 
 
-def test_capabilities_declares_six_ops() -> None:
-    """The declared capabilities are exactly the six in-process operations."""
+def test_capabilities_declares_six_ops_and_batches() -> None:
+    """The declared capabilities are the six in-process operations and batches."""
     assert PaperBroker().capabilities() == {
         Capability.PLACE_ORDER,
         Capability.CANCEL,
@@ -88,6 +88,10 @@ def test_capabilities_declares_six_ops() -> None:
         Capability.BALANCES,
         Capability.FILLS,
         Capability.TICKER,
+        Capability.BATCH_ORDERS,
+        Capability.BATCH_CANCEL,
+        Capability.CANCEL_ALL,
+        Capability.AMEND,
     }
     assert Capability.PRIVATE_WS not in PaperBroker().capabilities()
 
@@ -342,6 +346,55 @@ async def test_cancel_filled_order_raises_missing_order() -> None:
         await broker.cancel_order(venue_order_id)
 
 
+async def test_batch_place_reports_per_order_and_batch_cancel_is_atomic() -> None:
+    """``place_orders`` keeps one slot per order; ``cancel_orders`` is all-or-none."""
+    broker = PaperBroker(fill_model="partial", partial_fill_ratio=money("0.5"))
+    ids = await broker.place_orders(
+        [_limit_buy(cid="b1"), _market_buy(cid="m1"), _limit_buy(cid="b2")]
+    )
+    assert ids[0] == "PAPER-1" and ids[2] == "PAPER-3"
+    assert isinstance(ids[1], BrokerError)  # no mark price for the market order
+
+    with pytest.raises(MissingOrder):
+        await broker.cancel_orders(["PAPER-1", "PAPER-404"])
+    assert len(await broker.open_orders()) == 2  # nothing cancelled
+
+    await broker.cancel_orders(["PAPER-1", "PAPER-3"])
+    assert await broker.open_orders() == []
+
+    with pytest.raises(BrokerError, match="one instrument"):
+        await broker.place_orders([_limit_buy(), Order(
+            client_order_id="e1", instrument=ETH_USD, side=OrderSide.BUY,
+            qty=money("1"), type=OrderType.MARKET,
+        )])
+
+
+async def test_amend_updates_the_live_order_and_keeps_its_id() -> None:
+    """``amend_order`` emulates an in-place amend: same id, no fill, not mutated."""
+    broker = PaperBroker(fill_model="partial", partial_fill_ratio=money("0.5"))
+    order = _limit_buy(qty="2", price="30000")
+    order.submit()
+    order.open(await broker.place_order(order))
+
+    assert await broker.amend_order(
+        order, qty=money("3"), limit_price=money("29500")
+    ) == order.venue_order_id
+    [live] = await broker.open_orders()
+    assert (live.qty, live.limit_price, live.filled_qty) == (
+        money("3"),
+        money("29500"),
+        money("1"),
+    )
+    assert (order.qty, order.limit_price) == (money("2"), money("30000"))
+    assert len(await broker.fills()) == 2  # the placement's slices only
+
+    with pytest.raises(BrokerError, match="must exceed filled"):
+        await broker.amend_order(order, qty=money("1"))
+    await broker.cancel_order(order.venue_order_id)
+    with pytest.raises(MissingOrder):
+        await broker.amend_order(order, limit_price=money("29000"))
+
+
 # --- ticker ----------------------------------------------------------------- #
 
 
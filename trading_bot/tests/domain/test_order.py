@@ -248,6 +248,60 @@ class TestIllegalTransitions:
         assert o.status is OrderStatus.SUBMITTED
 
 
+class TestAmend:
+    def test_amend_keeps_identity_status_and_fills(self) -> None:
+        o = make_order(qty="2")
+        o.submit()
+        o.open("VID-1")
+        o.apply_fill(money("0.5"), money("30000"))
+        o.amend(qty=money("3"), limit_price=money("29900"))
+        assert (o.client_order_id, o.venue_order_id) == ("cid-1", "VID-1")
+        assert o.status is OrderStatus.PARTIALLY_FILLED
+        assert (o.qty, o.limit_price, o.filled_qty) == (
+            money("3"),
+            money("29900"),
+            money("0.5"),
+        )
+        o.amend(limit_price=money("29800"), venue_order_id="VID-2")
+        assert o.venue_order_id == "VID-2"
+
+    def test_amend_requires_a_live_order(self) -> None:
+        o = make_order()
+        with pytest.raises(OrderStatusError, match="cannot amend"):
+            o.amend(limit_price=money("1"))
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({}, "needs a qty or limit_price"),
+            ({"qty": money("0.5")}, "must exceed filled qty"),
+            ({"limit_price": money("0")}, "must be positive"),
+            ({"limit_price": money("1"), "venue_order_id": ""}, "non-empty"),
+        ],
+    )
+    def test_invalid_amend_changes_nothing(
+        self, kwargs: dict[str, object], match: str
+    ) -> None:
+        o = make_order(qty="2")
+        o.submit()
+        o.open("VID-1")
+        o.apply_fill(money("0.5"), money("30000"))
+        with pytest.raises(OrderError, match=match):
+            o.amend(**kwargs)  # type: ignore[arg-type]
+        assert (o.qty, o.limit_price, o.venue_order_id) == (
+            money("2"),
+            money("30000"),
+            "VID-1",
+        )
+
+    def test_amend_price_of_market_order_is_refused(self) -> None:
+        o = make_order(otype=OrderType.MARKET, limit_price=None)
+        o.submit()
+        o.open("VID-1")
+        with pytest.raises(OrderError, match="MARKET order has no limit_price"):
+            o.amend(limit_price=money("1"))
+
+
 class TestApplyFillAccounting:
     def test_weighted_average_is_exact(self) -> None:
         # Two equal-qty fills -> arithmetic mean.
@@ -22,6 +22,7 @@ from trading_bot.domain.instrument import Instrument, Symbol
 from trading_bot.domain.money import money
 from trading_bot.domain.order import OrderSide
 from trading_bot.domain.performance import PerformanceDependencyError
+from trading_bot.domain.position import Position
 
 BTCUSD = Instrument(Symbol("BTC", "USD"), price_precision=1, qty_precision=8)
 
@@ -318,6 +319,48 @@ class TestKPIParity:
         assert perf.max_drawdown(self.equity) == pytest.approx(0.325)
 
 
+class TestFoldFillColumns:
+    """The column fold equals folding ``Position.with_fill`` per instrument."""
+
+    def test_matches_positions_across_instruments(self) -> None:
+        eth = Instrument(Symbol("ETH", "USD"))
+        rows = [  # instrument, side, qty, price, fee
+            (BTCUSD, OrderSide.BUY, "2", "100", "0.1"),
+            (eth, OrderSide.SELL, "3", "2000", "0.2"),
+            (BTCUSD, OrderSide.BUY, "1", "130", "0"),
+            (BTCUSD, OrderSide.SELL, "4", "120", "0.3"),  # flip short
+            (eth, OrderSide.BUY, "3", "1900", "0"),  # close flat
+            (BTCUSD, OrderSide.BUY, "1", "110", "0"),
+        ]
+        fills = [
+            Fill(f"T{i}", "cid", inst, side, money(q), money(p), money(f), i)
+            for i, (inst, side, q, p, f) in enumerate(rows)
+        ]
+
+        path, positions = perf.fold_fill_columns(
+            [f.instrument for f in fills],
+            [f.signed_qty for f in fills],
+            [f.price for f in fills],
+            [f.fee for f in fills],
+        )
+
+        expected = {
+            inst: Position.from_fills(f for f in fills if f.instrument == inst)
+            for inst in (BTCUSD, eth)
+        }
+        assert positions == expected
+        assert path[-1] == sum(
+            (p.realised_pnl for p in expected.values()), money("0")
+        )
+        assert path[1] == money("-0.3")  # two fees, nothing closed yet
+        assert len(path) == len(fills)
+
+    def test_empty_and_misaligned(self) -> None:
+        assert perf.fold_fill_columns([], [], [], []) == ((), {})
+        with pytest.raises(ValueError):
+            perf.fold_fill_columns([BTCUSD], [money("1")], [], [money("0")])
+
+
 class TestKPIMissingDependency:
     """When fynance is absent the wrappers raise a clear domain error."""
 
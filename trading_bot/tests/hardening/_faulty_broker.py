@@ -240,5 +240,15 @@ class FaultyBroker(Broker):
         return await self.inner.ticker(instrument)
 
     def capabilities(self) -> set[Capability]:
-        """Mirror the wrapped broker's declared capabilities."""
-        return self.inner.capabilities()
+        """Mirror the wrapped broker's declared capabilities, minus bulk calls.
+
+        Faults are injected on the single-order calls only, so the batch,
+        cancel-all and amend endpoints are not offered (every order is routed
+        singly).
+        """
+        return self.inner.capabilities() - {
+            Capability.BATCH_ORDERS,
+            Capability.BATCH_CANCEL,
+            Capability.CANCEL_ALL,
+            Capability.AMEND,
+        }
@@ -14,9 +14,11 @@ What is verified
 * ``GET /api/orders`` returns the router's tracked orders with enums by ``.value``
   and money as strings;
 * ``GET /api/kpi`` returns realised PnL as a string equal to
-  ``engine.perf.realised_pnl()`` and the four KPI ratio keys;
-* ``GET /api/events`` (SSE) streams a :class:`FillEvent` emitted on the bus and
-  the queue is removed on disconnect;
+  ``engine.perf.realised_pnl()`` and the four KPI ratio keys, and its stored
+  ``history`` is read on a store reader thread, not the event loop;
+* ``GET /api/logs`` pages the engine's log ring newest-first;
+* ``GET /api/events`` (SSE) streams a :class:`FillEvent` emitted on the bus from
+  the app's serialise-once hub, and the client is released on disconnect;
 * there is **no** mutation route — a POST to a plausible order path is rejected.
 """
 
@@ -24,6 +26,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import threading
 from decimal import Decimal
 from typing import Any
 
@@ -33,8 +36,9 @@ from fastapi.testclient import TestClient
 from starlette.requests import Request
 
 from trading_bot.application.config import AppConfig
-from trading_bot.application.events import FillEvent
+from trading_bot.application.events import FillEvent, LogEvent
 from trading_bot.application.service_factory import Engine, build_engine
+from trading_bot.application.watchdog import LoopWatchdog
 from trading_bot.domain.fill import Fill
 from trading_bot.domain.instrument import Instrument, Symbol
 from trading_bot.domain.money import money
@@ -63,6 +67,7 @@ def _build_seeded_engine() -> Engine:
                 {"name": "btc-ma", "symbol": "BTC/USD"},
                 {"name": "eth-ma", "symbol": "ETH/USD"},
             ],
+            "events": {"log_buffer": 100},
         }
     )
     engine = build_engine(config)
@@ -130,6 +135,19 @@ def test_health_reports_paper_mode_and_strategy_count(client: TestClient) -> Non
     assert body["strategies"] == 2
 
 
+def test_metrics_report_the_watchdog_lag_histogram(engine: Engine) -> None:
+    """``/api/metrics`` carries the loop lag histogram — ``null`` with no watchdog."""
+    assert TestClient(create_app(engine)).get("/api/metrics").json() == {"loop": None}
+    watchdog = LoopWatchdog(threshold=0.5)
+    watchdog.histogram.observe(0.2)
+    loop = TestClient(create_app(engine, watchdog=watchdog)).get("/api/metrics")
+    body = loop.json()["loop"]
+    assert body["lag"]["count"] == 1
+    assert body["lag"]["max"] == 0.2
+    assert body["stalls"] == 0
+    assert body["threshold"] == 0.5
+
+
 # --- positions: money is an exact Decimal string --------------------------- #
 
 
@@ -265,9 +283,70 @@ def test_kpi_empty_engine_returns_zero_ratios_and_null_equity() -> None:
     assert body["realised_pnl"] == "0"
     assert body["equity_end"] is None
     assert body["sharpe"] == 0.0
+    assert body["history"] == []
+
+
+def test_kpi_history_sums_the_store(tmp_path) -> None:
+    """With a store, ``history`` carries per-instrument totals as strings."""
+    engine = build_engine(AppConfig(), db_path=tmp_path / "engine.db")
+    assert engine.store is not None
+    for fill_id, side, qty in (("F1", OrderSide.BUY, "2"), ("F2", OrderSide.SELL, "0.5")):
+        engine.store.record_fill(
+            Fill(fill_id, "cid", _BTC, side, money(qty), money("30000"), money("1"), 1)
+        )
+    body = TestClient(create_app(engine)).get("/api/kpi").json()
+    assert body["history"] == [
+        {
+            "instrument": "BTC/USD",
+            "fills": 2,
+            "net_qty": "1.5",
+            "volume": "75000",
+            "fees": "2",
+        }
+    ]
+
+
+def test_kpi_history_is_read_off_the_event_loop(tmp_path, monkeypatch) -> None:
+    """The store query behind ``history`` runs on a reader thread."""
+    engine = build_engine(AppConfig(), db_path=tmp_path / "engine.db")
+    assert engine.store is not None
+    threads: list[str] = []
+    fill_totals = engine.store.fill_totals
 
+    def _spy(**kwargs: object) -> list:
+        threads.append(threading.current_thread().name)
+        return fill_totals(**kwargs)
 
-# --- SSE: a FillEvent streams through, queue removed on disconnect ---------- #
+    monkeypatch.setattr(engine.store, "fill_totals", _spy)
+    assert TestClient(create_app(engine)).get("/api/kpi").json()["history"] == []
+    assert len(threads) == 1 and threads[0].startswith("AsyncStore-reader")
+
+
+# --- logs: the ring pages newest-first -------------------------------------- #
+
+
+def test_default_engine_and_idle_dashboard_take_no_logs() -> None:
+    """No ring by default and no SSE client: ``EventBus.log`` stays free."""
+    engine = build_engine(AppConfig())
+    create_app(engine)
+    assert engine.logs is None
+    assert not engine.bus.wants(LogEvent)
+
+
+def test_logs_endpoint_pages_the_ring(client: TestClient, engine: Engine) -> None:
+    """``/api/logs`` returns rendered lines newest-first with a ``next`` cursor."""
+    for i in range(3):
+        engine.bus.log("tick {i}", category="strategy", i=i)
+
+    first = client.get("/api/logs", params={"limit": 2}).json()
+    assert [row["message"] for row in first["logs"]] == ["tick 2", "tick 1"]
+    assert first["logs"][0]["category"] == "strategy"
+    rest = client.get("/api/logs", params={"before": first["next"]}).json()
+    assert [row["message"] for row in rest["logs"]][:1] == ["tick 0"]
+    assert rest["next"] is None
+
+
+# --- SSE: a FillEvent streams through, client released on disconnect -------- #
 
 
 def _events_route(app: FastAPI) -> Any:
@@ -284,7 +363,7 @@ async def _never_disconnect() -> dict[str, Any]:
     return {"type": "http.disconnect"}  # pragma: no cover - never reached
 
 
-async def test_events_stream_delivers_fill_event_and_removes_queue(
+async def test_events_stream_delivers_fill_event_and_releases_client(
     engine: Engine,
 ) -> None:
     """``/api/events`` streams an emitted ``FillEvent`` (money as strings), cleans up.
@@ -292,12 +371,13 @@ async def test_events_stream_delivers_fill_event_and_removes_queue(
     The endpoint serves an **infinite** ``text/event-stream``; the in-process
     ``TestClient`` deadlocks consuming an endless stream, so this drives the
     endpoint's real ``StreamingResponse.body_iterator`` directly — the exact
-    generator the route returns, including the bus-queue registration on open and
-    the ``remove_queue`` in its ``finally`` on close.
+    generator the route returns, including the hub's client count on open and
+    its release in the ``finally`` on close. No bus queue is registered per client.
     """
     app = create_app(engine)
     bus = engine.bus
-    before = len(bus._queues)
+    hub = app.state.sse_hub
+    queues = len(bus._queues)
 
     fill = Fill(
         fill_id="SSE-1",
@@ -325,16 +405,17 @@ async def test_events_stream_delivers_fill_event_and_removes_queue(
     frames = response.body_iterator
     try:
         # First frame is the immediate ": connected" comment (flushes the start),
-        # and the bus queue is now registered for this consumer.
+        # and the hub now counts this consumer.
         first = await frames.__anext__()
-        assert first.startswith(":")
-        assert len(bus._queues) == before + 1
+        assert first.startswith(b":")
+        assert hub.clients == 1
 
         # Emit a fill; it must arrive next as a `data:` frame with string money.
         bus.emit(FillEvent(fill))
-        frame = await frames.__anext__()
-        assert frame.startswith("data:")
-        payload = json.loads(frame[len("data:"):].strip())
+        frame = (await frames.__anext__()).decode()
+        id_line, data_line = frame.strip().split("\n")
+        assert id_line == f"id: {hub.head}"
+        payload = json.loads(data_line[len("data:"):].strip())
         assert payload["type"] == "fill"
         assert payload["fill"]["fill_id"] == "SSE-1"
         # Money in the SSE frame is an exact Decimal string, like the REST routes.
@@ -343,10 +424,11 @@ async def test_events_stream_delivers_fill_event_and_removes_queue(
         assert payload["fill"]["side"] == "buy"
     finally:
         # Closing the stream (client disconnect) runs the generator's `finally`,
-        # which removes the queue from the bus.
+        # which releases the client.
         await frames.aclose()
 
-    assert len(bus._queues) == before
+    assert hub.clients == 0
+    assert len(bus._queues) == queues
 
 
 # --- no-mutation: the API never places or cancels an order ----------------- #
@@ -418,7 +500,12 @@ def test_event_dict_serializes_each_event_type_with_string_money() -> None:
     assert order_payload["order"]["side"] == "buy"
 
     log_payload = _event_dict(LogEvent(message="hi", level="warning"))
-    assert log_payload == {"type": "log", "message": "hi", "level": "warning"}
+    assert log_payload == {
+        "type": "log",
+        "message": "hi",
+        "level": "warning",
+        "category": "general",
+    }
 
 
 def test_kpi_endpoint_stays_robust_over_a_profitable_curve() -> None:
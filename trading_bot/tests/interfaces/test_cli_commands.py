@@ -11,7 +11,9 @@ file replayed through the engine's :class:`~trading_bot.brokers.paper.PaperBroke
 * the ``--live`` path refuses (non-zero exit, clear message) and **never places
   an order** when confirmation/credentials are missing;
 * ``status`` and ``kpi`` render their tables from a persisted store and surface
-  the expected position / PnL values.
+  the expected position / PnL values; they and ``export`` open a journal
+  store's directory as well as a SQLite file, and ``vacuum`` converts an older
+  SQLite file to incremental auto-vacuum.
 
 The ``_render`` helpers are also tested directly (no CLI) from a known state, so
 the table formatting is unit-checked without invoking a command.
@@ -33,6 +35,7 @@ from trading_bot.domain.order import Order, OrderSide, OrderType
 from trading_bot.domain.position import Position
 from trading_bot.interfaces.cli import _render
 from trading_bot.interfaces.cli.main import app
+from trading_bot.storage.journal_store import JournalStore
 from trading_bot.storage.sqlite_store import SqliteStore
 
 runner = CliRunner()
@@ -211,9 +214,9 @@ def test_run_live_declined_confirmation_refuses() -> None:
 # --- status ---------------------------------------------------------------- #
 
 
-def _seed_store(path: pathlib.Path) -> None:
+def _seed_store(path: pathlib.Path, *, journal: bool = False) -> None:
     """Persist a known order + a couple of fills into a store at ``path``."""
-    store = SqliteStore(path)
+    store = JournalStore(path) if journal else SqliteStore(path)
 
     # A still-open order (status OPEN) so status lists it under "Open orders".
     order = Order(
@@ -237,6 +240,8 @@ def _seed_store(path: pathlib.Path) -> None:
         Fill("F2", "cid-1", _BTC_USD, OrderSide.SELL, money("1"),
              money("31000"), money("0"), 2)
     )
+    if journal:
+        store.close()
 
 
 def test_status_renders_positions_and_open_orders(
@@ -284,6 +289,110 @@ def test_kpi_renders_realised_pnl(tmp_path: pathlib.Path) -> None:
     assert "Sharpe" in result.output
 
 
+def test_kpi_fast_renders_store_totals(tmp_path: pathlib.Path) -> None:
+    """`kpi --fast` shows SQL-side totals: net qty 1, volume 91000, no ratios."""
+    db = tmp_path / "kpi.db"
+    _seed_store(db)
+
+    result = runner.invoke(app, ["kpi", "--db", str(db), "--fast"])
+
+    assert result.exit_code == 0, result.output
+    assert "Traded (history)" in result.output
+    assert "91000" in result.output  # 2 * 30000 + 1 * 31000
+    assert "Sharpe" not in result.output
+
+
+def test_export_then_kpi_over_parquet(tmp_path: pathlib.Path) -> None:
+    """`export` writes a Parquet dataset; `kpi --parquet` reads the same figures."""
+    db = tmp_path / "kpi.db"
+    _seed_store(db)
+    out = tmp_path / "pq"
+
+    result = runner.invoke(app, ["export", "--db", str(db), "--out", str(out)])
+    assert result.exit_code == 0, result.output
+    assert "exported 2 fills, 1 orders" in result.output
+
+    fast = runner.invoke(app, ["kpi", "--parquet", str(out), "--fast"])
+    assert fast.exit_code == 0, fast.output
+    assert "91000" in fast.output  # same totals as `kpi --db --fast`
+
+    again = runner.invoke(app, ["export", "--db", str(db), "--out", str(out)])
+    assert "exported 0 fills" in again.output
+
+
+def test_commands_read_a_journal_store_directory(tmp_path: pathlib.Path) -> None:
+    """`status`, `kpi` and `export` open a journal directory as a JournalStore."""
+    path = tmp_path / "journal"
+    _seed_store(path, journal=True)
+
+    status = runner.invoke(app, ["status", "--db", str(path)])
+    assert status.exit_code == 0, status.output
+    assert "cid-1" in status.output
+
+    fast = runner.invoke(app, ["kpi", "--db", str(path), "--fast"])
+    assert fast.exit_code == 0, fast.output
+    assert "91000" in fast.output  # the same totals as the SQLite store's
+
+    out = tmp_path / "pq"
+    result = runner.invoke(app, ["export", "--db", str(path), "--out", str(out)])
+    assert result.exit_code == 0, result.output
+    assert "exported 2 fills, 1 orders" in result.output
+
+
+def test_store_backend_follows_the_config(tmp_path: pathlib.Path) -> None:
+    """With --config, its storage.backend picks the store, not the path."""
+    db = tmp_path / "kpi.db"
+    _seed_store(db)
+    config = tmp_path / "cfg.yaml"
+    config.write_text("storage:\n  backend: journal\n")
+
+    result = runner.invoke(app, ["kpi", "--db", str(db), "--fast", "-c", str(config)])
+
+    assert result.exit_code != 0  # a SQLite file is no journal directory
+
+
+def test_vacuum_converts_an_older_sqlite_store(tmp_path: pathlib.Path) -> None:
+    import sqlite3
+
+    db = tmp_path / "old.db"
+    raw = sqlite3.connect(str(db))
+    raw.execute("CREATE TABLE legacy (a)")
+    raw.close()
+    _seed_store(db)
+
+    result = runner.invoke(app, ["vacuum", "--db", str(db)])
+    assert result.exit_code == 0, result.output
+    assert "converted" in result.output
+    result = runner.invoke(app, ["vacuum", "--db", str(db)])
+    assert "already" in result.output
+    assert runner.invoke(app, ["vacuum", "--db", str(tmp_path)]).exit_code != 0
+
+
+def test_kpi_parquet_renders_realised_pnl(tmp_path: pathlib.Path) -> None:
+    """`kpi --parquet` folds the exported fills column-wise: realised PnL 1000."""
+    pytest.importorskip("fynance")
+    db = tmp_path / "kpi.db"
+    _seed_store(db)
+    out = tmp_path / "pq"
+    runner.invoke(app, ["export", "--db", str(db), "--out", str(out)])
+
+    result = runner.invoke(app, ["kpi", "--parquet", str(out)])
+
+    assert result.exit_code == 0, result.output
+    assert "1000" in result.output
+
+
+def test_kpi_needs_exactly_one_source(tmp_path: pathlib.Path) -> None:
+    """`kpi` refuses no source, both sources, and a missing export directory."""
+    db = tmp_path / "kpi.db"
+    _seed_store(db)
+    assert runner.invoke(app, ["kpi"]).exit_code != 0
+    both = ["kpi", "--db", str(db), "--parquet", str(tmp_path)]
+    assert runner.invoke(app, both).exit_code != 0
+    missing = ["kpi", "--parquet", str(tmp_path / "nope")]
+    assert runner.invoke(app, missing).exit_code != 0
+
+
 def test_kpi_default_capital_anchors_equity_endpoint(
     tmp_path: pathlib.Path,
 ) -> None:
@@ -432,3 +541,82 @@ async def test_daemon_starts_ticks_and_stops_cleanly() -> None:
     task.cancel()
     with contextlib.suppress(asyncio.CancelledError):
         await task
+
+
+async def test_daemon_align_bars_starts_and_stops_cleanly() -> None:
+    """`_run_daemon(align_bars=True)` runs the bar-close scheduler and tears it down.
+
+    Same smoke as above over the bar-aligned path: the scheduler task is started in
+    place of the apscheduler trigger and is stopped (not leaked) on cancel.
+    """
+    import asyncio
+    import contextlib
+
+    from trading_bot.application.config import AppConfig
+    from trading_bot.interfaces.cli.main import _run_daemon
+
+    task = asyncio.create_task(
+        _run_daemon(AppConfig(), interval=1, cron=None, align_bars=True, settle=0)
+    )
+    await asyncio.sleep(0.05)
+    assert not task.done()
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+
+def test_start_rejects_cron_with_align_bars() -> None:
+    """`start --align-bars --cron ...` is refused rather than ignoring the cron."""
+    result = runner.invoke(app, ["start", "--align-bars", "--cron", "0 * * * *"])
+    assert result.exit_code != 0
+    assert "exclusive" in result.output
+
+
+_UNIT_ROW = {
+    "name": "btc-ma",
+    "kind": "strategy",
+    "exchange": "kraken",
+    "mode": "paper",
+    "running": True,
+    "realised_pnl": "0",
+    "open_orders": 0,
+    "usage": {
+        "steps": 12,
+        "cpu_seconds": 0.25,
+        "memory_bytes": 3 * 1024 * 1024,
+        "peak_memory_bytes": 4 * 1024 * 1024,
+        "tracked_orders": 7,
+        "latency_p50": 0.0042,
+        "latency_p95": 0.01,
+        "latency_p99": 0.02,
+    },
+}
+
+
+def test_strategies_table_renders_unit_usage() -> None:
+    """`strategies_table` shows steps, CPU, memory (binary units) and latency."""
+    rendered = _render_to_text(_render.strategies_table([_UNIT_ROW]))
+    for text in ("btc-ma", "12", "0.250s", "3.0MiB", "4.0MiB", "7", "4.2ms", "20.0ms"):
+        assert text in rendered
+
+
+def test_strategies_command_reads_the_control_api(httpx_mock) -> None:  # noqa: ANN001
+    """`strategies` fetches /api/strategies (bearer token) and renders the table."""
+    httpx_mock.add_response(
+        url="http://127.0.0.1:9000/api/strategies",
+        match_headers={"Authorization": "Bearer tok"},
+        json=[_UNIT_ROW],
+    )
+    result = runner.invoke(
+        app, ["strategies", "--url", "http://127.0.0.1:9000", "--token", "tok"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "Strategies" in result.output
+    assert "4.2ms" in result.output
+
+
+def test_strategies_command_fails_cleanly_when_unreachable(httpx_mock) -> None:  # noqa: ANN001
+    httpx_mock.add_response(status_code=401)
+    result = runner.invoke(app, ["strategies", "--url", "http://127.0.0.1:9000"])
+    assert result.exit_code == 1
+    assert "cannot read strategies" in result.output
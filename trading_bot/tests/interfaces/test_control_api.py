@@ -82,6 +82,8 @@ def test_list_strategies() -> None:
     assert s["mode"] == "paper"
     assert s["running"] is False
     assert s["realised_pnl"] is None
+    assert s["usage"]["steps"] == 0
+    assert s["usage"]["latency_p99"] is None
 
 
 def test_set_mode_testnet_then_paper() -> None:
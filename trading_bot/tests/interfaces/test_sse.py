@@ -0,0 +1,211 @@
+"""Tests for :class:`~trading_bot.interfaces.api.sse.SseHub` — the SSE broadcast hub.
+
+What is verified
+----------------
+* each event is encoded **once**, however many cursors read it;
+* a cursor resumes after ``Last-Event-ID`` and an unparsable / future id starts
+  at the head;
+* a cursor that fell off the ring gets a ``gap`` frame before the survivors;
+* a burst of log events is coalesced per chunk while order/fill frames are kept;
+* a quiet wait times out to ``None`` (the route's heartbeat);
+* with no client connected orders and fills still enter the ring, so the only
+  dashboard reconnecting with its ``Last-Event-ID`` resumes without a gap;
+* log events are only subscribed while a client is attached.
+
+Tests attach clients as the ``/api/events`` route does per connection.
+
+Async tests run un-decorated (``asyncio_mode = "auto"``).
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from trading_bot.application.events import (
+    Event,
+    EventBus,
+    FillEvent,
+    LogEvent,
+    OrderEvent,
+)
+from trading_bot.domain import (
+    Fill,
+    Instrument,
+    Order,
+    OrderSide,
+    OrderType,
+    Symbol,
+    money,
+)
+from trading_bot.interfaces.api.sse import SseCursor, SseHub
+
+
+def _encode(event: Event) -> str:
+    if isinstance(event, LogEvent):
+        return json.dumps({"type": "log", "message": event.message})
+    if isinstance(event, FillEvent):
+        return json.dumps({"type": "fill"})
+    return json.dumps({"type": "order"})
+
+
+def _frames(chunk: bytes) -> list[tuple[str | None, dict]]:
+    """Split a chunk into ``(id, payload)`` pairs."""
+    out = []
+    for frame in chunk.decode().split("\n\n"):
+        if not frame:
+            continue
+        fields = dict(line.split(": ", 1) for line in frame.split("\n"))
+        out.append((fields.get("id"), json.loads(fields["data"])))
+    return out
+
+
+def _order_event() -> OrderEvent:
+    return OrderEvent(
+        Order(
+            client_order_id="cid-1",
+            instrument=Instrument(Symbol("BTC", "USD")),
+            side=OrderSide.BUY,
+            qty=money("1"),
+            type=OrderType.MARKET,
+        )
+    )
+
+
+def _fill_event() -> FillEvent:
+    return FillEvent(
+        Fill(
+            fill_id="F1",
+            client_order_id="cid-1",
+            instrument=Instrument(Symbol("BTC", "USD")),
+            side=OrderSide.BUY,
+            qty=money("1"),
+            price=money("30000"),
+            fee=money("0"),
+            ts=1,
+        )
+    )
+
+
+async def test_each_event_is_encoded_once_for_every_client() -> None:
+    calls: list[Event] = []
+
+    def _counting(event: Event) -> str:
+        calls.append(event)
+        return _encode(event)
+
+    bus = EventBus()
+    hub = SseHub(bus, _counting)
+    for _ in range(3):
+        hub.attach()
+    cursors = [hub.cursor() for _ in range(3)]
+    bus.emit(LogEvent(message="a"))
+    bus.emit(LogEvent(message="b"))
+
+    chunks = [await hub.next_chunk(c, timeout=1.0) for c in cursors]
+    assert len(calls) == 2
+    assert len(set(chunks)) == 1
+    assert [p["message"] for _, p in _frames(chunks[0])] == ["a", "b"]
+    assert all(c.seq == hub.head == 2 for c in cursors)
+
+
+async def test_resume_after_last_event_id() -> None:
+    bus = EventBus()
+    hub = SseHub(bus, _encode)
+    hub.attach()
+    for name in "abc":
+        bus.emit(LogEvent(message=name))
+
+    resumed = hub.cursor("1")
+    chunk = await hub.next_chunk(resumed, timeout=1.0)
+    assert chunk is not None
+    assert [(i, p["message"]) for i, p in _frames(chunk)] == [("2", "b"), ("3", "c")]
+    assert hub.cursor("junk").seq == 3
+    assert hub.cursor("99").seq == 3
+
+
+async def test_a_cursor_that_fell_off_the_ring_gets_a_gap_frame() -> None:
+    bus = EventBus()
+    hub = SseHub(bus, _encode, capacity=2)
+    hub.attach()
+    cursor = hub.cursor()
+    for name in "abcd":
+        bus.emit(LogEvent(message=name))
+
+    chunk = await hub.next_chunk(cursor, timeout=1.0)
+    assert chunk is not None
+    frames = _frames(chunk)
+    assert frames[0] == (None, {"type": "gap", "missed": 2})
+    assert [p["message"] for _, p in frames[1:]] == ["c", "d"]
+
+
+async def test_log_bursts_are_coalesced_but_orders_are_kept() -> None:
+    bus = EventBus()
+    hub = SseHub(bus, _encode, max_logs=2)
+    for _ in range(2):
+        hub.attach()
+    fast = hub.cursor()
+    slow = hub.cursor()
+    bus.emit(LogEvent(message="0"))
+    first = await hub.next_chunk(fast, timeout=1.0)
+    assert first is not None and len(_frames(first)) == 1
+    bus.emit(_order_event())
+    for i in range(1, 5):
+        bus.emit(LogEvent(message=str(i)))
+
+    chunk = await hub.next_chunk(slow, timeout=1.0)
+    assert chunk is not None
+    assert [(i, p.get("message", p["type"])) for i, p in _frames(chunk)] == [
+        ("2", "order"),
+        ("4", "3 log events coalesced"),
+        ("5", "3"),
+        ("6", "4"),
+    ]
+
+
+async def test_quiet_wait_times_out_to_none() -> None:
+    hub = SseHub(EventBus(), _encode)
+    assert await hub.next_chunk(hub.cursor(), timeout=0.01) is None
+
+
+async def test_the_only_client_resumes_across_a_reconnect_without_a_gap() -> None:
+    """Detached, the hub still rings fills; the old id resumes from them."""
+    bus = EventBus()
+    hub = SseHub(bus, _encode)
+    hub.attach()
+    cursor = hub.cursor()
+    bus.emit(LogEvent(message="a"))
+    assert await hub.next_chunk(cursor, timeout=1.0) is not None
+    hub.detach()  # the EventSource blipped
+    bus.emit(_fill_event())
+    bus.emit(LogEvent(message="unwatched"))  # not subscribed: no frame, no gap
+    bus.emit(_order_event())
+
+    hub.attach()
+    resumed = hub.cursor(str(cursor.seq))
+    chunk = await hub.next_chunk(resumed, timeout=1.0)
+    assert chunk is not None
+    assert _frames(chunk) == [("2", {"type": "fill"}), ("3", {"type": "order"})]
+
+
+def test_logs_are_only_wanted_while_a_client_is_attached() -> None:
+    """The hub keeps ``EventBus.log`` free until someone watches the stream."""
+    bus = EventBus()
+    hub = SseHub(bus, _encode)
+    assert not bus.wants(LogEvent) and bus.wants(OrderEvent)
+    hub.attach()
+    hub.attach()
+    assert bus.wants(LogEvent)
+    hub.detach()
+    assert bus.wants(LogEvent)
+    hub.detach()
+    assert not bus.wants(LogEvent) and hub.clients == 0
+
+
+def test_invalid_parameters_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        SseHub(EventBus(), _encode, capacity=0)
+    with pytest.raises(ValueError):
+        SseHub(EventBus(), _encode, max_logs=0)
+    assert SseCursor(0).seq == 0
@@ -0,0 +1,199 @@
+"""Tests for :mod:`trading_bot.interfaces.stream` — the bus over a Unix socket.
+
+What is verified
+----------------
+* the codec round-trips every event type with **exact** ``Decimal`` money and
+  rejects malformed / unknown frames;
+* a real :class:`EventStreamServer` on a temp socket delivers bus events, in
+  order, to two concurrent :func:`subscribe` clients, with a ``types`` filter;
+* a peer that is not an event stream is refused at the handshake;
+* ``stop`` ends the clients' iteration and removes the socket file.
+
+Async tests run un-decorated (``asyncio_mode = "auto"``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from decimal import Decimal
+
+import pytest
+
+from trading_bot.application.events import EventBus, FillEvent, LogEvent, OrderEvent
+from trading_bot.domain import (
+    Fill,
+    Instrument,
+    Order,
+    OrderSide,
+    OrderType,
+    Symbol,
+    money,
+)
+from trading_bot.interfaces.stream import (
+    EventStreamServer,
+    StreamDecodeError,
+    decode_event,
+    encode_event,
+    subscribe,
+)
+from trading_bot.interfaces.stream.codec import HEADER, KIND_FILL
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="Unix domain sockets"
+)
+
+_BTC = Instrument(Symbol("BTC", "USD"))
+
+
+def _fill(fill_id: str = "F1") -> Fill:
+    return Fill(
+        fill_id=fill_id,
+        client_order_id="cid-1",
+        instrument=_BTC,
+        side=OrderSide.BUY,
+        qty=money("0.1"),
+        price=money("30000.10"),
+        fee=money("0.000001"),
+        ts=1_700_000_000_000,
+    )
+
+
+def _order() -> Order:
+    order = Order(
+        client_order_id="cid-1",
+        instrument=_BTC,
+        side=OrderSide.SELL,
+        qty=money("0.3"),
+        type=OrderType.LIMIT,
+        limit_price=money("31000.5"),
+    )
+    order.submit()
+    order.open("V-1")
+    order.apply_fill(money("0.1"), money("31000.5"))
+    return order
+
+
+def _roundtrip(frame: bytes) -> object:
+    kind, length = HEADER.unpack(frame[: HEADER.size])
+    assert length == len(frame) - HEADER.size
+    return decode_event(kind, frame[HEADER.size :])
+
+
+def test_codec_round_trips_exact_decimal_money() -> None:
+    fill_event = _roundtrip(encode_event(FillEvent(_fill())))
+    assert isinstance(fill_event, FillEvent)
+    assert fill_event.fill == _fill()
+    assert fill_event.fill.price == Decimal("30000.10")
+    assert str(fill_event.fill.fee) == "0.000001"
+
+    order = _order()
+    order_event = _roundtrip(encode_event(OrderEvent(order)))
+    assert isinstance(order_event, OrderEvent)
+    got = order_event.order
+    assert (got.status, got.venue_order_id) == (order.status, "V-1")
+    assert (got.filled_qty, got.avg_fill_price) == (money("0.1"), money("31000.5"))
+    assert got.limit_price == money("31000.5")
+
+    log = _roundtrip(encode_event(LogEvent(message="hi", level="warning")))
+    assert log == LogEvent(message="hi", level="warning")
+
+
+def test_codec_rejects_bad_frames() -> None:
+    with pytest.raises(StreamDecodeError):
+        decode_event(KIND_FILL, b"{not json")
+    with pytest.raises(StreamDecodeError):
+        decode_event(KIND_FILL, b'{"fill_id": "x"}')
+    with pytest.raises(StreamDecodeError):
+        decode_event(99, b"{}")
+    with pytest.raises(TypeError):
+        encode_event("nope")  # type: ignore[arg-type]
+
+
+async def _collect(path: str, n: int, **kwargs: object) -> list[object]:
+    out: list[object] = []
+    async for event in subscribe(path, **kwargs):  # type: ignore[arg-type]
+        out.append(event)
+        if len(out) == n:
+            break
+    return out
+
+
+async def _wait_for_clients(server: EventStreamServer, n: int) -> None:
+    for _ in range(200):
+        if server.clients >= n:
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError(f"only {server.clients} clients connected")
+
+
+async def test_server_fans_out_to_clients_in_order(tmp_path) -> None:
+    bus = EventBus()
+    path = str(tmp_path / "events.sock")
+    async with EventStreamServer(bus, path) as server:
+        everything = asyncio.create_task(_collect(path, 3))
+        fills = asyncio.create_task(_collect(path, 2, types=(FillEvent,)))
+        await _wait_for_clients(server, 2)
+
+        bus.emit(FillEvent(_fill("F1")))
+        bus.emit(LogEvent(message="between"))
+        bus.emit(FillEvent(_fill("F2")))
+
+        got_all, got_fills = await asyncio.wait_for(
+            asyncio.gather(everything, fills), timeout=5
+        )
+        assert server.sent == 3
+
+    assert [type(e).__name__ for e in got_all] == ["FillEvent", "LogEvent", "FillEvent"]
+    assert [e.fill.fill_id for e in got_fills] == ["F1", "F2"]  # type: ignore[attr-defined]
+    assert got_fills[0].fill.price == Decimal("30000.10")  # type: ignore[attr-defined]
+    assert not (tmp_path / "events.sock").exists()
+
+
+async def test_stop_ends_the_client_stream(tmp_path) -> None:
+    bus = EventBus()
+    path = str(tmp_path / "events.sock")
+    server = EventStreamServer(bus, path)
+    await server.start()
+    client = asyncio.create_task(_collect(path, 10))
+    await _wait_for_clients(server, 1)
+    bus.emit(LogEvent(message="last"))
+    await asyncio.sleep(0.05)
+    await server.stop()
+    got = await asyncio.wait_for(client, timeout=5)
+    assert got == [LogEvent(message="last")]
+    assert not server.running
+
+
+async def test_client_refuses_a_foreign_peer(tmp_path) -> None:
+    path = str(tmp_path / "other.sock")
+
+    async def _foreign(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        writer.write(b"HTTP/1.1 200 OK\r\n")
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_unix_server(_foreign, path=path)
+    try:
+        with pytest.raises(StreamDecodeError):
+            await _collect(path, 1)
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+async def test_a_client_that_stops_reading_is_disconnected(tmp_path) -> None:
+    """A stalled reader is shed once its backlog passes ``max_buffer``."""
+    bus = EventBus()
+    path = str(tmp_path / "events.sock")
+    async with EventStreamServer(bus, path, max_buffer=1024) as server:
+        reader, writer = await asyncio.open_unix_connection(path)  # never reads
+        await _wait_for_clients(server, 1)
+        big = LogEvent(message="x" * 65536)
+        for _ in range(64):  # far past any kernel socket buffer
+            bus.emit(big)
+        assert server.disconnected == 1
+        assert server.clients == 0
+        writer.close()
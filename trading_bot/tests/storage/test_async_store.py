@@ -0,0 +1,191 @@
+"""Tests for the :class:`~trading_bot.storage.async_store.AsyncStore`.
+
+What is verified
+----------------
+* every read awaits the same result as the wrapped store's, for both the SQLite
+  and the journal backend, and runs on a reader thread;
+* paged iterators yield every row across pages, one hop per page, and close the
+  store's iterator on an early ``break``;
+* a slow read does not stall the event loop: other coroutines keep running and
+  a write-behind store's flush waits on the worker;
+* ``restore_engine`` restores orders and the snapshot on the reader threads, and
+  ``close`` stops the workers but leaves the store open.
+
+Async tests run un-decorated (``asyncio_mode = "auto"``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from trading_bot.application.config import AppConfig
+from trading_bot.application.events import FillEvent
+from trading_bot.application.service_factory import build_engine, restore_engine
+from trading_bot.domain import (
+    Fill,
+    Instrument,
+    Order,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    Symbol,
+    money,
+)
+from trading_bot.storage import AsyncStore, JournalStore, SqliteStore
+
+BTC_USD = Instrument(Symbol("BTC", "USD"))
+ETH_USD = Instrument(Symbol("ETH", "USD"))
+
+
+def _order(i: int) -> Order:
+    order = Order(
+        f"cid-{i}",
+        ETH_USD if i % 2 else BTC_USD,
+        OrderSide.BUY,
+        money("1.5"),
+        OrderType.LIMIT,
+        limit_price=money(f"{30000 + i}.1"),
+    )
+    order.submit()
+    return order
+
+
+def _fill(i: int) -> Fill:
+    return Fill(
+        f"F{i}",
+        f"cid-{i}",
+        ETH_USD if i % 2 else BTC_USD,
+        OrderSide.SELL if i % 3 == 0 else OrderSide.BUY,
+        money(f"0.{i % 7 + 1}"),
+        money(f"{30000 + i}.5"),
+        money("0.03"),
+        1_700_000_000_000 + i,
+    )
+
+
+@pytest.fixture(params=["sqlite", "journal"])
+def store(request, tmp_path):
+    if request.param == "sqlite":
+        backend: SqliteStore | JournalStore = SqliteStore(tmp_path / "a.db")
+    else:
+        backend = JournalStore(tmp_path / "journal")
+    for i in range(25):
+        backend.upsert_order(_order(i))
+        backend.record_fill(_fill(i))
+    backend.set_state("mode", "paper")
+    yield backend
+    backend.close()
+
+
+async def test_reads_match_the_store_and_run_on_reader_threads(store) -> None:
+    reader = AsyncStore(store)
+    assert await reader.get_order("cid-3") == store.get_order("cid-3")
+    assert await reader.orders() == store.orders()
+    assert await reader.fills(since_ms=_fill(20).ts) == store.fills(_fill(20).ts)
+    assert await reader.fill_totals(by_day=True) == store.fill_totals(by_day=True)
+    assert await reader.fill_watermark() == store.fill_watermark()
+    assert await reader.fill_ids(since=_fill(10).ts, upto=12) == ["F10", "F11"]
+    assert await reader.get_state("mode") == "paper"
+    assert await reader.get_state("missing") is None
+
+    name = await reader.run(lambda: threading.current_thread().name)
+    assert name.startswith("AsyncStore-reader")
+    reader.close()
+
+
+async def test_paged_iterators_hop_once_per_page(store, monkeypatch) -> None:
+    reader = AsyncStore(store)
+    hops = 0
+    run = reader.run
+
+    async def _counting(fn, /, *args, **kwargs):  # noqa: ANN001, ANN202
+        nonlocal hops
+        hops += 1
+        return await run(fn, *args, **kwargs)
+
+    monkeypatch.setattr(reader, "run", _counting)
+    fills = [fill async for fill in reader.iter_fills(batch=10)]
+    assert fills == list(store.iter_fills())
+    assert hops == 3  # 10 + 10 + 5
+
+    eth = [o async for o in reader.iter_orders(instrument=ETH_USD, batch=4)]
+    assert eth == list(store.iter_orders(instrument=ETH_USD))
+    live = [o async for o in reader.orders_to_restore(window_ms=0, batch=7)]
+    assert {o.status for o in live} == {OrderStatus.SUBMITTED} and len(live) == 25
+
+    pages = reader.iter_fills(batch=2)
+    assert (await anext(pages)).fill_id == "F0"
+    await pages.aclose()  # closes the store's iterator with it
+    with pytest.raises(ValueError, match="batch"):
+        reader.iter_fills(batch=0)
+    reader.close()
+
+
+async def test_a_slow_read_does_not_stall_the_loop(tmp_path, monkeypatch) -> None:
+    store = SqliteStore(tmp_path / "wb.db", write_behind=True, flush_interval=1.0)
+    store.record_fill(_fill(1))  # queued: the read must flush it first
+    reader = AsyncStore(store)
+    fill_totals = store.fill_totals
+
+    def _slow(**kwargs: object) -> list:
+        time.sleep(0.2)
+        return fill_totals(**kwargs)
+
+    monkeypatch.setattr(store, "fill_totals", _slow)
+    ticks = 0
+
+    async def _ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(_ticker())
+    totals = await reader.fill_totals()
+    task.cancel()
+    assert [t.fills for t in totals] == [1]
+    assert ticks >= 5  # the loop kept turning while the read ran
+    reader.close()
+    store.close()
+
+
+async def test_restore_engine_reads_on_the_reader_threads(
+    tmp_path, monkeypatch
+) -> None:
+    config = AppConfig.model_validate(
+        {"storage": {"snapshot_every": 3, "read_workers": 1}}
+    )
+    first = build_engine(config, db_path=tmp_path / "engine.db")
+    assert first.store is not None
+    first.store.upsert_order(_order(1))
+    for i in range(7):
+        first.bus.emit(FillEvent(_fill(i)))
+    first.store.close()
+
+    engine = build_engine(config, db_path=tmp_path / "engine.db")
+    assert engine.store is not None and engine.reader is not None
+    threads: set[str] = set()
+    for name in ("iter_orders", "iter_fills"):
+        method = getattr(engine.store, name)
+
+        def _spy(*args, _method=method, **kwargs):  # noqa: ANN002, ANN003, ANN202
+            threads.add(threading.current_thread().name)
+            return _method(*args, **kwargs)
+
+        monkeypatch.setattr(engine.store, name, _spy)
+    assert await restore_engine(engine) == _fill(6).ts
+    assert engine.router.get("cid-1") is not None
+    assert engine.tracker.has_seen("F6")
+    assert len(threads) == 1 and threads.pop().startswith("AsyncStore-reader")
+
+    engine.reader.close()
+    with pytest.raises(RuntimeError):
+        await engine.reader.get_state("x")
+    assert engine.store.get_state("x") is None  # the store is still open
+    engine.store.close()
+    with pytest.raises(ValueError, match="read_workers"):
+        AppConfig.model_validate({"storage": {"read_workers": 0}})
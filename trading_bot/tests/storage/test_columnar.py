@@ -0,0 +1,214 @@
+"""Tests for :mod:`trading_bot.storage.columnar` — the Parquet export and its scans.
+
+What is verified
+----------------
+* an export lays fills out by UTC day and instrument, with exact
+  ``Decimal(38, 18)`` money that reads back equal to the store's;
+* a second export writes only what the store gained (the high-water marks),
+  and an export re-run from an older mark rewrites its parts rather than
+  duplicating fills;
+* :func:`scan_orders` keeps each order's latest version; :func:`scan_state`
+  the newest snapshot;
+* :func:`fill_totals` equals :meth:`SqliteStore.fill_totals`, including a fill
+  whose notional does not fit the exported scale;
+* a value that cannot be exported exactly raises :class:`ExportError`, and an
+  empty dataset scans to an empty frame.
+"""
+
+from __future__ import annotations
+
+import json
+from decimal import Decimal
+
+import polars as pl
+import pytest
+
+from trading_bot.domain import (
+    Fill,
+    Instrument,
+    Order,
+    OrderSide,
+    OrderType,
+    Symbol,
+    money,
+)
+from trading_bot.storage import (
+    ExportError,
+    SqliteStore,
+    export_parquet,
+    scan_fills,
+    scan_orders,
+    scan_state,
+)
+from trading_bot.storage.columnar import fill_totals
+
+_BTC = Instrument(Symbol("BTC", "USD"))
+_ETH = Instrument(Symbol("ETH", "USD"))
+_DAY_MS = 86_400_000
+#: 2024-01-01T00:00:00Z
+_T0 = 1_704_067_200_000
+
+
+def _fill(i: int, instrument: Instrument = _BTC, **money_fields: str) -> Fill:
+    return Fill(
+        f"F{i}",
+        f"cid-{i}",
+        instrument,
+        OrderSide.BUY if i % 3 else OrderSide.SELL,
+        money(money_fields.get("qty", f"0.{i % 9 + 1}")),
+        money(money_fields.get("price", f"{30000 + i}.5")),
+        money(money_fields.get("fee", "0.01")),
+        _T0 + (i % 4) * _DAY_MS,
+    )
+
+
+def _order(cid: str) -> Order:
+    order = Order(
+        client_order_id=cid,
+        instrument=_BTC,
+        side=OrderSide.BUY,
+        qty=money("1"),
+        type=OrderType.LIMIT,
+        limit_price=money("30000.1"),
+    )
+    order.submit()
+    return order
+
+
+@pytest.fixture
+def store(tmp_path):
+    with SqliteStore(tmp_path / "history.db") as store:
+        yield store
+
+
+def test_export_partitions_fills_with_exact_money(store, tmp_path) -> None:
+    for i in range(20):
+        store.record_fill(_fill(i, _ETH if i % 2 else _BTC))
+    result = export_parquet(store, tmp_path / "pq", batch=7)
+
+    assert (result.fills, result.fill_mark) == (20, 20)
+    part = tmp_path / "pq" / "fills" / "day=2024-01-01" / "instrument=BTC%2FUSD"
+    assert sorted(p.name for p in part.iterdir()) == [
+        "part-000000000001.parquet",
+        "part-000000000008.parquet",
+        "part-000000000015.parquet",
+    ]
+    frame = scan_fills(tmp_path / "pq").sort("seq").collect()
+    assert frame["fill_id"].to_list() == [f"F{i}" for i in range(20)]
+    assert frame["price"].dtype == pl.Decimal(38, 18)
+    assert frame["price"][3] == Decimal("30003.5")
+    assert frame["notional"][3] == Decimal("0.4") * Decimal("30003.5")
+
+    eth_day2 = (
+        scan_fills(tmp_path / "pq")
+        .filter(
+            pl.col("instrument") == "ETH/USD", pl.col("day") == pl.date(2024, 1, 2)
+        )
+        .collect()
+    )
+    assert eth_day2["fill_id"].to_list() == ["F1", "F5", "F9", "F13", "F17"]
+
+
+def test_second_export_is_incremental(store, tmp_path) -> None:
+    root = tmp_path / "pq"
+    for i in range(10):
+        store.record_fill(_fill(i))
+    export_parquet(store, root)
+    for i in range(10, 15):
+        store.record_fill(_fill(i))
+
+    result = export_parquet(store, root)
+
+    assert (result.fills, result.fill_mark) == (5, 15)
+    assert json.loads((root / "_watermark.json").read_text())["fills"] == 15
+    assert scan_fills(root).collect().height == 15
+    assert export_parquet(store, root).fills == 0
+
+
+def test_rerun_from_an_older_mark_does_not_duplicate(store, tmp_path) -> None:
+    root = tmp_path / "pq"
+    for i in range(12):
+        store.record_fill(_fill(i))
+    export_parquet(store, root, batch=5)
+    # As if the export had died after writing its parts but before the marks.
+    (root / "_watermark.json").write_text(json.dumps({"fills": 5, "orders": None}))
+
+    assert export_parquet(store, root, batch=5).fills == 7
+    frame = scan_fills(root).collect()
+    assert frame.height == 12
+    assert frame["fill_id"].n_unique() == 12
+
+
+def test_orders_keep_their_latest_version(tmp_path) -> None:
+    now = [_T0]
+    with SqliteStore(tmp_path / "o.db", clock=lambda: now[0]) as store:
+        order = _order("cid-1")
+        store.upsert_order(order)
+        store.upsert_order(_order("cid-2"))
+        root = tmp_path / "pq"
+        assert export_parquet(store, root).orders == 2
+
+        now[0] += _DAY_MS
+        order.open("V-1")
+        order.apply_fill(money("0.4"), money("30000.1"))
+        store.upsert_order(order)
+        result = export_parquet(store, root)
+
+    # cid-2 was written at the old mark itself, so it is exported again.
+    assert (result.orders, result.order_mark) == (2, _T0 + _DAY_MS)
+    assert scan_orders(root, latest=False).collect().height == 4
+    latest = scan_orders(root).sort("client_order_id").collect()
+    assert latest["client_order_id"].to_list() == ["cid-1", "cid-2"]
+    assert latest["status"].to_list() == ["partially_filled", "submitted"]
+    assert latest["filled_qty"][0] == Decimal("0.4")
+    assert latest["day"][0].isoformat() == "2024-01-02"
+
+
+def test_state_snapshots(store, tmp_path) -> None:
+    root = tmp_path / "pq"
+    store.set_state("risk.day", "2024-01-01")
+    export_parquet(store, root, clock=lambda: _T0)
+    store.set_state("risk.day", "2024-01-02")
+    store.set_state("mode", "paper")
+    export_parquet(store, root, clock=lambda: _T0 + _DAY_MS)
+
+    assert scan_state(root, latest=False).collect().height == 3
+    latest = scan_state(root).sort("key").collect()
+    assert latest.select("key", "value").rows() == [
+        ("mode", "paper"),
+        ("risk.day", "2024-01-02"),
+    ]
+
+
+def test_fill_totals_match_the_store(store, tmp_path) -> None:
+    for i in range(30):
+        store.record_fill(_fill(i, _ETH if i % 4 == 0 else _BTC))
+    # 18 + 2 places: the notional does not fit Decimal(38, 18).
+    store.record_fill(_fill(30, qty="0.000000000000000001", price="30000.25"))
+    root = tmp_path / "pq"
+    export_parquet(store, root)
+    unfit = scan_fills(root).filter(pl.col("notional").is_null()).collect()
+    assert unfit["fill_id"].to_list() == ["F30"]
+
+    assert fill_totals(root) == store.fill_totals()
+    assert fill_totals(root, by_day=True) == store.fill_totals(by_day=True)
+    assert str(fill_totals(root)[1].fees) == str(store.fill_totals()[1].fees)
+
+
+def test_inexact_money_stops_the_export(store, tmp_path) -> None:
+    store.record_fill(_fill(0))
+    store.record_fill(_fill(1, fee="0.0000000000000000001"))
+    with pytest.raises(ExportError, match="fee"):
+        export_parquet(store, tmp_path / "pq", batch=1)
+    marks = json.loads((tmp_path / "pq" / "_watermark.json").read_text())
+    assert marks["fills"] == 1
+
+
+def test_empty_dataset_scans_empty(tmp_path) -> None:
+    assert scan_fills(tmp_path).collect().height == 0
+    assert "price" in scan_fills(tmp_path).collect_schema()
+    assert scan_orders(tmp_path).collect().height == 0
+    assert scan_state(tmp_path).collect().height == 0
+    assert fill_totals(tmp_path) == []
+    with SqliteStore(":memory:") as store, pytest.raises(ValueError):
+        export_parquet(store, tmp_path, batch=0)
@@ -0,0 +1,437 @@
+"""Tests for the :class:`~trading_bot.storage.journal_store.JournalStore`.
+
+What is verified
+----------------
+* orders, fills and state read back exactly as from a
+  :class:`~trading_bot.storage.SqliteStore` fed the same writes (latest order
+  state, deduplicated fills, exact ``Decimal`` exponents), before and after a
+  reopen, through the paged readers, ``orders_to_restore`` and the fill
+  watermark;
+* ``fill_totals`` equals the SQLite store's, with and without bounds;
+* a transaction is one atomic record: a raising block leaves no trace in memory
+  or on disk;
+* lifecycle changes to a known order are replayed, and rolled back, on top of
+  its full record;
+* full segments roll, compaction replaces them with a snapshot that reopens to
+  the same state, and what an interrupted compaction left behind is cleaned up;
+* a torn tail is truncated, damage elsewhere raises
+  :class:`~trading_bot.storage.StoreCorruptError`, a failed write is sticky, and
+  a process killed without closing loses no flushed fill;
+* ``iter_rows`` yields the SQLite store's columns, so a Parquet export of either
+  store is the same, and ``archive`` compacts the log without dropping a row;
+* ``storage.backend: journal`` builds the engine on this store, and a snapshot
+  restart over it equals a full refold.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from trading_bot.application import EventBus, FillEvent, OrderEvent
+from trading_bot.application.config import AppConfig
+from trading_bot.application.service_factory import build_engine
+from trading_bot.application.snapshot import restore_snapshot
+from trading_bot.domain import (
+    Fill,
+    Instrument,
+    Order,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    Symbol,
+    money,
+)
+from trading_bot.storage import (
+    JournalStore,
+    SqliteStore,
+    StoreCorruptError,
+    StoreWriteError,
+)
+
+BTC_USD = Instrument(Symbol("BTC", "USD"), price_precision=1, qty_precision=4)
+ETH_USD = Instrument(Symbol("ETH", "USD"))
+_DAY_MS = 86_400_000
+#: 2024-01-01T00:00:00Z
+_T0 = 1_704_067_200_000
+
+
+def _order(i: int) -> Order:
+    order = Order(
+        f"cid-{i}",
+        ETH_USD if i % 4 == 0 else BTC_USD,
+        OrderSide.SELL if i % 3 == 0 else OrderSide.BUY,
+        money("1.50"),
+        OrderType.LIMIT,
+        limit_price=money(f"{30000 + i}.10"),
+    )
+    order.submit()
+    return order
+
+
+def _fill(i: int, **money_fields: str) -> Fill:
+    return Fill(
+        f"F{i}",
+        f"cid-{i % 10}",
+        ETH_USD if i % 4 == 0 else BTC_USD,
+        OrderSide.SELL if i % 3 == 0 else OrderSide.BUY,
+        money(money_fields.get("qty", f"0.{i % 7 + 1}0")),
+        money(money_fields.get("price", f"{30000 + (i * 37) % 500}.5")),
+        money(money_fields.get("fee", "0.0300")),
+        _T0 + (i % 5) * _DAY_MS + i,
+    )
+
+
+def _write_both(journal: JournalStore, sqlite: SqliteStore, n: int = 40) -> None:
+    """The same order/fill/state stream into both stores."""
+    for i in range(n):
+        order = _order(i % 10)
+        if i >= 10:
+            order.open(f"V-{i % 10}")
+            order.apply_fill(money("0.5"), money("30000.1"))
+        for store in (journal, sqlite):
+            store.upsert_order(order)
+            store.record_fill(_fill(i))
+            store.record_fill(_fill(i // 2))  # mostly a replay: a no-op
+            store.set_state("last", str(i))
+
+
+@pytest.fixture
+def stores(tmp_path):
+    clock = lambda: _T0  # noqa: E731
+    journal = JournalStore(tmp_path / "journal", clock=clock)
+    sqlite = SqliteStore(tmp_path / "history.db", clock=clock)
+    yield journal, sqlite
+    journal.close()
+    sqlite.close()
+
+
+def test_reads_match_the_sqlite_store(stores, tmp_path) -> None:
+    journal, sqlite = stores
+    _write_both(journal, sqlite)
+    journal.record_fill(_fill(99, fee="-0.00", price="1E+3"))
+    sqlite.record_fill(_fill(99, fee="-0.00", price="1E+3"))
+    journal.flush()  # the durability barrier: a reopen sees every write
+
+    reopened = JournalStore(tmp_path / "journal", clock=lambda: _T0)
+    for store in (journal, reopened):
+        assert store.orders() == sqlite.orders()
+        assert store.get_order("cid-3") == sqlite.get_order("cid-3")
+        assert store.get_order("missing") is None
+        assert store.fills() == sqlite.fills()
+        assert store.get_state("last") == "39"
+        assert store.get_state("missing") is None
+        assert store.fill_watermark() == sqlite.fill_watermark()
+    last = reopened.fills()[-1]
+    assert (str(last.fee), str(last.price)) == ("-0.00", "1E+3")
+    reopened.close()
+
+
+def test_paged_readers_and_restore_set(stores) -> None:
+    journal, sqlite = stores
+    _write_both(journal, sqlite)
+    for store in (journal, sqlite):
+        store.upsert_order(_order(77))  # still live
+
+    def ids(items) -> list[str]:  # noqa: ANN001
+        return [getattr(x, "fill_id", None) or x.client_order_id for x in items]
+
+    for kwargs in (
+        {"instrument": ETH_USD, "batch": 3},
+        {"since": _T0 + _DAY_MS, "until": _T0 + 3 * _DAY_MS, "batch": 1},
+        {"after": 17, "batch": 4},
+    ):
+        assert ids(journal.iter_fills(**kwargs)) == ids(sqlite.iter_fills(**kwargs))
+    for kwargs in ({"status": OrderStatus.SUBMITTED}, {"instrument": BTC_USD}):
+        assert list(journal.iter_orders(**kwargs)) == list(
+            sqlite.iter_orders(**kwargs)
+        )
+    assert journal.fill_ids(since=_T0 + 4 * _DAY_MS, upto=30) == sqlite.fill_ids(
+        since=_T0 + 4 * _DAY_MS, upto=30
+    )
+    # Terminal or not, every order was written "now": all within the window.
+    assert ids(journal.orders_to_restore(window_ms=1)) == ids(
+        sqlite.orders_to_restore(window_ms=1)
+    )
+    with pytest.raises(ValueError, match="batch"):
+        next(journal.iter_fills(batch=0))
+
+
+def test_fill_totals_match_the_sqlite_store(stores) -> None:
+    journal, sqlite = stores
+    _write_both(journal, sqlite)
+    # More places than the instrument's scale: SQLite folds it from its TEXT.
+    journal.record_fill(_fill(50, qty="0.000000000000000001"))
+    sqlite.record_fill(_fill(50, qty="0.000000000000000001"))
+
+    for kwargs in (
+        {},
+        {"by_day": True},
+        {"instrument": BTC_USD, "by_day": True},
+        {"since": _T0 + _DAY_MS, "until": _T0 + 4 * _DAY_MS},
+    ):
+        totals = journal.fill_totals(**kwargs)
+        assert totals == sqlite.fill_totals(**kwargs)
+        assert [str(t.volume) for t in totals] == [
+            str(t.volume) for t in sqlite.fill_totals(**kwargs)
+        ]
+
+
+def test_iter_rows_and_parquet_export_match_the_sqlite_store(stores, tmp_path) -> None:
+    journal, sqlite = stores
+    _write_both(journal, sqlite)
+    assert journal.write_behind
+
+    columns = ("fill_id", "client_order_id", "instrument", "side", "qty", "price",
+               "fee", "ts", "_rowid")
+    for kwargs in ({}, {"after": 7, "batch": 3}, {"since": _T0 + 2 * _DAY_MS}):
+        assert list(journal.iter_rows("fills", **kwargs)) == [
+            {name: row[name] for name in columns}
+            for row in sqlite.iter_rows("fills", **kwargs)
+        ]
+    for table in ("orders", "state"):
+        assert list(journal.iter_rows(table, batch=4)) == [
+            dict(row) for row in sqlite.iter_rows(table, batch=4)
+        ]
+    with pytest.raises(ValueError, match="ts column"):
+        journal.iter_rows("state", since=0)
+
+    columnar = pytest.importorskip("trading_bot.storage.columnar")
+    from_journal = columnar.export_parquet(journal, tmp_path / "pj", clock=lambda: 1)
+    from_sqlite = columnar.export_parquet(sqlite, tmp_path / "ps", clock=lambda: 1)
+    assert from_journal == from_sqlite
+    assert columnar.scan_fills(tmp_path / "pj").sort("seq").collect().equals(
+        columnar.scan_fills(tmp_path / "ps").sort("seq").collect()
+    )
+
+
+def test_archive_compacts_and_keeps_every_row(tmp_path) -> None:
+    path = tmp_path / "j"
+    store = JournalStore(path)
+    for i in range(50):
+        store.upsert_order(_order(i % 5))
+        store.record_fill(_fill(i))
+    orders, fills = store.orders(), store.fills()
+
+    assert store.archive(_T0 + 10 * _DAY_MS) == (0, 0)
+    names = sorted(os.listdir(path))
+    assert names == ["seg-00000002.tbj", "snap-00000002.tbj"]
+    assert (store.orders(), store.fills()) == (orders, fills)
+    store.close()
+    with JournalStore(path) as reopened:
+        assert (reopened.orders(), reopened.fills()) == (orders, fills)
+
+
+def test_transaction_is_atomic(tmp_path) -> None:
+    store = JournalStore(tmp_path / "j")
+    store.set_state("mode", "paper")
+    with store.transaction():
+        store.record_fill(_fill(1))
+        with store.transaction():  # joins the outer block
+            store.set_state("mode", "live")
+        assert store.get_state("mode") == "live"
+
+    with pytest.raises(RuntimeError), store.transaction():
+        store.upsert_order(_order(2))
+        store.record_fill(_fill(2))
+        store.set_state("mode", "halted")
+        raise RuntimeError("boom")
+
+    assert store.get_order("cid-2") is None
+    assert [f.fill_id for f in store.fills()] == ["F1"]
+    assert store.get_state("mode") == "live"
+    assert [t.fills for t in store.fill_totals()] == [1]
+    store.close()
+    with JournalStore(tmp_path / "j") as reopened:
+        assert [f.fill_id for f in reopened.fills()] == ["F1"]
+        assert reopened.get_state("mode") == "live"
+        assert reopened.get_order("cid-2") is None
+
+
+def test_lifecycle_updates_replay_and_roll_back(tmp_path) -> None:
+    order = _order(7)
+    store = JournalStore(tmp_path / "j")
+    store.upsert_order(order)
+    order.open("V-7")
+    store.upsert_order(order)  # same terms: written as a short update
+    order.apply_fill(money("0.50"), money("30007.1"))
+    store.upsert_order(order)
+    before = store.get_order("cid-7")
+
+    with pytest.raises(RuntimeError), store.transaction():
+        order.apply_fill(money("1.00"), money("30007.3"))
+        store.upsert_order(order)
+        raise RuntimeError("boom")
+    assert store.get_order("cid-7") == before
+    store.close()
+
+    with JournalStore(tmp_path / "j") as reopened:
+        restored = reopened.get_order("cid-7")
+    assert restored == before
+    assert restored is not None
+    assert restored.venue_order_id == "V-7"
+    assert restored.status is OrderStatus.PARTIALLY_FILLED
+    assert restored.filled_qty == money("0.50")
+    assert restored.limit_price == money("30007.10")
+
+
+def test_segments_roll_and_compact_into_a_snapshot(tmp_path) -> None:
+    path = tmp_path / "j"
+    store = JournalStore(path, segment_bytes=2_000, flush_rows=10)
+    for i in range(600):
+        store.set_state("tick", str(i))
+        order = _order(i % 5)
+        store.upsert_order(order)
+        if i % 20 == 0:
+            store.record_fill(_fill(i))
+    orders, fills = store.orders(), store.fills()
+    store.close()
+
+    names = sorted(os.listdir(path))
+    snapshots = [name for name in names if name.startswith("snap-")]
+    assert len(snapshots) == 1
+    assert names == sorted([*snapshots, *(n for n in names if n.startswith("seg-"))])
+    # Only the segments from the snapshot on are kept.
+    assert min(n for n in names if n.startswith("seg-")) == snapshots[0].replace(
+        "snap-", "seg-"
+    )
+
+    # As if a later compaction died after its rename, before its clean-up.
+    (path / "seg-00000000.tbj").write_bytes(b"stale")
+    (path / "snap-00000000.tbj").write_bytes(b"stale")
+    (path / "snap-99999999.tmp").write_bytes(b"half written")
+    with JournalStore(path) as reopened:
+        assert reopened.orders() == orders
+        assert reopened.fills() == fills
+        assert reopened.get_state("tick") == "599"
+    assert sorted(os.listdir(path)) == names
+
+
+def test_torn_tail_is_truncated_and_damage_elsewhere_raises(tmp_path, caplog) -> None:
+    path = tmp_path / "j"
+    store = JournalStore(path, segment_bytes=500)
+    for i in range(30):
+        store.record_fill(_fill(i))
+        store.flush()
+    store.close()
+    segments = sorted(p for p in path.iterdir() if p.name.startswith("seg-"))
+    assert len(segments) > 2
+    last = segments[-1]
+    size = last.stat().st_size
+    with last.open("ab") as fh:
+        fh.write(b"\x02\x00\x00\x00\x40partial")
+
+    with JournalStore(path) as reopened:
+        assert len(reopened.fills()) == 30
+    assert "torn tail" in caplog.text
+    assert last.stat().st_size == size
+
+    data = bytearray(segments[0].read_bytes())
+    data[12] ^= 0xFF
+    segments[0].write_bytes(bytes(data))
+    with pytest.raises(StoreCorruptError, match=segments[0].name):
+        JournalStore(path)
+
+
+def test_failed_write_is_sticky(tmp_path) -> None:
+    store = JournalStore(tmp_path / "j")
+    store.set_state("k", "v")
+    os.close(store._fd)  # the disk goes away under the store
+    with pytest.raises(StoreWriteError):
+        store.flush()
+    with pytest.raises(StoreWriteError):
+        store.record_fill(_fill(1))
+    store._fd = os.open(tmp_path / "j" / "seg-00000001.tbj", os.O_RDONLY)
+    with pytest.raises(StoreWriteError):
+        store.close()
+    with pytest.raises(ValueError, match="closed"):
+        store.set_state("k", "w")
+
+
+_CRASHING_WRITER = textwrap.dedent(
+    """
+    import os, sys
+    from trading_bot.domain import Fill, Instrument, OrderSide, Symbol, money
+    from trading_bot.storage import JournalStore
+
+    btc = Instrument(Symbol("BTC", "USD"))
+    store = JournalStore(sys.argv[1], flush_rows=10_000, flush_interval=60)
+
+    def fill(i):
+        return Fill(f"T{i}", "cid", btc, OrderSide.BUY, money("0.1"),
+                    money("30000.10"), money("0.01"), i)
+
+    for i in range(250):
+        store.record_fill(fill(i))
+    store.flush()
+    print("acked 250", flush=True)
+    for i in range(250, 300):
+        store.record_fill(fill(i))  # buffered, never acknowledged
+    os._exit(1)  # crash: no close, no atexit, flusher thread killed
+    """
+)
+
+
+def test_crash_loses_no_flushed_fill(tmp_path) -> None:
+    path = tmp_path / "j"
+    proc = subprocess.run(
+        [sys.executable, "-c", _CRASHING_WRITER, str(path)],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    assert proc.returncode == 1, proc.stderr
+    assert proc.stdout.strip() == "acked 250"
+
+    with JournalStore(path) as reopened:
+        ids = [f.fill_id for f in reopened.fills()]
+        assert ids == [f"T{i}" for i in range(250)]
+        assert all(f.price == money("30000.10") for f in reopened.fills())
+
+
+def test_attach_fills_the_store_from_the_bus(tmp_path) -> None:
+    bus = EventBus()
+    store = JournalStore(tmp_path / "j")
+    store.attach(bus)
+    bus.emit(OrderEvent(_order(1)))
+    bus.emit(FillEvent(_fill(1)))
+    assert store.get_order("cid-1") is not None
+    assert [f.fill_id for f in store.fills()] == ["F1"]
+    store.close()
+
+
+def test_engine_on_the_journal_backend_restarts_from_a_snapshot(tmp_path) -> None:
+    config = AppConfig.model_validate(
+        {
+            "starting_capital": "1000",
+            "storage": {"backend": "journal", "snapshot_every": 7},
+        }
+    )
+    path = tmp_path / "engine"
+    first = build_engine(config, db_path=path)
+    assert isinstance(first.store, JournalStore)
+    for i in range(30):
+        first.bus.emit(FillEvent(_fill(i)))
+    first.store.close()
+
+    second = build_engine(config, db_path=path)
+    assert second.store is not None
+    assert restore_snapshot(second) == max(_fill(i).ts for i in range(30))
+    positions = {
+        inst.symbol: (p.net_qty, p.realised_pnl)
+        for inst, p in second.tracker.all_positions().items()
+    }
+    assert positions == {
+        inst.symbol: (p.net_qty, p.realised_pnl)
+        for inst, p in first.tracker.all_positions().items()
+    }
+    assert second.perf.equity_curve() == first.perf.equity_curve()
+    second.store.close()
+
+    with pytest.raises(ValueError, match="backend"):
+        AppConfig.model_validate({"storage": {"backend": "parquet"}})
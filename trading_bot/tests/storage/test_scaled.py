@@ -0,0 +1,64 @@
+"""Tests for :mod:`trading_bot.storage.scaled` — exact scaled-integer money.
+
+What is verified
+----------------
+* :func:`to_scaled` / :func:`from_scaled` round-trip exactly, refuse a value with
+  more places than the scale or outside 64 bits, and never touch float;
+* :func:`from_split` recombines a split sum, negative halves included;
+* :func:`scales_for` prefers the instrument's venue precision and otherwise
+  floors the first fill's own places at :data:`MIN_SCALES`.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+from trading_bot.domain import Fill, Instrument, OrderSide, Symbol, money
+from trading_bot.storage.scaled import (
+    MIN_SCALES,
+    SPLIT,
+    Scales,
+    from_scaled,
+    from_split,
+    scales_for,
+    to_scaled,
+)
+
+
+def _fill(instrument: Instrument, qty: str, price: str, fee: str) -> Fill:
+    return Fill("F1", "cid", instrument, OrderSide.BUY, money(qty), money(price),
+                money(fee), 1)
+
+
+def test_round_trip_is_exact() -> None:
+    for text, scale in (("0.1", 8), ("30000.10", 2), ("-0.000001", 8), ("7", 0)):
+        units = to_scaled(Decimal(text), scale)
+        assert units is not None
+        assert from_scaled(units, scale) == Decimal(text)
+    assert to_scaled(Decimal("1E+3"), 2) == 100_000
+    assert str(from_scaled(3_000_010, 2)) == "30000.1"
+
+
+def test_inexact_or_oversized_values_are_refused() -> None:
+    assert to_scaled(Decimal("0.123"), 2) is None
+    assert to_scaled(Decimal("1E+19"), 0) is None
+    assert to_scaled(Decimal("NaN"), 2) is None
+    assert to_scaled(Decimal(2**63 - 1), 0) == 2**63 - 1
+
+
+def test_split_sum_recombines() -> None:
+    values = [5 * SPLIT + 7, -(3 * SPLIT) - 2, 999]
+    high = sum(int(v / SPLIT) for v in values)  # SQLite truncates toward zero
+    low = sum(v - int(v / SPLIT) * SPLIT for v in values)
+    assert from_split(high, low, 3) == from_scaled(sum(values), 3)
+    assert from_split(None, None, 8) == 0
+
+
+def test_scales_prefer_venue_precision() -> None:
+    catalogued = Instrument(Symbol("BTC", "USD"), price_precision=1, qty_precision=6)
+    assert scales_for(_fill(catalogued, "0.5", "30000.1", "0")) == Scales(6, 1, 8)
+
+    bare = Instrument(Symbol("ETH", "BTC"))
+    scales = scales_for(_fill(bare, "2", "0.051234", "0.0000000001"))
+    assert scales == Scales(MIN_SCALES["qty"], 6, 10)
+    assert scales.notional == MIN_SCALES["qty"] + 6
@@ -19,14 +19,46 @@ These prove the store's persistence contract end to end:
   :class:`~trading_bot.brokers.paper.PaperBroker` (store attached to the bus),
   then **reopened from the file**, persists the orders/fills, and
   :meth:`Position.from_fills` over the stored fills matches the live tracker's
-  position.
+  position;
+* connections are long-lived: an in-memory store persists across operations,
+  :meth:`~SqliteStore.transaction` commits a group of writes together (or rolls
+  them all back) while other threads read only committed rows, executor threads
+  read through their own connections, and ``close`` really closes;
+* write-behind: queued writes commit on the size budget or at a ``flush``,
+  reads see them at once, a failed batch surfaces as
+  :class:`~trading_bot.storage.StoreWriteError`, and a process killed without
+  closing loses **no acknowledged (flushed) fill**;
+* history reads page by key: orders carry the time of their latest write,
+  ``iter_fills`` / ``iter_orders`` filter by instrument / status / time across
+  pages, and ``orders_to_restore`` yields only live and recent orders;
+* ``fill_totals`` sums inside SQLite yet equals a Decimal fold exactly, also
+  for rows too precise for their scale, per day, and after a database written
+  before the scaled columns existed is migrated in place;
+* month archives: old terminal orders and fills move to per-month databases
+  while every read (pages, totals, watermark, reopen) still sees them, a move
+  cut short is redone on open, a reader paging beside a running move sees each
+  row once, the archiver thread moves and vacuums on its interval, an order
+  miss reads only the archive its index names, an archived order or fill
+  written again gets no second copy, and an older file is converted
+  to incremental auto-vacuum only by the explicit offline step.
 
 Async tests run un-decorated (``asyncio_mode = "auto"``).
 """
 
 from __future__ import annotations
 
+import json
+import os
 import sqlite3
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import pytest
 
 from trading_bot.application import (
     EventBus,
@@ -36,6 +68,8 @@ from trading_bot.application import (
     OrderRouter,
     PositionTracker,
 )
+from trading_bot.application.config import AppConfig
+from trading_bot.application.service_factory import build_engine
 from trading_bot.brokers import PaperBroker
 from trading_bot.domain import (
     Fill,
@@ -48,7 +82,8 @@ from trading_bot.domain import (
     Symbol,
     money,
 )
-from trading_bot.storage import SqliteStore
+from trading_bot.storage import SqliteStore, StoreWriteError
+from trading_bot.storage.sqlite_store import _ARCHIVE_PENDING
 
 BTC_USD = Instrument(Symbol("BTC", "USD"))
 ETH_USD = Instrument(Symbol("ETH", "USD"))
@@ -243,6 +278,21 @@ def test_fills_filter_since_ms(tmp_path) -> None:
     assert [f.fill_id for f in store.fills(since_ms=301)] == []
 
 
+def test_fill_watermark_and_resuming_after_it(tmp_path) -> None:
+    """The watermark is the newest rowid and ts; ``after`` resumes past it."""
+    store = _store(tmp_path)
+    assert store.fill_watermark() == (0, None)
+    for fill_id, ts in (("T1", 100), ("T2", 300), ("T3", 200)):
+        store.record_fill(_fill(fill_id=fill_id, ts=ts))
+    seq, ts = store.fill_watermark()
+    assert (seq, ts) == (3, 300)
+
+    store.record_fill(_fill(fill_id="T4", ts=300))
+    assert [f.fill_id for f in store.iter_fills(after=seq)] == ["T4"]
+    assert sorted(store.fill_ids(since=200)) == ["T2", "T3", "T4"]
+    assert sorted(store.fill_ids(since=200, upto=seq)) == ["T2", "T3"]
+
+
 # --- state ----------------------------------------------------------------- #
 
 
@@ -330,6 +380,422 @@ def test_attach_tracks_latest_order_state(tmp_path) -> None:
     assert got.venue_order_id == "VID-1"
 
 
+# --- connections + transactions --------------------------------------------- #
+
+
+def test_in_memory_store_persists_across_operations() -> None:
+    store = SqliteStore(":memory:")
+    store.upsert_order(_order(cid="mem"))
+    store.record_fill(_fill(fill_id="Tm", cid="mem"))
+    assert store.get_order("mem") is not None
+    assert [f.fill_id for f in store.fills()] == ["Tm"]
+    store.close()
+
+
+def test_transaction_commits_together_and_isolates_readers(tmp_path) -> None:
+    store = _store(tmp_path)
+    seen_elsewhere: list[int] = []
+
+    def _other_thread_count() -> None:
+        seen_elsewhere.append(len(store.fills()))
+
+    with store.transaction():
+        store.record_fill(_fill(fill_id="T1"))
+        with store.transaction():  # nested blocks join the outer one
+            store.record_fill(_fill(fill_id="T2"))
+        assert len(store.fills()) == 2  # this thread sees its own writes
+        reader = threading.Thread(target=_other_thread_count)
+        reader.start()
+        reader.join()
+    assert seen_elsewhere == [0]  # another thread saw only committed rows
+    assert len(store.fills()) == 2
+    store.close()
+
+
+def test_transaction_rolls_back_on_error(tmp_path) -> None:
+    store = _store(tmp_path)
+    store.set_state("k", "before")
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            store.set_state("k", "during")
+            store.record_fill(_fill(fill_id="T1"))
+            raise RuntimeError("boom")
+    assert store.get_state("k") == "before"
+    assert store.fills() == []
+    store.set_state("k", "after")  # the writer is usable again
+    assert store.get_state("k") == "after"
+    store.close()
+
+
+def test_executor_reads_use_per_thread_connections(tmp_path) -> None:
+    store = _store(tmp_path)
+    for i in range(20):
+        store.record_fill(_fill(fill_id=f"T{i}", ts=i))
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        counts = list(pool.map(lambda _: len(store.fills()), range(40)))
+    assert counts == [20] * 40
+    assert 1 <= len(store._readers) <= 4
+    store.close()
+
+
+def test_close_is_idempotent_and_final(tmp_path) -> None:
+    with _store(tmp_path) as store:
+        store.set_state("k", "v")
+    store.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        store.get_state("k")
+    with pytest.raises(sqlite3.ProgrammingError):
+        store.set_state("k", "w")
+
+
+def test_close_waits_for_a_read_in_flight_on_another_thread(tmp_path) -> None:
+    store = _store(tmp_path)
+    store.record_fill(_fill(fill_id="T1"))
+    reading, release = threading.Event(), threading.Event()
+    rows: list[int] = []
+
+    def _slow_read() -> None:
+        with store._read() as conn:
+            reading.set()
+            release.wait(5)
+            rows.append(conn.execute("SELECT COUNT(*) FROM fills").fetchone()[0])
+
+    reader = threading.Thread(target=_slow_read)
+    reader.start()
+    assert reading.wait(5)
+    closer = threading.Thread(target=store.close)
+    closer.start()
+    closer.join(0.2)
+    assert closer.is_alive()  # the reader's connection is still in use
+    release.set()
+    reader.join()
+    closer.join(5)
+    assert not closer.is_alive()
+    assert rows == [1]
+    with pytest.raises(sqlite3.ProgrammingError):
+        store.fills()
+
+
+# --- write-behind ------------------------------------------------------------ #
+
+
+def _raw_fill_count(db) -> int:
+    raw = sqlite3.connect(str(db))
+    try:
+        return int(raw.execute("SELECT COUNT(*) FROM fills").fetchone()[0])
+    finally:
+        raw.close()
+
+
+def test_write_behind_commits_at_flush(tmp_path) -> None:
+    db = tmp_path / "engine.db"
+    store = SqliteStore(db, write_behind=True, flush_interval=60)
+    assert store.write_behind
+    for i in range(3):
+        store.record_fill(_fill(fill_id=f"T{i}"))
+    assert _raw_fill_count(db) == 0  # still queued
+    store.flush()
+    assert _raw_fill_count(db) == 3
+    store.close()
+
+
+def test_write_behind_commits_on_the_row_budget(tmp_path) -> None:
+    db = tmp_path / "engine.db"
+    store = SqliteStore(db, write_behind=True, flush_rows=4, flush_interval=60)
+    for i in range(4):
+        store.record_fill(_fill(fill_id=f"T{i}"))
+    for _ in range(500):
+        if _raw_fill_count(db) == 4:
+            break
+        time.sleep(0.01)
+    assert _raw_fill_count(db) == 4
+    store.close()
+
+
+def test_write_behind_reads_see_queued_writes(tmp_path) -> None:
+    store = SqliteStore(tmp_path / "engine.db", write_behind=True, flush_interval=60)
+    order = _order(cid="wb")
+    store.upsert_order(order)
+    order.submit()
+    store.upsert_order(order)
+    store.set_state("k", "v")
+    got = store.get_order("wb")
+    assert got is not None and got.status == OrderStatus.SUBMITTED
+    assert store.get_state("k") == "v"
+    store.close()
+
+
+def test_write_behind_point_lookup_does_not_wait_for_a_commit(tmp_path) -> None:
+    db = tmp_path / "engine.db"
+    store = SqliteStore(db, write_behind=True, flush_interval=60)
+    order = _order(cid="wb")
+    order.submit()
+    store.upsert_order(order)
+    got = store.get_order("wb")
+    assert got is not None and got.status == OrderStatus.SUBMITTED
+    assert store.get_order("missing") is None
+    raw = sqlite3.connect(str(db))
+    try:  # answered from the queue: nothing was committed for the lookups
+        assert raw.execute("SELECT COUNT(*) FROM orders").fetchone()[0] == 0
+    finally:
+        raw.close()
+    store.flush()
+    got = store.get_order("wb")
+    assert got is not None and got.status == OrderStatus.SUBMITTED
+    store.close()
+
+
+def test_write_behind_close_commits_the_queue(tmp_path) -> None:
+    db = tmp_path / "engine.db"
+    store = SqliteStore(db, write_behind=True, flush_interval=60)
+    store.record_fill(_fill(fill_id="T1"))
+    store.close()
+    assert _raw_fill_count(db) == 1
+
+
+def test_write_behind_failed_batch_is_reported(tmp_path) -> None:
+    db = tmp_path / "engine.db"
+    store = SqliteStore(db, write_behind=True, flush_interval=60)
+    raw = sqlite3.connect(str(db))
+    raw.execute("DROP TABLE fills")
+    raw.close()
+    store.record_fill(_fill(fill_id="T1"))
+    with pytest.raises(StoreWriteError, match="no such table"):
+        store.flush()
+    with pytest.raises(StoreWriteError):
+        store.set_state("k", "v")  # the failure is sticky
+    with pytest.raises(StoreWriteError):
+        store.close()
+
+
+_CRASHING_WRITER = textwrap.dedent(
+    """
+    import os, sys
+    from trading_bot.domain import Fill, Instrument, OrderSide, Symbol, money
+    from trading_bot.storage import SqliteStore
+
+    btc = Instrument(Symbol("BTC", "USD"))
+    store = SqliteStore(sys.argv[1], write_behind=True, flush_interval=60)
+
+    def fill(i):
+        return Fill(f"T{i}", "cid", btc, OrderSide.BUY, money("0.1"),
+                    money("30000.10"), money("0.01"), i)
+
+    for i in range(250):
+        store.record_fill(fill(i))
+    store.flush()
+    print("acked 250", flush=True)
+    for i in range(250, 300):
+        store.record_fill(fill(i))  # queued, never acknowledged
+    os._exit(1)  # crash: no close, no atexit, writer thread killed
+    """
+)
+
+
+def test_write_behind_crash_loses_no_acknowledged_fill(tmp_path) -> None:
+    db = tmp_path / "engine.db"
+    proc = subprocess.run(
+        [sys.executable, "-c", _CRASHING_WRITER, str(db)],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    assert proc.returncode == 1, proc.stderr
+    assert proc.stdout.strip() == "acked 250"
+
+    with SqliteStore(db) as reopened:
+        ids = {f.fill_id for f in reopened.fills()}
+        assert {f"T{i}" for i in range(250)} <= ids
+        assert ids <= {f"T{i}" for i in range(300)}
+        assert all(f.price == money("30000.10") for f in reopened.fills())
+
+
+# --- timestamps + paginated history ----------------------------------------- #
+
+
+def test_upsert_stamps_the_write_time(tmp_path) -> None:
+    now = [1_000]
+    store = SqliteStore(tmp_path / "engine.db", clock=lambda: now[0])
+    order = _order(cid="t")
+    store.upsert_order(order)
+    assert [o.client_order_id for o in store.iter_orders(since=1_000)] == ["t"]
+    now[0] = 5_000
+    order.submit()
+    store.upsert_order(order)  # the latest write moves ts
+    assert list(store.iter_orders(until=5_000)) == []
+    assert [o.client_order_id for o in store.iter_orders(since=5_000)] == ["t"]
+    store.close()
+
+
+def test_iter_fills_pages_with_filters(tmp_path) -> None:
+    store = _store(tmp_path)
+    for i in range(25):
+        instrument = ETH_USD if i % 5 == 0 else BTC_USD
+        store.record_fill(_fill(fill_id=f"T{i:02}", ts=i, instrument=instrument))
+
+    assert [f.fill_id for f in store.iter_fills(batch=4)] == [
+        f"T{i:02}" for i in range(25)
+    ]
+    eth = store.iter_fills(instrument=ETH_USD, batch=2)
+    assert [f.fill_id for f in eth] == ["T00", "T05", "T10", "T15", "T20"]
+    window = store.iter_fills(instrument=BTC_USD, since=6, until=12, batch=3)
+    assert [f.fill_id for f in window] == ["T06", "T07", "T08", "T09", "T11"]
+    assert store.fills(since_ms=23) == list(store.iter_fills(since=23))
+    with pytest.raises(ValueError):
+        next(store.iter_fills(batch=0))
+    store.close()
+
+
+def test_iter_orders_filters_by_status_and_instrument(tmp_path) -> None:
+    store = _store(tmp_path)
+    for i in range(6):
+        order = _order(cid=f"o{i}", instrument=ETH_USD if i % 2 else BTC_USD)
+        if i < 3:
+            order.submit()
+        store.upsert_order(order)
+    submitted = store.iter_orders(status=OrderStatus.SUBMITTED, batch=2)
+    assert [o.client_order_id for o in submitted] == ["o0", "o1", "o2"]
+    eth = store.iter_orders(instrument=ETH_USD, batch=1)
+    assert [o.client_order_id for o in eth] == ["o1", "o3", "o5"]
+    store.close()
+
+
+def test_orders_to_restore_yields_live_and_recent_orders(tmp_path) -> None:
+    now = [0]
+    store = SqliteStore(tmp_path / "engine.db", clock=lambda: now[0])
+    old_done = _order(cid="old-done")
+    old_done.submit()
+    old_done.reject("test")
+    store.upsert_order(old_done)
+    old_live = _order(cid="old-live")
+    old_live.submit()
+    store.upsert_order(old_live)
+    now[0] = 10_000_000
+    new_done = _order(cid="new-done")
+    new_done.submit()
+    new_done.reject("test")
+    store.upsert_order(new_done)
+
+    restored = store.orders_to_restore(window_ms=60_000, batch=1)
+    assert [o.client_order_id for o in restored] == ["old-live", "new-done"]
+    assert store.get_order("old-done") is not None  # still on disk
+    store.close()
+
+
+def test_history_indexes_exist(tmp_path) -> None:
+    db = tmp_path / "engine.db"
+    SqliteStore(db).close()
+    raw = sqlite3.connect(str(db))
+    try:
+        names = {
+            row[0]
+            for row in raw.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        }
+    finally:
+        raw.close()
+    assert {
+        "idx_orders_status",
+        "idx_orders_instrument",
+        "idx_orders_ts",
+        "idx_fills_ts",
+        "idx_fills_instrument",
+    } <= names
+
+
+# --- scaled-integer totals -------------------------------------------------- #
+
+
+_DAY_MS = 86_400_000
+
+
+def _python_totals(fills: list[Fill]) -> dict[str, tuple]:
+    out: dict[str, list] = {}
+    for f in fills:
+        key = str(f.instrument)
+        row = out.setdefault(key, [0, Decimal(0), Decimal(0), Decimal(0), Decimal(0)])
+        sign = 1 if f.side is OrderSide.BUY else -1
+        row[0] += 1
+        row[1] += sign * f.qty
+        row[2] += f.qty * f.price
+        row[3] += f.fee
+    return {k: tuple(v[:4]) for k, v in out.items()}
+
+
+def test_fill_totals_match_a_decimal_fold(tmp_path) -> None:
+    store = _store(tmp_path)
+    fills = [
+        _fill(fill_id="A", qty="0.00012345", price="30000.10", fee="0.0037"),
+        _fill(fill_id="B", side=OrderSide.SELL, qty="0.1", price="31000.5"),
+        # one place too many for the price scale: folded from its TEXT
+        _fill(fill_id="C", qty="1", price="30000.123"),
+        # too large for 64 bits at 8 places: folded from its TEXT
+        _fill(fill_id="D", qty="123456789012.5", price="1", instrument=ETH_USD),
+        _fill(fill_id="E", side=OrderSide.SELL, qty="2", price="2000",
+              instrument=ETH_USD),
+    ]
+    for fill in fills:
+        store.record_fill(fill)
+
+    got = {
+        str(t.instrument): (t.fills, t.net_qty, t.volume, t.fees)
+        for t in store.fill_totals()
+    }
+    assert got == _python_totals(fills)
+    [eth] = store.fill_totals(instrument=ETH_USD)
+    assert eth.sold == Decimal("2") and eth.sell_notional == Decimal("4000")
+    assert str(eth.sold) == "2"  # trailing zeros are not invented
+    store.close()
+
+
+def test_fill_totals_by_day_and_window(tmp_path) -> None:
+    store = _store(tmp_path)
+    for i in range(6):
+        store.record_fill(_fill(fill_id=f"T{i}", qty="1", price="10", fee="0.5",
+                                ts=i * _DAY_MS // 2))
+    days = store.fill_totals(by_day=True)
+    assert [(t.day, t.fills, t.volume) for t in days] == [
+        ("1970-01-01", 2, Decimal(20)),
+        ("1970-01-02", 2, Decimal(20)),
+        ("1970-01-03", 2, Decimal(20)),
+    ]
+    [window] = store.fill_totals(since=_DAY_MS, until=2 * _DAY_MS)
+    assert (window.day, window.fills, window.fees) == (None, 2, Decimal(1))
+    store.close()
+
+
+def test_scaled_columns_are_backfilled_on_an_old_database(tmp_path) -> None:
+    db = tmp_path / "old.db"
+    raw = sqlite3.connect(str(db))
+    raw.executescript(
+        """
+        CREATE TABLE fills (
+            fill_id TEXT PRIMARY KEY, client_order_id TEXT NOT NULL,
+            instrument TEXT NOT NULL, side TEXT NOT NULL, qty TEXT NOT NULL,
+            price TEXT NOT NULL, fee TEXT NOT NULL, ts INTEGER NOT NULL
+        );
+        INSERT INTO fills VALUES ('F1', 'c', 'BTC/USD', 'buy', '0.5', '30000.1',
+                                  '0.01', 1);
+        INSERT INTO fills VALUES ('F2', 'c', 'BTC/USD', 'sell', '0.2', '31000',
+                                  '0.02', 2);
+        """
+    )
+    raw.commit()
+    raw.close()
+
+    with SqliteStore(db) as store:
+        [totals] = store.fill_totals()
+        assert (totals.net_qty, totals.fees) == (Decimal("0.3"), Decimal("0.03"))
+        assert totals.volume == Decimal("0.5") * Decimal("30000.1") + Decimal("6200")
+    raw = sqlite3.connect(str(db))
+    try:
+        assert raw.execute(
+            "SELECT COUNT(*) FROM fills WHERE notional_i IS NULL"
+        ).fetchone() == (0,)
+    finally:
+        raw.close()
+
+
 # --- verification on real data: reopen the file ---------------------------- #
 
 
@@ -408,3 +874,276 @@ async def test_engine_sequence_survives_reopen(tmp_path) -> None:
     assert rebuilt.realised_pnl == live_pos.realised_pnl
     assert rebuilt.fees_paid == live_pos.fees_paid
     reopened.close()
+
+
+# --- month archives ---------------------------------------------------------- #
+
+_JAN_2024 = 1_704_067_200_000  # 2024-01-01T00:00:00Z
+
+
+def _history(store: SqliteStore, now: list[int], count: int = 120) -> None:
+    """``count`` orders and fills over 120 days from January 2024, one a day.
+
+    Every fifth order stays live (OPEN); the rest are FILLED.
+    """
+    for i in range(count):
+        now[0] = _JAN_2024 + i * _DAY_MS
+        order = _order(cid=f"c{i}", instrument=ETH_USD if i % 2 else BTC_USD)
+        order.submit()
+        order.open(f"v{i}")
+        if i % 5:
+            order.apply_fill(money("2"), money("30000"))
+        store.upsert_order(order)
+        store.record_fill(
+            _fill(
+                fill_id=f"F{i}",
+                cid=f"c{i}",
+                price=f"{30000 + i}.25",
+                ts=now[0],
+                instrument=order.instrument,
+            )
+        )
+
+
+def _hot_count(db, table: str) -> int:
+    raw = sqlite3.connect(str(db))
+    try:
+        return raw.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        raw.close()
+
+
+def test_archived_rows_stay_readable(tmp_path) -> None:
+    db = tmp_path / "engine.db"
+    now = [0]
+    store = SqliteStore(db, clock=lambda: now[0])
+    _history(store, now)
+    orders, fills = store.orders(), store.fills()
+    totals = store.fill_totals(by_day=True)
+    watermark = store.fill_watermark()
+
+    cutoff = _JAN_2024 + 90 * _DAY_MS  # 2024-03-31: January to March move
+    moved_orders, moved_fills = store.archive(cutoff, batch=7)
+    assert moved_fills == 90
+    assert moved_orders == 90 - 18  # every fifth order is live and stays
+    assert sorted(p.name for p in (tmp_path / "engine.archive").iterdir()) == [
+        "2024-01.db",
+        "2024-02.db",
+        "2024-03.db",
+    ]
+    assert _hot_count(db, "fills") == 30
+    assert _hot_count(db, "orders") == 30 + 18
+
+    assert store.orders() == orders and store.fills() == fills
+    assert list(store.iter_fills(batch=4)) == fills
+    assert list(store.iter_orders(instrument=ETH_USD, batch=3)) == [
+        o for o in orders if o.instrument == ETH_USD
+    ]
+    assert store.fill_totals(by_day=True) == totals
+    assert store.fill_watermark() == watermark
+    assert store.get_order("c1") == orders[1]
+    since = _JAN_2024 + 40 * _DAY_MS
+    assert store.fills(since_ms=since) == [f for f in fills if f.ts >= since]
+    assert store.fill_ids(since=since, upto=45) == [f"F{i}" for i in range(40, 45)]
+    restore = [o.client_order_id for o in store.orders_to_restore(window_ms=0)]
+    live = [o.client_order_id for o in orders if not o.is_terminal]
+    assert restore == [*live, "c119"]  # c119 was written just now
+    assert store.archive(cutoff) == (0, 0)  # nothing left to move
+    store.close()
+
+    with SqliteStore(db) as reopened:
+        assert reopened.orders() == orders and reopened.fills() == fills
+        assert reopened.fill_totals(by_day=True) == totals
+
+
+def test_rewriting_an_archived_row_adds_no_second_copy(tmp_path) -> None:
+    db = tmp_path / "engine.db"
+    now = [0]
+    store = SqliteStore(db, clock=lambda: now[0])
+    _history(store, now)
+    store.archive(_JAN_2024 + 90 * _DAY_MS)
+    orders, fills = store.orders(), store.fills()
+    totals = store.fill_totals(by_day=True)
+    archived_fill = next(f for f in fills if f.fill_id == "F1")
+    archived_order = store.get_order("c1")
+    assert archived_order is not None
+
+    store.record_fill(archived_fill)  # a replayed event, a reconcile re-fetch
+    store.upsert_order(archived_order)
+
+    assert store.fills() == fills and store.orders() == orders
+    assert [o.client_order_id for o in store.iter_orders()].count("c1") == 1
+    assert store.fill_totals(by_day=True) == totals
+    assert _hot_count(db, "fills") == 30
+    store.close()
+
+    # The same holds on a write-behind store, and after a reopen.
+    with SqliteStore(db, write_behind=True) as again:
+        again.record_fill(archived_fill)
+        again.upsert_order(archived_order)
+        again.flush()
+        assert again.fills() == fills and again.orders() == orders
+
+
+def test_an_order_miss_reads_at_most_the_indexed_archive(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db = tmp_path / "engine.db"
+    now = [0]
+    store = SqliteStore(db, clock=lambda: now[0])
+    _history(store, now)
+    orders = {o.client_order_id: o for o in store.orders()}
+    store.archive(_JAN_2024 + 90 * _DAY_MS)
+    opened: list[str] = []
+    reader = store._archive_reader
+
+    def _spy(archive):  # noqa: ANN001, ANN202
+        opened.append(archive.month)
+        return reader(archive)
+
+    monkeypatch.setattr(store, "_archive_reader", _spy)
+    assert store.get_order("new-id") is None
+    assert opened == []  # a fresh id touches no archive
+    assert store.get_order("c41") == orders["c41"]
+    assert opened == ["2024-02"]
+    store.close()
+
+    # Archives written before the index existed are indexed on open.
+    raw = sqlite3.connect(str(db))
+    raw.execute("DELETE FROM archived_orders")
+    raw.commit()
+    raw.close()
+    with SqliteStore(db) as reopened:
+        assert reopened.get_order("c1") == orders["c1"]
+        assert reopened.get_order("c80") == orders["c80"]
+
+
+def test_an_older_database_is_converted_to_auto_vacuum_only_offline(
+    tmp_path, caplog: pytest.LogCaptureFixture
+) -> None:
+    db = tmp_path / "engine.db"
+    raw = sqlite3.connect(str(db))
+    raw.execute("CREATE TABLE legacy (a)")  # a table: auto_vacuum is now fixed
+    raw.close()
+    now = [0]
+    store = SqliteStore(db, clock=lambda: now[0])
+    _history(store, now)
+    with caplog.at_level("WARNING", logger="trading_bot.storage.sqlite_store"):
+        store.archive(_JAN_2024 + 30 * _DAY_MS)
+        store.archive(_JAN_2024 + 60 * _DAY_MS)
+    assert [r.message.count("trading-bot vacuum") for r in caplog.records] == [1]
+    pragma = store._writer.execute("PRAGMA auto_vacuum").fetchone()[0]
+    assert pragma == 0  # archiving never runs the full VACUUM itself
+
+    assert store.enable_incremental_vacuum() is True
+    assert store._writer.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    assert store._writer.execute("PRAGMA freelist_count").fetchone()[0] == 0
+    assert store.enable_incremental_vacuum() is False
+    store.close()
+    with pytest.raises(ValueError, match="in-memory"):
+        SqliteStore(":memory:").enable_incremental_vacuum()
+
+
+def test_archive_keeps_the_newest_row_and_rejects_bad_input(tmp_path) -> None:
+    now = [0]
+    store = SqliteStore(tmp_path / "engine.db", clock=lambda: now[0])
+    _history(store, now, count=3)
+    # Everything is old enough, yet the newest fill and order keep their rowid.
+    assert store.archive(_JAN_2024 + 365 * _DAY_MS) == (1, 2)
+    assert store.fill_watermark() == (3, _JAN_2024 + 2 * _DAY_MS)
+    store.record_fill(_fill(fill_id="F3", ts=_JAN_2024 + 3 * _DAY_MS))
+    assert store.fill_watermark()[0] == 4
+    with pytest.raises(ValueError, match="batch"):
+        store.archive(0, batch=0)
+    store.close()
+
+    memory = SqliteStore(":memory:")
+    with pytest.raises(ValueError, match="in-memory"):
+        memory.archive(0)
+    memory.close()
+    with pytest.raises(ValueError, match="in-memory"):
+        SqliteStore(":memory:", archive_after=0)
+
+
+def test_a_move_cut_short_is_redone_on_open(tmp_path) -> None:
+    db = tmp_path / "engine.db"
+    now = [0]
+    store = SqliteStore(db, clock=lambda: now[0])
+    _history(store, now, count=40)
+    fills = store.fills()
+    # Note a move and copy its rows, as a crash before the delete leaves them.
+    with store._moving, store._lock:
+        move = store._next_move("fills", _JAN_2024 + 20 * _DAY_MS, 10)
+    assert move is not None and move["month"] == "2024-01"
+    store.set_state(_ARCHIVE_PENDING, json.dumps(move))
+    archive = store._archive_path("2024-01")
+    store.close()
+    raw = sqlite3.connect(str(db))
+    raw.execute("ATTACH DATABASE ? AS archive", (str(archive),))
+    raw.execute(
+        "INSERT INTO archive.fills (rowid, fill_id, client_order_id, instrument,"
+        " side, qty, price, fee, ts) SELECT rowid, fill_id, client_order_id,"
+        " instrument, side, qty, price, fee, ts FROM main.fills WHERE rowid <= 10"
+    )
+    raw.commit()
+    raw.close()
+
+    with SqliteStore(db) as reopened:
+        assert reopened.get_state(_ARCHIVE_PENDING) is None
+        assert reopened.fills() == fills  # each fill once
+    assert _hot_count(db, "fills") == 30
+
+
+def test_archiving_runs_off_a_thread_beside_readers(tmp_path) -> None:
+    db = tmp_path / "engine.db"
+    now = [0]
+    store = SqliteStore(db, clock=lambda: now[0])
+    _history(store, now)
+    fills = store.fills()
+    mover = threading.Thread(
+        target=store.archive, args=(_JAN_2024 + 100 * _DAY_MS,), kwargs={"batch": 3}
+    )
+    mover.start()
+    seen = [list(store.iter_fills(batch=5)) for _ in range(5)]
+    mover.join()
+    assert all(page == fills for page in seen)  # never a row missed or doubled
+    assert _hot_count(db, "fills") == 20
+    store.close()
+
+
+def test_the_archiver_thread_moves_and_vacuums(tmp_path) -> None:
+    db = tmp_path / "engine.db"
+    now = [0]
+    with SqliteStore(db, clock=lambda: now[0]) as store:
+        _history(store, now)
+    store = SqliteStore(
+        db, clock=lambda: now[0], archive_after=30 * _DAY_MS, archive_interval=0.05
+    )
+    deadline = time.monotonic() + 10
+    while _hot_count(db, "fills") > 31 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert _hot_count(db, "fills") == 31
+    store.close()
+    assert not store._archiver.is_alive()
+    raw = sqlite3.connect(str(db))
+    try:
+        assert raw.execute("PRAGMA auto_vacuum").fetchone() == (2,)
+        assert raw.execute("PRAGMA freelist_count").fetchone() == (0,)
+    finally:
+        raw.close()
+    with pytest.raises(ValueError, match="archive_interval"):
+        SqliteStore(tmp_path / "x.db", archive_after=0, archive_interval=0)
+
+
+def test_build_engine_passes_the_archive_settings(tmp_path) -> None:
+    config = AppConfig.model_validate(
+        {"storage": {"archive_after_days": 0.5, "archive_interval": 60}}
+    )
+    engine = build_engine(config, db_path=tmp_path / "engine.db")
+    assert engine.store is not None
+    assert engine.store._archive_after == _DAY_MS // 2
+    assert engine.store._archive_interval == 60
+    engine.store.close()
+    for bad in ({"archive_after_days": -1}, {"archive_interval": 0}):
+        with pytest.raises(ValueError, match=next(iter(bad))):
+            AppConfig.model_validate({"storage": bad})
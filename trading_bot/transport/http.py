@@ -227,6 +227,7 @@ class AsyncHTTPClient:
         *,
         data: Mapping[str, Any] | None = None,
         json: Any | None = None,
+        content: str | bytes | None = None,
         headers: Mapping[str, str] | None = None,
         retry: bool = True,
     ) -> Any:
@@ -240,6 +241,10 @@ class AsyncHTTPClient:
             Form-encoded body.
         json : Any, optional
             JSON body (mutually exclusive with *data*, per httpx).
+        content : str or bytes, optional
+            A pre-serialised body, sent byte for byte — for a signed JSON body,
+            whose signature covers the exact bytes (set ``Content-Type`` in
+            *headers*).
         headers : mapping, optional
             Per-request headers, merged over the client defaults.
         retry : bool, default True
@@ -268,7 +273,13 @@ class AsyncHTTPClient:
             transport error — the outcome is unknown; reconcile before retrying.
         """
         return await self._request(
-            "POST", url, data=data, json=json, headers=headers, retry=retry
+            "POST",
+            url,
+            data=data,
+            json=json,
+            content=content,
+            headers=headers,
+            retry=retry,
         )
 
     async def request(
@@ -328,6 +339,7 @@ class AsyncHTTPClient:
         params: Mapping[str, Any] | None = None,
         data: Mapping[str, Any] | None = None,
         json: Any | None = None,
+        content: str | bytes | None = None,
         headers: Mapping[str, str] | None = None,
         retry: bool = True,
     ) -> Any:
@@ -365,6 +377,7 @@ class AsyncHTTPClient:
                     params=params,
                     data=data,
                     json=json,
+                    content=content,
                     headers=dict(headers) if headers is not None else None,
                 )
 
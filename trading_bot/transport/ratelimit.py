@@ -257,6 +257,10 @@ class KrakenCallCounter:
     COSTS: dict[str, int] = {
         "AddOrder": 0,
         "CancelOrder": 0,
+        "AddOrderBatch": 0,
+        "CancelOrderBatch": 0,
+        "CancelAll": 0,
+        "AmendOrder": 0,
         "Balance": 1,
         "TradeBalance": 1,
         "OpenOrders": 1,